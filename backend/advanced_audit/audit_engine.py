@@ -5,7 +5,7 @@ Advanced Audit Logger - Blockchain-Style Audit Engine
 import hashlib
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from .models import AuditEntry, ChainTip, VerificationResult
 
@@ -21,6 +21,9 @@ class AdvancedAuditEngine:
         # In-memory chain storage (use database in production)
         self.chains: Dict[str, List[AuditEntry]] = {}
         self.chain_tips: Dict[str, ChainTip] = {}
+        
+        # bout_id -> (entries verified, hash of last verified entry)
+        self.checkpoints: Dict[str, Tuple[int, str]] = {}
     
     def log_event(
         self,
@@ -109,10 +112,17 @@ class AdvancedAuditEngine:
         
         return hashlib.sha256(hash_input.encode()).hexdigest()
     
-    def verify_chain(self, bout_id: str) -> VerificationResult:
+    def verify_chain(self, bout_id: str, full: bool = False) -> VerificationResult:
         """
         Verify integrity of audit chain
         
+        Resumes after the last verified entry: the checkpointed entry is
+        re-hashed and must still match, then only newer entries are checked.
+        
+        Args:
+            bout_id: Bout identifier
+            full: Ignore the checkpoint and verify from genesis
+        
         Returns:
             VerificationResult with tamper detection
         """
@@ -128,13 +138,27 @@ class AdvancedAuditEngine:
         
         chain = self.chains[bout_id]
         total_entries = len(chain)
-        verified_entries = 0
         tampered = False
         tamper_at = None
         tamper_details = None
         
-        # Verify each entry
-        for i, entry in enumerate(chain):
+        start, previous_hash = 0, self.GENESIS_HASH
+        checkpoint = None if full else self.checkpoints.get(bout_id)
+        if checkpoint is not None:
+            count, checkpoint_hash = checkpoint
+            anchor = chain[count - 1] if count <= total_entries else None
+            if anchor is not None and anchor.current_hash == checkpoint_hash and self._calculate_hash(anchor) == checkpoint_hash:
+                start, previous_hash = count, checkpoint_hash
+            else:
+                # Checkpointed entry changed or vanished: fall back to a full pass
+                self.checkpoints.pop(bout_id, None)
+        
+        verified_entries = start
+        
+        # Verify each new entry
+        for i in range(start, total_entries):
+            entry = chain[i]
+            
             # Recalculate hash
             expected_hash = self._calculate_hash(entry)
             
@@ -145,24 +169,22 @@ class AdvancedAuditEngine:
                 tamper_details = f"Hash mismatch at entry {i}: expected {expected_hash}, got {entry.current_hash}"
                 break
             
-            # Check previous hash linkage
-            if i > 0:
-                prev_entry = chain[i-1]
-                if entry.previous_hash != prev_entry.current_hash:
-                    tampered = True
-                    tamper_at = i
-                    tamper_details = f"Chain broken at entry {i}: previous_hash mismatch"
-                    break
-            else:
-                # First entry should point to genesis
-                if entry.previous_hash != self.GENESIS_HASH:
-                    tampered = True
-                    tamper_at = i
+            # Check previous hash linkage (first entry points to genesis)
+            if entry.previous_hash != previous_hash:
+                tampered = True
+                tamper_at = i
+                if i == 0:
                     tamper_details = f"Genesis hash mismatch at entry {i}"
-                    break
+                else:
+                    tamper_details = f"Chain broken at entry {i}: previous_hash mismatch"
+                break
             
+            previous_hash = entry.current_hash
             verified_entries += 1
         
+        if verified_entries > 0:
+            self.checkpoints[bout_id] = (verified_entries, chain[verified_entries - 1].current_hash)
+        
         result = VerificationResult(
             bout_id=bout_id,
             valid=not tampered,
@@ -170,7 +192,9 @@ class AdvancedAuditEngine:
             verified_entries=verified_entries,
             tampered=tampered,
             tamper_detected_at=tamper_at,
-            tamper_details=tamper_details
+            tamper_details=tamper_details,
+            resumed_from=start,
+            entries_checked=verified_entries - start + (1 if tampered else 0)
         )
         
         if tampered:
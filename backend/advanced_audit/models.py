@@ -52,4 +52,8 @@ class VerificationResult(BaseModel):
     tamper_detected_at: Optional[int] = None
     tamper_details: Optional[str] = None
     
+    # Incremental verification
+    resumed_from: int = 0  # Entries trusted from the previous checkpoint
+    entries_checked: int = 0
+    
     verified_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -33,10 +33,10 @@ async def log_event(
     return engine.log_event(bout_id, event_type, payload, actor, cv_version, judge_device_id, scoring_engine_version)
 
 @advanced_audit_api.get("/verify/{bout_id}", response_model=VerificationResult)
-async def verify_chain(bout_id: str):
-    """Verify audit chain integrity"""
+async def verify_chain(bout_id: str, full: bool = False):
+    """Verify audit chain integrity (incremental unless full=true)"""
     engine = get_audit_engine()
-    return engine.verify_chain(bout_id)
+    return engine.verify_chain(bout_id, full=full)
 
 @advanced_audit_api.get("/chain/{bout_id}", response_model=List[AuditEntry])
 async def get_chain(bout_id: str):
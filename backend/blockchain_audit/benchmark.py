@@ -0,0 +1,220 @@
+"""
+Blockchain Audit - Verification Benchmark
+Compares the legacy per-block verify_record walk against ChainVerifier
+(full pass, then an incremental pass after new blocks are appended) on an
+in-memory collection, so only query count and hashing cost are measured.
+
+    python -m blockchain_audit.benchmark --blocks 100000 --append 1000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List
+
+from .blockchain_engine import BlockchainEngine, SECRET_KEY
+from .chain_verifier import ChainVerifier, GENESIS_HASH
+
+
+class MemoryCursor:
+    """find() cursor over a list of documents (sort/batch_size/async iteration)"""
+    
+    def __init__(self, docs: List[Dict], projection: Dict = None):
+        self.docs = docs
+        self.projection = projection
+    
+    def sort(self, key, direction: int = 1):
+        keys = key if isinstance(key, list) else [(key, direction)]
+        for field, order in reversed(keys):
+            self.docs = sorted(self.docs, key=lambda d: d.get(field), reverse=order < 0)
+        return self
+    
+    def batch_size(self, size: int):
+        return self
+    
+    def _project(self, doc: Dict) -> Dict:
+        if not self.projection:
+            return dict(doc)
+        included = [k for k, v in self.projection.items() if v and k != "_id"]
+        return {k: doc[k] for k in included if k in doc} if included else dict(doc)
+    
+    async def to_list(self, length=None):
+        docs = self.docs if length is None else self.docs[:length]
+        return [self._project(d) for d in docs]
+    
+    def __aiter__(self):
+        self._iter = iter(self.docs)
+        return self
+    
+    async def __anext__(self):
+        try:
+            return self._project(next(self._iter))
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _matches(doc: Dict, query: Dict) -> bool:
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(_matches(doc, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = doc.get(field)
+            for op, operand in condition.items():
+                if value is None:
+                    return False
+                if op == "$gte" and not value >= operand:
+                    return False
+                if op == "$gt" and not value > operand:
+                    return False
+        elif doc.get(field) != condition:
+            return False
+    return True
+
+
+class MemoryCollection:
+    """Just enough of a Motor collection for the verifiers"""
+    
+    def __init__(self):
+        self.docs: List[Dict] = []
+        self.queries = 0
+        self._by_record_id: Dict[str, Dict] = {}
+        self._by_block: Dict[tuple, Dict] = {}
+    
+    async def insert_one(self, doc: Dict):
+        self.docs.append(doc)
+        if "record_id" in doc:
+            self._by_record_id[doc["record_id"]] = doc
+        if "block_number" in doc:
+            self._by_block[(doc.get("bout_id"), doc["block_number"])] = doc
+    
+    def find(self, query: Dict = None, projection: Dict = None) -> MemoryCursor:
+        self.queries += 1
+        return MemoryCursor([d for d in self.docs if _matches(d, query or {})], projection)
+    
+    async def find_one(self, query: Dict, projection: Dict = None, sort=None):
+        self.queries += 1
+        # Indexed lookups, like the real collection
+        if set(query) == {"record_id"}:
+            doc = self._by_record_id.get(query["record_id"])
+        elif set(query) == {"bout_id", "block_number"}:
+            doc = self._by_block.get((query["bout_id"], query["block_number"]))
+        else:
+            cursor = MemoryCursor([d for d in self.docs if _matches(d, query)])
+            docs = cursor.sort(sort).docs if sort else cursor.docs
+            doc = docs[0] if docs else None
+        return dict(doc) if doc is not None else None
+    
+    async def replace_one(self, query: Dict, doc: Dict, upsert: bool = False):
+        self.docs = [d for d in self.docs if not _matches(d, query)]
+        await self.insert_one(doc)
+    
+    async def delete_one(self, query: Dict):
+        self.docs = [d for d in self.docs if not _matches(d, query)]
+    
+    async def count_documents(self, query: Dict) -> int:
+        return sum(1 for d in self.docs if _matches(d, query))
+
+
+class MemoryDatabase:
+    def __init__(self):
+        self.collections: Dict[str, MemoryCollection] = {}
+    
+    def __getattr__(self, name: str) -> MemoryCollection:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self.collections.setdefault(name, MemoryCollection())
+
+
+async def append_blocks(engine: BlockchainEngine, db: MemoryDatabase, bout_id: str,
+                        count: int, start: int = 1, previous_hash: str = GENESIS_HASH) -> str:
+    """Append signed, linked blocks directly (skips per-insert lookups)"""
+    for number in range(start, start + count):
+        data_hash = engine.hash_data({"bout_id": bout_id, "block": number})
+        await db.blockchain_records.insert_one({
+            "block_id": f"{bout_id}-{number}",
+            "record_id": f"{bout_id}-rec-{number}",
+            "record_type": "score",
+            "data_hash": data_hash,
+            "signature": engine.create_signature(data_hash, "judge_1"),
+            "signed_by": "judge_1",
+            "previous_hash": previous_hash,
+            "block_number": number,
+            "bout_id": bout_id,
+            "round_num": 1,
+            "created_at": "2024-01-01T00:00:00+00:00"
+        })
+        previous_hash = data_hash
+    return previous_hash
+
+
+async def run_benchmark(blocks: int = 100000, append: int = 1000, legacy_sample: int = 5000,
+                        workers: int = 4, batch_size: int = 2000) -> Dict:
+    db = MemoryDatabase()
+    engine = BlockchainEngine(db)
+    bout_id = "bench_bout"
+    tip = await append_blocks(engine, db, bout_id, blocks)
+    
+    # Legacy: verify_record per block (2 lookups + model build each); sampled
+    sample = min(legacy_sample, blocks)
+    db.blockchain_records.queries = 0
+    start = time.perf_counter()
+    for number in range(1, sample + 1):
+        await engine.verify_record(f"{bout_id}-rec-{number}")
+    legacy_s = (time.perf_counter() - start) * blocks / sample
+    legacy_queries = db.blockchain_records.queries * blocks // sample
+    
+    verifier = ChainVerifier(db, SECRET_KEY, max_workers=workers, batch_size=batch_size)
+    
+    db.blockchain_records.queries = 0
+    start = time.perf_counter()
+    full = await verifier.verify_bout(bout_id, full=True)
+    full_s = time.perf_counter() - start
+    full_queries = db.blockchain_records.queries
+    
+    await append_blocks(engine, db, bout_id, append, start=blocks + 1, previous_hash=tip)
+    db.blockchain_records.queries = 0
+    start = time.perf_counter()
+    incremental = await verifier.verify_bout(bout_id)
+    incremental_s = time.perf_counter() - start
+    
+    verifier.shutdown()
+    return {
+        "blocks": blocks,
+        "legacy_per_record": {
+            "seconds_estimated": round(legacy_s, 3),
+            "sampled_blocks": sample,
+            "queries": legacy_queries
+        },
+        "full_verification": {
+            "seconds": round(full_s, 3),
+            "blocks_per_sec": round(blocks / full_s),
+            "queries": full_queries,
+            "verified": full["verified"]
+        },
+        "incremental_verification": {
+            "appended_blocks": append,
+            "seconds": round(incremental_s, 4),
+            "blocks_checked": incremental["blocks_checked"],
+            "queries": db.blockchain_records.queries,
+            "verified": incremental["verified"]
+        },
+        "speedup_full_vs_legacy": round(legacy_s / full_s, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blockchain audit verification benchmark")
+    parser.add_argument("--blocks", type=int, default=100000)
+    parser.add_argument("--append", type=int, default=1000, help="Blocks added before the incremental pass")
+    parser.add_argument("--legacy-sample", type=int, default=5000, help="Blocks timed on the legacy path")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    args = parser.parse_args()
+    result = asyncio.run(run_benchmark(args.blocks, args.append, args.legacy_sample, args.workers, args.batch_size))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
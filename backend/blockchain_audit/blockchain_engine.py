@@ -15,6 +15,7 @@ from .models import (
     AuditTrail,
     DigitalSignature
 )
+from .chain_verifier import ChainVerifier
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,7 @@ class BlockchainEngine:
     def __init__(self, db=None):
         self.db = db
         self.chain_cache: Dict[str, List[BlockchainRecord]] = {}
+        self.verifier = ChainVerifier(db, SECRET_KEY) if db is not None else None
     
     def hash_data(self, data: dict) -> str:
         """
@@ -288,40 +290,34 @@ class BlockchainEngine:
             logger.error(f"Error getting audit trail: {e}")
             return None
     
-    async def verify_bout_integrity(self, bout_id: str) -> dict:
+    async def verify_bout_integrity(self, bout_id: str, full: bool = False) -> dict:
         """
         Verify complete integrity of all records for a bout
         
+        Blocks are streamed in one sorted query and signature-checked in a
+        thread pool; only blocks after the bout's checkpoint are processed
+        unless full is set.
+        
         Args:
             bout_id: Bout ID
+            full: Ignore the checkpoint and verify from genesis
         
         Returns:
             Verification summary
         """
-        audit_trail = await self.get_audit_trail(bout_id)
-        
-        if not audit_trail:
+        if self.verifier is None:
             return {
                 "bout_id": bout_id,
                 "verified": False,
                 "message": "No audit trail found"
             }
         
-        # Verify each record
-        total = len(audit_trail.blocks)
-        verified = 0
-        
-        for block in audit_trail.blocks:
-            result = await self.verify_record(block.record_id)
-            if result.is_valid:
-                verified += 1
-        
-        return {
-            "bout_id": bout_id,
-            "total_records": total,
-            "verified_records": verified,
-            "failed_records": total - verified,
-            "chain_valid": audit_trail.chain_valid,
-            "verified": verified == total and audit_trail.chain_valid,
-            "integrity_percentage": (verified / total * 100) if total > 0 else 0
-        }
+        try:
+            return await self.verifier.verify_bout(bout_id, full=full)
+        except Exception as e:
+            logger.error(f"Error verifying bout chain: {e}")
+            return {
+                "bout_id": bout_id,
+                "verified": False,
+                "message": f"Error: {str(e)}"
+            }
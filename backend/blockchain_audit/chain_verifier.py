@@ -0,0 +1,223 @@
+"""
+Blockchain Audit - Chain Verifier
+
+Verifies a bout's chain with one sorted query instead of two lookups per
+block. Blocks are streamed in block_number order in batches; linkage
+(previous_hash -> prior data_hash) is checked inline and signature batches
+are handed to a thread pool while the next batch is read. The last verified
+block per bout is checkpointed, so re-verification only walks new blocks
+(after re-checking that the checkpointed block itself is unchanged).
+"""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+GENESIS_HASH = "0" * 64
+
+# Fields needed for verification; nothing else is pulled from Mongo
+BLOCK_PROJECTION = {"_id": 0, "block_number": 1, "data_hash": 1, "previous_hash": 1, "signature": 1, "signed_by": 1}
+
+
+def verify_signature_batch(secret_key: bytes, blocks: List[Dict]) -> List[bool]:
+    """HMAC check for a batch of blocks (runs in the thread pool)"""
+    results = []
+    for block in blocks:
+        message = f"{block['data_hash']}:{block['signed_by']}".encode()
+        expected = hmac.new(secret_key, message, hashlib.sha256).hexdigest()
+        results.append(hmac.compare_digest(block.get("signature", ""), expected))
+    return results
+
+
+class ChainCheckpoint:
+    """Last block of a bout known to be valid"""
+    
+    __slots__ = ("bout_id", "block_number", "data_hash", "verified_at")
+    
+    def __init__(self, bout_id: str, block_number: int = 0, data_hash: str = GENESIS_HASH,
+                 verified_at: Optional[str] = None):
+        self.bout_id = bout_id
+        self.block_number = block_number
+        self.data_hash = data_hash
+        self.verified_at = verified_at
+    
+    def to_dict(self) -> Dict:
+        return {
+            "bout_id": self.bout_id,
+            "block_number": self.block_number,
+            "data_hash": self.data_hash,
+            "verified_at": self.verified_at
+        }
+
+
+class ChainVerifier:
+    """Streaming, checkpointed verification of blockchain_records"""
+    
+    def __init__(self, db, secret_key: str, max_workers: int = 4, batch_size: int = 2000):
+        """
+        Args:
+            db: Motor database (blockchain_records, blockchain_checkpoints)
+            secret_key: HMAC key used to sign blocks
+            max_workers: Threads for signature checks
+            batch_size: Blocks per cursor batch / pool task
+        """
+        self.db = db
+        self.secret_key = secret_key.encode()
+        self.batch_size = batch_size
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chain-verify")
+        self.checkpoints: Dict[str, ChainCheckpoint] = {}
+    
+    async def get_checkpoint(self, bout_id: str) -> ChainCheckpoint:
+        checkpoint = self.checkpoints.get(bout_id)
+        if checkpoint is None:
+            doc = await self.db.blockchain_checkpoints.find_one({"bout_id": bout_id}, {"_id": 0})
+            checkpoint = ChainCheckpoint(**doc) if doc else ChainCheckpoint(bout_id)
+            self.checkpoints[bout_id] = checkpoint
+        return checkpoint
+    
+    async def _save_checkpoint(self, checkpoint: ChainCheckpoint):
+        self.checkpoints[checkpoint.bout_id] = checkpoint
+        await self.db.blockchain_checkpoints.replace_one(
+            {"bout_id": checkpoint.bout_id}, checkpoint.to_dict(), upsert=True
+        )
+    
+    async def reset_checkpoint(self, bout_id: str):
+        self.checkpoints.pop(bout_id, None)
+        await self.db.blockchain_checkpoints.delete_one({"bout_id": bout_id})
+    
+    async def _batches(self, bout_id: str, from_block: int):
+        cursor = self.db.blockchain_records.find(
+            {"bout_id": bout_id, "block_number": {"$gte": from_block}},
+            BLOCK_PROJECTION
+        ).sort("block_number", 1).batch_size(self.batch_size)
+        batch = []
+        async for block in cursor:
+            batch.append(block)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    async def verify_bout(self, bout_id: str, full: bool = False) -> Dict:
+        """
+        Verify a bout's chain from its checkpoint (or from genesis if full)
+        
+        Returns:
+            Verification summary (same shape as verify_bout_integrity)
+        """
+        loop = asyncio.get_running_loop()
+        checkpoint = ChainCheckpoint(bout_id) if full else await self.get_checkpoint(bout_id)
+        resumed_from = checkpoint.block_number
+        
+        # Linkage state: the checkpointed block is re-read and must be unchanged
+        prev_number, prev_hash = checkpoint.block_number, checkpoint.data_hash
+        anchor_pending = checkpoint.block_number > 0
+        
+        checked = 0
+        verified = 0
+        first_invalid: Optional[int] = None
+        invalid_reason: Optional[str] = None
+        chain_valid = True
+        last_good: Tuple[int, str] = (checkpoint.block_number, checkpoint.data_hash)
+        pending = None  # (future, blocks) for the batch being signature-checked
+        
+        async def settle(task) -> bool:
+            nonlocal verified, first_invalid, invalid_reason, last_good
+            future, blocks = task
+            for block, ok in zip(blocks, await future):
+                if not ok:
+                    if first_invalid is None or block["block_number"] < first_invalid:
+                        first_invalid = block["block_number"]
+                        invalid_reason = "signature mismatch"
+                    return False
+                if first_invalid is None or block["block_number"] < first_invalid:
+                    verified += 1
+                    last_good = (block["block_number"], block["data_hash"])
+            return True
+        
+        async for batch in self._batches(bout_id, max(checkpoint.block_number, 1)):
+            if anchor_pending:
+                anchor = batch[0]
+                anchor_pending = False
+                if anchor["block_number"] != checkpoint.block_number or anchor["data_hash"] != checkpoint.data_hash:
+                    chain_valid = False
+                    first_invalid = checkpoint.block_number
+                    invalid_reason = "checkpointed block changed"
+                    break
+                batch = batch[1:]
+            
+            # Linkage is sequential and cheap; stop at the first break
+            linked = []
+            for block in batch:
+                if block["block_number"] != prev_number + 1 or block["previous_hash"] != prev_hash:
+                    chain_valid = False
+                    first_invalid = block["block_number"]
+                    invalid_reason = "chain linkage broken"
+                    break
+                linked.append(block)
+                prev_number, prev_hash = block["block_number"], block["data_hash"]
+            checked += len(linked)
+            
+            # Hash this batch in the pool while the previous one settles
+            task = (loop.run_in_executor(self.executor, verify_signature_batch, self.secret_key, linked), linked)
+            if pending is not None and not await settle(pending):
+                pending = None
+                await task[0]
+                break
+            pending = task
+            if not chain_valid:
+                break
+        
+        if pending is not None:
+            await settle(pending)
+        
+        if anchor_pending and checkpoint.block_number > 0:
+            # Checkpoint points past the stored chain: blocks were removed
+            chain_valid = False
+            first_invalid = checkpoint.block_number
+            invalid_reason = "checkpointed block missing"
+        
+        # Checkpoint only moves forward over the valid prefix
+        if last_good[0] > checkpoint.block_number or full:
+            if last_good[0] > 0:
+                await self._save_checkpoint(ChainCheckpoint(
+                    bout_id, last_good[0], last_good[1], datetime.now(timezone.utc).isoformat()
+                ))
+        
+        valid = chain_valid and first_invalid is None
+        if valid and checked == 0 and resumed_from == 0:
+            return {
+                "bout_id": bout_id,
+                "verified": False,
+                "message": "No audit trail found"
+            }
+        if valid:
+            total = (0 if full else resumed_from) + checked
+        else:
+            # Verification stopped early; report against the stored chain length
+            total = await self.db.blockchain_records.count_documents({"bout_id": bout_id})
+        verified_total = (0 if full else resumed_from) + verified
+        return {
+            "bout_id": bout_id,
+            "total_records": total,
+            "verified_records": verified_total,
+            "failed_records": total - verified_total,
+            "chain_valid": chain_valid,
+            "verified": valid,
+            "integrity_percentage": (verified_total / total * 100) if total > 0 else 0,
+            "resumed_from_block": 0 if full else resumed_from,
+            "blocks_checked": checked,
+            "first_invalid_block": first_invalid,
+            "invalid_reason": invalid_reason,
+            "checkpoint_block": self.checkpoints[bout_id].block_number if bout_id in self.checkpoints else 0
+        }
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
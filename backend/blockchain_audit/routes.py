@@ -64,15 +64,18 @@ async def verify_blockchain_record(record_id: str):
     return result
 
 @blockchain_audit_api.get("/blockchain/verify/bout/{bout_id}")
-async def verify_bout_integrity(bout_id: str):
+async def verify_bout_integrity(bout_id: str, full: bool = False):
     """
     Verify complete integrity of all records for a bout
     
+    Incremental from the bout's last verified block; full=true re-verifies
+    from genesis.
+    
     Returns summary of verification status
     """
     engine = get_blockchain_engine()
     
-    summary = await engine.verify_bout_integrity(bout_id)
+    summary = await engine.verify_bout_integrity(bout_id, full=full)
     return summary
 
 # ============================================================================
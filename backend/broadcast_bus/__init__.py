@@ -0,0 +1,8 @@
+"""
+Broadcast Bus
+Cross-worker websocket fan-out with per-bout channels
+"""
+
+from .bus import BroadcastBus, LocalHub, LocalHubTransport, RedisTransport, channel_name, ws_bus
+
+__version__ = "1.0.0"
@@ -0,0 +1,107 @@
+"""
+Broadcast Bus - Fan-out Latency Benchmark
+Event-to-screen latency with N workers sharing a bus and M sockets spread
+across them. Each worker is a BroadcastBus + OverlayWebSocketManager pair;
+publishers rotate across workers so both local and remote paths are measured.
+
+    python -m broadcast_bus.benchmark --workers 4 --sockets 1000 --events 200 --interval-ms 5
+    python -m broadcast_bus.benchmark --redis      # real Redis pub/sub
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List
+
+from stats_overlay.websocket_handler import OverlayWebSocketManager
+from .bus import BroadcastBus, LocalHub, RedisTransport
+
+
+class BenchmarkSocket:
+    """Stands in for a websocket; records publish-to-send latency"""
+    
+    def __init__(self, latencies: List[float]):
+        self.latencies = latencies
+    
+    async def accept(self):
+        pass
+    
+    async def send_json(self, data: Dict):
+        self.latencies.append((time.perf_counter() - data["t"]) * 1000)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+async def run_benchmark(workers: int = 4, sockets: int = 1000, events: int = 200,
+                        bouts: int = 1, use_redis: bool = False, interval_ms: float = 5.0) -> Dict:
+    if use_redis:
+        from redis_utils import init_redis
+        if await init_redis() is None:
+            raise RuntimeError("Redis not available")
+        transports = [RedisTransport() for _ in range(workers)]
+    else:
+        hub = LocalHub()
+        transports = [hub.transport() for _ in range(workers)]
+    
+    buses = [BroadcastBus(transport, worker_id=f"worker-{i}") for i, transport in enumerate(transports)]
+    managers = [OverlayWebSocketManager(bus) for bus in buses]
+    
+    latencies: List[float] = []
+    for i in range(sockets):
+        await managers[i % workers].connect(BenchmarkSocket(latencies), f"bout_{i % bouts}")
+    if use_redis:
+        await asyncio.sleep(0.5)  # Let SUBSCRIBE round-trips finish
+    
+    expected = events * sockets // bouts
+    start = time.perf_counter()
+    for i in range(events):
+        await managers[i % workers].broadcast_to_fight(f"bout_{i % bouts}", {"seq": i, "t": time.perf_counter()})
+        await asyncio.sleep(interval_ms / 1000)  # Paced like live events, not one burst
+    deadline = time.perf_counter() + 10
+    while len(latencies) < expected and time.perf_counter() < deadline:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    
+    for bus in buses:
+        await bus.detach_transport()
+    
+    ordered = sorted(latencies)
+    return {
+        "transport": "redis" if use_redis else "local_hub",
+        "workers": workers,
+        "sockets": sockets,
+        "bouts": bouts,
+        "events": events,
+        "interval_ms": interval_ms,
+        "deliveries": len(latencies),
+        "expected_deliveries": expected,
+        "deliveries_per_sec": round(len(latencies) / elapsed),
+        "latency_ms": {
+            "p50": round(percentile(ordered, 0.50), 3),
+            "p95": round(percentile(ordered, 0.95), 3),
+            "p99": round(percentile(ordered, 0.99), 3),
+            "max": round(ordered[-1], 3) if ordered else 0.0
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Broadcast bus fan-out latency benchmark")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--sockets", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--bouts", type=int, default=1)
+    parser.add_argument("--interval-ms", type=float, default=5.0, help="Gap between published events")
+    parser.add_argument("--redis", action="store_true", help="Use Redis (REDIS_HOST/REDIS_PORT)")
+    args = parser.parse_args()
+    result = asyncio.run(run_benchmark(args.workers, args.sockets, args.events, args.bouts, args.redis, args.interval_ms))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Broadcast Bus - Cross-Worker WebSocket Fan-out
+
+Websocket managers publish each message once to the bus. The bus delivers
+it to the publishing worker's own sockets immediately and hands one copy to
+the transport; every other worker receives it on the bout's channel and
+fans it out to its local sockets. Workers only subscribe to bouts that have
+local sockets.
+
+Transports:
+- None: single-process mode, local delivery only
+- LocalHubTransport: in-process hub shared by several buses (tests, benchmark)
+- RedisTransport: per-bout channels over redis_utils.RedisPubSub
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# (bout_id, message) -> local delivery
+DeliverFn = Callable[[str, Dict], Awaitable[None]]
+
+
+def channel_name(namespace: str, bout_id: str) -> str:
+    return f"ws:{namespace}:{bout_id}"
+
+
+class LocalHubTransport:
+    """In-process stand-in for Redis pub/sub between buses"""
+    
+    def __init__(self, hub: "LocalHub"):
+        self.hub = hub
+        self.on_message: Optional[Callable[[Dict], Awaitable[None]]] = None
+        self._pending: Set[asyncio.Task] = set()
+    
+    def bind(self, on_message: Callable[[Dict], Awaitable[None]]):
+        self.on_message = on_message
+    
+    async def publish(self, channel: str, envelope: Dict) -> bool:
+        # Serialize like the wire would, once per publish
+        payload = json.dumps(envelope)
+        for transport in list(self.hub.subscribers.get(channel, ())):
+            transport._receive(payload)
+        return True
+    
+    def _receive(self, payload: str):
+        if self.on_message is None:
+            return
+        task = asyncio.get_running_loop().create_task(self.on_message(json.loads(payload)))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+    
+    def subscribe(self, channel: str):
+        self.hub.subscribers.setdefault(channel, set()).add(self)
+    
+    def unsubscribe(self, channel: str):
+        subscribers = self.hub.subscribers.get(channel)
+        if subscribers is not None:
+            subscribers.discard(self)
+            if not subscribers:
+                del self.hub.subscribers[channel]
+    
+    async def close(self):
+        for channel in list(self.hub.subscribers):
+            self.unsubscribe(channel)
+
+
+class LocalHub:
+    """Shared channel registry for LocalHubTransport instances"""
+    
+    def __init__(self):
+        self.subscribers: Dict[str, Set[LocalHubTransport]] = {}
+    
+    def transport(self) -> LocalHubTransport:
+        return LocalHubTransport(self)
+
+
+class RedisTransport:
+    """Per-bout Redis channels, one RedisPubSub listener per subscribed channel"""
+    
+    def __init__(self):
+        self.on_message: Optional[Callable[[Dict], Awaitable[None]]] = None
+        self.publishers: Dict[str, object] = {}
+        self.listeners: Dict[str, tuple] = {}  # channel -> (RedisPubSub, Task)
+    
+    def bind(self, on_message: Callable[[Dict], Awaitable[None]]):
+        self.on_message = on_message
+    
+    async def publish(self, channel: str, envelope: Dict) -> bool:
+        from redis_utils import RedisPubSub
+        
+        publisher = self.publishers.get(channel)
+        if publisher is None:
+            publisher = RedisPubSub(channel)
+            self.publishers[channel] = publisher
+        return await publisher.publish(envelope)
+    
+    def subscribe(self, channel: str):
+        from redis_utils import RedisPubSub
+        
+        if channel in self.listeners:
+            return
+        pubsub = RedisPubSub(channel)
+        task = asyncio.get_running_loop().create_task(pubsub.subscribe(self.on_message))
+        self.listeners[channel] = (pubsub, task)
+    
+    def unsubscribe(self, channel: str):
+        self.publishers.pop(channel, None)
+        listener = self.listeners.pop(channel, None)
+        if listener is None:
+            return
+        pubsub, task = listener
+        task.cancel()
+        asyncio.get_running_loop().create_task(pubsub.unsubscribe())
+    
+    async def close(self):
+        for channel in list(self.listeners):
+            self.unsubscribe(channel)
+
+
+class BroadcastBus:
+    """Publish-once websocket fan-out, local in-process or across workers"""
+    
+    def __init__(self, transport=None, worker_id: Optional[str] = None):
+        """
+        Args:
+            transport: LocalHubTransport / RedisTransport, or None for single-process
+            worker_id: Identifies this worker's own messages on the transport
+        """
+        self.worker_id = worker_id or f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.handlers: Dict[str, DeliverFn] = {}
+        self.joined: Dict[str, int] = {}  # channel -> local socket refcount
+        self.transport = None
+        
+        # Stats
+        self.published = 0
+        self.remote_received = 0
+        self.delivery_errors = 0
+        self.last_remote_latency_ms: Optional[float] = None
+        
+        if transport is not None:
+            self.attach_transport(transport)
+    
+    def register(self, namespace: str, deliver: DeliverFn):
+        """Register the local fan-out for a namespace (one per manager/feed)"""
+        self.handlers[namespace] = deliver
+    
+    def attach_transport(self, transport):
+        """Switch to cross-worker mode; already-joined channels are subscribed"""
+        self.transport = transport
+        transport.bind(self._on_transport_message)
+        for channel in self.joined:
+            transport.subscribe(channel)
+    
+    async def detach_transport(self):
+        if self.transport is not None:
+            await self.transport.close()
+            self.transport = None
+    
+    def join(self, namespace: str, bout_id: str):
+        """A local socket started watching a bout"""
+        channel = channel_name(namespace, bout_id)
+        count = self.joined.get(channel, 0)
+        self.joined[channel] = count + 1
+        if count == 0 and self.transport is not None:
+            self.transport.subscribe(channel)
+    
+    def leave(self, namespace: str, bout_id: str):
+        """A local socket stopped watching a bout"""
+        channel = channel_name(namespace, bout_id)
+        count = self.joined.get(channel, 0) - 1
+        if count > 0:
+            self.joined[channel] = count
+            return
+        self.joined.pop(channel, None)
+        if count == 0 and self.transport is not None:
+            self.transport.unsubscribe(channel)
+    
+    async def publish(self, namespace: str, bout_id: str, message: Dict):
+        """
+        Deliver a message to every socket watching the bout, on every worker
+        
+        Args:
+            namespace: Manager/feed namespace
+            bout_id: Bout (channel) identifier
+            message: JSON-serializable message
+        """
+        self.published += 1
+        if self.transport is not None:
+            await self.transport.publish(channel_name(namespace, bout_id), {
+                "origin": self.worker_id,
+                "ns": namespace,
+                "bout_id": bout_id,
+                "message": message,
+                "sent_at": time.time()
+            })
+        await self._deliver(namespace, bout_id, message)
+    
+    async def _on_transport_message(self, envelope: Dict):
+        if envelope.get("origin") == self.worker_id:
+            return  # Delivered locally at publish time
+        self.remote_received += 1
+        sent_at = envelope.get("sent_at")
+        if sent_at is not None:
+            self.last_remote_latency_ms = (time.time() - sent_at) * 1000
+        await self._deliver(envelope["ns"], envelope["bout_id"], envelope["message"])
+    
+    async def _deliver(self, namespace: str, bout_id: str, message: Dict):
+        handler = self.handlers.get(namespace)
+        if handler is None:
+            return
+        try:
+            await handler(bout_id, message)
+        except Exception as e:
+            self.delivery_errors += 1
+            logger.error(f"Local delivery failed for {namespace}/{bout_id}: {e}")
+    
+    def get_stats(self) -> Dict:
+        return {
+            "worker_id": self.worker_id,
+            "transport": type(self.transport).__name__ if self.transport else "local",
+            "namespaces": sorted(self.handlers),
+            "subscribed_channels": len(self.joined),
+            "published": self.published,
+            "remote_received": self.remote_received,
+            "delivery_errors": self.delivery_errors,
+            "last_remote_latency_ms": self.last_remote_latency_ms
+        }
+
+
+# Process-wide bus shared by all websocket managers; server startup attaches
+# a RedisTransport when BROADCAST_BUS=redis
+ws_bus = BroadcastBus()
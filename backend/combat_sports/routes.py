@@ -11,6 +11,7 @@ import logging
 
 from combat_sports import SPORT_TYPES
 from combat_sports.filters import validate_sport_type, validate_organization
+from stats_rollups import StatsRollups, init_stats_rollups
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +19,14 @@ router = APIRouter(prefix="/api/sports", tags=["Combat Sports"])
 
 # Global instances
 db: Optional[AsyncIOMotorDatabase] = None
+rollups: Optional[StatsRollups] = None
 
 
 def init_combat_sports(database: AsyncIOMotorDatabase):
     """Initialize combat sports with database"""
-    global db
+    global db, rollups
     db = database
+    rollups = init_stats_rollups(database)
     logger.info("✅ Combat Sports initialized")
 
 
@@ -98,23 +101,16 @@ async def get_sport_organizations(sport_type: str):
     
     # Get stats for each organization
     if db is not None:
-        org_stats = []
-        for org_id in organizations:
-            event_count = await db.events.count_documents({
-                'sport_type': sport_type,
-                'organization_id': org_id
-            })
-            
-            fight_count = await db.fight_stats.count_documents({
-                'sport_type': sport_type,
-                'organization_id': org_id
-            })
-            
-            org_stats.append({
+        rows = await rollups.rows({'kind': 'scope', 'scope': 'org_sport', 'sport_type': sport_type})
+        counts = {row['organization_id']: row for row in rows}
+        org_stats = [
+            {
                 'organization_id': org_id,
-                'total_events': event_count,
-                'total_fights': fight_count
-            })
+                'total_events': counts.get(org_id, {}).get('total_events', 0),
+                'total_fights': counts.get(org_id, {}).get('total_fights', 0)
+            }
+            for org_id in organizations
+        ]
         
         return {
             'sport_type': sport_type,
@@ -157,37 +153,26 @@ async def get_sport_stats_summary(
             if not validate_organization(sport_type, organization_id):
                 raise HTTPException(status_code=400, detail="Invalid organization for this sport")
         
-        # Build query
-        query = {}
-        if sport_type:
-            query['sport_type'] = sport_type
-        if organization_id:
-            query['organization_id'] = organization_id
-        
-        # Get counts
-        total_events = await db.events.count_documents(query)
-        total_fights = await db.fight_stats.count_documents(query)
+        # Totals for the filter from the rollup
+        summary = await rollups.scope(organization_id=organization_id, sport_type=sport_type)
         
-        # Get unique fighters
-        unique_fighters = await db.events.distinct('fighter_id', query)
-        
-        # Get breakdown by sport if no filter
+        # Breakdown by sport if no filter: one read of the per-sport rows
         sport_breakdown = []
         if not sport_type:
+            if organization_id:
+                query = {'kind': 'scope', 'scope': 'org_sport', 'organization_id': organization_id}
+            else:
+                query = {'kind': 'scope', 'scope': 'sport'}
+            counts = {row['sport_type']: row for row in await rollups.rows(query)}
+            
             for st in SPORT_TYPES.keys():
-                st_query = {'sport_type': st}
-                if organization_id:
-                    st_query['organization_id'] = organization_id
-                
-                st_events = await db.events.count_documents(st_query)
-                st_fights = await db.fight_stats.count_documents(st_query)
-                
-                if st_events > 0 or st_fights > 0:
+                row = counts.get(st)
+                if row and (row['total_events'] > 0 or row['total_fights'] > 0):
                     sport_breakdown.append({
                         'sport_type': st,
                         'sport_name': SPORT_TYPES[st]['name'],
-                        'total_events': st_events,
-                        'total_fights': st_fights
+                        'total_events': row['total_events'],
+                        'total_fights': row['total_fights']
                     })
         
         return {
@@ -195,11 +180,7 @@ async def get_sport_stats_summary(
                 'sport_type': sport_type,
                 'organization_id': organization_id
             },
-            'summary': {
-                'total_events': total_events,
-                'total_fights': total_fights,
-                'total_fighters': len(unique_fighters)
-            },
+            'summary': summary,
             'sport_breakdown': sport_breakdown
         }
     
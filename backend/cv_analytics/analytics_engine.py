@@ -39,7 +39,7 @@ class CVAnalyticsEngine:
         events = []
         
         # Apply temporal smoothing
-        smoothed = self.temporal_smoother.smooth(raw_input)
+        smoothed = self.temporal_smoother.smooth(raw_input, bout_id)
         if not smoothed:
             return events  # Too noisy, skip
         
@@ -129,6 +129,10 @@ class CVAnalyticsEngine:
         
         return fused_events
     
+    def release_bout(self, bout_id: str) -> int:
+        """Drop per-stream smoothing state once a bout is over"""
+        return self.temporal_smoother.release_bout(bout_id)
+    
     def generate_analytics(self, events: List[CombatEvent], window_seconds: int = 60) -> AnalyticsOutput:
         """
         Generate analytics from event stream
@@ -0,0 +1,92 @@
+"""
+CV Analytics Engine - Smoothing Benchmark
+Frames/sec per core for temporal smoothing and the full E2 frame path.
+
+    python -m cv_analytics.benchmark --cameras 8 --frames 100000
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Dict, List
+
+from .models import RawCVInput, ActionType, ImpactLevel
+from .temporal_smoothing import TemporalSmoother
+from .analytics_engine import CVAnalyticsEngine
+
+
+def generate_frames(count: int, cameras: int, seed: int = 11) -> List[RawCVInput]:
+    """Interleaved frames for cameras x 2 fighters with bursty action runs"""
+    rng = random.Random(seed)
+    actions = list(ActionType)
+    current = {}
+    frames = []
+    for i in range(count):
+        camera_id = f"cam_{i % cameras}"
+        fighter_id = "fighter_a" if (i // cameras) % 2 == 0 else "fighter_b"
+        key = (camera_id, fighter_id)
+        if key not in current or rng.random() < 0.15:
+            current[key] = rng.choice(actions)
+        action = current[key]
+        frames.append(RawCVInput(
+            frame_id=i,
+            timestamp_ms=i * 16,
+            camera_id=camera_id,
+            fighter_id=fighter_id,
+            action_type=action,
+            action_logits={action.value: rng.uniform(0.5, 0.99), "other": rng.uniform(0.0, 0.3)},
+            fighter_bbox=[rng.random(), rng.random(), 0.2, 0.4],
+            keypoints=[(0.5, 0.5, 0.9)] * 17,
+            impact_detected=True,
+            impact_level=rng.choice(list(ImpactLevel)),
+            motion_vectors={"vx": 4.0, "vy": -1.0, "magnitude": rng.uniform(1.0, 9.0)},
+            camera_angle=0.0,
+            camera_distance=5.0
+        ))
+    return frames
+
+
+def run_benchmark(cameras: int = 8, frames: int = 100_000, bouts: int = 1) -> Dict:
+    inputs = generate_frames(frames, cameras)
+    bout_ids = [f"bout_{i}" for i in range(bouts)]
+
+    smoother = TemporalSmoother()
+    emitted = 0
+    start = time.perf_counter()
+    for i, raw_input in enumerate(inputs):
+        if smoother.smooth(raw_input, bout_ids[i % bouts]) is not None:
+            emitted += 1
+    smooth_elapsed = time.perf_counter() - start
+
+    engine = CVAnalyticsEngine()
+    events = 0
+    start = time.perf_counter()
+    for i, raw_input in enumerate(inputs):
+        events += len(engine.process_raw_input(raw_input, bout_ids[i % bouts], "round_1"))
+    engine_elapsed = time.perf_counter() - start
+
+    return {
+        "cameras": cameras,
+        "bouts": bouts,
+        "frames": frames,
+        "streams": len(smoother.windows),
+        "smooth_frames_per_sec": round(frames / smooth_elapsed),
+        "smooth_us_per_frame": round(smooth_elapsed / frames * 1e6, 3),
+        "smoothed_frames": emitted,
+        "engine_frames_per_sec": round(frames / engine_elapsed),
+        "engine_events": events
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CV Analytics temporal smoothing benchmark")
+    parser.add_argument("--cameras", type=int, default=8)
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--bouts", type=int, default=1)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.cameras, args.frames, args.bouts), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -202,7 +202,8 @@ async def get_status():
         "temporal_smoother": {
             "window_size": analytics_engine.temporal_smoother.window_size,
             "confidence_threshold": analytics_engine.temporal_smoother.confidence_threshold,
-            "buffer_size": len(analytics_engine.temporal_smoother.frame_buffer)
+            "active_streams": len(analytics_engine.temporal_smoother.windows),
+            "max_streams": analytics_engine.temporal_smoother.max_streams
         },
         "multicam_fusion": {
             "fusion_window_ms": analytics_engine.multicam_fusion.fusion_window_ms
@@ -1,46 +1,119 @@
 """
 CV Analytics Engine - Temporal Smoothing
 Rolling window smoothing and optical flow validation
+
+Each (bout, camera, fighter) stream has its own fixed-size window stored in
+NumPy arrays of action ids and per-frame confidences. Action counts and the
+confidence sum are updated in O(1) as frames enter and leave the window.
 """
 
-from typing import Optional, List
-from collections import deque
+from typing import Optional, Dict, Tuple
+from collections import OrderedDict
 import logging
-from .models import RawCVInput
+import numpy as np
+from .models import RawCVInput, ActionType
 
 logger = logging.getLogger(__name__)
 
+ACTION_IDS: Dict[ActionType, int] = {action: i for i, action in enumerate(ActionType)}
+
+StreamKey = Tuple[str, str, str]
+
+
+class SmoothingWindow:
+    """Ring buffer for one (bout, camera, fighter) stream"""
+    
+    __slots__ = (
+        "actions", "confidences", "action_counts", "count_frequency",
+        "max_count", "confidence_sum", "position", "size"
+    )
+    
+    def __init__(self, window_size: int):
+        self.actions = np.zeros(window_size, dtype=np.int8)
+        self.confidences = np.zeros(window_size, dtype=np.float64)
+        self.action_counts = np.zeros(len(ACTION_IDS), dtype=np.int32)
+        # count_frequency[c] = number of actions seen exactly c times in the
+        # window; lets the most-common count be maintained without a scan
+        self.count_frequency = np.zeros(window_size + 1, dtype=np.int32)
+        self.count_frequency[0] = len(ACTION_IDS)
+        self.max_count = 0
+        self.confidence_sum = 0.0
+        self.position = 0
+        self.size = 0
+    
+    def push(self, action_id: int, confidence: float):
+        """Add a frame, evicting the oldest once the window is full"""
+        i = self.position
+        capacity = self.actions.shape[0]
+        if self.size == capacity:
+            evicted = int(self.actions[i])
+            count = int(self.action_counts[evicted])
+            self.action_counts[evicted] = count - 1
+            self.count_frequency[count] -= 1
+            self.count_frequency[count - 1] += 1
+            if count == self.max_count and self.count_frequency[count] == 0:
+                self.max_count = count - 1
+            self.confidence_sum -= float(self.confidences[i])
+        else:
+            self.size += 1
+        
+        self.actions[i] = action_id
+        self.confidences[i] = confidence
+        count = int(self.action_counts[action_id]) + 1
+        self.action_counts[action_id] = count
+        self.count_frequency[count - 1] -= 1
+        self.count_frequency[count] += 1
+        if count > self.max_count:
+            self.max_count = count
+        self.confidence_sum += confidence
+        
+        self.position = (i + 1) % capacity
+        if self.position == 0:
+            # Re-anchor the running sum once per wrap to avoid float drift
+            self.confidence_sum = float(self.confidences.sum())
+
 
 class TemporalSmoother:
-    """Smooth CV detections over time"""
+    """Smooth CV detections over time, per (bout, camera, fighter) stream"""
     
-    def __init__(self, window_size: int = 5, confidence_threshold: float = 0.6):
+    def __init__(self, window_size: int = 5, confidence_threshold: float = 0.6,
+                 max_streams: int = 512):
         self.window_size = window_size
         self.confidence_threshold = confidence_threshold
-        self.frame_buffer: deque = deque(maxlen=window_size)
+        self.max_streams = max_streams
+        self.windows: "OrderedDict[StreamKey, SmoothingWindow]" = OrderedDict()
     
-    def smooth(self, raw_input: RawCVInput) -> Optional[RawCVInput]:
+    def _get_window(self, key: StreamKey) -> SmoothingWindow:
+        window = self.windows.get(key)
+        if window is None:
+            window = SmoothingWindow(self.window_size)
+            self.windows[key] = window
+            if len(self.windows) > self.max_streams:
+                self.windows.popitem(last=False)  # Least recently seen stream
+        else:
+            self.windows.move_to_end(key)
+        return window
+    
+    def smooth(self, raw_input: RawCVInput, bout_id: str = "") -> Optional[RawCVInput]:
         """
         Apply temporal smoothing
         
+        Args:
+            raw_input: Frame detection
+            bout_id: Bout the frame belongs to (part of the stream key)
+        
         Returns:
             Smoothed input or None if too noisy
         """
-        # Add to buffer
-        self.frame_buffer.append(raw_input)
+        window = self._get_window((bout_id, raw_input.camera_id, raw_input.fighter_id))
+        frame_confidence = max(raw_input.action_logits.values()) if raw_input.action_logits else 0.0
+        window.push(ACTION_IDS[raw_input.action_type], frame_confidence)
         
-        if len(self.frame_buffer) < self.window_size:
+        if window.size < self.window_size:
             return None  # Need full window
         
-        # Check consistency across window
-        action_counts = {}
-        for frame in self.frame_buffer:
-            action = frame.action_type.value
-            action_counts[action] = action_counts.get(action, 0) + 1
-        
-        # Get most common action
-        most_common_action = max(action_counts, key=action_counts.get)
-        consistency = action_counts[most_common_action] / self.window_size
+        # Check consistency across window (most common action)
+        consistency = window.max_count / self.window_size
         
         # Require at least 60% consistency
         if consistency < 0.6:
@@ -53,20 +126,31 @@ class TemporalSmoother:
             return None
         
         # Average confidence across window
-        avg_confidence = sum(
-            max(frame.action_logits.values()) for frame in self.frame_buffer
-        ) / len(self.frame_buffer)
+        avg_confidence = window.confidence_sum / self.window_size
         
         if avg_confidence < self.confidence_threshold:
             logger.debug(f"Low confidence: {avg_confidence:.2f}")
             return None
         
-        # Return smoothed input (use most recent frame with averaged confidence)
-        smoothed = raw_input.model_copy(deep=True)
-        for action, logit in smoothed.action_logits.items():
-            smoothed.action_logits[action] = avg_confidence
-        
-        return smoothed
+        # Return smoothed input (most recent frame with averaged confidence).
+        # Shallow copy: only action_logits is replaced, other fields are shared.
+        return raw_input.model_copy(update={
+            "action_logits": dict.fromkeys(raw_input.action_logits, avg_confidence)
+        })
+    
+    def release_bout(self, bout_id: str) -> int:
+        """Drop smoothing state for every stream of a finished bout"""
+        keys = [key for key in self.windows if key[0] == bout_id]
+        for key in keys:
+            del self.windows[key]
+        return len(keys)
+    
+    def get_stats(self) -> Dict:
+        return {
+            "streams": len(self.windows),
+            "max_streams": self.max_streams,
+            "window_size": self.window_size
+        }
     
     def _validate_optical_flow(self, raw_input: RawCVInput) -> bool:
         """
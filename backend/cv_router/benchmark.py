@@ -0,0 +1,86 @@
+"""
+CV Router - Routing Benchmark
+Measures per-frame worker selection cost.
+
+    python -m cv_router.benchmark --workers 16 --frames 200000
+
+Simulates 8 cameras x 60fps style load: every frame calls select_worker and
+every `--update-every` frames one worker reports new metrics.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import tracemalloc
+from typing import Dict
+
+from .worker_manager import WorkerManager
+
+
+async def run_benchmark(workers: int = 16, frames: int = 200_000, update_every: int = 8,
+                        seed: int = 7) -> Dict:
+    rng = random.Random(seed)
+    manager = WorkerManager()
+    worker_ids = [
+        (await manager.register_worker(f"mock://worker{i}")).worker_id
+        for i in range(workers)
+    ]
+    frame_ids = [f"frame_{i}" for i in range(1024)]
+
+    # Warm the ring buffer so steady state is measured
+    for i in range(manager.routing_history.capacity):
+        manager.select_worker(frame_ids[i & 1023])
+
+    select_time = 0.0
+    update_time = 0.0
+
+    for i in range(frames):
+        start = time.perf_counter()
+        manager.select_worker(frame_ids[i & 1023])
+        select_time += time.perf_counter() - start
+
+        if i % update_every == 0:
+            start = time.perf_counter()
+            await manager.update_worker_metrics(
+                worker_ids[rng.randrange(workers)], rng.uniform(5, 80), rng.randrange(0, 12)
+            )
+            update_time += time.perf_counter() - start
+
+    # Separate (slower) pass: memory retained by routing alone
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    for i in range(min(frames, 50_000)):
+        manager.select_worker(frame_ids[i & 1023])
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(
+        stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, "filename")
+        if "worker_manager" in str(stat.traceback)
+    )
+
+    updates = frames // update_every + 1
+    return {
+        "workers": workers,
+        "frames": frames,
+        "select_us_per_frame": round(select_time / frames * 1e6, 3),
+        "metric_update_us": round(update_time / updates * 1e6, 3),
+        "frames_per_sec": round(frames / select_time),
+        "routing_history_len": len(manager.routing_history),
+        "retained_bytes_worker_manager": retained
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CV Router worker selection benchmark")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--frames", type=int, default=200_000)
+    parser.add_argument("--update-every", type=int, default=8)
+    args = parser.parse_args()
+    result = asyncio.run(run_benchmark(args.workers, args.frames, args.update_every))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+CV Router - Frame Transport
+Binary frame packets, per-worker bounded queues with drop policies,
+and transports that deliver frames to CV workers.
+"""
+
+import asyncio
+import base64
+import time
+from typing import Dict, Optional, Tuple
+import logging
+
+from .models import Frame, DropPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class FramePacket:
+    """
+    In-flight video frame
+
+    Carries the encoded image as bytes end to end (no base64 text, no
+    pydantic validation on the hot path). Slicing uses memoryview so
+    tiles/sub-regions never copy the payload.
+    """
+
+    __slots__ = (
+        "frame_id",
+        "camera_id",
+        "timestamp_ms",
+        "sequence_num",
+        "payload",
+        "width",
+        "height",
+        "format",
+        "camera_angle",
+        "is_keyframe",
+        "enqueued_at",
+    )
+
+    def __init__(self, frame_id: str, camera_id: str, timestamp_ms: int, sequence_num: int,
+                 payload: bytes, width: int, height: int, format: str = "jpeg",
+                 camera_angle: float = 0.0, is_keyframe: bool = True):
+        self.frame_id = frame_id
+        self.camera_id = camera_id
+        self.timestamp_ms = timestamp_ms
+        self.sequence_num = sequence_num
+        self.payload = payload
+        self.width = width
+        self.height = height
+        self.format = format
+        self.camera_angle = camera_angle
+        self.is_keyframe = is_keyframe
+        self.enqueued_at = 0.0
+
+    @classmethod
+    def from_frame(cls, frame: Frame) -> "FramePacket":
+        """Decode an API Frame (base64 text) once at the edge"""
+        return cls(
+            frame_id=frame.frame_id,
+            camera_id=frame.camera_id,
+            timestamp_ms=frame.timestamp_ms,
+            sequence_num=frame.sequence_num,
+            payload=base64.b64decode(frame.data),
+            width=frame.width,
+            height=frame.height,
+            format=frame.format,
+            camera_angle=frame.camera_angle,
+            is_keyframe=frame.is_keyframe
+        )
+
+    def view(self) -> memoryview:
+        """Zero-copy view of the payload"""
+        return memoryview(self.payload)
+
+    def headers(self) -> Dict[str, str]:
+        """Frame metadata sent alongside the binary body"""
+        return {
+            "Content-Type": f"image/{self.format}",
+            "X-Frame-Id": self.frame_id,
+            "X-Camera-Id": self.camera_id,
+            "X-Timestamp-Ms": str(self.timestamp_ms),
+            "X-Sequence-Num": str(self.sequence_num),
+            "X-Frame-Width": str(self.width),
+            "X-Frame-Height": str(self.height),
+            "X-Camera-Angle": str(self.camera_angle),
+            "X-Keyframe": "1" if self.is_keyframe else "0",
+        }
+
+
+class WorkerChannel:
+    """Bounded async frame queue in front of one CV worker"""
+
+    def __init__(self, worker_id: str, maxsize: int = 32,
+                 drop_policy: DropPolicy = DropPolicy.DROP_OLDEST):
+        self.worker_id = worker_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.drop_policy = drop_policy
+        self.task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.frames_enqueued = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.avg_send_ms = 0.0
+        self.avg_queue_wait_ms = 0.0
+        self.throughput_fps = 0.0
+        self._last_sent_at = 0.0
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize()
+
+    def offer(self, packet: FramePacket, under_pressure: bool = False) -> Tuple[bool, Optional[FramePacket], Optional[str]]:
+        """
+        Enqueue without waiting, applying the drop policy
+
+        Args:
+            packet: Frame to enqueue
+            under_pressure: Worker reports queue pressure (SKIP_NON_KEYFRAMES)
+
+        Returns:
+            (accepted, evicted, drop_reason) - evicted is an older frame
+            dropped to make room
+        """
+        if (self.drop_policy == DropPolicy.SKIP_NON_KEYFRAMES and
+                not packet.is_keyframe and (under_pressure or self.queue.full())):
+            self.frames_dropped += 1
+            return False, None, "non_keyframe_skipped"
+
+        evicted = None
+        if self.queue.full():
+            if self.drop_policy == DropPolicy.DROP_NEWEST:
+                self.frames_dropped += 1
+                return False, None, "queue_full"
+            evicted = self.queue.get_nowait()
+            self.frames_dropped += 1
+
+        packet.enqueued_at = time.perf_counter()
+        self.queue.put_nowait(packet)
+        self.frames_enqueued += 1
+        depth = self.queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+        return True, evicted, "evicted_oldest" if evicted else None
+
+    def record_send(self, packet: FramePacket, send_ms: float):
+        """Update EMA latency/throughput after a delivery"""
+        alpha = 0.2
+        now = time.perf_counter()
+        wait_ms = (now - packet.enqueued_at) * 1000 - send_ms
+        self.frames_sent += 1
+        self.avg_send_ms = alpha * send_ms + (1 - alpha) * self.avg_send_ms
+        self.avg_queue_wait_ms = alpha * max(wait_ms, 0.0) + (1 - alpha) * self.avg_queue_wait_ms
+        if self._last_sent_at:
+            delta = now - self._last_sent_at
+            if delta > 0:
+                self.throughput_fps = 0.9 * self.throughput_fps + 0.1 * (1.0 / delta)
+        self._last_sent_at = now
+
+    def get_stats(self) -> Dict:
+        return {
+            "queue_depth": self.depth,
+            "queue_capacity": self.queue.maxsize,
+            "max_queue_depth": self.max_depth,
+            "frames_enqueued": self.frames_enqueued,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "errors": self.errors,
+            "throughput_fps": round(self.throughput_fps, 2),
+            "avg_send_ms": round(self.avg_send_ms, 3),
+            "avg_queue_wait_ms": round(self.avg_queue_wait_ms, 3),
+            "drop_policy": self.drop_policy.value
+        }
+
+
+class MockFrameTransport:
+    """Simulated delivery for mock:// workers"""
+
+    def __init__(self, latency_s: float = 0.01):
+        self.latency_s = latency_s
+
+    async def send(self, endpoint: str, packet: FramePacket) -> Dict:
+        await asyncio.sleep(self.latency_s)  # Simulate network latency
+        return {}
+
+    async def close(self):
+        pass
+
+
+class HttpFrameTransport:
+    """
+    Deliver frames to HTTP workers as raw binary bodies
+
+    POST {endpoint}/frames with the encoded image as the body and frame
+    metadata in X-* headers. Workers may reply with JSON containing their
+    own queue_size.
+    """
+
+    def __init__(self, timeout_s: float = 2.0, max_connections: int = 64):
+        self.timeout_s = timeout_s
+        self.max_connections = max_connections
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_s,
+                limits=httpx.Limits(max_connections=self.max_connections)
+            )
+        return self._client
+
+    async def send(self, endpoint: str, packet: FramePacket) -> Dict:
+        response = await self._get_client().post(
+            f"{endpoint.rstrip('/')}/frames",
+            content=packet.payload,
+            headers=packet.headers()
+        )
+        response.raise_for_status()
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return response.json()
+        return {}
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -23,6 +23,13 @@ class StreamType(str, Enum):
     MOCK = "mock"
 
 
+class DropPolicy(str, Enum):
+    """What to drop when a worker queue is full or under pressure"""
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    SKIP_NON_KEYFRAMES = "skip_non_keyframes"
+
+
 class CVWorker(BaseModel):
     """CV Worker registration"""
     worker_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -72,6 +79,7 @@ class Frame(BaseModel):
     # Metadata
     sequence_num: int
     camera_angle: float
+    is_keyframe: bool = True
     
 
 class RoutingDecision(BaseModel):
@@ -100,3 +108,7 @@ class RouterMetrics(BaseModel):
     
     # Per-camera stats
     camera_stats: Dict[str, Dict] = Field(default_factory=dict)
+    
+    # Per-worker queue/throughput stats
+    worker_stats: Dict[str, Dict] = Field(default_factory=dict)
+    drop_policy: Optional[str] = None
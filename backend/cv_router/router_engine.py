@@ -1,27 +1,50 @@
 """
 CV Router - Main Router Engine
 Coordinate stream ingestion, worker management, and frame routing
+
+Frames are routed off the ingest loop: _on_frame_received only selects a
+worker and offers the frame to that worker's bounded queue. One delivery
+task per worker drains its queue through the worker's transport.
 """
 
 import asyncio
-from typing import Optional
+import time
+from typing import Dict, Optional, Union
 import logging
-from datetime import datetime, timezone
 
 from .worker_manager import WorkerManager
 from .stream_ingestor import StreamIngestor
-from .models import Frame, RouterMetrics
+from .models import Frame, RouterMetrics, DropPolicy
+from .frame_transport import FramePacket, WorkerChannel, MockFrameTransport, HttpFrameTransport
 
 logger = logging.getLogger(__name__)
 
 
 class CVRouterEngine:
     """Main CV Router coordination engine"""
-    
-    def __init__(self):
+
+    def __init__(self,
+                 worker_queue_size: int = 32,
+                 drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
+                 pressure_queue_size: int = 8):
+        """
+        Args:
+            worker_queue_size: Bounded router-side queue per worker
+            drop_policy: Frame drop policy when a worker queue is full/under pressure
+            pressure_queue_size: Worker-reported queue size treated as pressure
+        """
         self.worker_manager = WorkerManager()
         self.stream_ingestor = StreamIngestor()
-        
+
+        self.worker_queue_size = worker_queue_size
+        self.drop_policy = drop_policy
+        self.pressure_queue_size = pressure_queue_size
+
+        # Per-worker bounded queues and transports
+        self.channels: Dict[str, WorkerChannel] = {}
+        self.mock_transport = MockFrameTransport()
+        self.http_transport = HttpFrameTransport()
+
         # Set frame callback
         self.stream_ingestor.set_frame_callback(self._on_frame_received)
         
@@ -29,29 +52,44 @@ class CVRouterEngine:
         self.total_frames_routed = 0
         self.frames_dropped = 0
         self.routing_latencies = []
-        
+        self.camera_routing: Dict[str, Dict] = {}
+
         # WebSocket connection to E2 (CV Analytics)
         self.e2_websocket = None
-    
-    async def _on_frame_received(self, frame: Frame):
-        """Handle incoming frame from stream"""
-        start_time = datetime.now(timezone.utc)
-        
+
+    async def _on_frame_received(self, frame: Union[FramePacket, Frame]):
+        """Handle incoming frame from stream (never waits on a worker)"""
+        start_time = time.perf_counter()
+
+        if isinstance(frame, Frame):
+            frame = FramePacket.from_frame(frame)
+
+        camera = self._camera_stats(frame.camera_id)
+        camera["frames_in"] += 1
+
         try:
             # Select worker
             worker = self.worker_manager.select_worker(frame.frame_id)
             
             if not worker:
-                self.frames_dropped += 1
+                self._record_drop(camera, "no_worker")
                 logger.warning(f"Frame {frame.frame_id} dropped - no workers available")
                 return
-            
-            # Route frame to worker (mocked)
-            await self._route_to_worker(worker.worker_id, frame)
-            
+
+            channel = self._get_channel(worker.worker_id)
+            under_pressure = worker.queue_size >= self.pressure_queue_size
+            accepted, evicted, reason = channel.offer(frame, under_pressure)
+
+            if evicted is not None:
+                self._record_drop(self._camera_stats(evicted.camera_id), reason)
+            if not accepted:
+                self._record_drop(camera, reason)
+                return
+
             # Update metrics
             self.total_frames_routed += 1
-            routing_time = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+            camera["frames_routed"] += 1
+            routing_time = (time.perf_counter() - start_time) * 1000
             self.routing_latencies.append(routing_time)
             
             # Keep only recent latencies
@@ -60,19 +98,103 @@ class CVRouterEngine:
         
         except Exception as e:
             logger.error(f"Error routing frame {frame.frame_id}: {e}")
-            self.frames_dropped += 1
-    
-    async def _route_to_worker(self, worker_id: str, frame: Frame):
-        """Route frame to CV worker (mocked)"""
-        # In production: send frame to worker via HTTP/WebSocket
-        # For now: simulate processing
-        await asyncio.sleep(0.01)  # Simulate network latency
-        
+            self._record_drop(camera, "error")
+
+    def _get_channel(self, worker_id: str) -> WorkerChannel:
+        """Get (or start) the bounded queue and delivery task for a worker"""
+        channel = self.channels.get(worker_id)
+        if channel is None:
+            channel = WorkerChannel(worker_id, maxsize=self.worker_queue_size, drop_policy=self.drop_policy)
+            channel.task = asyncio.get_running_loop().create_task(self._worker_loop(channel))
+            self.channels[worker_id] = channel
+        return channel
+
+    def _transport_for(self, endpoint: str):
+        if endpoint.startswith(("http://", "https://")):
+            return self.http_transport
+        return self.mock_transport
+
+    async def _worker_loop(self, channel: WorkerChannel):
+        """Drain one worker's queue through its transport"""
+        worker_id = channel.worker_id
+        try:
+            while True:
+                packet = await channel.queue.get()
+
+                worker = self.worker_manager.workers.get(worker_id)
+                if worker is None:
+                    # Worker deregistered: drop what is left and stop
+                    self._record_drop(self._camera_stats(packet.camera_id), "worker_removed")
+                    while not channel.queue.empty():
+                        leftover = channel.queue.get_nowait()
+                        self._record_drop(self._camera_stats(leftover.camera_id), "worker_removed")
+                    break
+
+                await self._route_to_worker(worker_id, worker.endpoint, packet, channel)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.channels.pop(worker_id, None)
+
+    async def _route_to_worker(self, worker_id: str, endpoint: str, packet: FramePacket,
+                               channel: WorkerChannel):
+        """Deliver a frame to a CV worker and feed back its load"""
+        send_start = time.perf_counter()
+        try:
+            reply = await self._transport_for(endpoint).send(endpoint, packet)
+        except Exception as e:
+            channel.errors += 1
+            self._record_drop(self._camera_stats(packet.camera_id), "worker_error")
+            logger.warning(f"Frame {packet.frame_id} delivery to {worker_id} failed: {e}")
+            await self.worker_manager.report_worker_error(worker_id)
+            return
+
+        send_ms = (time.perf_counter() - send_start) * 1000
+        channel.record_send(packet, send_ms)
+        self._camera_stats(packet.camera_id)["frames_delivered"] += 1
+
+        # Worker load = its own backlog (if reported) + frames waiting here
+        remote_queue = int(reply.get("queue_size", 0)) if reply else 0
+        await self.worker_manager.update_worker_metrics(
+            worker_id, reply.get("latency_ms", send_ms) if reply else send_ms,
+            remote_queue + channel.depth
+        )
+
         # Simulate worker processing and send to E2
         if self.e2_websocket:
             # In production: receive CV output from worker, send to E2
             pass
-    
+
+    def _camera_stats(self, camera_id: str) -> Dict:
+        stats = self.camera_routing.get(camera_id)
+        if stats is None:
+            stats = {
+                "frames_in": 0,
+                "frames_routed": 0,
+                "frames_delivered": 0,
+                "frames_dropped": 0,
+                "drop_reasons": {}
+            }
+            self.camera_routing[camera_id] = stats
+        return stats
+
+    def _record_drop(self, camera: Dict, reason: str):
+        self.frames_dropped += 1
+        camera["frames_dropped"] += 1
+        camera["drop_reasons"][reason] = camera["drop_reasons"].get(reason, 0) + 1
+
+    def start(self):
+        """Start worker health monitoring on the running loop"""
+        self.worker_manager.start()
+
+    async def shutdown(self):
+        """Stop delivery tasks and close transports"""
+        await self.worker_manager.close()
+        for channel in list(self.channels.values()):
+            if channel.task:
+                channel.task.cancel()
+        await self.http_transport.close()
+
     def get_metrics(self) -> RouterMetrics:
         """Get comprehensive system metrics"""
         worker_metrics = self.worker_manager.get_metrics()
@@ -82,7 +204,14 @@ class CVRouterEngine:
             sum(self.routing_latencies) / len(self.routing_latencies)
             if self.routing_latencies else 0.0
         )
-        
+
+        camera_stats = {}
+        for camera_id in set(stream_stats) | set(self.camera_routing):
+            camera_stats[camera_id] = {
+                **stream_stats.get(camera_id, {}),
+                **self.camera_routing.get(camera_id, {})
+            }
+
         return RouterMetrics(
             total_workers=worker_metrics["total_workers"],
             healthy_workers=worker_metrics["healthy_workers"],
@@ -91,5 +220,7 @@ class CVRouterEngine:
             total_frames_routed=self.total_frames_routed,
             avg_routing_latency_ms=avg_routing_latency,
             frames_dropped=self.frames_dropped,
-            camera_stats=stream_stats
+            camera_stats=camera_stats,
+            worker_stats={wid: ch.get_stats() for wid, ch in self.channels.items()},
+            drop_policy=self.drop_policy.value
         )
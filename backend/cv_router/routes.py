@@ -2,13 +2,15 @@
 CV Router - FastAPI Routes
 """
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
 from typing import Optional
 import logging
+import uuid
 from datetime import datetime, timezone
 
 from .models import CVWorker, CameraStream, Frame, StreamType, RouterMetrics
 from .router_engine import CVRouterEngine
+from .frame_transport import FramePacket
 
 logger = logging.getLogger(__name__)
 
@@ -152,10 +154,47 @@ async def ingest_frame(frame: Frame):
         frame: Video frame data
     """
     engine = get_router_engine()
-    await engine._on_frame_received(frame)
+    await engine._on_frame_received(FramePacket.from_frame(frame))
     return {"success": True, "frame_id": frame.frame_id}
 
 
+@cv_router_api.post("/ingest_frame/raw")
+async def ingest_frame_raw(
+    request: Request,
+    camera_id: str,
+    timestamp_ms: int,
+    sequence_num: int,
+    width: int = 1920,
+    height: int = 1080,
+    format: str = "jpeg",
+    camera_angle: float = 0.0,
+    is_keyframe: bool = True
+):
+    """
+    Ingest single frame as a raw binary body (no base64)
+    
+    Args:
+        camera_id: Camera identifier
+        timestamp_ms: Capture timestamp
+        sequence_num: Frame sequence number
+    """
+    engine = get_router_engine()
+    packet = FramePacket(
+        frame_id=str(uuid.uuid4()),
+        camera_id=camera_id,
+        timestamp_ms=timestamp_ms,
+        sequence_num=sequence_num,
+        payload=await request.body(),
+        width=width,
+        height=height,
+        format=format,
+        camera_angle=camera_angle,
+        is_keyframe=is_keyframe
+    )
+    await engine._on_frame_received(packet)
+    return {"success": True, "frame_id": packet.frame_id}
+
+
 @cv_router_api.post("/route_frame")
 async def route_frame(frame_id: str):
     """
@@ -8,8 +8,9 @@ from typing import Dict, Callable, Optional
 import logging
 from datetime import datetime, timezone
 import random
-import base64
-from .models import CameraStream, Frame, StreamType
+import uuid
+from .models import CameraStream, StreamType
+from .frame_transport import FramePacket
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +18,9 @@ logger = logging.getLogger(__name__)
 class StreamIngestor:
     """Ingest video streams from multiple cameras"""
     
-    def __init__(self):
+    def __init__(self, keyframe_interval: int = 30):
         self.streams: Dict[str, CameraStream] = {}
+        self.keyframe_interval = keyframe_interval
         self.frame_callback: Optional[Callable] = None
         self.ingestion_tasks: Dict[str, asyncio.Task] = {}
     
@@ -101,23 +103,20 @@ class StreamIngestor:
             logger.error(f"Stream ingestion error for {stream.camera_id}: {e}")
             stream.active = False
     
-    async def _generate_mock_frame(self, stream: CameraStream, sequence_num: int) -> Frame:
-        """Generate mock frame for testing"""
-        # Create fake frame data (small base64 string)
-        fake_data = base64.b64encode(b"mock_frame_data_" + str(sequence_num).encode()).decode()
-        
-        frame = Frame(
+    async def _generate_mock_frame(self, stream: CameraStream, sequence_num: int) -> FramePacket:
+        """Generate mock frame for testing (raw bytes payload)"""
+        return FramePacket(
+            frame_id=str(uuid.uuid4()),
             camera_id=stream.camera_id,
             timestamp_ms=int(datetime.now(timezone.utc).timestamp() * 1000),
-            data=fake_data,
+            sequence_num=sequence_num,
+            payload=b"mock_frame_data_" + str(sequence_num).encode(),
             width=1920,
             height=1080,
             format="jpeg",
-            sequence_num=sequence_num,
-            camera_angle=random.uniform(0, 360)
+            camera_angle=random.uniform(0, 360),
+            is_keyframe=sequence_num % self.keyframe_interval == 0
         )
-        
-        return frame
     
     def get_stream_stats(self) -> Dict:
         """Get statistics for all streams"""
@@ -0,0 +1,102 @@
+"""
+CV Router - Stub Worker
+Minimal local CV worker for exercising the HTTP frame transport.
+
+    python -m cv_router.stub_worker --port 9101 --delay-ms 5
+
+Accepts POST /frames (raw binary body + X-* frame headers) and replies with
+{"queue_size", "frames_received", "bytes_received"}.
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+
+class StubWorkerServer(ThreadingHTTPServer):
+    """Threaded HTTP server that records received frames"""
+
+    daemon_threads = True
+
+    def __init__(self, address, delay_ms: float = 0.0):
+        super().__init__(address, _StubWorkerHandler)
+        self.delay_ms = delay_ms
+        self.frames_received = 0
+        self.bytes_received = 0
+        self.in_flight = 0
+        self.frame_ids: List[str] = []
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _StubWorkerHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        if self.path != "/frames":
+            self.send_error(404)
+            return
+
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server: StubWorkerServer = self.server
+        with server.lock:
+            server.in_flight += 1
+
+        if server.delay_ms:
+            time.sleep(server.delay_ms / 1000.0)
+
+        with server.lock:
+            server.in_flight -= 1
+            server.frames_received += 1
+            server.bytes_received += len(body)
+            server.frame_ids.append(self.headers.get("X-Frame-Id", ""))
+            reply = json.dumps({
+                "queue_size": server.in_flight,
+                "frames_received": server.frames_received,
+                "bytes_received": server.bytes_received
+            }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_worker(host: str = "127.0.0.1", port: int = 0,
+                      delay_ms: float = 0.0) -> StubWorkerServer:
+    """Start a stub worker on a background thread (port 0 = ephemeral)"""
+    server = StubWorkerServer((host, port), delay_ms=delay_ms)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Local stub CV worker")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9101)
+    parser.add_argument("--delay-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    server = StubWorkerServer((args.host, args.port), delay_ms=args.delay_ms)
+    print(f"Stub CV worker listening on {server.endpoint}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,190 @@
 """
 CV Router - Worker Manager
 Manage CV worker pool with health monitoring and load balancing
+
+Selection reads the top of an indexed min-heap of load scores. Scores are
+recomputed only when a worker's metrics or status change, so routing a
+frame is O(1) and allocates nothing.
 """
 
 import asyncio
-from typing import Dict, Optional, List
-from datetime import datetime, timezone, timedelta
+import time
+from array import array
+from typing import Dict, Optional, List, Tuple
+from datetime import datetime, timezone
 import logging
 from .models import CVWorker, WorkerStatus, RoutingDecision
 
 logger = logging.getLogger(__name__)
 
 
+def load_score(worker: CVWorker) -> float:
+    """Lower is better: latency + queue_size penalty"""
+    latency_weight = 0.6
+    queue_weight = 0.4
+    return (
+        worker.avg_latency_ms * latency_weight +
+        worker.queue_size * 10 * queue_weight  # 10ms penalty per queued frame
+    )
+
+
+class WorkerLoadHeap:
+    """Indexed min-heap of (load_score, registration_seq, worker_id)"""
+    
+    def __init__(self):
+        self.heap: List[list] = []
+        self.position: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.heap)
+    
+    def __contains__(self, worker_id: str) -> bool:
+        return worker_id in self.position
+    
+    def peek(self) -> Optional[Tuple[float, str]]:
+        """Lowest (score, worker_id) without removing it"""
+        if not self.heap:
+            return None
+        entry = self.heap[0]
+        return entry[0], entry[2]
+    
+    def push(self, worker_id: str, score: float, seq: int):
+        """Insert or update a worker's score"""
+        index = self.position.get(worker_id)
+        if index is not None:
+            self.update(worker_id, score)
+            return
+        self.heap.append([score, seq, worker_id])
+        self.position[worker_id] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+    
+    def update(self, worker_id: str, score: float):
+        index = self.position.get(worker_id)
+        if index is None:
+            return
+        entry = self.heap[index]
+        old_score = entry[0]
+        entry[0] = score
+        if score < old_score:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+    
+    def remove(self, worker_id: str):
+        index = self.position.pop(worker_id, None)
+        if index is None:
+            return
+        last = self.heap.pop()
+        if index < len(self.heap):
+            self.heap[index] = last
+            self.position[last[2]] = index
+            self._sift_up(index)
+            self._sift_down(self.position[last[2]])
+    
+    def _less(self, a: list, b: list) -> bool:
+        return (a[0], a[1]) < (b[0], b[1])
+    
+    def _swap(self, i: int, j: int):
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.position[heap[i][2]] = i
+        self.position[heap[j][2]] = j
+    
+    def _sift_up(self, index: int):
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not self._less(self.heap[index], self.heap[parent]):
+                break
+            self._swap(index, parent)
+            index = parent
+    
+    def _sift_down(self, index: int):
+        size = len(self.heap)
+        while True:
+            smallest = index
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < size and self._less(self.heap[child], self.heap[smallest]):
+                    smallest = child
+            if smallest == index:
+                break
+            self._swap(index, smallest)
+            index = smallest
+
+
+class RoutingHistory:
+    """
+    Fixed-size ring buffer of routing decisions
+    
+    Stores primitive columns (preallocated lists/arrays) instead of one
+    RoutingDecision model per frame; decisions are materialized on read.
+    """
+    
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.frame_ids: List[Optional[str]] = [None] * capacity
+        self.worker_ids: List[Optional[str]] = [None] * capacity
+        self.route_times = array("d", bytes(8 * capacity))
+        self.load_scores = array("d", bytes(8 * capacity))
+        self.latencies = array("d", bytes(8 * capacity))
+        self.queue_sizes = array("l", [0]) * capacity
+        self.total = 0
+    
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+    
+    def record(self, frame_id: str, worker_id: str, score: float, latency_ms: float, queue_size: int):
+        i = self.total % self.capacity
+        self.frame_ids[i] = frame_id
+        self.worker_ids[i] = worker_id
+        self.route_times[i] = time.time()
+        self.load_scores[i] = score
+        self.latencies[i] = latency_ms
+        self.queue_sizes[i] = queue_size
+        self.total += 1
+    
+    def recent(self, limit: Optional[int] = None) -> List[RoutingDecision]:
+        """Most recent decisions, oldest first"""
+        count = len(self)
+        if limit is not None:
+            count = min(count, limit)
+        decisions = []
+        for n in range(self.total - count, self.total):
+            i = n % self.capacity
+            decisions.append(RoutingDecision(
+                frame_id=self.frame_ids[i],
+                worker_id=self.worker_ids[i],
+                route_time=datetime.fromtimestamp(self.route_times[i], tz=timezone.utc),
+                worker_load_score=self.load_scores[i],
+                worker_latency=self.latencies[i],
+                worker_queue_size=self.queue_sizes[i]
+            ))
+        return decisions
+
+
 class WorkerManager:
     """Manage CV worker pool"""
     
-    def __init__(self, health_check_interval: int = 10):
+    def __init__(self, health_check_interval: int = 10, history_size: int = 1000):
         self.workers: Dict[str, CVWorker] = {}
         self.health_check_interval = health_check_interval
-        self.routing_history: List[RoutingDecision] = []
+        self.routing_history = RoutingHistory(history_size)
         
-        # Start health monitor
-        asyncio.create_task(self._health_monitor())
+        # Selection index: one heap per routable status
+        self.healthy_heap = WorkerLoadHeap()
+        self.degraded_heap = WorkerLoadHeap()
+        self._registration_seq: Dict[str, int] = {}
+        self._next_seq = 0
+        
+        # Health monitor, started from the app's startup hook
+        self._monitor_task: Optional[asyncio.Task] = None
     
     async def register_worker(self, endpoint: str) -> CVWorker:
         """Register new CV worker"""
         worker = CVWorker(endpoint=endpoint)
         self.workers[worker.worker_id] = worker
+        self._registration_seq[worker.worker_id] = self._next_seq
+        self._next_seq += 1
+        self._reindex(worker)
         
         logger.info(f"Worker registered: {worker.worker_id} at {endpoint}")
         return worker
@@ -35,6 +193,9 @@ class WorkerManager:
         """Remove worker from pool"""
         if worker_id in self.workers:
             del self.workers[worker_id]
+            self.healthy_heap.remove(worker_id)
+            self.degraded_heap.remove(worker_id)
+            self._registration_seq.pop(worker_id, None)
             logger.info(f"Worker deregistered: {worker_id}")
             return True
         return False
@@ -59,6 +220,7 @@ class WorkerManager:
         worker.queue_size = queue_size
         worker.frames_processed += 1
         worker.last_heartbeat = datetime.now(timezone.utc)
+        self._reindex(worker)
     
     async def report_worker_error(self, worker_id: str):
         """Report worker error"""
@@ -70,82 +232,101 @@ class WorkerManager:
             error_rate = worker.errors / max(worker.frames_processed, 1)
             
             if error_rate > 0.1:  # >10% error rate
-                worker.status = WorkerStatus.UNHEALTHY
+                self.set_worker_status(worker, WorkerStatus.UNHEALTHY)
                 logger.warning(f"Worker {worker_id} marked UNHEALTHY (error rate: {error_rate:.2%})")
     
+    def set_worker_status(self, worker: CVWorker, status: WorkerStatus):
+        """Change a worker's status and move it between selection heaps"""
+        worker.status = status
+        self._reindex(worker)
+    
+    def _reindex(self, worker: CVWorker):
+        """Place a worker in the heap matching its status with a fresh score"""
+        worker_id = worker.worker_id
+        seq = self._registration_seq.get(worker_id, 0)
+        if worker.status == WorkerStatus.HEALTHY:
+            self.degraded_heap.remove(worker_id)
+            self.healthy_heap.push(worker_id, load_score(worker), seq)
+        elif worker.status == WorkerStatus.DEGRADED:
+            self.healthy_heap.remove(worker_id)
+            self.degraded_heap.push(worker_id, load_score(worker), seq)
+        else:
+            self.healthy_heap.remove(worker_id)
+            self.degraded_heap.remove(worker_id)
+    
+    def _peek(self, heap: WorkerLoadHeap, status: WorkerStatus) -> Optional[Tuple[float, CVWorker]]:
+        """
+        Top of a heap, lazily re-filing workers whose status was changed
+        directly on the model instead of through set_worker_status
+        """
+        while True:
+            top = heap.peek()
+            if top is None:
+                return None
+            score, worker_id = top
+            worker = self.workers[worker_id]
+            if worker.status == status:
+                return score, worker
+            self._reindex(worker)
+    
     def select_worker(self, frame_id: str) -> Optional[CVWorker]:
         """Select best worker for frame using load balancing"""
-        healthy_workers = [
-            w for w in self.workers.values()
-            if w.status == WorkerStatus.HEALTHY
-        ]
+        top = self._peek(self.healthy_heap, WorkerStatus.HEALTHY)
         
-        if not healthy_workers:
+        if top is None:
             # Try degraded workers as fallback
-            healthy_workers = [
-                w for w in self.workers.values()
-                if w.status == WorkerStatus.DEGRADED
-            ]
+            top = self._peek(self.degraded_heap, WorkerStatus.DEGRADED)
         
-        if not healthy_workers:
+        if top is None:
             logger.error("No healthy workers available")
             return None
         
-        # Calculate load score for each worker
-        # Lower is better: latency + queue_size penalty
-        def load_score(worker: CVWorker) -> float:
-            latency_weight = 0.6
-            queue_weight = 0.4
-            return (
-                worker.avg_latency_ms * latency_weight +
-                worker.queue_size * 10 * queue_weight  # 10ms penalty per queued frame
-            )
-        
-        # Select worker with lowest load
-        selected_worker = min(healthy_workers, key=load_score)
+        score, selected_worker = top
         
         # Record routing decision
-        decision = RoutingDecision(
-            frame_id=frame_id,
-            worker_id=selected_worker.worker_id,
-            worker_load_score=load_score(selected_worker),
-            worker_latency=selected_worker.avg_latency_ms,
-            worker_queue_size=selected_worker.queue_size
+        self.routing_history.record(
+            frame_id,
+            selected_worker.worker_id,
+            score,
+            selected_worker.avg_latency_ms,
+            selected_worker.queue_size
         )
-        self.routing_history.append(decision)
-        
-        # Keep only recent history
-        if len(self.routing_history) > 1000:
-            self.routing_history = self.routing_history[-1000:]
-        
-        logger.debug(f"Routed frame {frame_id} to worker {selected_worker.worker_id} (load: {load_score(selected_worker):.2f})")
         return selected_worker
     
+    def start(self):
+        """Start the health monitor on the running loop"""
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = asyncio.get_running_loop().create_task(self._health_monitor())
+    
+    async def close(self):
+        if self._monitor_task is not None and not self._monitor_task.done():
+            self._monitor_task.cancel()
+    
     async def _health_monitor(self):
         """Background task to monitor worker health"""
         while True:
             await asyncio.sleep(self.health_check_interval)
             
             now = datetime.now(timezone.utc)
-            for worker in self.workers.values():
+            for worker in list(self.workers.values()):
                 # Check heartbeat
                 time_since_heartbeat = (now - worker.last_heartbeat).total_seconds()
                 
                 if time_since_heartbeat > 30:
-                    worker.status = WorkerStatus.OFFLINE
+                    self.set_worker_status(worker, WorkerStatus.OFFLINE)
                     logger.warning(f"Worker {worker.worker_id} marked OFFLINE (no heartbeat for {time_since_heartbeat:.0f}s)")
                 
                 elif time_since_heartbeat > 15:
-                    worker.status = WorkerStatus.DEGRADED
+                    self.set_worker_status(worker, WorkerStatus.DEGRADED)
                 
                 # Check latency
                 elif worker.avg_latency_ms > 200:  # >200ms latency
-                    worker.status = WorkerStatus.DEGRADED
+                    self.set_worker_status(worker, WorkerStatus.DEGRADED)
                     logger.warning(f"Worker {worker.worker_id} marked DEGRADED (high latency: {worker.avg_latency_ms:.0f}ms)")
                 
                 elif worker.status != WorkerStatus.HEALTHY:
                     # Recover if metrics improved
-                    worker.status = WorkerStatus.HEALTHY
+                    self.set_worker_status(worker, WorkerStatus.HEALTHY)
                     logger.info(f"Worker {worker.worker_id} recovered to HEALTHY")
     
     def get_metrics(self) -> Dict:
@@ -162,5 +343,6 @@ class WorkerManager:
             "offline_workers": status_counts[WorkerStatus.OFFLINE],
             "avg_latency_ms": sum(w.avg_latency_ms for w in self.workers.values()) / len(self.workers) if self.workers else 0,
             "total_frames_processed": sum(w.frames_processed for w in self.workers.values()),
-            "total_errors": sum(w.errors for w in self.workers.values())
+            "total_errors": sum(w.errors for w in self.workers.values()),
+            "routing_decisions": self.routing_history.total
         }
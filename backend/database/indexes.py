@@ -46,6 +46,33 @@ class IndexManager:
         # Career stats indexes
         results['career_stats'] = await self._create_career_stats_indexes()
         
+        # ICVSS event buckets indexes
+        results['icvss_event_buckets'] = await self._create_icvss_event_buckets_indexes()
+        
+        # Audit log indexes
+        results['audit_logs'] = await self._create_audit_logs_indexes()
+        
+        # Blockchain record indexes
+        results['blockchain_records'] = await self._create_blockchain_records_indexes()
+        
+        # Heartbeat indexes (TTL retention)
+        results['heartbeats'] = await self._create_heartbeats_indexes()
+        
+        # Fan vote indexes
+        results['fan_scores'] = await self._create_fan_scores_indexes()
+        results['fan_users'] = await self._create_fan_users_indexes()
+        results['judge_leaderboard'] = await self._create_judge_leaderboard_indexes()
+        results['stats_rollups'] = await self._create_stats_rollups_indexes()
+        
+        # Fight finalization indexes
+        results['fight_live_stats'] = await self._create_fight_live_stats_indexes()
+        results['finalization_jobs'] = await self._create_finalization_jobs_indexes()
+        
+        # Judge variance summary indexes
+        results['round_variance'] = await self._create_round_variance_indexes()
+        results['discrepancy_flags'] = await self._create_discrepancy_flags_indexes()
+        results['supervisor_dashboard'] = await self._create_supervisor_dashboard_indexes()
+        
         logger.info(f"✅ All indexes created successfully")
         return results
     
@@ -318,6 +345,323 @@ class IndexManager:
         
         return indexes
     
+    async def _create_icvss_event_buckets_indexes(self) -> List[str]:
+        """Create indexes for icvss_event_buckets table"""
+        
+        indexes = []
+        
+        try:
+            # Unique bucket address; also serves in-order bucket reads per round
+            await self.db.icvss_event_buckets.create_index(
+                [("round_id", ASCENDING), ("kind", ASCENDING), ("bucket_index", ASCENDING)],
+                unique=True,
+                name="idx_icvss_buckets_round_kind_index"
+            )
+            indexes.append("idx_icvss_buckets_round_kind_index")
+            
+            # Index on bout_id for archiving a whole bout
+            await self.db.icvss_event_buckets.create_index(
+                [("bout_id", ASCENDING)],
+                name="idx_icvss_buckets_bout_id"
+            )
+            indexes.append("idx_icvss_buckets_bout_id")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for icvss_event_buckets")
+        
+        except Exception as e:
+            logger.error(f"Error creating icvss_event_buckets indexes: {e}")
+        
+        return indexes
+    
+    async def _create_audit_logs_indexes(self) -> List[str]:
+        """Create indexes for audit_logs table"""
+        
+        indexes = []
+        
+        try:
+            # Export cursor order and resume position: (timestamp, id)
+            await self.db.audit_logs.create_index(
+                [("timestamp", ASCENDING), ("id", ASCENDING)],
+                name="idx_audit_logs_timestamp_id"
+            )
+            indexes.append("idx_audit_logs_timestamp_id")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for audit_logs")
+        
+        except Exception as e:
+            logger.error(f"Error creating audit_logs indexes: {e}")
+        
+        return indexes
+    
+    async def _create_blockchain_records_indexes(self) -> List[str]:
+        """Create indexes for blockchain_records table"""
+        
+        indexes = []
+        
+        try:
+            # Chain verification streams a bout's blocks in block order
+            await self.db.blockchain_records.create_index(
+                [("bout_id", ASCENDING), ("block_number", ASCENDING)],
+                name="idx_blockchain_bout_block"
+            )
+            indexes.append("idx_blockchain_bout_block")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for blockchain_records")
+        
+        except Exception as e:
+            logger.error(f"Error creating blockchain_records indexes: {e}")
+        
+        return indexes
+    
+    async def _create_heartbeats_indexes(self) -> List[str]:
+        """Create indexes for heartbeats table"""
+        from heartbeat_monitor.monitor_engine import HEARTBEAT_RETENTION_SEC
+        
+        indexes = []
+        
+        try:
+            # TTL retention: Mongo expires heartbeats by their received_at datetime
+            await self.db.heartbeats.create_index(
+                [("received_at", ASCENDING)],
+                expireAfterSeconds=HEARTBEAT_RETENTION_SEC,
+                name="idx_heartbeats_received_at_ttl"
+            )
+            indexes.append("idx_heartbeats_received_at_ttl")
+            
+            # Per-service history, newest first
+            await self.db.heartbeats.create_index(
+                [("service_name", ASCENDING), ("received_at", DESCENDING)],
+                name="idx_heartbeats_service_received_at"
+            )
+            indexes.append("idx_heartbeats_service_received_at")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for heartbeats")
+        
+        except Exception as e:
+            logger.error(f"Error creating heartbeats indexes: {e}")
+        
+        return indexes
+    
+    async def _create_fan_scores_indexes(self) -> List[str]:
+        """Create indexes for fan_scores table"""
+        
+        indexes = []
+        
+        try:
+            # One vote per voter per round; batched vote upserts match on this key.
+            # Partial so legacy rows without voter_key don't block the build.
+            await self.db.fan_scores.create_index(
+                [("bout_id", ASCENDING), ("round_number", ASCENDING), ("voter_key", ASCENDING)],
+                unique=True,
+                partialFilterExpression={"voter_key": {"$exists": True}},
+                name="idx_fan_scores_bout_round_voter"
+            )
+            indexes.append("idx_fan_scores_bout_round_voter")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for fan_scores")
+        
+        except Exception as e:
+            logger.error(f"Error creating fan_scores indexes: {e}")
+        
+        return indexes
+    
+    async def _create_fan_users_indexes(self) -> List[str]:
+        """Create indexes for fan_users table"""
+        
+        indexes = []
+        
+        try:
+            # Accuracy settlement updates fans by fan_id
+            await self.db.fan_users.create_index(
+                [("fan_id", ASCENDING)],
+                unique=True,
+                name="idx_fan_users_fan_id"
+            )
+            indexes.append("idx_fan_users_fan_id")
+            
+            # Incremental leaderboard sync across workers
+            await self.db.fan_users.create_index(
+                [("accuracy_updated_at", ASCENDING)],
+                sparse=True,
+                name="idx_fan_users_accuracy_updated"
+            )
+            indexes.append("idx_fan_users_accuracy_updated")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for fan_users")
+        
+        except Exception as e:
+            logger.error(f"Error creating fan_users indexes: {e}")
+        
+        return indexes
+    
+    async def _create_judge_leaderboard_indexes(self) -> List[str]:
+        """Create indexes for judge_leaderboard table"""
+        
+        indexes = []
+        
+        try:
+            # One materialized row per judge; submissions $inc it by judgeId
+            await self.db.judge_leaderboard.create_index(
+                [("judgeId", ASCENDING)],
+                unique=True,
+                name="idx_judge_leaderboard_judge"
+            )
+            indexes.append("idx_judge_leaderboard_judge")
+            
+            # Incremental leaderboard sync across workers
+            await self.db.judge_leaderboard.create_index(
+                [("updated_at", ASCENDING)],
+                name="idx_judge_leaderboard_updated"
+            )
+            indexes.append("idx_judge_leaderboard_updated")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for judge_leaderboard")
+        
+        except Exception as e:
+            logger.error(f"Error creating judge_leaderboard indexes: {e}")
+        
+        return indexes
+    
+    async def _create_stats_rollups_indexes(self) -> List[str]:
+        """Create indexes for stats_rollups table"""
+        
+        indexes = []
+        
+        try:
+            # Browse pages read rollup rows by kind / scope and filters
+            await self.db.stats_rollups.create_index(
+                [("kind", ASCENDING), ("scope", ASCENDING), ("organization_id", ASCENDING), ("sport_type", ASCENDING)],
+                name="idx_stats_rollups_scope"
+            )
+            indexes.append("idx_stats_rollups_scope")
+            
+            # Stale row cleanup after each refresh
+            await self.db.stats_rollups.create_index(
+                [("refreshed_at", ASCENDING)],
+                name="idx_stats_rollups_refreshed"
+            )
+            indexes.append("idx_stats_rollups_refreshed")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for stats_rollups")
+        
+        except Exception as e:
+            logger.error(f"Error creating stats_rollups indexes: {e}")
+        
+        return indexes
+    
+    async def _create_fight_live_stats_indexes(self) -> List[str]:
+        """Create indexes for fight_live_stats table"""
+        
+        indexes = []
+        
+        try:
+            # One counter document per corner; every event increments it
+            await self.db.fight_live_stats.create_index(
+                [("bout_id", ASCENDING), ("fighter", ASCENDING)],
+                unique=True,
+                name="idx_fight_live_stats_bout_fighter"
+            )
+            indexes.append("idx_fight_live_stats_bout_fighter")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for fight_live_stats")
+        
+        except Exception as e:
+            logger.error(f"Error creating fight_live_stats indexes: {e}")
+        
+        return indexes
+    
+    async def _create_finalization_jobs_indexes(self) -> List[str]:
+        """Create indexes for finalization_jobs table"""
+        
+        indexes = []
+        
+        try:
+            # Status updates by job_id
+            await self.db.finalization_jobs.create_index(
+                [("job_id", ASCENDING)],
+                unique=True,
+                name="idx_finalization_jobs_job_id"
+            )
+            indexes.append("idx_finalization_jobs_job_id")
+            
+            # Unfinished jobs resumed on startup, oldest first
+            await self.db.finalization_jobs.create_index(
+                [("status", ASCENDING), ("created_at", ASCENDING)],
+                name="idx_finalization_jobs_status"
+            )
+            indexes.append("idx_finalization_jobs_status")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for finalization_jobs")
+        
+        except Exception as e:
+            logger.error(f"Error creating finalization_jobs indexes: {e}")
+        
+        return indexes
+    
+    async def _create_round_variance_indexes(self) -> List[str]:
+        """Create indexes for round_variance table"""
+        
+        indexes = []
+        
+        try:
+            # One summary per bout + round; dashboard reads a bout's rounds
+            await self.db.round_variance.create_index(
+                [("bout_id", ASCENDING), ("round_num", ASCENDING)],
+                unique=True,
+                name="idx_round_variance_bout_round"
+            )
+            indexes.append("idx_round_variance_bout_round")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for round_variance")
+        
+        except Exception as e:
+            logger.error(f"Error creating round_variance indexes: {e}")
+        
+        return indexes
+    
+    async def _create_discrepancy_flags_indexes(self) -> List[str]:
+        """Create indexes for discrepancy_flags table"""
+        
+        indexes = []
+        
+        try:
+            # A rule flags a round once; manually created flags are not limited
+            await self.db.discrepancy_flags.create_index(
+                [("bout_id", ASCENDING), ("round_num", ASCENDING), ("flag_type", ASCENDING)],
+                unique=True,
+                partialFilterExpression={"source": "rules"},
+                name="idx_discrepancy_flags_rule"
+            )
+            indexes.append("idx_discrepancy_flags_rule")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for discrepancy_flags")
+        
+        except Exception as e:
+            logger.error(f"Error creating discrepancy_flags indexes: {e}")
+        
+        return indexes
+    
+    async def _create_supervisor_dashboard_indexes(self) -> List[str]:
+        """Create indexes for supervisor_dashboard table"""
+        
+        indexes = []
+        
+        try:
+            # One projection per bout, updated on every event / note / lock
+            await self.db.supervisor_dashboard.create_index(
+                [("bout_id", ASCENDING)],
+                unique=True,
+                name="idx_supervisor_dashboard_bout"
+            )
+            indexes.append("idx_supervisor_dashboard_bout")
+            
+            logger.info(f"✅ Created {len(indexes)} indexes for supervisor_dashboard")
+        
+        except Exception as e:
+            logger.error(f"Error creating supervisor_dashboard indexes: {e}")
+        
+        return indexes
+    
     async def verify_indexes(self) -> Dict[str, List[str]]:
         """
         Verify all indexes exist
@@ -328,7 +672,7 @@ class IndexManager:
         
         results = {}
         
-        collections = ['fighters', 'events', 'round_stats', 'fight_stats', 'career_stats']
+        collections = ['fighters', 'events', 'round_stats', 'fight_stats', 'career_stats', 'icvss_event_buckets', 'audit_logs', 'blockchain_records', 'heartbeats', 'fan_scores', 'fan_users', 'judge_leaderboard', 'stats_rollups', 'fight_live_stats', 'finalization_jobs', 'round_variance', 'discrepancy_flags', 'supervisor_dashboard']
         
         for collection_name in collections:
             try:
@@ -358,7 +702,7 @@ class IndexManager:
         
         logger.warning("⚠️ Dropping all indexes...")
         
-        collections = ['fighters', 'events', 'round_stats', 'fight_stats', 'career_stats']
+        collections = ['fighters', 'events', 'round_stats', 'fight_stats', 'career_stats', 'icvss_event_buckets', 'audit_logs', 'blockchain_records', 'heartbeats', 'fan_scores', 'fan_users', 'judge_leaderboard', 'stats_rollups', 'fight_live_stats', 'finalization_jobs', 'round_variance', 'discrepancy_flags', 'supervisor_dashboard']
         
         for collection_name in collections:
             try:
@@ -0,0 +1,350 @@
+"""
+Discrepancy Rules
+
+Every discrepancy and judge-variance rule, evaluated in one pass over an
+in-memory RoundSnapshot. Flags produced by a pass are written with a single
+unordered insert_many; the unique index on (bout_id, round_num, flag_type)
+over rule flags turns a repeated flag into a no-op.
+
+The per-round judge variance summary (round_variance, one document per
+bout + round) is recomputed whenever a judge locks or unlocks a score, so
+/variance/detect and the supervisor dashboard read it instead of
+re-fetching every judge score. Each summary carries a version; a recompute
+only replaces the version it started from, and starts over from
+judge_scores when another lock got there first.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+# A judge is an outlier, and a round shows variance, beyond this many points
+VARIANCE_THRESHOLD = 2
+
+DUPLICATE_KEY = 11000
+
+# Attempts at replacing a round's summary before giving up on the race
+MAX_VARIANCE_ATTEMPTS = 5
+
+
+@dataclass
+class RoundSnapshot:
+    """
+    What the rules look at for one round
+    
+    Score fields are set when the round was scored by the engine
+    (/calculate-score); variance (and the summary it replaced) when judges
+    lock their cards. Rules whose inputs are missing are skipped.
+    """
+    bout_id: str
+    round_num: int
+    delta: Optional[float] = None
+    card: Optional[str] = None
+    winner: Optional[str] = None
+    draw: bool = False
+    tie_breaker: Optional[str] = None
+    to_108: bool = False
+    gates: Dict[str, bool] = field(default_factory=dict)
+    event_count: Optional[int] = None
+    variance: Optional[Dict[str, Any]] = None
+    previous_variance: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_round_score(cls, bout_id: str, round_num: int, round_score, events: list) -> "RoundSnapshot":
+        """Snapshot of a RoundScore from the scoring engine"""
+        reasons = round_score.reasons
+        gates = reasons.gates_winner
+        return cls(
+            bout_id=bout_id,
+            round_num=round_num,
+            delta=round_score.score_gap,
+            card=round_score.card,
+            winner=round_score.winner,
+            draw=bool(reasons.draw),
+            tie_breaker=reasons.tie_breaker,
+            to_108=bool(reasons.to_108),
+            gates={
+                "finish_threat": gates.finish_threat,
+                "control_dom": gates.control_dom,
+                "multi_cat_dom": gates.multi_cat_dom
+            },
+            event_count=len(events)
+        )
+
+
+def variance_summary(bout_id: str, round_num: int, judge_scores: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Judge variance for one round, in a single pass over its judge scores
+    
+    Returns:
+        The round_variance document (scores included, without _id)
+    """
+    scores = [{k: v for k, v in s.items() if k != "_id"} for s in judge_scores]
+    f1 = [s.get("fighter1_score", 10) for s in scores]
+    f2 = [s.get("fighter2_score", 10) for s in scores]
+    judge_count = len(scores)
+    locked_count = sum(1 for s in scores if s.get("locked", False))
+    
+    summary = {
+        "bout_id": bout_id,
+        "round_num": round_num,
+        "judge_count": judge_count,
+        "locked_count": locked_count,
+        "all_locked": all(s.get("locked", False) for s in scores),
+        "scores": scores,
+        "fighter1_min": min(f1) if f1 else None,
+        "fighter1_max": max(f1) if f1 else None,
+        "fighter2_min": min(f2) if f2 else None,
+        "fighter2_max": max(f2) if f2 else None,
+        "fighter1_variance": 0,
+        "fighter2_variance": 0,
+        "max_variance": 0,
+        "severity": "low",
+        "variance_detected": False,
+        "outliers": [],
+        "anomaly": None,
+        "updated_at": datetime.now(timezone.utc).isoformat()
+    }
+    if judge_count < 2:
+        return summary
+    
+    f1_low, f1_high, f2_low, f2_high = min(f1), max(f1), min(f2), max(f2)
+    f1_variance = f1_high - f1_low
+    f2_variance = f2_high - f2_low
+    max_variance = max(f1_variance, f2_variance)
+    
+    # More than VARIANCE_THRESHOLD from some other judge == that far from the
+    # round's min or max
+    outliers = [
+        {
+            "judge_id": s.get("judge_id"),
+            "judge_name": s.get("judge_name"),
+            "card": s.get("card"),
+            "fighter1_score": a,
+            "fighter2_score": b
+        }
+        for s, a, b in zip(scores, f1, f2)
+        if max(a - f1_low, f1_high - a, b - f2_low, f2_high - b) > VARIANCE_THRESHOLD
+    ]
+    
+    severity = "low"
+    if max_variance > 3:
+        severity = "critical"
+    elif max_variance > 2:
+        severity = "high"
+    elif max_variance > 1:
+        severity = "medium"
+    
+    summary.update({
+        "fighter1_variance": f1_variance,
+        "fighter2_variance": f2_variance,
+        "max_variance": max_variance,
+        "severity": severity,
+        "variance_detected": max_variance > VARIANCE_THRESHOLD,
+        "outliers": outliers
+    })
+    
+    # Supervisor dashboard anomaly (fighter1 score spread)
+    if f1_variance > VARIANCE_THRESHOLD:
+        summary["anomaly"] = {
+            "round": round_num,
+            "type": "variance",
+            "severity": "high" if f1_variance > 3 else "medium",
+            "message": f"High score variance ({f1_variance} points) in Round {round_num}"
+        }
+    return summary
+
+
+# ============================================================================
+# Rules: each returns (flag_type, severity, description, context) or None
+# ============================================================================
+
+def _boundary_10_8(s: RoundSnapshot):
+    if s.delta is not None and abs(s.delta - 600) < 50:
+        return ("boundary_10_9_vs_10_8", "medium",
+                f"Score is {s.delta:.0f} points, very close to 10-8 threshold (600)",
+                {"delta": s.delta, "threshold": 600, "difference_from_threshold": abs(s.delta - 600), "card": s.card})
+
+
+def _boundary_10_7(s: RoundSnapshot):
+    if s.delta is not None and abs(s.delta - 900) < 50:
+        return ("boundary_10_8_vs_10_7", "high",
+                f"Score is {s.delta:.0f} points, very close to 10-7 threshold (900)",
+                {"delta": s.delta, "threshold": 900, "difference_from_threshold": abs(s.delta - 900), "card": s.card})
+
+
+def _tie_breaker(s: RoundSnapshot):
+    if s.tie_breaker:
+        return ("tie_breaker_used", "medium",
+                f"Round decided by tie-breaker: {s.tie_breaker}",
+                {"tie_breaker": s.tie_breaker, "delta": s.delta, "card": s.card})
+
+
+def _very_close(s: RoundSnapshot):
+    if s.delta is not None and s.delta < 100 and not s.draw:
+        return ("very_close_decision", "low",
+                f"Extremely close round with only {s.delta:.0f} point difference",
+                {"delta": s.delta, "card": s.card, "winner": s.winner})
+
+
+def _10_8_without_gate(s: RoundSnapshot):
+    if s.to_108 and not any(s.gates.values()):
+        return ("10_8_without_gate", "high",
+                "10-8 score given without any standard dominance gates triggered",
+                {"delta": s.delta, "card": s.card, "gates": dict(s.gates)})
+
+
+def _low_activity(s: RoundSnapshot):
+    if s.event_count is not None and s.event_count < 5:
+        return ("low_activity", "low",
+                f"Very low activity round with only {s.event_count} logged events",
+                {"event_count": s.event_count, "card": s.card})
+
+
+def _judge_variance(s: RoundSnapshot):
+    # Flag once, when the round first crosses the variance threshold
+    if not s.variance or not s.variance["variance_detected"]:
+        return None
+    if s.previous_variance and s.previous_variance.get("variance_detected"):
+        return None
+    v = s.variance
+    return ("judge_variance", "high" if v["severity"] in ("high", "critical") else "medium",
+            f"Judge scores differ by {v['max_variance']} points in Round {s.round_num}",
+            {"max_variance": v["max_variance"], "judge_count": v["judge_count"],
+             "outliers": [o["judge_id"] for o in v["outliers"]]})
+
+
+RULES: List[Callable[[RoundSnapshot], Optional[tuple]]] = [
+    _boundary_10_8,
+    _boundary_10_7,
+    _tie_breaker,
+    _very_close,
+    _10_8_without_gate,
+    _low_activity,
+    _judge_variance
+]
+
+
+def evaluate_rules(snapshot: RoundSnapshot) -> List[Dict[str, Any]]:
+    """
+    Run every rule over the snapshot
+    
+    Returns:
+        discrepancy_flags documents (same fields as DiscrepancyFlag)
+    """
+    created_at = datetime.now(timezone.utc)
+    flags = []
+    for rule in RULES:
+        hit = rule(snapshot)
+        if hit is None:
+            continue
+        flag_type, severity, description, context = hit
+        flags.append({
+            "id": str(uuid.uuid4()),
+            "bout_id": snapshot.bout_id,
+            "round_num": snapshot.round_num,
+            "flag_type": flag_type,
+            "source": "rules",
+            "severity": severity,
+            "description": description,
+            "context": context,
+            "status": "pending",
+            "created_at": created_at,
+            "resolved_at": None,
+            "resolved_by": None,
+            "resolution_notes": None
+        })
+    return flags
+
+
+class DiscrepancyRuleEngine:
+    """Evaluates rounds and keeps round_variance current"""
+    
+    def __init__(self, db):
+        self.db = db
+    
+    async def flag(self, snapshot: RoundSnapshot) -> List[str]:
+        """
+        Evaluate and store the flags for one snapshot
+        
+        Returns:
+            The flag types created (flags the round already has are skipped)
+        """
+        flags = evaluate_rules(snapshot)
+        if not flags:
+            return []
+        try:
+            await self.db.discrepancy_flags.insert_many(flags, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(err.get("code") != DUPLICATE_KEY for err in errors):
+                raise
+            skipped = {err["index"] for err in errors}
+            flags = [f for i, f in enumerate(flags) if i not in skipped]
+        return [f["flag_type"] for f in flags]
+    
+    async def update_variance(self, bout_id: str, round_num: int) -> Dict[str, Any]:
+        """
+        Recompute a round's variance summary from its judge scores and flag
+        the round if it newly shows variance
+        
+        judge_scores is read after the current summary's version, and the
+        summary is only replaced if that version is still current, so a lock
+        racing this one can't leave an older set of scores behind.
+        
+        Returns:
+            The round_variance document
+        """
+        key = {"bout_id": bout_id, "round_num": round_num}
+        for _ in range(MAX_VARIANCE_ATTEMPTS):
+            previous = await self.db.round_variance.find_one(key, {"_id": 0, "version": 1, "variance_detected": 1})
+            scores = await self.db.judge_scores.find(key, {"_id": 0}).to_list(100)
+            summary = variance_summary(bout_id, round_num, scores)
+            
+            if previous is None:
+                summary["version"] = 1
+                try:
+                    await self.db.round_variance.insert_one(summary)
+                except DuplicateKeyError:
+                    continue
+            else:
+                version = previous.get("version")
+                summary["version"] = (version or 0) + 1
+                result = await self.db.round_variance.replace_one({**key, "version": version}, summary)
+                if result.matched_count == 0:
+                    continue
+            break
+        else:
+            raise RuntimeError(f"round_variance {bout_id} round {round_num} kept changing, not updated")
+        summary.pop("_id", None)
+        
+        try:
+            await self.flag(RoundSnapshot(bout_id, round_num, variance=summary, previous_variance=previous))
+        except Exception as e:
+            logger.error(f"Error flagging judge variance: {e}")
+        return summary
+    
+    async def get_round(self, bout_id: str, round_num: int) -> Dict[str, Any]:
+        summary = await self.db.round_variance.find_one({"bout_id": bout_id, "round_num": round_num}, {"_id": 0})
+        if summary is None:
+            summary = await self.update_variance(bout_id, round_num)
+        return summary
+    
+    async def get_bout(self, bout_id: str) -> List[Dict[str, Any]]:
+        """
+        All round summaries for a bout, by round
+        
+        Bouts scored before round_variance existed are rebuilt from
+        judge_scores once.
+        """
+        summaries = await self.db.round_variance.find({"bout_id": bout_id}, {"_id": 0}).to_list(100)
+        if not summaries:
+            round_nums = await self.db.judge_scores.distinct("round_num", {"bout_id": bout_id})
+            summaries = [await self.update_variance(bout_id, round_num) for round_num in round_nums]
+        return sorted(summaries, key=lambda s: (s["round_num"] is None, s["round_num"] or 0))
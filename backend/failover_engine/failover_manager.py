@@ -41,12 +41,17 @@ class FailoverManager:
         self.failover_history: List[FailoverEvent] = []
         self.alerts = []
         
-        # Start health monitoring (only if event loop is running)
-        try:
-            asyncio.create_task(self._health_monitor())
-        except RuntimeError:
-            # No event loop - tests will handle this manually
-            pass
+        # Health monitoring, started from the app's startup hook
+        self._monitor_task = None
+    
+    def start(self):
+        """Start health monitoring on the running loop"""
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = asyncio.get_running_loop().create_task(self._health_monitor())
+    
+    async def close(self):
+        if self._monitor_task is not None and not self._monitor_task.done():
+            self._monitor_task.cancel()
     
     async def _health_monitor(self):
         """Background health monitoring"""
@@ -0,0 +1,128 @@
+"""
+Fan Accuracy Settlement
+Marks a round's fan scores against the official result in a fixed number of
+server-side operations, whatever the crowd size:
+
+1. One $facet aggregation: round totals, plus per-fan deltas against any
+   earlier settlement (so a corrected official score re-settles cleanly).
+2. One update_many with a conditional $set of is_correct.
+3. One unordered bulk_write of per-fan $inc correct_predictions.
+4. One update_many refreshing the stored accuracy of the round's fans,
+   which the materialized fan leaderboard ranks on.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Tuple
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+# Settlements of the same round on this worker run one at a time, so two
+# concurrent calls can't both read the pre-settlement state.
+# (bout_id, round) -> [lock, settlements holding or waiting]; an entry is
+# discarded when its last settlement finishes.
+_round_locks: Dict[Tuple[str, int], List[Any]] = {}
+
+# Stored fan accuracy (percent, 1 decimal), computed server-side
+ACCURACY_EXPR = {
+    "$cond": [
+        {"$gt": [{"$ifNull": ["$rounds_scored", 0]}, 0]},
+        {"$round": [{"$multiply": [
+            {"$divide": [{"$ifNull": ["$correct_predictions", 0]}, "$rounds_scored"]},
+            100
+        ]}, 1]},
+        0
+    ]
+}
+
+
+@asynccontextmanager
+async def _round_lock(bout_id: str, round_number: int):
+    key = (bout_id, round_number)
+    entry = _round_locks.get(key)
+    if entry is None:
+        entry = _round_locks[key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _round_locks[key]
+
+
+def settlement_pipeline(bout_id: str, round_number: int, official_winner: str) -> list:
+    """$facet pipeline: round totals and per-registered-fan correct deltas"""
+    is_correct = {"$cond": [{"$eq": ["$winner", official_winner]}, 1, 0]}
+    was_correct = {"$cond": [{"$eq": ["$is_correct", True]}, 1, 0]}
+    return [
+        {"$match": {"bout_id": bout_id, "round_number": round_number}},
+        {"$facet": {
+            "totals": [
+                {"$group": {"_id": None, "total": {"$sum": 1}, "correct": {"$sum": is_correct}}}
+            ],
+            "fans": [
+                {"$match": {"fan_id": {"$ne": None}}},
+                {"$group": {
+                    "_id": "$fan_id",
+                    "delta": {"$sum": {"$subtract": [is_correct, was_correct]}}
+                }}
+            ]
+        }}
+    ]
+
+
+async def settle_round(db, bout_id: str, round_number: int, official_winner: str) -> Dict[str, Any]:
+    """
+    Settle fan predictions for one round
+    
+    Args:
+        db: Motor database handle
+        bout_id: Bout identifier
+        round_number: Round number
+        official_winner: Official round winner (RED, BLUE or DRAW)
+    
+    Returns:
+        Totals plus the per-fan correct_predictions deltas that were applied
+    """
+    async with _round_lock(bout_id, round_number):
+        result = await db.fan_scores.aggregate(
+            settlement_pipeline(bout_id, round_number, official_winner)
+        ).to_list(1)
+        facets = result[0] if result else {"totals": [], "fans": []}
+        totals = facets["totals"][0] if facets["totals"] else {"total": 0, "correct": 0}
+        deltas = {fan["_id"]: fan["delta"] for fan in facets["fans"]}
+        
+        await db.fan_scores.update_many(
+            {"bout_id": bout_id, "round_number": round_number},
+            [{"$set": {
+                "is_correct": {"$eq": ["$winner", official_winner]},
+                "official_winner": official_winner
+            }}]
+        )
+        
+        changed = [
+            UpdateOne({"fan_id": fan_id}, {"$inc": {"correct_predictions": delta}})
+            for fan_id, delta in deltas.items() if delta
+        ]
+        if changed:
+            await db.fan_users.bulk_write(changed, ordered=False)
+        
+        # Every fan who scored this round has a new rounds_scored or
+        # correct_predictions since their accuracy was last stored
+        if deltas:
+            await db.fan_users.update_many(
+                {"fan_id": {"$in": list(deltas)}},
+                [{"$set": {"accuracy": ACCURACY_EXPR, "accuracy_updated_at": "$$NOW"}}]
+            )
+    
+    return {
+        "total_scores": totals["total"],
+        "correct_predictions": totals["correct"],
+        "fans_updated": len(deltas),
+        "deltas": deltas
+    }
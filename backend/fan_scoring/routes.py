@@ -10,16 +10,24 @@ from datetime import datetime, timezone
 import uuid
 import logging
 
+from .vote_ingest import FanVoteIngestor, ScoringClosed
+from .accuracy import settle_round
+from leaderboards import FanLeaderboard
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/fan", tags=["Fan Scoring"])
 
 # Database reference - will be set during initialization
 db = None
+ingestor: Optional[FanVoteIngestor] = None
+fan_board: Optional[FanLeaderboard] = None
 
 def init_fan_routes(database):
-    global db
+    global db, ingestor, fan_board
     db = database
+    ingestor = FanVoteIngestor(database)
+    fan_board = FanLeaderboard(database)
     logger.info("✅ Fan Scoring routes initialized")
 
 
@@ -195,6 +203,7 @@ async def set_active_event(event_name: str, event_id: str):
             {"$set": event_doc},
             upsert=True
         )
+        ingestor.events.set(event_doc)
         
         return {"success": True, "message": f"Active event set to: {event_name}"}
     except Exception as e:
@@ -207,19 +216,19 @@ async def open_scoring_window(bout_id: str, round_number: int, duration_seconds:
     """Supervisor: Open scoring window for fans (30 second window after round ends)"""
     try:
         deadline = datetime.now(timezone.utc).timestamp() + duration_seconds
+        window = {
+            "current_bout_id": bout_id,
+            "current_round": round_number,
+            "scoring_open": True,
+            "scoring_deadline": deadline,
+            "scoring_opened_at": datetime.now(timezone.utc).isoformat()
+        }
         
         await db.fan_active_event.update_one(
             {"is_active": True},
-            {
-                "$set": {
-                    "current_bout_id": bout_id,
-                    "current_round": round_number,
-                    "scoring_open": True,
-                    "scoring_deadline": deadline,
-                    "scoring_opened_at": datetime.now(timezone.utc).isoformat()
-                }
-            }
+            {"$set": window}
         )
+        ingestor.events.update(window)
         
         return {
             "success": True,
@@ -240,6 +249,8 @@ async def close_scoring_window():
             {"is_active": True},
             {"$set": {"scoring_open": False, "scoring_deadline": None}}
         )
+        ingestor.events.update({"scoring_open": False, "scoring_deadline": None})
+        await ingestor.flush()
         
         return {"success": True, "message": "Scoring window closed"}
     except Exception as e:
@@ -257,15 +268,6 @@ async def submit_detailed_score(data: FanScoreSubmission):
         if not (7 <= data.red_score <= 10) or not (7 <= data.blue_score <= 10):
             raise HTTPException(status_code=400, detail="Scores must be between 7 and 10")
         
-        # Check if scoring is open
-        event = await db.fan_active_event.find_one({"is_active": True})
-        if not event or not event.get("scoring_open"):
-            raise HTTPException(status_code=400, detail="Scoring is not currently open")
-        
-        # Check deadline
-        if event.get("scoring_deadline") and datetime.now(timezone.utc).timestamp() > event["scoring_deadline"]:
-            raise HTTPException(status_code=400, detail="Scoring window has closed")
-        
         # Determine winner
         if data.red_score > data.blue_score:
             winner = "RED"
@@ -274,54 +276,22 @@ async def submit_detailed_score(data: FanScoreSubmission):
         else:
             winner = "DRAW"
         
-        # Create score document
-        score_id = str(uuid.uuid4())[:10]
-        score_doc = {
-            "score_id": score_id,
-            "bout_id": data.bout_id,
-            "round_number": data.round_number,
-            "red_score": data.red_score,
-            "blue_score": data.blue_score,
-            "winner": winner,
-            "fan_id": data.fan_id,
-            "session_id": data.session_id,
-            "is_guest": data.fan_id is None,
-            "score_type": "detailed",
-            "submitted_at": datetime.now(timezone.utc).isoformat()
-        }
-        
-        # Check for duplicate submission
-        existing = await db.fan_scores.find_one({
-            "bout_id": data.bout_id,
-            "round_number": data.round_number,
-            "$or": [
-                {"fan_id": data.fan_id} if data.fan_id else {"fan_id": None},
-                {"session_id": data.session_id} if data.session_id else {"session_id": None}
-            ]
-        })
-        
-        if existing:
-            # Update existing score
-            await db.fan_scores.update_one(
-                {"score_id": existing["score_id"]},
-                {"$set": score_doc}
-            )
-            return {"success": True, "message": "Score updated", "score_id": existing["score_id"]}
+        # Window check from the cached event; the write is batched with other votes
+        result = await ingestor.submit(
+            data.bout_id, data.round_number, data.red_score, data.blue_score, winner,
+            "detailed", fan_id=data.fan_id, session_id=data.session_id
+        )
         
-        await db.fan_scores.insert_one(score_doc)
-        
-        # Update fan stats if registered
-        if data.fan_id:
-            await db.fan_users.update_one(
-                {"fan_id": data.fan_id},
-                {"$inc": {"rounds_scored": 1}}
-            )
+        if result["updated"]:
+            return {"success": True, "message": "Score updated", "score_id": result["score_id"]}
         
         return {
             "success": True,
-            "score_id": score_id,
+            "score_id": result["score_id"],
             "message": f"Score submitted: {data.red_score}-{data.blue_score}"
         }
+    except ScoringClosed as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -336,15 +306,6 @@ async def submit_simple_score(data: SimpleScoreSubmission):
         if data.winner not in ["RED", "BLUE", "DRAW"]:
             raise HTTPException(status_code=400, detail="Winner must be RED, BLUE, or DRAW")
         
-        # Check if scoring is open
-        event = await db.fan_active_event.find_one({"is_active": True})
-        if not event or not event.get("scoring_open"):
-            raise HTTPException(status_code=400, detail="Scoring is not currently open")
-        
-        # Check deadline
-        if event.get("scoring_deadline") and datetime.now(timezone.utc).timestamp() > event["scoring_deadline"]:
-            raise HTTPException(status_code=400, detail="Scoring window has closed")
-        
         # Convert simple to score
         if data.winner == "RED":
             red_score, blue_score = 10, 9
@@ -353,51 +314,21 @@ async def submit_simple_score(data: SimpleScoreSubmission):
         else:
             red_score, blue_score = 10, 10
         
-        score_id = str(uuid.uuid4())[:10]
-        score_doc = {
-            "score_id": score_id,
-            "bout_id": data.bout_id,
-            "round_number": data.round_number,
-            "red_score": red_score,
-            "blue_score": blue_score,
-            "winner": data.winner,
-            "fan_id": data.fan_id,
-            "session_id": data.session_id,
-            "is_guest": data.fan_id is None,
-            "score_type": "simple",
-            "submitted_at": datetime.now(timezone.utc).isoformat()
-        }
-        
-        # Check for duplicate
-        existing = await db.fan_scores.find_one({
-            "bout_id": data.bout_id,
-            "round_number": data.round_number,
-            "$or": [
-                {"fan_id": data.fan_id} if data.fan_id else {"fan_id": None},
-                {"session_id": data.session_id} if data.session_id else {"session_id": None}
-            ]
-        })
-        
-        if existing:
-            await db.fan_scores.update_one(
-                {"score_id": existing["score_id"]},
-                {"$set": score_doc}
-            )
-            return {"success": True, "message": "Score updated", "score_id": existing["score_id"]}
-        
-        await db.fan_scores.insert_one(score_doc)
+        result = await ingestor.submit(
+            data.bout_id, data.round_number, red_score, blue_score, data.winner,
+            "simple", fan_id=data.fan_id, session_id=data.session_id
+        )
         
-        if data.fan_id:
-            await db.fan_users.update_one(
-                {"fan_id": data.fan_id},
-                {"$inc": {"rounds_scored": 1}}
-            )
+        if result["updated"]:
+            return {"success": True, "message": "Score updated", "score_id": result["score_id"]}
         
         return {
             "success": True,
-            "score_id": score_id,
+            "score_id": result["score_id"],
             "message": f"Score submitted: {data.winner}"
         }
+    except ScoringClosed as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -405,53 +336,41 @@ async def submit_simple_score(data: SimpleScoreSubmission):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/tally/{bout_id}")
+async def get_live_tally(bout_id: str):
+    """Live per-round fan vote tallies (aggregated from fan_scores, cached briefly)"""
+    return {
+        "bout_id": bout_id,
+        "rounds": list((await ingestor.get_tally(bout_id)).values()),
+        "ingest": ingestor.get_stats()
+    }
+
+
 # ============== Leaderboard ==============
 
 @router.get("/leaderboard")
 async def get_leaderboard(event_id: Optional[str] = None, limit: int = 50):
     """Get fan leaderboard - ranked by accuracy"""
     try:
-        pipeline = [
-            {"$match": {"rounds_scored": {"$gt": 0}}},
-            {
-                "$addFields": {
-                    "accuracy": {
-                        "$multiply": [
-                            {"$divide": ["$correct_predictions", "$rounds_scored"]},
-                            100
-                        ]
-                    }
-                }
-            },
-            {"$sort": {"accuracy": -1, "rounds_scored": -1}},
-            {"$limit": limit},
-            {
-                "$project": {
-                    "_id": 0,
-                    "fan_id": 1,
-                    "display_name": 1,
-                    "rounds_scored": 1,
-                    "correct_predictions": 1,
-                    "accuracy": {"$round": ["$accuracy", 1]}
-                }
-            }
-        ]
-        
-        leaderboard = await db.fan_users.aggregate(pipeline).to_list(limit)
-        
-        # Add rank
-        for i, fan in enumerate(leaderboard, 1):
-            fan["rank"] = i
-        
+        # Materialized ranking, updated as rounds are settled
         return {
-            "leaderboard": leaderboard,
-            "total_fans": await db.fan_users.count_documents({})
+            "leaderboard": await fan_board.top(limit),
+            "total_fans": await db.fan_users.estimated_document_count()
         }
     except Exception as e:
         logger.error(f"Error getting leaderboard: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/leaderboard/rank/{fan_id}")
+async def get_fan_rank(fan_id: str):
+    """Get a fan's leaderboard row and rank"""
+    entry = await fan_board.get(fan_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Fan has no scored rounds")
+    return {**entry, "ranked_fans": await fan_board.total()}
+
+
 # ============== Scorecard ==============
 
 @router.get("/scorecard/{bout_id}")
@@ -476,6 +395,7 @@ async def get_fan_scorecard(bout_id: str, fan_id: Optional[str] = None, session_
         else:
             raise HTTPException(status_code=400, detail="Must provide fan_id or session_id")
         
+        await ingestor.flush()
         fan_scores = await db.fan_scores.find(query, {"_id": 0}).sort("round_number", 1).to_list(20)
         
         # Get AI/Official scores
@@ -535,6 +455,7 @@ async def compare_all_fan_scores(bout_id: str):
             {"$sort": {"_id": 1}}
         ]
         
+        await ingestor.flush()
         fan_aggregate = await db.fan_scores.aggregate(pipeline).to_list(20)
         
         # Get AI scores
@@ -625,38 +546,19 @@ async def update_fan_accuracy(bout_id: str, round_number: int):
         
         official_winner = official.get("winner")
         
-        # Get all fan scores for this round
-        fan_scores = await db.fan_scores.find({
-            "bout_id": bout_id,
-            "round_number": round_number
-        }).to_list(10000)
-        
-        # Update each fan's accuracy
-        correct_count = 0
-        for score in fan_scores:
-            is_correct = score.get("winner") == official_winner
-            if is_correct:
-                correct_count += 1
-            
-            # Mark score as correct/incorrect
-            await db.fan_scores.update_one(
-                {"score_id": score["score_id"]},
-                {"$set": {"is_correct": is_correct, "official_winner": official_winner}}
-            )
-            
-            # Update fan user stats
-            if score.get("fan_id"):
-                if is_correct:
-                    await db.fan_users.update_one(
-                        {"fan_id": score["fan_id"]},
-                        {"$inc": {"correct_predictions": 1}}
-                    )
+        # Settle server-side in a fixed number of operations
+        await ingestor.flush()
+        settled = await settle_round(db, bout_id, round_number, official_winner)
+        await fan_board.refresh(settled["deltas"])
+        total = settled["total_scores"]
+        correct_count = settled["correct_predictions"]
         
         return {
             "success": True,
-            "total_scores": len(fan_scores),
+            "total_scores": total,
             "correct_predictions": correct_count,
-            "accuracy_rate": round(correct_count / len(fan_scores) * 100, 1) if fan_scores else 0
+            "fans_updated": settled["fans_updated"],
+            "accuracy_rate": round(correct_count / total * 100, 1) if total else 0
         }
     except HTTPException:
         raise
@@ -0,0 +1,403 @@
+"""
+Fan Vote Ingestion
+Absorbs round-end vote bursts without per-vote database round trips.
+
+- ActiveEventCache: the active event / scoring window, read from Mongo at
+  most once per refresh interval and updated in place by supervisor routes.
+- Votes are keyed by (bout_id, round_number, voter_key); the voter key is
+  the fan_id, else the session_id. Re-votes replace the earlier vote.
+- Submitted votes are group-committed: pending votes are coalesced per key
+  and flushed as one unordered bulk_write of upserts on that unique key,
+  and each submit waits for its batch. Whether a vote was new or replaced
+  an earlier one comes from the upsert result, and a replaced vote answers
+  with the score_id already stored, whichever worker wrote it.
+- One bulk_write of fan_users $inc follows for votes that were new inserts.
+  The increments are queued separately, so a failed fan_users write is
+  retried without rewriting (and no longer counting) the votes.
+- Live per-round tallies are aggregated from fan_scores, cached per bout
+  for tally_refresh_sec.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY = 11000
+
+VoteKey = Tuple[str, int, str]
+
+
+class ScoringClosed(Exception):
+    """Vote rejected because the scoring window is not open"""
+
+
+class ActiveEventCache:
+    """Cached fan_active_event document"""
+    
+    def __init__(self, db, refresh_sec: float = 2.0):
+        """
+        Args:
+            db: Motor database handle
+            refresh_sec: Maximum age before the active event is re-read
+        """
+        self.db = db
+        self.refresh_sec = refresh_sec
+        self.event: Optional[Dict[str, Any]] = None
+        self.loaded_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def get(self) -> Optional[Dict[str, Any]]:
+        if time.monotonic() - self.loaded_at < self.refresh_sec:
+            return self.event
+        async with self._lock:
+            if time.monotonic() - self.loaded_at >= self.refresh_sec:
+                self.event = await self.db.fan_active_event.find_one({"is_active": True}, {"_id": 0})
+                self.loaded_at = time.monotonic()
+        return self.event
+    
+    def set(self, event: Optional[Dict[str, Any]]):
+        """Replace the cached event after a supervisor change on this worker"""
+        self.event = event
+        self.loaded_at = time.monotonic()
+    
+    def update(self, fields: Dict[str, Any]):
+        if self.event is not None:
+            self.event = {**self.event, **fields}
+            self.loaded_at = time.monotonic()
+    
+    def invalidate(self):
+        self.loaded_at = 0.0
+    
+    async def check_open(self):
+        """
+        Raises:
+            ScoringClosed: no open scoring window
+        """
+        event = await self.get()
+        if not event or not event.get("scoring_open"):
+            raise ScoringClosed("Scoring is not currently open")
+        if event.get("scoring_deadline") and time.time() > event["scoring_deadline"]:
+            raise ScoringClosed("Scoring window has closed")
+
+
+def voter_key(fan_id: Optional[str], session_id: Optional[str]) -> Optional[str]:
+    if fan_id:
+        return f"fan:{fan_id}"
+    if session_id:
+        return f"session:{session_id}"
+    return None
+
+
+def tally_pipeline(bout_id: str) -> list:
+    """Per-round vote counts and score sums for one bout"""
+    def votes_for(winner):
+        return {"$sum": {"$cond": [{"$eq": ["$winner", winner]}, 1, 0]}}
+    
+    return [
+        {"$match": {"bout_id": bout_id}},
+        {"$group": {
+            "_id": "$round_number",
+            "red_votes": votes_for("RED"),
+            "blue_votes": votes_for("BLUE"),
+            "draw_votes": votes_for("DRAW"),
+            "total_votes": {"$sum": 1},
+            "red_total": {"$sum": "$red_score"},
+            "blue_total": {"$sum": "$blue_score"}
+        }}
+    ]
+
+
+class FanVoteIngestor:
+    """Group-committed fan vote ingestion with live tallies"""
+    
+    def __init__(self, db, flush_interval_ms: int = 250, max_batch: int = 1000,
+                 event_refresh_sec: float = 2.0, tally_refresh_sec: float = 1.0):
+        """
+        Args:
+            db: Motor database handle
+            flush_interval_ms: Maximum time a vote waits before being written
+            max_batch: Flush as soon as this many votes are pending
+            event_refresh_sec: Active event cache refresh interval
+            tally_refresh_sec: Maximum age of a bout's cached tallies
+        """
+        self.db = db
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch = max_batch
+        self.tally_refresh_sec = tally_refresh_sec
+        self.events = ActiveEventCache(db, event_refresh_sec)
+        
+        # bout_id -> (monotonic load time, per-round tallies)
+        self.tallies: Dict[str, Tuple[float, Dict[int, Dict[str, Any]]]] = {}
+        
+        # (bout_id, round, voter_key) -> latest vote not yet written
+        self.pending: Dict[VoteKey, Dict[str, Any]] = {}
+        # (bout_id, round, voter_key) -> submits waiting for that vote's write
+        self._waiters: Dict[VoteKey, List[asyncio.Future]] = {}
+        # fan_id -> rounds_scored increment not yet written
+        self.pending_increments: Dict[str, int] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        
+        self.stats = {
+            "votes_received": 0,
+            "votes_replaced": 0,
+            "flushes": 0,
+            "votes_written": 0,
+            "flush_errors": 0
+        }
+    
+    async def submit(self, bout_id: str, round_number: int, red_score: int, blue_score: int,
+                     winner: str, score_type: str, fan_id: Optional[str] = None,
+                     session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Accept a vote (scoring window must be open) and wait for its batch
+        to be written
+        
+        Returns:
+            {"score_id": str, "updated": bool}: the stored score_id, and
+            whether the vote replaced one the voter had already stored
+        
+        Raises:
+            ScoringClosed: no open scoring window
+            Exception: the vote could not be written
+        """
+        await self.events.check_open()
+        
+        score_id = str(uuid.uuid4())[:10]
+        key = voter_key(fan_id, session_id) or f"anon:{score_id}"
+        
+        # score_id is only stored if this vote is the voter's first
+        vote = {
+            "score_id": score_id,
+            "bout_id": bout_id,
+            "round_number": round_number,
+            "voter_key": key,
+            "red_score": red_score,
+            "blue_score": blue_score,
+            "winner": winner,
+            "fan_id": fan_id,
+            "session_id": session_id,
+            "is_guest": fan_id is None,
+            "score_type": score_type,
+            "submitted_at": datetime.now(timezone.utc).isoformat()
+        }
+        self.stats["votes_received"] += 1
+        
+        vote_key = (bout_id, round_number, key)
+        written = asyncio.get_running_loop().create_future()
+        self.pending[vote_key] = vote
+        self._waiters.setdefault(vote_key, []).append(written)
+        if len(self.pending) >= self.max_batch:
+            await self.flush()
+        else:
+            self._ensure_flusher()
+        
+        result = await written
+        if result["updated"]:
+            self.stats["votes_replaced"] += 1
+        return result
+    
+    async def flush(self) -> int:
+        """
+        Write pending votes: one bulk_write of upserts, then fan_users $inc
+        for votes that were inserted (not re-votes). Every submit waiting on
+        a written vote gets its result.
+        
+        Returns:
+            Number of votes written
+        """
+        async with self._flush_lock:
+            written = await self._flush_votes()
+            await self._flush_increments()
+            return written
+    
+    async def _flush_votes(self) -> int:
+        if not self.pending:
+            return 0
+        keys = list(self.pending)
+        batch = [self.pending[key] for key in keys]
+        waiters = [self._waiters.pop(key, []) for key in keys]
+        self.pending = {}
+        
+        operations = []
+        for vote in batch:
+            fields = {k: v for k, v in vote.items() if k != "score_id"}
+            operations.append(UpdateOne(
+                {"bout_id": vote["bout_id"], "round_number": vote["round_number"], "voter_key": vote["voter_key"]},
+                {"$set": fields, "$setOnInsert": {"score_id": vote["score_id"]}},
+                upsert=True
+            ))
+        
+        errors: Dict[int, Dict[str, Any]] = {}
+        try:
+            result = await self.db.fan_scores.bulk_write(operations, ordered=False)
+            upserted = set(result.upserted_ids or {})
+        except BulkWriteError as e:
+            # Unordered: only the reported writes failed
+            upserted = {u["index"] for u in e.details.get("upserted", [])}
+            errors = {err["index"]: err for err in e.details.get("writeErrors", [])}
+        except Exception as e:
+            self._fail(waiters, e)
+            self.stats["flush_errors"] += 1
+            logger.error(f"Error flushing {len(batch)} fan votes: {e}")
+            return 0
+        
+        retried = []
+        for index, error in errors.items():
+            if error.get("code") == DUPLICATE_KEY:
+                # Another worker inserted the voter's first vote meanwhile: write this one as an update
+                retried.append(index)
+            else:
+                self._fail([waiters[index]], RuntimeError(error.get("errmsg", "fan vote write failed")))
+        if errors:
+            self.stats["flush_errors"] += 1
+            logger.error(f"Error flushing {len(errors)} of {len(batch)} fan votes "
+                         f"({len(retried)} requeued): {list(errors.values())[:3]}")
+        for index in retried:
+            self._requeue(keys[index], batch[index], waiters[index])
+        
+        replaced = [i for i in range(len(batch)) if i not in upserted and i not in errors]
+        stored_ids: Dict[VoteKey, str] = {}
+        if replaced:
+            try:
+                stored_ids = await self._stored_score_ids([keys[i] for i in replaced])
+            except Exception as e:
+                # The votes are written; only their answers are unknown
+                logger.error(f"Error reading back {len(replaced)} replaced fan votes: {e}")
+                self._fail([waiters[i] for i in replaced], e)
+                replaced = []
+        
+        for index in upserted:
+            self._resolve(waiters[index], batch[index]["score_id"], updated=False)
+            # Only first-time votes count toward rounds_scored
+            fan_id = batch[index].get("fan_id")
+            if fan_id:
+                self.pending_increments[fan_id] = self.pending_increments.get(fan_id, 0) + 1
+        for index in replaced:
+            self._resolve(waiters[index], stored_ids.get(keys[index], batch[index]["score_id"]), updated=True)
+        
+        written = len(batch) - len(errors)
+        if not errors:
+            self.stats["flushes"] += 1
+        self.stats["votes_written"] += written
+        return written
+    
+    async def _stored_score_ids(self, keys: List[VoteKey]) -> Dict[VoteKey, str]:
+        """score_id of the stored votes for keys, one query on the unique vote key"""
+        by_round: Dict[Tuple[str, int], List[str]] = {}
+        for bout_id, round_number, key in keys:
+            by_round.setdefault((bout_id, round_number), []).append(key)
+        query = {"$or": [
+            {"bout_id": bout_id, "round_number": round_number, "voter_key": {"$in": voter_keys}}
+            for (bout_id, round_number), voter_keys in by_round.items()
+        ]}
+        docs = await self.db.fan_scores.find(
+            query, {"_id": 0, "bout_id": 1, "round_number": 1, "voter_key": 1, "score_id": 1}
+        ).to_list(None)
+        return {(d["bout_id"], d["round_number"], d["voter_key"]): d["score_id"] for d in docs}
+    
+    @staticmethod
+    def _resolve(waiters: List[asyncio.Future], score_id: str, updated: bool):
+        # Submits coalesced after the first one replaced its vote
+        for position, waiter in enumerate(waiters):
+            if not waiter.done():
+                waiter.set_result({"score_id": score_id, "updated": updated or position > 0})
+    
+    @staticmethod
+    def _fail(waiter_lists, error: Exception):
+        for waiters in waiter_lists:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(error)
+    
+    def _requeue(self, key: VoteKey, vote: Dict[str, Any], waiters: List[asyncio.Future]):
+        """Requeue unless a newer vote for the same key arrived meanwhile"""
+        self.pending.setdefault(key, vote)
+        self._waiters[key] = waiters + self._waiters.get(key, [])
+        self._ensure_flusher()
+    
+    async def _flush_increments(self):
+        if not self.pending_increments:
+            return
+        increments, self.pending_increments = self.pending_increments, {}
+        try:
+            await self.db.fan_users.bulk_write([
+                UpdateOne({"fan_id": fan_id}, {"$inc": {"rounds_scored": count}})
+                for fan_id, count in increments.items()
+            ], ordered=False)
+        except Exception as e:
+            # $inc is not idempotent: retry only when nothing was applied
+            applied = set()
+            if isinstance(e, BulkWriteError):
+                failed = {err["index"] for err in e.details.get("writeErrors", [])}
+                applied = {fan_id for i, fan_id in enumerate(increments) if i not in failed}
+            self.stats["flush_errors"] += 1
+            for fan_id, count in increments.items():
+                if fan_id not in applied:
+                    self.pending_increments[fan_id] = self.pending_increments.get(fan_id, 0) + count
+            logger.error(f"Error updating rounds_scored for {len(increments) - len(applied)} fans: {e}")
+    
+    def _ensure_flusher(self):
+        """Start the interval flusher on the running loop if it is not active"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+    
+    async def _flush_loop(self):
+        """Flush every flush_interval_ms until nothing is pending"""
+        while self.pending or self.pending_increments:
+            await asyncio.sleep(self.flush_interval_ms / 1000.0)
+            await self.flush()
+    
+    async def get_tally(self, bout_id: str) -> Dict[int, Dict[str, Any]]:
+        """Per-round tallies for a bout, at most tally_refresh_sec old"""
+        cached = self.tallies.get(bout_id)
+        if cached is not None and time.monotonic() - cached[0] < self.tally_refresh_sec:
+            return cached[1]
+        
+        rounds = {}
+        async for group in self.db.fan_scores.aggregate(tally_pipeline(bout_id)):
+            total = group["total_votes"]
+            rounds[group["_id"]] = {
+                "round_number": group["_id"],
+                "red_votes": group["red_votes"],
+                "blue_votes": group["blue_votes"],
+                "draw_votes": group["draw_votes"],
+                "total_votes": total,
+                "avg_red_score": round(group["red_total"] / total, 1) if total else 0,
+                "avg_blue_score": round(group["blue_total"] / total, 1) if total else 0,
+                "consensus_winner": (
+                    "RED" if group["red_votes"] > group["blue_votes"]
+                    else "BLUE" if group["blue_votes"] > group["red_votes"] else "DRAW"
+                )
+            }
+        rounds = dict(sorted(rounds.items()))
+        self.tallies[bout_id] = (time.monotonic(), rounds)
+        return rounds
+    
+    def release_bout(self, bout_id: str):
+        """Drop the cached tallies of a finished bout"""
+        self.tallies.pop(bout_id, None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending": len(self.pending),
+            "pending_increments": len(self.pending_increments),
+            "tallies_cached": len(self.tallies),
+            "flush_interval_ms": self.flush_interval_ms,
+            "max_batch": self.max_batch
+        }
+    
+    async def close(self):
+        """Durability flush on shutdown"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush()
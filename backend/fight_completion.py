@@ -3,38 +3,49 @@ Fight Completion and Archival System
 Saves all fight data to database for future reference
 """
 
+import asyncio
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 
-async def save_completed_fight(db, bout_id: str):
+async def save_completed_fight(db, bout_id: str, fighter_stats: Optional[Dict[str, Dict]] = None):
     """
     Save completed fight with all stats to database
     
     Args:
         db: MongoDB database instance
         bout_id: Bout identifier
+        fighter_stats: Stats already accumulated from unified_events while
+            the fight was scored ({"fighter1": ..., "fighter2": ...}); the
+            archived event log is then read from unified_events too.
+            Computed from the legacy events log if not given
         
     Returns:
         dict: Saved fight record
     """
     
     # Get bout data
-    bout = await db.bouts.find_one({"_id": bout_id})
+    bout = await db.bouts.find_one({"$or": [{"_id": bout_id}, {"bout_id": bout_id}, {"boutId": bout_id}]})
     if not bout:
         raise ValueError(f"Bout {bout_id} not found")
     
-    # Get all events for this bout
-    events = await db.events.find({"boutId": bout_id}, {"_id": 0}).to_list(None)
-    
-    # Get all round scores
-    rounds = await db.round_state.find({"boutId": bout_id}, {"_id": 0}).to_list(None)
-    
-    # Get judge scores
-    judge_scores = await db.judge_scores.find({"boutId": bout_id}, {"_id": 0}).to_list(None)
+    # Get all events, round scores and judge scores for this bout
+    if fighter_stats:
+        events_cursor = db.unified_events.find({"bout_id": bout_id}, {"_id": 0}).sort("created_at", 1)
+    else:
+        events_cursor = db.events.find({"boutId": bout_id}, {"_id": 0})
+    events, rounds, judge_scores = await asyncio.gather(
+        events_cursor.to_list(None),
+        db.round_state.find({"boutId": bout_id}, {"_id": 0}).to_list(None),
+        db.judge_scores.find({"boutId": bout_id}, {"_id": 0}).to_list(None)
+    )
     
     # Calculate final statistics
-    fighter1_stats = calculate_fighter_stats(events, 'fighter1')
-    fighter2_stats = calculate_fighter_stats(events, 'fighter2')
+    if fighter_stats:
+        fighter1_stats = fighter_stats['fighter1']
+        fighter2_stats = fighter_stats['fighter2']
+    else:
+        fighter1_stats = calculate_fighter_stats(events, 'fighter1')
+        fighter2_stats = calculate_fighter_stats(events, 'fighter2')
     
     # Create completed fight record
     completed_fight = {
@@ -100,7 +111,7 @@ async def save_completed_fight(db, bout_id: str):
     
     # Update original bout status
     await db.bouts.update_one(
-        {"_id": bout_id},
+        {"_id": bout["_id"]},
         {
             "$set": {
                 "status": "completed",
@@ -113,12 +124,49 @@ async def save_completed_fight(db, bout_id: str):
     return completed_fight
 
 
-def calculate_fighter_stats(events: List[Dict], fighter: str) -> Dict[str, Any]:
-    """Calculate comprehensive stats for a fighter"""
-    
-    fighter_events = [e for e in events if e.get('fighter') == fighter]
-    
-    stats = {
+# Striking event type -> (count key, significant count key); covers both the
+# legacy events log and the unified_events vocabulary (unified_scoring)
+STRIKE_STATS = {
+    'Jab': ('jabs', 'ss_jabs'),
+    'Cross': ('crosses', 'ss_crosses'),
+    'Hook': ('hooks', 'ss_hooks'),
+    'Uppercut': ('uppercuts', 'ss_uppercuts'),
+    'Elbow': ('elbows', 'ss_elbows'),
+    'Knee': ('knees', 'ss_knees'),
+    'Kick': ('kicks', 'ss_kicks'),
+    'Head Kick': ('kicks', 'ss_kicks'),
+    'Body Kick': ('kicks', 'ss_kicks'),
+    'Low Kick': ('kicks', 'ss_kicks'),
+    'Leg Kick': ('kicks', 'ss_kicks'),
+    'Ground Strike': ('ground_strikes', 'ss_ground_strikes')
+}
+
+KD_TIERS = {'Flash': 'kd_flash', 'Hard': 'kd_hard', 'Near-Finish': 'kd_near_finish'}
+SUB_TIERS = {'Light': 'sub_light', 'Deep': 'sub_deep', 'Near-Finish': 'sub_near_finish'}
+
+GRAPPLING_STATS = {
+    'Takedown Landed': 'takedowns_landed',
+    'Takedown': 'takedowns_landed',
+    'TD': 'takedowns_landed',
+    'Takedown Stuffed': 'takedowns_stuffed',
+    'Takedown Defended': 'takedowns_stuffed',
+    'Sweep/Reversal': 'sweeps',
+    'Guard Passing': 'guard_passes'
+}
+
+CONTROL_STATS = {
+    'Ground Top Control': 'ground_top_seconds',
+    'Top Control': 'ground_top_seconds',
+    'Ground Back Control': 'ground_back_seconds',
+    'Back Control': 'ground_back_seconds',
+    'Cage Control Time': 'cage_control_seconds',
+    'Cage Control': 'cage_control_seconds'
+}
+
+
+def empty_fighter_stats() -> Dict[str, Any]:
+    """Zeroed stats document (see calculate_fighter_stats)"""
+    return {
         # Striking Stats
         "striking": {
             "total_strikes": 0,
@@ -136,7 +184,9 @@ def calculate_fighter_stats(events: List[Dict], fighter: str) -> Dict[str, Any]:
             "knees": 0,
             "ss_knees": 0,
             "kicks": 0,
-            "ss_kicks": 0
+            "ss_kicks": 0,
+            "ground_strikes": 0,
+            "ss_ground_strikes": 0
         },
         
         # Damage Stats
@@ -170,119 +220,60 @@ def calculate_fighter_stats(events: List[Dict], fighter: str) -> Dict[str, Any]:
         
         # Summary
         "summary": {
-            "total_events": len(fighter_events),
+            "total_events": 0,
             "offensive_actions": 0,
             "defensive_actions": 0
         }
     }
+
+
+def stat_increments(event_type: str, metadata: Optional[Dict] = None) -> List[Tuple[str, str, float]]:
+    """
+    Counter increments one event adds to its fighter's stats
     
-    # Count events
-    for event in fighter_events:
-        event_type = event.get('eventType', '')
-        metadata = event.get('metadata', {})
-        is_significant = metadata.get('significant', False)
-        tier = metadata.get('tier')
+    Returns:
+        List of (section, key, amount); summary.total_events is not included
+    """
+    metadata = metadata or {}
+    tier = metadata.get('tier')
+    
+    # Striking
+    if event_type in STRIKE_STATS:
+        count_key, ss_key = STRIKE_STATS[event_type]
+        increments = [('striking', count_key, 1), ('striking', 'total_strikes', 1)]
+        if metadata.get('significant', False):
+            increments.append(('striking', ss_key, 1))
+            increments.append(('striking', 'significant_strikes', 1))
+        return increments
+    
+    # Damage
+    if event_type == 'KD':
+        increments = [('damage', 'knockdowns', 1)]
+        if tier in KD_TIERS:
+            increments.append(('damage', KD_TIERS[tier], 1))
+        return increments
+    if event_type == 'Rocked/Stunned':
+        return [('damage', 'rocked', 1)]
+    
+    # Grappling
+    if event_type == 'Submission Attempt':
+        increments = [('grappling', 'submission_attempts', 1)]
+        if tier in SUB_TIERS:
+            increments.append(('grappling', SUB_TIERS[tier], 1))
+        return increments
+    if event_type in GRAPPLING_STATS:
+        return [('grappling', GRAPPLING_STATS[event_type], 1)]
+    
+    # Control
+    if event_type in CONTROL_STATS:
         duration = metadata.get('duration', 0)
-        
-        # Striking
-        if event_type == 'Jab':
-            stats['striking']['jabs'] += 1
-            if is_significant:
-                stats['striking']['ss_jabs'] += 1
-                stats['striking']['significant_strikes'] += 1
-            stats['striking']['total_strikes'] += 1
-            
-        elif event_type == 'Cross':
-            stats['striking']['crosses'] += 1
-            if is_significant:
-                stats['striking']['ss_crosses'] += 1
-                stats['striking']['significant_strikes'] += 1
-            stats['striking']['total_strikes'] += 1
-            
-        elif event_type == 'Hook':
-            stats['striking']['hooks'] += 1
-            if is_significant:
-                stats['striking']['ss_hooks'] += 1
-                stats['striking']['significant_strikes'] += 1
-            stats['striking']['total_strikes'] += 1
-            
-        elif event_type == 'Uppercut':
-            stats['striking']['uppercuts'] += 1
-            if is_significant:
-                stats['striking']['ss_uppercuts'] += 1
-                stats['striking']['significant_strikes'] += 1
-            stats['striking']['total_strikes'] += 1
-            
-        elif event_type == 'Elbow':
-            stats['striking']['elbows'] += 1
-            if is_significant:
-                stats['striking']['ss_elbows'] += 1
-                stats['striking']['significant_strikes'] += 1
-            stats['striking']['total_strikes'] += 1
-            
-        elif event_type == 'Knee':
-            stats['striking']['knees'] += 1
-            if is_significant:
-                stats['striking']['ss_knees'] += 1
-                stats['striking']['significant_strikes'] += 1
-            stats['striking']['total_strikes'] += 1
-            
-        elif event_type == 'Kick':
-            stats['striking']['kicks'] += 1
-            if is_significant:
-                stats['striking']['ss_kicks'] += 1
-                stats['striking']['significant_strikes'] += 1
-            stats['striking']['total_strikes'] += 1
-            
-        # Damage
-        elif event_type == 'KD':
-            stats['damage']['knockdowns'] += 1
-            if tier == 'Flash':
-                stats['damage']['kd_flash'] += 1
-            elif tier == 'Hard':
-                stats['damage']['kd_hard'] += 1
-            elif tier == 'Near-Finish':
-                stats['damage']['kd_near_finish'] += 1
-                
-        elif event_type == 'Rocked/Stunned':
-            stats['damage']['rocked'] += 1
-            
-        # Grappling
-        elif event_type == 'Takedown Landed':
-            stats['grappling']['takedowns_landed'] += 1
-            
-        elif event_type == 'Takedown Stuffed':
-            stats['grappling']['takedowns_stuffed'] += 1
-            
-        elif event_type == 'Submission Attempt':
-            stats['grappling']['submission_attempts'] += 1
-            if tier == 'Light':
-                stats['grappling']['sub_light'] += 1
-            elif tier == 'Deep':
-                stats['grappling']['sub_deep'] += 1
-            elif tier == 'Near-Finish':
-                stats['grappling']['sub_near_finish'] += 1
-                
-        elif event_type == 'Sweep/Reversal':
-            stats['grappling']['sweeps'] += 1
-            
-        elif event_type == 'Guard Passing':
-            stats['grappling']['guard_passes'] += 1
-            
-        # Control
-        elif event_type == 'Ground Top Control':
-            stats['control']['ground_top_seconds'] += duration
-            stats['control']['total_control_seconds'] += duration
-            
-        elif event_type == 'Ground Back Control':
-            stats['control']['ground_back_seconds'] += duration
-            stats['control']['total_control_seconds'] += duration
-            
-        elif event_type == 'Cage Control Time':
-            stats['control']['cage_control_seconds'] += duration
-            stats['control']['total_control_seconds'] += duration
+        return [('control', CONTROL_STATS[event_type], duration), ('control', 'total_control_seconds', duration)]
     
-    # Calculate summary
+    return []
+
+
+def finish_fighter_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in the derived summary counts"""
     stats['summary']['offensive_actions'] = (
         stats['striking']['total_strikes'] +
         stats['damage']['knockdowns'] +
@@ -297,6 +288,22 @@ def calculate_fighter_stats(events: List[Dict], fighter: str) -> Dict[str, Any]:
     return stats
 
 
+def calculate_fighter_stats(events: List[Dict], fighter: str) -> Dict[str, Any]:
+    """Calculate comprehensive stats for a fighter"""
+    
+    fighter_events = [e for e in events if e.get('fighter') == fighter]
+    
+    stats = empty_fighter_stats()
+    stats['summary']['total_events'] = len(fighter_events)
+    
+    # Count events
+    for event in fighter_events:
+        for section, key, amount in stat_increments(event.get('eventType', ''), event.get('metadata', {})):
+            stats[section][key] += amount
+    
+    return finish_fighter_stats(stats)
+
+
 def determine_winner(rounds: List[Dict]) -> str:
     """Determine fight winner from round scores"""
     if not rounds:
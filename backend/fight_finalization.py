@@ -0,0 +1,553 @@
+"""
+Fight Finalization
+
+Pipelined /fights/finalize:
+- fighter stats are accumulated per corner as events are logged
+  (fight_live_stats) instead of being recomputed from the event log; bouts
+  with events logged before the counters existed are recounted once
+- the round results and the bout are read once, in parallel
+- fight_results and the bout status are written in one transaction (or as
+  two concurrent idempotent upserts when the deployment has no replica set)
+- the result broadcast is fired without waiting, and the heavy follow-up
+  work (completed-fight archive, career aggregation, ...) goes through the
+  durable finalization_jobs queue, where a worker claims a job with a lease
+  before running it
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure
+
+from fight_completion import empty_fighter_stats, finish_fighter_stats, stat_increments
+from unified_scoring import compute_fight_totals
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.environ.get("FINALIZATION_JOB_WORKERS", "2"))
+JOB_MAX_ATTEMPTS = int(os.environ.get("FINALIZATION_JOB_MAX_ATTEMPTS", "5"))
+JOB_RETRY_DELAY_SEC = float(os.environ.get("FINALIZATION_JOB_RETRY_DELAY_SEC", "2"))
+JOB_LEASE_SEC = float(os.environ.get("FINALIZATION_JOB_LEASE_SEC", "300"))
+
+CORNER_FIGHTERS = {"RED": "fighter1", "BLUE": "fighter2"}
+
+JobHandler = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+ReleaseHook = Callable[[str], Any]
+
+
+class LiveFighterStats:
+    """Per-corner stat counters kept current as events are logged"""
+    
+    def __init__(self, db):
+        self.db = db
+    
+    async def record(self, event_doc: Dict[str, Any], sign: int = 1):
+        """
+        Apply one unified event to its corner's counters
+        
+        Args:
+            event_doc: Stored unified_events document
+            sign: 1 when the event is added, -1 when it is deleted
+        """
+        fighter = CORNER_FIGHTERS.get(str(event_doc.get("corner", "")).upper())
+        if fighter is None:
+            return
+        
+        inc = {"stats.summary.total_events": sign}
+        for section, key, amount in stat_increments(event_doc.get("event_type", ""), event_doc.get("metadata")):
+            field = f"stats.{section}.{key}"
+            inc[field] = inc.get(field, 0) + sign * amount
+        
+        await self.db.fight_live_stats.update_one(
+            {"bout_id": event_doc["bout_id"], "fighter": fighter},
+            {"$inc": inc, "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}},
+            upsert=True
+        )
+    
+    async def load(self, bout_id: str) -> Optional[Dict[str, Dict]]:
+        """
+        Returns:
+            {"fighter1": stats, "fighter2": stats} in calculate_fighter_stats
+            form, or None if the bout has no unified events
+        """
+        docs, logged = await asyncio.gather(
+            self.db.fight_live_stats.find({"bout_id": bout_id}, {"_id": 0}).to_list(2),
+            self.db.unified_events.count_documents({"bout_id": bout_id})
+        )
+        counted = sum(d.get("stats", {}).get("summary", {}).get("total_events", 0) for d in docs)
+        if logged and counted != logged:
+            # Events logged before the counters existed: count them from the log
+            return await self.recount(bout_id)
+        if not docs:
+            return None
+        
+        result = {}
+        for fighter in CORNER_FIGHTERS.values():
+            stats = empty_fighter_stats()
+            counters = next((d.get("stats", {}) for d in docs if d.get("fighter") == fighter), {})
+            for section, values in counters.items():
+                stats.setdefault(section, {}).update(values)
+            result[fighter] = finish_fighter_stats(stats)
+        return result
+    
+    async def recount(self, bout_id: str) -> Dict[str, Dict]:
+        """Stats for both corners computed from the bout's unified_events"""
+        events = await self.db.unified_events.find(
+            {"bout_id": bout_id}, {"_id": 0, "corner": 1, "event_type": 1, "metadata": 1}
+        ).to_list(None)
+        
+        stats = {fighter: empty_fighter_stats() for fighter in CORNER_FIGHTERS.values()}
+        for event in events:
+            fighter = CORNER_FIGHTERS.get(str(event.get("corner", "")).upper())
+            if fighter is None:
+                continue
+            stats[fighter]["summary"]["total_events"] += 1
+            for section, key, amount in stat_increments(event.get("event_type", ""), event.get("metadata")):
+                stats[fighter][section][key] += amount
+        return {fighter: finish_fighter_stats(values) for fighter, values in stats.items()}
+    
+    async def clear(self, bout_id: str):
+        await self.db.fight_live_stats.delete_many({"bout_id": bout_id})
+
+
+class FinalizationJobQueue:
+    """
+    Durable background queue for post-fight work
+    
+    Jobs are finalization_jobs documents (status queued -> running -> done,
+    or failed after max_attempts). A job is run only after it is claimed
+    with a find_one_and_update that takes its lease (owner + lease_until),
+    renewed while the handler runs; a job waiting to retry stays leased to
+    its worker until the retry is due. On start() every worker picks up
+    queued and running jobs whose lease has expired, and the claim decides
+    which of them runs each one.
+    """
+    
+    def __init__(self, db, workers: int = JOB_WORKERS, max_attempts: int = JOB_MAX_ATTEMPTS,
+                 retry_delay_sec: float = JOB_RETRY_DELAY_SEC, lease_sec: float = JOB_LEASE_SEC,
+                 worker_id: Optional[str] = None):
+        """
+        Args:
+            db: Motor database handle
+            workers: Concurrent job runners
+            max_attempts: Tries before a job is marked failed
+            retry_delay_sec: Base retry delay, doubled per attempt
+            lease_sec: How long a claim holds a job without being renewed
+            worker_id: Identifies this worker as a job's lease owner
+        """
+        self.db = db
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay_sec = retry_delay_sec
+        self.lease_sec = lease_sec
+        self.worker_id = worker_id or f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.handlers: Dict[str, JobHandler] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retrying = 0
+        # job ids queued, running or waiting to retry in this process
+        self._active: set = set()
+        
+        self.stats = {
+            "enqueued": 0,
+            "completed": 0,
+            "retried": 0,
+            "failed": 0,
+            "recovered": 0,
+            "claims_lost": 0
+        }
+    
+    def register(self, kind: str, handler: JobHandler):
+        """Run handler(bout_id, payload) for every finalized fight"""
+        self.handlers[kind] = handler
+    
+    def _pending(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+    
+    def _put(self, job: Dict[str, Any]):
+        self._active.add(job["job_id"])
+        self._pending().put_nowait(job)
+    
+    async def enqueue(self, bout_id: str, payload: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Queue one job per registered handler
+        
+        Returns:
+            The new job ids
+        """
+        if not self.handlers:
+            return []
+        
+        now = datetime.now(timezone.utc).isoformat()
+        jobs = [
+            {
+                "job_id": str(uuid.uuid4()),
+                "kind": kind,
+                "bout_id": bout_id,
+                "payload": payload or {},
+                "status": "queued",
+                "attempts": 0,
+                "error": None,
+                "created_at": now,
+                "updated_at": now
+            }
+            for kind in self.handlers
+        ]
+        await self.db.finalization_jobs.insert_many([dict(job) for job in jobs])
+        
+        for job in jobs:
+            self._put(job)
+        self.stats["enqueued"] += len(jobs)
+        return [job["job_id"] for job in jobs]
+    
+    def start(self):
+        """Start the workers on the running loop and resume unfinished jobs"""
+        self._tasks = [t for t in self._tasks if not t.done()]
+        if self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        self._tasks.append(loop.create_task(self._recover()))
+        self._tasks.extend(loop.create_task(self._worker()) for _ in range(self.workers))
+    
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+    
+    def _lease_until(self, seconds: Optional[float] = None) -> str:
+        return (self._now() + timedelta(seconds=self.lease_sec if seconds is None else seconds)).isoformat()
+    
+    async def _recover(self):
+        try:
+            jobs = await self.db.finalization_jobs.find(
+                {"status": {"$in": ["queued", "running"]},
+                 # Never leased, or the lease has run out
+                 "$or": [{"lease_until": None}, {"lease_until": {"$lt": self._now().isoformat()}}]},
+                {"_id": 0}
+            ).sort("created_at", 1).to_list(1000)
+        except Exception as e:
+            logger.error(f"Finalization job recovery failed: {e}")
+            return
+        
+        for job in jobs:
+            if job["job_id"] not in self._active:
+                self._put(job)
+                self.stats["recovered"] += 1
+    
+    async def _worker(self):
+        queue = self._pending()
+        while True:
+            job = await queue.get()
+            try:
+                await self._run(job)
+            except Exception as e:
+                logger.error(f"Finalization job {job.get('job_id')} could not be updated: {e}")
+                self._active.discard(job.get("job_id"))
+            finally:
+                queue.task_done()
+    
+    async def _claim(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Take the job's lease; None if another worker holds it or it has finished"""
+        now = self._now().isoformat()
+        return await self.db.finalization_jobs.find_one_and_update(
+            {
+                "job_id": job["job_id"],
+                "status": {"$in": ["queued", "running"]},
+                "$or": [
+                    {"lease_until": None},
+                    {"lease_until": {"$lt": now}},
+                    # This worker's own retry, leased to it until it was due
+                    {"status": "queued", "owner": self.worker_id}
+                ]
+            },
+            {
+                "$set": {"status": "running", "owner": self.worker_id,
+                         "lease_until": self._lease_until(), "updated_at": now},
+                "$inc": {"attempts": 1}
+            },
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+    
+    async def _renew(self, job_id: str):
+        # Keeps the lease while the handler runs
+        while True:
+            await asyncio.sleep(self.lease_sec / 3)
+            try:
+                await self.db.finalization_jobs.update_one(
+                    {"job_id": job_id, "owner": self.worker_id},
+                    {"$set": {"lease_until": self._lease_until()}}
+                )
+            except Exception as e:
+                logger.warning(f"Could not renew the lease of finalization job {job_id}: {e}")
+    
+    async def _run(self, job: Dict[str, Any]):
+        claimed = await self._claim(job)
+        if claimed is None:
+            self.stats["claims_lost"] += 1
+            self._active.discard(job["job_id"])
+            return
+        job = claimed
+        owned = {"job_id": job["job_id"], "owner": self.worker_id}
+        
+        handler = self.handlers.get(job["kind"])
+        try:
+            if handler is None:
+                raise RuntimeError(f"No handler registered for {job['kind']}")
+            renewal = asyncio.get_running_loop().create_task(self._renew(job["job_id"]))
+            try:
+                await handler(job["bout_id"], job.get("payload") or {})
+            finally:
+                renewal.cancel()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            retry = handler is not None and job["attempts"] < self.max_attempts
+            delay = self.retry_delay_sec * 2 ** (job["attempts"] - 1)
+            logger.warning(f"Finalization job {job['kind']} for {job['bout_id']} failed "
+                           f"(attempt {job['attempts']}): {error}")
+            update = {"status": "queued" if retry else "failed", "error": error,
+                      "updated_at": self._now().isoformat()}
+            if retry:
+                # Held until the retry is due, so recovering workers leave it alone
+                update["lease_until"] = self._lease_until(delay)
+            await self.db.finalization_jobs.update_one(owned, {"$set": update})
+            if retry:
+                self.stats["retried"] += 1
+                self._retrying += 1
+                asyncio.get_running_loop().call_later(delay, self._requeue, job)
+            else:
+                self.stats["failed"] += 1
+                self._active.discard(job["job_id"])
+            return
+        
+        await self.db.finalization_jobs.update_one(
+            owned,
+            {"$set": {"status": "done", "error": None, "lease_until": None,
+                      "updated_at": self._now().isoformat()}}
+        )
+        self.stats["completed"] += 1
+        self._active.discard(job["job_id"])
+    
+    def _requeue(self, job: Dict[str, Any]):
+        self._retrying -= 1
+        self._pending().put_nowait(job)
+    
+    async def drain(self):
+        """Wait until every queued job, including pending retries, has finished"""
+        queue = self._pending()
+        while True:
+            await queue.join()
+            if not self._retrying:
+                return
+            await asyncio.sleep(0.01)
+    
+    async def close(self):
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        self._tasks = []
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "handlers": sorted(self.handlers),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "retrying": self._retrying,
+            "workers": self.workers
+        }
+
+
+class FightFinalizer:
+    """Computes, stores and announces the authoritative fight result"""
+    
+    def __init__(self, db):
+        self.db = db
+        self.live_stats = LiveFighterStats(db)
+        self.jobs = FinalizationJobQueue(db)
+        # None until the first write shows whether the deployment has transactions
+        self._transactions: Optional[bool] = None
+        self._background: set = set()
+        # In-process per-bout state (smoothing windows, clip metadata, ...)
+        self._release_hooks: List[ReleaseHook] = []
+    
+    async def _read(self, bout_id: str):
+        bout_query = {"$or": [{"bout_id": bout_id}, {"boutId": bout_id}]}
+        round_results, bout = await asyncio.gather(
+            self.db.round_results.find({"bout_id": bout_id}, {"_id": 0}).sort("round_number", 1).to_list(100),
+            self.db.bouts.find_one(bout_query, {"_id": 0, "fighter1": 1, "fighter2": 1, "roundScores": 1})
+        )
+        
+        # If no round_results, fall back to the bout's round scores
+        if not round_results and bout and bout.get("roundScores"):
+            round_results = [
+                {
+                    "round_number": r.get("round"),
+                    "red_points": r.get("red_score", r.get("unified_red", 0)),
+                    "blue_points": r.get("blue_score", r.get("unified_blue", 0)),
+                    "delta": r.get("delta", 0)
+                }
+                for r in bout["roundScores"]
+            ]
+        return round_results, bout
+    
+    async def _write(self, bout_id: str, fight_result: Dict[str, Any], bout_update: Dict[str, Any]):
+        """Store the result and close the bout, atomically where supported"""
+        bout_query = {"$or": [{"bout_id": bout_id}, {"boutId": bout_id}]}
+        
+        async def apply(session=None):
+            await self.db.fight_results.update_one(
+                {"bout_id": bout_id}, {"$set": fight_result}, upsert=True, session=session
+            )
+            await self.db.bouts.update_one(bout_query, {"$set": bout_update}, session=session)
+        
+        client = getattr(self.db, "client", None)
+        if self._transactions is not False and client is not None:
+            try:
+                async with await client.start_session() as session:
+                    async with session.start_transaction():
+                        await apply(session)
+                self._transactions = True
+                return
+            except OperationFailure as e:
+                # 20 = IllegalOperation: standalone server, no transactions
+                if e.code != 20:
+                    raise
+                logger.info("Transactions unavailable; finalization writes fall back to idempotent upserts")
+                self._transactions = False
+        
+        # Both writes are idempotent, so a retry of the request repairs a partial write
+        await asyncio.gather(
+            self.db.fight_results.update_one({"bout_id": bout_id}, {"$set": fight_result}, upsert=True),
+            self.db.bouts.update_one(bout_query, {"$set": bout_update})
+        )
+    
+    def _spawn(self, coro: Awaitable, what: str):
+        async def run():
+            try:
+                await coro
+            except Exception as e:
+                logger.error(f"{what} failed: {e}")
+        
+        task = asyncio.get_running_loop().create_task(run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+    
+    async def finalize(self, bout_id: str,
+                       broadcast: Optional[Callable[[str, Dict[str, Any]], Awaitable[Any]]] = None) -> Dict[str, Any]:
+        """
+        Finalize a fight
+        
+        Args:
+            bout_id: Bout identifier
+            broadcast: broadcast(bout_id, fight_result) coroutine, fired
+                without waiting
+        
+        Returns:
+            The fight_results document
+        """
+        round_results, bout = await self._read(bout_id)
+        
+        # Compute final totals
+        fight_totals = compute_fight_totals(round_results)
+        
+        fighter1_name = bout.get("fighter1", "Red Corner") if bout else "Red Corner"
+        fighter2_name = bout.get("fighter2", "Blue Corner") if bout else "Blue Corner"
+        
+        if fight_totals["winner"] == "RED":
+            winner_name = fighter1_name
+        elif fight_totals["winner"] == "BLUE":
+            winner_name = fighter2_name
+        else:
+            winner_name = "DRAW"
+        
+        fight_result = {
+            "bout_id": bout_id,
+            "final_red": fight_totals["final_red"],
+            "final_blue": fight_totals["final_blue"],
+            "winner": fight_totals["winner"],
+            "winner_name": winner_name,
+            "fighter1_name": fighter1_name,
+            "fighter2_name": fighter2_name,
+            "total_rounds": fight_totals["total_rounds"],
+            "rounds": [
+                {
+                    "round": r.get("round_number"),
+                    "red": r.get("red_points"),
+                    "blue": r.get("blue_points"),
+                    "delta": r.get("delta", 0)
+                }
+                for r in round_results
+            ],
+            "finalized_at": datetime.now(timezone.utc).isoformat()
+        }
+        
+        await self._write(bout_id, fight_result, {
+            "status": "completed",
+            "fighter1_total": fight_totals["final_red"],
+            "fighter2_total": fight_totals["final_blue"],
+            "winner": fight_totals["winner"],
+            "winner_name": winner_name,
+            "finalized_at": fight_result["finalized_at"]
+        })
+        
+        logger.info(f"Fight finalized: {bout_id} - {fighter1_name} {fight_totals['final_red']} vs "
+                    f"{fight_totals['final_blue']} {fighter2_name} | Winner: {winner_name}")
+        
+        if broadcast is not None:
+            self._spawn(broadcast(bout_id, dict(fight_result)), f"Finalization broadcast for {bout_id}")
+        
+        try:
+            await self.jobs.enqueue(bout_id, {"winner": fight_totals["winner"], "finalized_at": fight_result["finalized_at"]})
+        except Exception as e:
+            # The result is stored; the follow-up work can be re-run by finalizing again
+            logger.error(f"Could not queue finalization jobs for {bout_id}: {e}")
+        
+        await self.release(bout_id)
+        return fight_result
+    
+    def on_release(self, hook: ReleaseHook):
+        """Register hook(bout_id), sync or async, run once a bout is over"""
+        self._release_hooks.append(hook)
+    
+    async def release(self, bout_id: str):
+        """Let every subsystem drop its in-memory state for a finished bout"""
+        for hook in self._release_hooks:
+            try:
+                result = hook(bout_id)
+                if result is not None and hasattr(result, "__await__"):
+                    await result
+            except Exception as e:
+                logger.error(f"Release hook for {bout_id} failed: {e}")
+    
+    def start(self):
+        self.jobs.start()
+    
+    async def close(self):
+        await self.jobs.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "transactions": self._transactions,
+            "background_tasks": len(self._background),
+            "release_hooks": len(self._release_hooks),
+            "jobs": self.jobs.get_stats()
+        }
+
+
+# Shared by the scoring routes and the job handlers registered in server.py
+finalizer: Optional[FightFinalizer] = None
+
+
+def init_fight_finalization(database) -> FightFinalizer:
+    """Create the shared FightFinalizer on first call and return it"""
+    global finalizer
+    if finalizer is None or finalizer.db is not database:
+        finalizer = FightFinalizer(database)
+    return finalizer
@@ -3,8 +3,11 @@ Fight Judge AI - Audit Layer
 Append-only logging with SHA256 signatures
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime, timezone
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import hashlib
 import json
 import logging
@@ -13,11 +16,34 @@ from .models import AuditLogEntry
 logger = logging.getLogger(__name__)
 
 
+def compute_signature(log_doc: Dict) -> str:
+    """SHA256 signature of a stored log document (same fields as _generate_signature)"""
+    timestamp = log_doc["timestamp"]
+    sig_data = {
+        "bout_id": log_doc["bout_id"],
+        "round_id": log_doc["round_id"],
+        "action": log_doc["action"],
+        "actor": log_doc["actor"],
+        "timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp,
+        "data": log_doc["data"]
+    }
+    return hashlib.sha256(json.dumps(sig_data, sort_keys=True).encode()).hexdigest()
+
+
+def verify_log_batch(log_docs: List[Dict]) -> List[bool]:
+    """Signature check for a batch of logs (runs in the thread pool)"""
+    return [log_doc.get("signature") == compute_signature(log_doc) for log_doc in log_docs]
+
+
 class AuditLayer:
     """Immutable audit logging"""
     
-    def __init__(self, db):
+    def __init__(self, db, verify_workers: int = 2, verify_batch_size: int = 1000):
         self.db = db
+        self.verify_batch_size = verify_batch_size
+        # Batches hashing at once per verification; bounds the logs held in memory
+        self.verify_window = verify_workers + 1
+        self.executor = ThreadPoolExecutor(max_workers=verify_workers, thread_name_prefix="fjai-audit-verify")
     
     async def log_action(
         self,
@@ -75,6 +101,94 @@ class AuditLayer:
         
         return log_entry.signature == expected_signature
     
+    async def verify_bout(self, bout_id: str, full: bool = False) -> Dict:
+        """
+        Verify every log signature for a bout, resuming from the last checkpoint
+        
+        Logs are read in one (timestamp, log_id) ordered query and hashed in
+        batches on the thread pool, at most verify_window batches at a time;
+        the oldest batch is settled before another is started. The
+        checkpointed log is re-checked before resuming, so only logs appended
+        since the last run are re-hashed.
+        
+        Args:
+            bout_id: Bout identifier
+            full: Ignore the checkpoint and verify from the first log
+        
+        Returns:
+            Verification summary
+        """
+        checkpoint = None if full else await self.db.fjai_audit_checkpoints.find_one({"bout_id": bout_id}, {"_id": 0})
+        query: Dict[str, Any] = {"bout_id": bout_id}
+        resumed_from = 0
+        if checkpoint:
+            anchor = await self.db.fjai_audit_logs.find_one({"log_id": checkpoint["log_id"]}, {"_id": 0})
+            if anchor and verify_log_batch([anchor])[0]:
+                resumed_from = checkpoint["count"]
+                query["$or"] = [
+                    {"timestamp": {"$gt": checkpoint["timestamp"]}},
+                    {"timestamp": checkpoint["timestamp"], "log_id": {"$gt": checkpoint["log_id"]}}
+                ]
+        
+        loop = asyncio.get_running_loop()
+        cursor = self.db.fjai_audit_logs.find(query, {"_id": 0}).sort(
+            [("timestamp", 1), ("log_id", 1)]
+        ).batch_size(self.verify_batch_size)
+        
+        verified = resumed_from
+        checked = 0
+        invalid_log_ids = []
+        last_good = None
+        pending = deque()
+        
+        async def settle_oldest():
+            nonlocal verified, checked, last_good
+            future, logs = pending.popleft()
+            for log_doc, ok in zip(logs, await future):
+                checked += 1
+                if not ok:
+                    invalid_log_ids.append(log_doc.get("log_id"))
+                elif not invalid_log_ids:
+                    verified += 1
+                    last_good = log_doc
+        
+        def submit(logs):
+            pending.append((loop.run_in_executor(self.executor, verify_log_batch, logs), logs))
+        
+        batch = []
+        async for log_doc in cursor:
+            batch.append(log_doc)
+            if len(batch) >= self.verify_batch_size:
+                if len(pending) >= self.verify_window:
+                    await settle_oldest()
+                submit(batch)
+                batch = []
+        if batch:
+            submit(batch)
+        while pending:
+            await settle_oldest()
+        
+        # Checkpoint only advances over the valid prefix
+        if last_good is not None:
+            timestamp = last_good["timestamp"]
+            await self.db.fjai_audit_checkpoints.replace_one({"bout_id": bout_id}, {
+                "bout_id": bout_id,
+                "timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp,
+                "log_id": last_good["log_id"],
+                "count": verified,
+                "verified_at": datetime.now(timezone.utc).isoformat()
+            }, upsert=True)
+        
+        return {
+            "bout_id": bout_id,
+            "total_logs": resumed_from + checked,
+            "verified_logs": verified,
+            "invalid_log_ids": invalid_log_ids,
+            "all_valid": not invalid_log_ids,
+            "resumed_from": resumed_from,
+            "logs_checked": checked
+        }
+    
     async def export_audit_bundle(self, bout_id: str) -> Dict:
         """Export complete audit trail for bout"""
         logs = await self.db.fjai_audit_logs.find(
@@ -7,7 +7,7 @@ from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timezone
 import logging
 import hashlib
-from collections import defaultdict
+from collections import defaultdict, deque
 from .models import CombatEvent, EventType, EventSource
 
 logger = logging.getLogger(__name__)
@@ -21,14 +21,17 @@ class EventPipeline:
         dedup_window_ms: int = 100,
         confidence_threshold: float = 0.5,
         momentum_window_ms: int = 1200,
-        momentum_strike_threshold: int = 3
+        momentum_strike_threshold: int = 3,
+        dedup_history_size: int = 50
     ):
         self.dedup_window_ms = dedup_window_ms
         self.confidence_threshold = confidence_threshold
         self.momentum_window_ms = momentum_window_ms
         self.momentum_strike_threshold = momentum_strike_threshold
+        self.dedup_history_size = dedup_history_size
         
-        self.processed_events: List[CombatEvent] = []
+        # Per-round dedup history: round_id -> bounded (fighter_id, event_type, timestamp_ms)
+        self.recent_by_round: Dict[str, deque] = {}
         self.stats = {
             "total_processed": 0,
             "rejected_low_confidence": 0,
@@ -58,26 +61,34 @@ class EventPipeline:
         event.deduplicated = True
         event.processed_at = datetime.now(timezone.utc)
         
-        # Step 4: Add to processed events
-        self.processed_events.append(event)
+        # Step 4: Add to round dedup history
+        history = self.recent_by_round.get(event.round_id)
+        if history is None:
+            history = deque(maxlen=self.dedup_history_size)
+            self.recent_by_round[event.round_id] = history
+        history.append((event.fighter_id, event.event_type, event.timestamp_ms))
         self.stats["total_processed"] += 1
         
         return True, "Event accepted"
     
     def _is_duplicate(self, event: CombatEvent) -> bool:
         """Check if event is duplicate within time window"""
-        for processed in reversed(self.processed_events[-50:]):  # Check last 50 events
+        history = self.recent_by_round.get(event.round_id)
+        if not history:
+            return False
+        for fighter_id, event_type, timestamp_ms in reversed(history):
             # Same fighter, same event type
-            if (
-                processed.fighter_id == event.fighter_id and
-                processed.event_type == event.event_type
-            ):
+            if fighter_id == event.fighter_id and event_type == event.event_type:
                 # Check time window
-                time_diff = abs(event.timestamp_ms - processed.timestamp_ms)
+                time_diff = abs(event.timestamp_ms - timestamp_ms)
                 if time_diff < self.dedup_window_ms:
                     return True
         return False
     
+    def release_round(self, round_id: str):
+        """Drop dedup history for a locked round"""
+        self.recent_by_round.pop(round_id, None)
+    
     def fuse_multicamera_events(
         self,
         events: List[CombatEvent],
@@ -223,4 +234,6 @@ class EventPipeline:
     
     def get_stats(self) -> Dict:
         """Get pipeline statistics"""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats["retained_rounds"] = len(self.recent_by_round)
+        return stats
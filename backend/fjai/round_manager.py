@@ -184,6 +184,10 @@ class RoundManager:
             data={"event_hash": event_hash, "final_score": round_state.score_card}
         )
         
+        # Locked rounds are served from the database; free in-memory state
+        self.event_pipeline.release_round(round_id)
+        self.active_rounds.pop(round_id, None)
+        
         logger.info(f"Round locked: {round_id} with hash {event_hash}")
         return True
     
@@ -195,7 +199,8 @@ class RoundManager:
         round_doc = await self.db.fjai_rounds.find_one({"round_id": round_id})
         if round_doc:
             round_state = RoundState(**round_doc)
-            self.active_rounds[round_id] = round_state
+            if round_state.status != "locked":
+                self.active_rounds[round_id] = round_state
             return round_state
         
         return None
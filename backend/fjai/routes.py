@@ -201,6 +201,25 @@ async def export_audit_bundle(bout_id: str, manager: RoundManager = Depends(get_
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@fjai_router.get("/audit/verify/bout/{bout_id}")
+async def verify_bout_audit(bout_id: str, full: bool = False, manager: RoundManager = Depends(get_round_manager)):
+    """
+    Verify all audit log signatures for a bout
+    
+    Args:
+        bout_id: Bout identifier
+        full: Re-verify from the first log instead of the last checkpoint
+    
+    Returns:
+        Verification summary
+    """
+    try:
+        return await manager.audit_layer.verify_bout(bout_id, full=full)
+    except Exception as e:
+        logger.error(f"Error verifying bout audit trail: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @fjai_router.get("/audit/verify/{log_id}")
 async def verify_audit_log(log_id: str, manager: RoundManager = Depends(get_round_manager)):
     """
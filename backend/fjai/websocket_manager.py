@@ -4,10 +4,11 @@ Real-time feeds for CV, judge, score, and broadcast
 """
 
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 import json
 import logging
 from datetime import datetime, timezone
+from broadcast_bus import BroadcastBus, ws_bus
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,7 @@ logger = logging.getLogger(__name__)
 class FJAIWebSocketManager:
     """Manage WebSocket connections for Fight Judge AI"""
     
-    def __init__(self):
+    def __init__(self, bus: Optional[BroadcastBus] = None):
         # Connections by feed type
         self.cv_connections: Dict[str, Set[WebSocket]] = {}
         self.judge_connections: Dict[str, Set[WebSocket]] = {}
@@ -27,6 +28,22 @@ class FJAIWebSocketManager:
             "messages_sent": 0,
             "connection_errors": 0
         }
+        
+        # Broadcasts are published once on the bus and fanned out per worker
+        self.bus = bus or ws_bus
+        self.feeds = {
+            "cv": self.cv_connections,
+            "judge": self.judge_connections,
+            "score": self.score_connections,
+            "broadcast": self.broadcast_connections
+        }
+        for feed_type in self.feeds:
+            self.bus.register(f"fjai:{feed_type}", self._local_fanout(feed_type))
+    
+    def _local_fanout(self, feed_type: str):
+        async def deliver(bout_id: str, message: Dict):
+            await self._broadcast_to_feed(self.feeds[feed_type], bout_id, message, feed_type)
+        return deliver
     
     async def connect(self, websocket: WebSocket, feed_type: str, bout_id: str):
         """Connect client to feed"""
@@ -49,6 +66,9 @@ class FJAIWebSocketManager:
                 self.broadcast_connections[bout_id] = set()
             self.broadcast_connections[bout_id].add(websocket)
         
+        if feed_type in self.feeds:
+            self.bus.join(f"fjai:{feed_type}", bout_id)
+        
         logger.info(f"WebSocket connected: {feed_type} for bout {bout_id}")
         
         # Send welcome message
@@ -61,20 +81,18 @@ class FJAIWebSocketManager:
     
     def disconnect(self, websocket: WebSocket, feed_type: str, bout_id: str):
         """Disconnect client"""
-        if feed_type == "cv" and bout_id in self.cv_connections:
-            self.cv_connections[bout_id].discard(websocket)
-        elif feed_type == "judge" and bout_id in self.judge_connections:
-            self.judge_connections[bout_id].discard(websocket)
-        elif feed_type == "score" and bout_id in self.score_connections:
-            self.score_connections[bout_id].discard(websocket)
-        elif feed_type == "broadcast" and bout_id in self.broadcast_connections:
-            self.broadcast_connections[bout_id].discard(websocket)
+        feed_dict = self.feeds.get(feed_type)
+        if feed_dict is not None and websocket in feed_dict.get(bout_id, ()):
+            feed_dict[bout_id].discard(websocket)
+            if not feed_dict[bout_id]:
+                del feed_dict[bout_id]
+            self.bus.leave(f"fjai:{feed_type}", bout_id)
         
         logger.info(f"WebSocket disconnected: {feed_type} for bout {bout_id}")
     
     async def broadcast_cv_event(self, bout_id: str, event_data: Dict):
         """Broadcast CV event to subscribers"""
-        await self._broadcast_to_feed(self.cv_connections, bout_id, {
+        await self.bus.publish("fjai:cv", bout_id, {
             "type": "cv_event",
             "data": event_data,
             "timestamp": datetime.now(timezone.utc).isoformat()
@@ -82,7 +100,7 @@ class FJAIWebSocketManager:
     
     async def broadcast_judge_event(self, bout_id: str, event_data: Dict):
         """Broadcast judge event to subscribers"""
-        await self._broadcast_to_feed(self.judge_connections, bout_id, {
+        await self.bus.publish("fjai:judge", bout_id, {
             "type": "judge_event",
             "data": event_data,
             "timestamp": datetime.now(timezone.utc).isoformat()
@@ -90,7 +108,7 @@ class FJAIWebSocketManager:
     
     async def broadcast_score_update(self, bout_id: str, score_data: Dict):
         """Broadcast score update to subscribers"""
-        await self._broadcast_to_feed(self.score_connections, bout_id, {
+        await self.bus.publish("fjai:score", bout_id, {
             "type": "score_update",
             "data": score_data,
             "timestamp": datetime.now(timezone.utc).isoformat()
@@ -98,20 +116,21 @@ class FJAIWebSocketManager:
     
     async def broadcast_to_displays(self, bout_id: str, broadcast_data: Dict):
         """Broadcast to arena displays"""
-        await self._broadcast_to_feed(self.broadcast_connections, bout_id, {
+        await self.bus.publish("fjai:broadcast", bout_id, {
             "type": "broadcast",
             "data": broadcast_data,
             "timestamp": datetime.now(timezone.utc).isoformat()
         })
     
-    async def _broadcast_to_feed(self, feed_dict: Dict[str, Set[WebSocket]], bout_id: str, message: Dict):
+    async def _broadcast_to_feed(self, feed_dict: Dict[str, Set[WebSocket]], bout_id: str, message: Dict,
+                                 feed_type: Optional[str] = None):
         """Broadcast to all connections in feed"""
         if bout_id not in feed_dict:
             return
         
         dead_connections = set()
         
-        for connection in feed_dict[bout_id]:
+        for connection in list(feed_dict[bout_id]):
             try:
                 await self._send_message(connection, message)
                 self.stats["messages_sent"] += 1
@@ -122,7 +141,10 @@ class FJAIWebSocketManager:
         
         # Clean up dead connections
         for connection in dead_connections:
-            feed_dict[bout_id].discard(connection)
+            if feed_type is not None:
+                self.disconnect(connection, feed_type, bout_id)
+            else:
+                feed_dict[bout_id].discard(connection)
     
     async def _send_message(self, websocket: WebSocket, message: Dict):
         """Send message to specific connection"""
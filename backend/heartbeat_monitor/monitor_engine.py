@@ -1,8 +1,11 @@
 """Heartbeat Monitor - Monitoring Engine"""
 
+import asyncio
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime, timezone, timedelta
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from datetime import datetime, timezone
+from pymongo.errors import BulkWriteError
 from .models import HeartbeatData, HeartbeatRecord, ServiceStatus, HeartbeatSummary
 
 logger = logging.getLogger(__name__)
@@ -10,6 +13,12 @@ logger = logging.getLogger(__name__)
 # Heartbeat timeout (consider service offline after 15 seconds without heartbeat)
 HEARTBEAT_TIMEOUT_SEC = 15
 
+# Stored heartbeats expire via a TTL index on received_at (see database/indexes.py)
+HEARTBEAT_RETENTION_SEC = 3600
+
+# Duplicate key: the heartbeat was stored by an earlier attempt
+DUPLICATE_KEY = 11000
+
 # Expected services
 EXPECTED_SERVICES = [
     "CV Router",
@@ -25,18 +34,46 @@ EXPECTED_SERVICES = [
 class HeartbeatMonitor:
     """Monitor service health via heartbeats"""
     
-    def __init__(self, db=None):
+    def __init__(self, db=None, flush_interval_ms: int = 2000, max_batch: int = 500,
+                 history_size: int = 200):
+        """
+        Args:
+            db: Motor database handle
+            flush_interval_ms: Maximum time a heartbeat waits before insert_many
+            max_batch: Flush immediately once this many heartbeats are pending
+            history_size: Heartbeats kept in memory per service
+        """
         self.db = db
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch = max_batch
+        self.history_size = history_size
         
         # In-memory cache of latest heartbeats
         self.latest_heartbeats: Dict[str, HeartbeatRecord] = {}
         
+        # Recent heartbeats per service, newest last
+        self.history: Dict[str, Deque[HeartbeatRecord]] = {}
+        
+        # Write-behind buffer for the heartbeats collection
+        self.pending: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        
+        self.stats = {
+            "flushes": 0,
+            "heartbeats_written": 0,
+            "flush_errors": 0
+        }
+        
         logger.info("Heartbeat Monitor initialized")
     
     async def record_heartbeat(self, heartbeat: HeartbeatData) -> HeartbeatRecord:
         """
         Record a heartbeat from a service
         
+        The record is cached in memory immediately and persisted by the next
+        batched flush.
+        
         Args:
             heartbeat: Heartbeat data from service
         
@@ -53,34 +90,113 @@ class HeartbeatMonitor:
         
         # Update in-memory cache
         self.latest_heartbeats[heartbeat.service_name] = record
+        history = self.history.get(heartbeat.service_name)
+        if history is None:
+            history = deque(maxlen=self.history_size)
+            self.history[heartbeat.service_name] = history
+        history.append(record)
         
-        # Store in database if available
+        # Queue for the database; received_at stays a datetime for the TTL index
         if self.db is not None:
-            try:
-                # Convert to dict for MongoDB
-                record_dict = record.model_dump()
-                record_dict['timestamp'] = record_dict['timestamp'].isoformat()
-                record_dict['received_at'] = record_dict['received_at'].isoformat()
-                
-                await self.db.heartbeats.insert_one(record_dict)
-                
-                # Keep only last 1000 heartbeats per service (cleanup)
-                await self.db.heartbeats.delete_many({
-                    "service_name": heartbeat.service_name,
-                    "received_at": {"$lt": (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()}
-                })
-            except Exception as e:
-                logger.error(f"Error storing heartbeat in database: {e}")
+            self.pending.append(record.model_dump())
+            if len(self.pending) >= self.max_batch:
+                await self.flush()
+            else:
+                self._ensure_flusher()
         
         logger.debug(f"Heartbeat recorded: {heartbeat.service_name} [{heartbeat.status}]")
         return record
     
-    def get_service_status(self, service_name: str) -> ServiceStatus:
+    async def flush(self) -> int:
+        """
+        Write pending heartbeats with one insert_many
+        
+        Returns:
+            Number of heartbeats written
+        """
+        async with self._flush_lock:
+            batch, self.pending = self.pending, []
+            if not batch:
+                return 0
+            
+            try:
+                await self.db.heartbeats.insert_many(batch, ordered=False)
+            except BulkWriteError as e:
+                # Unordered: everything except the reported errors was inserted
+                failed = {
+                    err["index"] for err in e.details.get("writeErrors", [])
+                    if err.get("code") != DUPLICATE_KEY
+                }
+                retry = [batch[i] for i in sorted(failed)]
+                for doc in retry:
+                    doc.pop("_id", None)
+                self._requeue(retry)
+                written = e.details.get("nInserted", len(batch) - len(failed))
+                logger.error(f"Error storing {len(retry)} of {len(batch)} heartbeats in database: {e}")
+                self.stats["heartbeats_written"] += written
+                return written
+            except Exception as e:
+                # Outcome unknown: keep the _ids insert_many assigned, so rows that
+                # did land come back as duplicate keys on the retry
+                self._requeue(batch)
+                logger.error(f"Error storing {len(batch)} heartbeats in database: {e}")
+                return 0
+            
+            self.stats["flushes"] += 1
+            self.stats["heartbeats_written"] += len(batch)
+            return len(batch)
+    
+    def _requeue(self, batch: List[Dict[str, Any]]):
+        """Requeue ahead of newer heartbeats, bounded so an outage can't grow memory"""
+        self.stats["flush_errors"] += 1
+        self.pending[:0] = batch[-self.max_batch * 4:]
+    
+    async def migrate_legacy_rows(self) -> int:
+        """
+        Convert heartbeats stored with ISO-string timestamps to datetimes
+        
+        The TTL index only expires datetime values, so rows written before
+        the switch would otherwise never be removed. Idempotent.
+        
+        Returns:
+            Number of rows converted
+        """
+        result = await self.db.heartbeats.update_many(
+            {"received_at": {"$type": "string"}},
+            [{"$set": {
+                "received_at": {"$toDate": "$received_at"},
+                "timestamp": {"$convert": {"input": "$timestamp", "to": "date", "onError": "$timestamp"}}
+            }}]
+        )
+        if result.modified_count:
+            logger.info(f"Converted {result.modified_count} legacy heartbeats for TTL expiry")
+        return result.modified_count
+    
+    def _ensure_flusher(self):
+        """Start the interval flusher on the running loop if it is not active"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+    
+    async def _flush_loop(self):
+        """Flush every flush_interval_ms until nothing is pending"""
+        while self.pending:
+            await asyncio.sleep(self.flush_interval_ms / 1000.0)
+            await self.flush()
+    
+    async def close(self):
+        """Durability flush on shutdown"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        if self.db is not None:
+            await self.flush()
+    
+    def get_service_status(self, service_name: str, now: Optional[datetime] = None) -> ServiceStatus:
         """
         Get current status of a specific service
         
         Args:
             service_name: Name of the service
+            now: Reference time (defaults to the current time)
         
         Returns:
             ServiceStatus
@@ -97,7 +213,7 @@ class HeartbeatMonitor:
             )
         
         # Calculate time since last heartbeat
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
         time_since = (now - latest.received_at).total_seconds()
         
         # Determine if service is offline (no heartbeat for > HEARTBEAT_TIMEOUT_SEC)
@@ -127,6 +243,8 @@ class HeartbeatMonitor:
         """
         Get summary of all service statuses
         
+        Served from the in-memory latest heartbeats; never touches the database.
+        
         Returns:
             HeartbeatSummary with counts and service list
         """
@@ -137,8 +255,9 @@ class HeartbeatMonitor:
         offline_count = 0
         
         # Check all expected services
+        now = datetime.now(timezone.utc)
         for service_name in EXPECTED_SERVICES:
-            status = self.get_service_status(service_name)
+            status = self.get_service_status(service_name, now)
             services.append(status)
             
             if status.status == "ok":
@@ -163,19 +282,25 @@ class HeartbeatMonitor:
         """
         Get heartbeat history for a service
         
+        Recent heartbeats come from the in-memory ring buffer; the database is
+        only queried when more are requested than the buffer holds.
+        
         Args:
             service_name: Name of the service
             limit: Maximum number of records to return
         
         Returns:
-            List of HeartbeatRecord
+            List of HeartbeatRecord, newest first
         """
-        if self.db is None:
-            # Return in-memory data only
-            latest = self.latest_heartbeats.get(service_name)
-            return [latest] if latest else []
+        history = self.history.get(service_name, ())
+        if self.db is None or limit <= len(history):
+            recent = list(history)[-limit:] if limit > 0 else []
+            recent.reverse()
+            return recent
         
         try:
+            await self.flush()
+            
             # Query database
             cursor = self.db.heartbeats.find(
                 {"service_name": service_name},
@@ -184,18 +309,32 @@ class HeartbeatMonitor:
             
             records = await cursor.to_list(length=limit)
             
-            # Convert to HeartbeatRecord objects
+            # Convert to HeartbeatRecord objects (older rows stored ISO strings)
             return [
                 HeartbeatRecord(
                     id=r["id"],
                     service_name=r["service_name"],
-                    timestamp=datetime.fromisoformat(r["timestamp"]),
+                    timestamp=_as_datetime(r["timestamp"]),
                     status=r["status"],
                     metrics=r["metrics"],
-                    received_at=datetime.fromisoformat(r["received_at"])
+                    received_at=_as_datetime(r["received_at"])
                 )
                 for r in records
             ]
         except Exception as e:
             logger.error(f"Error fetching service history: {e}")
             return []
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Write buffer statistics"""
+        return {
+            **self.stats,
+            "pending": len(self.pending),
+            "services_buffered": len(self.history),
+            "flush_interval_ms": self.flush_interval_ms,
+            "max_batch": self.max_batch
+        }
+
+
+def _as_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
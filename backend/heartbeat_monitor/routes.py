@@ -56,6 +56,12 @@ async def get_service_history(service_name: str, limit: int = 100):
     mon = get_monitor()
     return await mon.get_service_history(service_name, limit)
 
+@heartbeat_api.get("/heartbeat/stats")
+async def get_heartbeat_stats():
+    """Write buffer statistics"""
+    mon = get_monitor()
+    return mon.get_stats()
+
 @heartbeat_api.get("/heartbeat/health")
 async def health_check():
     return {"status": "healthy", "service": "Heartbeat Monitor", "version": "1.0.0"}
@@ -43,6 +43,8 @@ class VideoClip(BaseModel):
     
     # Status
     status: ClipStatus = ClipStatus.PENDING
+    severity: float = 0.0  # Highest severity among merged events (queue priority)
+    event_ids: List[str] = Field(default_factory=list)  # Events covered by this clip
     
     # Metadata
     created_at: datetime = Field(default_factory=datetime.now)
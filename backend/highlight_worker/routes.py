@@ -38,6 +38,12 @@ async def generate_clip(
     engine = get_highlight_engine()
     return await engine.generate_manual_clip(bout_id, round_id, timestamp_ms, event_type)
 
+@highlight_worker_api.get("/metrics")
+async def get_metrics():
+    """Clip pipeline throughput and queue latency"""
+    engine = get_highlight_engine()
+    return engine.get_metrics()
+
 @highlight_worker_api.get("/health")
 async def health_check():
     return {"status": "healthy", "service": "Highlight Worker", "version": "1.0.0"}
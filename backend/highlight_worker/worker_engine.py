@@ -1,9 +1,17 @@
 """
 Highlight Worker - Background Worker Engine
+
+A pool of N clip workers drains a priority queue ordered by event severity.
+Events whose clip windows overlap an existing clip of the same bout/round
+are merged into that clip instead of producing another one.
 """
 
 import asyncio
-from typing import List
+import bisect
+import itertools
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
 import logging
 import uuid
 from datetime import datetime
@@ -16,7 +24,7 @@ logger = logging.getLogger(__name__)
 
 
 class HighlightWorkerEngine:
-    """Background worker for highlight generation"""
+    """Background worker pool for highlight generation"""
     
     # Major events that trigger highlight generation
     HIGHLIGHT_EVENTS = {
@@ -28,30 +36,75 @@ class HighlightWorkerEngine:
         EventType.SUB_ATTEMPT
     }
     
-    def __init__(self):
-        self.clips: List[VideoClip] = []
-        self.processing_queue = asyncio.Queue()
+    def __init__(self, num_workers: int = 4, pre_roll_ms: int = 5000, post_roll_ms: int = 10000,
+                 render_time_s: float = 2.0):
+        """
+        Args:
+            num_workers: Concurrent clip generators
+            pre_roll_ms: Footage kept before the event
+            post_roll_ms: Footage kept after the event
+            render_time_s: Simulated generation time per clip
+        """
+        self.num_workers = num_workers
+        self.pre_roll_ms = pre_roll_ms
+        self.post_roll_ms = post_roll_ms
+        self.render_time_s = render_time_s
         
-        # Start background worker
-        asyncio.create_task(self._process_queue())
+        # Clip metadata indexed by bout (creation order) and by id
+        self.clips_by_bout: Dict[str, List[VideoClip]] = {}
+        self.clips_by_id: Dict[str, VideoClip] = {}
+        
+        # (bout_id, round_id) -> clips sorted by start_time_ms, non-overlapping
+        self._windows: Dict[Tuple[str, str], List[VideoClip]] = {}
+        
+        # Priority queue of (-severity, seq, clip_id, version); stale versions are skipped
+        self.processing_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._seq = itertools.count()
+        self._versions: Dict[str, int] = {}
+        self._rerender: set = set()
+        self._queued_at: Dict[str, float] = {}
+        self._workers: List[asyncio.Task] = []
+        
+        # Metrics
+        self.events_received = 0
+        self.events_merged = 0
+        self.clips_completed = 0
+        self.clips_failed = 0
+        self.queue_latencies_ms: deque = deque(maxlen=500)
+        self.render_times_ms: deque = deque(maxlen=500)
+        self.completed_at: deque = deque(maxlen=1000)
     
-    async def watch_event(self, event: CombatEvent):
+    async def watch_event(self, event: CombatEvent) -> Optional[VideoClip]:
         """
         Watch event and generate clip if major event
         
         Args:
             event: Combat event
+        
+        Returns:
+            The clip covering the event (new or merged), or None
         """
-        if event.event_type in self.HIGHLIGHT_EVENTS:
+        if event.event_type not in self.HIGHLIGHT_EVENTS:
+            return None
+        
+        self.events_received += 1
+        clip = self._merge_into_existing(event)
+        if clip is None:
             clip = self._create_clip_metadata(event)
-            await self.processing_queue.put(clip)
             logger.info(f"Queued clip generation for {event.event_type.value}")
+        else:
+            self.events_merged += 1
+            logger.info(f"Merged {event.event_type.value} into clip {clip.clip_id}")
+        
+        self._enqueue(clip)
+        self._ensure_workers()
+        return clip
     
     def _create_clip_metadata(self, event: CombatEvent) -> VideoClip:
         """Create clip metadata from event"""
         # 5s before, 10s after = 15s total
-        start_time = event.timestamp_ms - 5000
-        end_time = event.timestamp_ms + 10000
+        start_time = event.timestamp_ms - self.pre_roll_ms
+        end_time = event.timestamp_ms + self.post_roll_ms
         
         clip = VideoClip(
             clip_id=str(uuid.uuid4()),
@@ -62,22 +115,128 @@ class HighlightWorkerEngine:
             timestamp_ms=event.timestamp_ms,
             start_time_ms=start_time,
             end_time_ms=end_time,
-            duration_sec=15.0,
+            duration_sec=(end_time - start_time) / 1000.0,
             camera_angles=["cam_1", "cam_2"],  # Mock
-            status=ClipStatus.PENDING
+            status=ClipStatus.PENDING,
+            severity=event.severity,
+            event_ids=[event.event_id]
         )
         
-        self.clips.append(clip)
+        self.clips_by_bout.setdefault(clip.bout_id, []).append(clip)
+        self.clips_by_id[clip.clip_id] = clip
+        windows = self._windows.setdefault((clip.bout_id, clip.round_id), [])
+        windows.insert(self._window_position(windows, clip.start_time_ms), clip)
         return clip
     
+    @staticmethod
+    def _window_position(windows: List[VideoClip], start_ms: int) -> int:
+        return bisect.bisect_left(windows, start_ms, key=lambda c: c.start_time_ms)
+    
+    def _merge_into_existing(self, event: CombatEvent) -> Optional[VideoClip]:
+        """
+        Extend the clip whose window overlaps the event's window
+        
+        Windows stay sorted and disjoint per (bout, round), so only the
+        neighbours of the insertion point can overlap. If the extended clip
+        now reaches the next clip, that clip is absorbed too.
+        """
+        windows = self._windows.get((event.bout_id, event.round_id))
+        if not windows:
+            return None
+        
+        start = event.timestamp_ms - self.pre_roll_ms
+        end = event.timestamp_ms + self.post_roll_ms
+        i = self._window_position(windows, start)
+        
+        target = None
+        for candidate in (windows[i - 1] if i > 0 else None, windows[i] if i < len(windows) else None):
+            if candidate is not None and candidate.start_time_ms <= end and start <= candidate.end_time_ms:
+                target = candidate
+                break
+        if target is None:
+            return None
+        
+        target.start_time_ms = min(target.start_time_ms, start)
+        target.end_time_ms = max(target.end_time_ms, end)
+        target.event_ids.append(event.event_id)
+        if event.severity > target.severity:
+            # Clip is labelled by its most severe event
+            target.severity = event.severity
+            target.event_type = event.event_type
+            target.fighter_id = event.fighter_id
+            target.timestamp_ms = event.timestamp_ms
+        
+        # Absorb following clips the extended window now overlaps
+        position = windows.index(target)
+        while position + 1 < len(windows) and windows[position + 1].start_time_ms <= target.end_time_ms:
+            absorbed = windows.pop(position + 1)
+            self._absorb(target, absorbed)
+        
+        target.duration_sec = (target.end_time_ms - target.start_time_ms) / 1000.0
+        return target
+    
+    def _absorb(self, target: VideoClip, absorbed: VideoClip):
+        target.end_time_ms = max(target.end_time_ms, absorbed.end_time_ms)
+        target.event_ids.extend(absorbed.event_ids)
+        if absorbed.severity > target.severity:
+            target.severity = absorbed.severity
+            target.event_type = absorbed.event_type
+            target.fighter_id = absorbed.fighter_id
+            target.timestamp_ms = absorbed.timestamp_ms
+        
+        self.clips_by_id.pop(absorbed.clip_id, None)
+        self._versions.pop(absorbed.clip_id, None)  # Invalidates its queue entry
+        self._queued_at.pop(absorbed.clip_id, None)
+        bout_clips = self.clips_by_bout.get(absorbed.bout_id, [])
+        if absorbed in bout_clips:
+            bout_clips.remove(absorbed)
+    
+    def _enqueue(self, clip: VideoClip):
+        """Queue (or re-queue at new priority) a clip for generation"""
+        if clip.status == ClipStatus.PROCESSING:
+            # Window changed mid-render: render again once this pass finishes
+            self._rerender.add(clip.clip_id)
+            return
+        
+        clip.status = ClipStatus.PENDING
+        version = self._versions.get(clip.clip_id, 0) + 1
+        self._versions[clip.clip_id] = version
+        self._queued_at.setdefault(clip.clip_id, time.perf_counter())
+        self.processing_queue.put_nowait((-clip.severity, next(self._seq), clip.clip_id, version))
+    
+    def _ensure_workers(self):
+        """Start the worker pool on the running loop if it is not active"""
+        self._workers = [task for task in self._workers if not task.done()]
+        loop = asyncio.get_running_loop()
+        while len(self._workers) < self.num_workers:
+            self._workers.append(loop.create_task(self._process_queue()))
+    
     async def _process_queue(self):
-        """Background processor for clip generation"""
+        """Clip worker: highest-severity pending clip first"""
         while True:
+            _, _, clip_id, version = await self.processing_queue.get()
+            clip = self.clips_by_id.get(clip_id)
+            if clip is None or self._versions.get(clip_id) != version or clip.status != ClipStatus.PENDING:
+                continue  # Superseded, merged away, or already taken
+            
+            queued_at = self._queued_at.pop(clip_id, None)
+            started = time.perf_counter()
+            if queued_at is not None:
+                self.queue_latencies_ms.append((started - queued_at) * 1000)
+            
             try:
-                clip = await self.processing_queue.get()
                 await self._generate_clip(clip)
+                self.clips_completed += 1
+                self.completed_at.append(time.monotonic())
             except Exception as e:
+                clip.status = ClipStatus.FAILED
+                self.clips_failed += 1
                 logger.error(f"Error processing clip: {e}")
+            self.render_times_ms.append((time.perf_counter() - started) * 1000)
+            
+            if clip_id in self._rerender and clip_id in self.clips_by_id:
+                self._rerender.discard(clip_id)
+                self._enqueue(clip)
     
     async def _generate_clip(self, clip: VideoClip):
         """
@@ -92,7 +251,7 @@ class HighlightWorkerEngine:
         clip.status = ClipStatus.PROCESSING
         
         # Simulate processing
-        await asyncio.sleep(2)
+        await asyncio.sleep(self.render_time_s)
         
         # Mock S3 URL
         clip.storage_url = f"s3://fight-highlights/{clip.bout_id}/{clip.clip_id}.mp4"
@@ -103,7 +262,55 @@ class HighlightWorkerEngine:
     
     def get_clips(self, bout_id: str) -> List[VideoClip]:
         """Get all clips for bout"""
-        return [c for c in self.clips if c.bout_id == bout_id]
+        return list(self.clips_by_bout.get(bout_id, []))
+    
+    def release_bout(self, bout_id: str) -> int:
+        """Drop clip metadata for a bout once it is archived"""
+        clips = self.clips_by_bout.pop(bout_id, [])
+        for clip in clips:
+            self.clips_by_id.pop(clip.clip_id, None)
+            self._versions.pop(clip.clip_id, None)
+            self._queued_at.pop(clip.clip_id, None)
+            self._rerender.discard(clip.clip_id)
+        for key in [k for k in self._windows if k[0] == bout_id]:
+            del self._windows[key]
+        return len(clips)
+    
+    def get_metrics(self) -> Dict:
+        """Throughput and queue latency for the clip pipeline"""
+        now = time.monotonic()
+        completed_last_minute = sum(1 for t in self.completed_at if now - t <= 60)
+        latencies = sorted(self.queue_latencies_ms)
+        
+        def percentile(values: List[float], pct: float) -> float:
+            if not values:
+                return 0.0
+            return values[min(len(values) - 1, int(len(values) * pct))]
+        
+        return {
+            "num_workers": self.num_workers,
+            "active_workers": len([t for t in self._workers if not t.done()]),
+            "queue_depth": sum(1 for c in self.clips_by_id.values() if c.status == ClipStatus.PENDING),
+            "processing": sum(1 for c in self.clips_by_id.values() if c.status == ClipStatus.PROCESSING),
+            "events_received": self.events_received,
+            "events_merged": self.events_merged,
+            "clips_completed": self.clips_completed,
+            "clips_failed": self.clips_failed,
+            "clips_per_minute": completed_last_minute,
+            "queue_latency_ms": {
+                "avg": sum(latencies) / len(latencies) if latencies else 0.0,
+                "p95": percentile(latencies, 0.95),
+                "max": latencies[-1] if latencies else 0.0
+            },
+            "avg_render_ms": sum(self.render_times_ms) / len(self.render_times_ms) if self.render_times_ms else 0.0,
+            "bouts": len(self.clips_by_bout)
+        }
+    
+    async def close(self):
+        """Stop the worker pool"""
+        for task in self._workers:
+            task.cancel()
+        self._workers = []
     
     async def generate_manual_clip(
         self,
@@ -126,5 +333,4 @@ class HighlightWorkerEngine:
             source=EventSource.MANUAL
         )
         
-        await self.watch_event(mock_event)
-        return self.clips[-1]
+        return await self.watch_event(mock_event)
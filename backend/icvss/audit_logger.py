@@ -8,6 +8,7 @@ from typing import Dict, List, Any
 from datetime import datetime, timezone
 import logging
 from .models import AuditLog
+from .event_buckets import EventBucketStore
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +19,9 @@ class AuditLogger:
     def __init__(self, db):
         self.db = db
     
-    async def log_action(self, bout_id: str, round_id: str, action: str, actor: str, data: Dict) -> AuditLog:
-        """Log an action with SHA256 hash"""
-        # Create log entry
-        log_entry = AuditLog(
+    def build_entry(self, bout_id: str, round_id: str, action: str, actor: str, data: Dict) -> AuditLog:
+        """Create a hashed log entry without writing it (for batched inserts)"""
+        return AuditLog(
             bout_id=bout_id,
             round_id=round_id,
             action=action,
@@ -29,6 +29,11 @@ class AuditLogger:
             data=data,
             data_hash=self._generate_hash(data)
         )
+    
+    async def log_action(self, bout_id: str, round_id: str, action: str, actor: str, data: Dict) -> AuditLog:
+        """Log an action with SHA256 hash"""
+        # Create log entry
+        log_entry = self.build_entry(bout_id, round_id, action, actor, data)
         
         # Store in database
         await self.db.icvss_audit_logs.insert_one(log_entry.model_dump())
@@ -71,9 +76,9 @@ class AuditLogger:
             logger.warning(f"No hash found for round {round_id}")
             return False
         
-        # Recalculate hash
-        events = round_doc.get("cv_events", []) + round_doc.get("judge_events", [])
-        calculated_hash = self.generate_event_hash(events)
+        # Recalculate hash from event buckets (plus any legacy embedded arrays)
+        events = await EventBucketStore(self.db).load_events(round_id, legacy_doc=round_doc)
+        calculated_hash = self.generate_event_hash(events["cv_events"] + events["judge_events"])
         
         # Compare
         is_valid = stored_hash == calculated_hash
@@ -0,0 +1,142 @@
+"""
+ICVSS Bucketed Event Storage
+CV/judge events live in fixed-size buckets in icvss_event_buckets instead of
+arrays embedded in the icvss_rounds document:
+
+    {round_id, bout_id, kind: "cv"|"judge", bucket_index, count,
+     start_ts, end_ts, events: [...]}
+
+Appends never rewrite a growing round document, no round can approach the
+16MB BSON limit, and reads stream buckets in order.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from pymongo import UpdateOne, ASCENDING
+from pymongo.errors import BulkWriteError
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Round document array field -> bucket kind
+FIELD_KINDS = {"cv_events": "cv", "judge_events": "judge"}
+
+
+class PartialAppendError(Exception):
+    """append_many failed after its first `written` documents were stored"""
+
+    def __init__(self, written: int, cause: Exception):
+        super().__init__(f"{written} events written before: {cause}")
+        self.written = written
+        self.cause = cause
+
+
+class EventBucketStore:
+    """Fixed-size event buckets per (round, kind)"""
+
+    def __init__(self, db, bucket_size: int = 200):
+        self.db = db
+        self.bucket_size = bucket_size
+        # (round_id, kind) -> (bucket_index, count) of the bucket being filled
+        self._cursors: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+    @property
+    def collection(self):
+        return self.db.icvss_event_buckets
+
+    async def _get_cursor(self, round_id: str, kind: str) -> Tuple[int, int]:
+        """Current fill position, recovered from the newest bucket after a restart"""
+        key = (round_id, kind)
+        cursor = self._cursors.get(key)
+        if cursor is None:
+            latest = await self.collection.find_one(
+                {"round_id": round_id, "kind": kind},
+                {"bucket_index": 1, "count": 1},
+                sort=[("bucket_index", -1)]
+            )
+            cursor = (latest["bucket_index"], latest["count"]) if latest else (0, 0)
+            self._cursors[key] = cursor
+        return cursor
+
+    async def append_many(self, round_id: str, bout_id: str, field: str, docs: List[Dict[str, Any]]) -> int:
+        """
+        Append event documents, splitting them across fixed-size buckets
+
+        Returns:
+            Number of buckets touched
+        """
+        if not docs:
+            return 0
+
+        kind = FIELD_KINDS[field]
+        bucket_index, count = await self._get_cursor(round_id, kind)
+
+        operations = []
+        # Cursor and documents written once each operation has been applied
+        progress: List[Tuple[int, int, int]] = []
+        offset = 0
+        while offset < len(docs):
+            if count >= self.bucket_size:
+                bucket_index += 1
+                count = 0
+            chunk = docs[offset:offset + self.bucket_size - count]
+            timestamps = [d.get("timestamp_ms", 0) for d in chunk]
+            operations.append(UpdateOne(
+                {"round_id": round_id, "kind": kind, "bucket_index": bucket_index},
+                {
+                    "$push": {"events": {"$each": chunk}},
+                    "$inc": {"count": len(chunk)},
+                    "$min": {"start_ts": min(timestamps)},
+                    "$max": {"end_ts": max(timestamps)},
+                    "$setOnInsert": {"bout_id": bout_id}
+                },
+                upsert=True
+            ))
+            count += len(chunk)
+            offset += len(chunk)
+            progress.append((bucket_index, count, offset))
+
+        try:
+            await self.collection.bulk_write(operations, ordered=True)
+        except BulkWriteError as e:
+            # Ordered: every operation before the first error was applied
+            errors = e.details.get("writeErrors") or []
+            applied = errors[0]["index"] if errors else len(operations)
+            if applied == 0:
+                raise
+            landed_index, landed_count, written = progress[applied - 1]
+            self._cursors[(round_id, kind)] = (landed_index, landed_count)
+            raise PartialAppendError(written, e) from e
+
+        self._cursors[(round_id, kind)] = (bucket_index, count)
+        return len(operations)
+
+    async def iter_events(self, round_id: str, kind: Optional[str] = None):
+        """Stream event documents for a round in bucket order"""
+        query: Dict[str, Any] = {"round_id": round_id}
+        if kind:
+            query["kind"] = kind
+        cursor = self.collection.find(
+            query, {"_id": 0, "kind": 1, "events": 1}
+        ).sort([("kind", ASCENDING), ("bucket_index", ASCENDING)])
+        async for bucket in cursor:
+            for event in bucket.get("events", []):
+                yield bucket["kind"], event
+
+    async def load_events(self, round_id: str, legacy_doc: Optional[Dict[str, Any]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Load all events for a round as {"cv_events": [...], "judge_events": [...]}
+
+        Arrays still embedded in a legacy round document are included first.
+        """
+        result = {
+            "cv_events": list((legacy_doc or {}).get("cv_events", [])),
+            "judge_events": list((legacy_doc or {}).get("judge_events", []))
+        }
+        async for kind, event in self.iter_events(round_id):
+            result["cv_events" if kind == "cv" else "judge_events"].append(event)
+        return result
+
+    def release_round(self, round_id: str):
+        """Drop fill cursors for a locked round"""
+        for kind in FIELD_KINDS.values():
+            self._cursors.pop((round_id, kind), None)
@@ -3,12 +3,14 @@ ICVSS Event Processing Pipeline
 - Deduplication (80-150ms window)
 - Confidence filtering
 - Normalization
+- Round-partitioned retention (evicted on round lock)
 """
 
 from typing import List, Dict, Tuple
 from datetime import datetime, timezone
 import logging
 from .models import CVEvent, EventSource
+from .event_store import RoundEventStore, EventRecord
 
 logger = logging.getLogger(__name__)
 
@@ -18,15 +20,23 @@ class EventProcessor:
     
     def __init__(self, 
                  dedup_window_ms: int = 100,
-                 confidence_threshold: float = 0.6):
+                 confidence_threshold: float = 0.6,
+                 max_events_per_round: int = 5000,
+                 max_rounds: int = 64):
         """
         Args:
             dedup_window_ms: Deduplication window in milliseconds (80-150)
             confidence_threshold: Minimum confidence to accept events
+            max_events_per_round: Retained history cap per round partition
+            max_rounds: Retained round partitions before LRU eviction
         """
         self.dedup_window_ms = dedup_window_ms
         self.confidence_threshold = confidence_threshold
-        self.processed_events: List[CVEvent] = []
+        self.event_store = RoundEventStore(
+            max_events_per_round=max_events_per_round,
+            max_rounds=max_rounds
+        )
+        self.total_accepted = 0
         self.dedup_count = 0  # Track deduplicated events
     
     def process_event(self, event: CVEvent) -> Tuple[bool, str]:
@@ -54,8 +64,13 @@ class EventProcessor:
         normalized_event.deduplicated = True
         normalized_event.processed_at = datetime.now(timezone.utc)
         
-        # Step 5: Add to processed events
-        self.processed_events.append(normalized_event)
+        # Step 5: Retain compact record in the round partition
+        self.event_store.append(
+            normalized_event.bout_id,
+            normalized_event.round_id,
+            EventRecord.from_event(normalized_event)
+        )
+        self.total_accepted += 1
         
         logger.info(f"Event {event.event_id} accepted: {event.event_type} for {event.fighter_id} at {event.timestamp_ms}ms")
         return True, "Accepted"
@@ -91,11 +106,19 @@ class EventProcessor:
         Check if event is a duplicate within the deduplication window
         
         Duplicate criteria:
+        - Same bout/round partition
         - Same fighter_id
         - Same event_type
         - Within dedup_window_ms milliseconds
         """
-        for existing_event in reversed(self.processed_events[-50:]):  # Check last 50 events
+        partition = self.event_store.get_round(new_event.bout_id, new_event.round_id)
+        if not partition:
+            return False
+        
+        new_event_type = new_event.event_type.value
+        for index, existing_event in enumerate(reversed(partition)):
+            if index >= 50:  # Check last 50 events
+                break
             # Check time window
             time_diff = abs(new_event.timestamp_ms - existing_event.timestamp_ms)
             if time_diff > self.dedup_window_ms:
@@ -103,7 +126,7 @@ class EventProcessor:
             
             # Check if same fighter and event type
             if (existing_event.fighter_id == new_event.fighter_id and
-                existing_event.event_type == new_event.event_type):
+                existing_event.event_type == new_event_type):
                 logger.debug(f"Duplicate found: {new_event.event_type} within {time_diff}ms")
                 return True
         
@@ -132,23 +155,31 @@ class EventProcessor:
         
         return event
     
-    def get_events_for_round(self, bout_id: str, round_id: str) -> List[CVEvent]:
+    def get_events_for_round(self, bout_id: str, round_id: str) -> List[EventRecord]:
+        """
+        Get retained event records for a specific round (O(1) partition lookup)
+        """
+        return self.event_store.records(bout_id, round_id)
+    
+    def release_round(self, bout_id: str, round_id: str) -> int:
         """
-        Get all processed events for a specific round
+        Evict a round partition once the round is locked
+        
+        Returns:
+            Number of records freed
         """
-        return [
-            event for event in self.processed_events
-            if event.bout_id == bout_id and event.round_id == round_id
-        ]
+        freed = self.event_store.evict_round(bout_id, round_id)
+        if freed:
+            logger.info(f"Released {freed} retained events for round {round_id}")
+        return freed
     
     def clear_old_events(self, keep_last_n: int = 1000):
         """
         Clear old events to prevent memory buildup
-        Keeps only the last N events
+        Evicts least recently used rounds until at most N events remain
         """
-        if len(self.processed_events) > keep_last_n:
-            removed = len(self.processed_events) - keep_last_n
-            self.processed_events = self.processed_events[-keep_last_n:]
+        removed = self.event_store.evict_oldest(keep_last_n)
+        if removed:
             logger.info(f"Cleared {removed} old events from memory")
     
     def get_stats(self) -> Dict:
@@ -156,9 +187,11 @@ class EventProcessor:
         Get processor statistics
         """
         return {
-            "total_processed": len(self.processed_events),
+            "total_processed": self.total_accepted,
+            "dedup_count": self.dedup_count,
             "dedup_window_ms": self.dedup_window_ms,
-            "confidence_threshold": self.confidence_threshold
+            "confidence_threshold": self.confidence_threshold,
+            "memory": self.event_store.get_memory_stats()
         }
 
 
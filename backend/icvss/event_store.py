@@ -0,0 +1,140 @@
+"""
+ICVSS Round-Partitioned Event Store
+- Compact __slots__ event records (no pydantic instances retained)
+- O(1) round lookup keyed by (bout_id, round_id)
+- Bounded per-round history with eviction on round lock
+"""
+
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
+import sys
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EventRecord:
+    """Compact retained view of an accepted CVEvent"""
+
+    __slots__ = (
+        "event_id",
+        "fighter_id",
+        "event_type",
+        "severity",
+        "confidence",
+        "timestamp_ms",
+        "source",
+    )
+
+    def __init__(self, event_id: str, fighter_id: str, event_type: str,
+                 severity: float, confidence: float, timestamp_ms: int, source: str):
+        self.event_id = event_id
+        self.fighter_id = fighter_id
+        self.event_type = event_type
+        self.severity = severity
+        self.confidence = confidence
+        self.timestamp_ms = timestamp_ms
+        self.source = source
+
+    @classmethod
+    def from_event(cls, event) -> "EventRecord":
+        """Build a record from a CVEvent (enum fields stored as plain strings)"""
+        return cls(
+            event.event_id,
+            event.fighter_id,
+            event.event_type.value if hasattr(event.event_type, "value") else event.event_type,
+            event.severity,
+            event.confidence,
+            event.timestamp_ms,
+            event.source.value if hasattr(event.source, "value") else event.source,
+        )
+
+    def to_dict(self) -> Dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+# Approximate retained size of one record (object header + slot pointers)
+RECORD_SIZE_BYTES = sys.getsizeof(EventRecord("", "", "", 0.0, 0.0, 0, ""))
+
+
+class RoundEventStore:
+    """
+    Round-partitioned event history
+
+    Each (bout_id, round_id) partition is a bounded deque of EventRecords.
+    Partitions are dropped when their round locks; if rounds are never
+    locked, the least recently used partition is evicted once max_rounds
+    is exceeded so memory stays bounded for the whole card.
+    """
+
+    def __init__(self, max_events_per_round: int = 5000, max_rounds: int = 64):
+        self.max_events_per_round = max_events_per_round
+        self.max_rounds = max_rounds
+        self._rounds: "OrderedDict[Tuple[str, str], deque]" = OrderedDict()
+        self.total_records = 0
+        self.evicted_rounds = 0
+        self.evicted_records = 0
+
+    def append(self, bout_id: str, round_id: str, record: EventRecord):
+        """Append a record to its round partition"""
+        key = (bout_id, round_id)
+        partition = self._rounds.get(key)
+        if partition is None:
+            partition = deque(maxlen=self.max_events_per_round)
+            self._rounds[key] = partition
+            if len(self._rounds) > self.max_rounds:
+                oldest_key = next(iter(self._rounds))
+                self.evict_round(*oldest_key)
+        else:
+            self._rounds.move_to_end(key)
+
+        if len(partition) == partition.maxlen:
+            # Oldest record falls off the bounded deque
+            self.total_records -= 1
+            self.evicted_records += 1
+        partition.append(record)
+        self.total_records += 1
+
+    def get_round(self, bout_id: str, round_id: str) -> Optional[deque]:
+        """O(1) partition lookup"""
+        return self._rounds.get((bout_id, round_id))
+
+    def evict_round(self, bout_id: str, round_id: str) -> int:
+        """Drop a round partition, returning the number of records freed"""
+        partition = self._rounds.pop((bout_id, round_id), None)
+        if partition is None:
+            return 0
+        freed = len(partition)
+        self.total_records -= freed
+        self.evicted_records += freed
+        self.evicted_rounds += 1
+        logger.debug(f"Evicted round {round_id} (bout: {bout_id}): {freed} records")
+        return freed
+
+    def evict_oldest(self, keep_last_n: int) -> int:
+        """Evict least recently used rounds until at most keep_last_n records remain"""
+        freed = 0
+        while self._rounds and self.total_records > keep_last_n:
+            bout_id, round_id = next(iter(self._rounds))
+            freed += self.evict_round(bout_id, round_id)
+        return freed
+
+    def get_memory_stats(self) -> Dict:
+        """Memory footprint metrics"""
+        return {
+            "retained_rounds": len(self._rounds),
+            "retained_records": self.total_records,
+            "max_events_per_round": self.max_events_per_round,
+            "max_rounds": self.max_rounds,
+            "evicted_rounds": self.evicted_rounds,
+            "evicted_records": self.evicted_records,
+            "record_size_bytes": RECORD_SIZE_BYTES,
+            "approx_bytes": self.total_records * RECORD_SIZE_BYTES
+        }
+
+    def __len__(self) -> int:
+        return self.total_records
+
+    def records(self, bout_id: str, round_id: str) -> List[EventRecord]:
+        partition = self._rounds.get((bout_id, round_id))
+        return list(partition) if partition is not None else []
@@ -1,16 +1,22 @@
 """
 ICVSS Live Round Engine
 /round/open, /round/event, /round/score, /round/lock
+
+Round documents hold metadata and scores only; events are stored in
+fixed-size buckets (see event_buckets) and live scores come from an
+incremental per-round accumulator.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 import logging
 import json
 from .models import ICVSSRound, CVEvent, ScoreResponse
 from .event_processor import EventProcessor
-from .scoring_engine import HybridScoringEngine
+from .scoring_engine import HybridScoringEngine, RoundScoreAccumulator
 from .audit_logger import AuditLogger
+from .write_buffer import RoundWriteBuffer
+from .event_buckets import EventBucketStore
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +39,24 @@ def serialize_for_mongo(data: Dict[str, Any]) -> Dict[str, Any]:
 class RoundEngine:
     """Manage ICVSS round lifecycle"""
     
-    def __init__(self, db):
+    # Event arrays are stored in icvss_event_buckets, never on the round document
+    ROUND_PROJECTION = {"_id": 0, "cv_events": 0, "judge_events": 0}
+    
+    def __init__(self, db, flush_interval_ms: int = 100, max_batch_events: int = 64,
+                 bucket_size: int = 200):
         self.db = db
         self.event_processor = EventProcessor()
         self.scoring_engine = HybridScoringEngine()
         self.audit_logger = AuditLogger(db)
+        self.bucket_store = EventBucketStore(db, bucket_size=bucket_size)
+        self.write_buffer = RoundWriteBuffer(
+            db,
+            bucket_store=self.bucket_store,
+            flush_interval_ms=flush_interval_ms,
+            max_batch_events=max_batch_events
+        )
         self.active_rounds: Dict[str, ICVSSRound] = {}
+        self.score_accumulators: Dict[str, RoundScoreAccumulator] = {}
     
     async def open_round(self, bout_id: str, round_num: int) -> ICVSSRound:
         """Open a new ICVSS round"""
@@ -49,10 +67,13 @@ class RoundEngine:
         )
         
         # Save to database with proper datetime serialization
-        await self.db.icvss_rounds.insert_one(serialize_for_mongo(round_data.model_dump()))
+        await self.db.icvss_rounds.insert_one(
+            serialize_for_mongo(round_data.model_dump(exclude={"cv_events", "judge_events"}))
+        )
         
         # Add to active rounds
         self.active_rounds[round_data.round_id] = round_data
+        self.score_accumulators[round_data.round_id] = RoundScoreAccumulator()
         
         # Audit log
         await self.audit_logger.log_action(
@@ -66,71 +87,112 @@ class RoundEngine:
         logger.info(f"Round opened: {round_data.round_id} (bout: {bout_id}, round: {round_num})")
         return round_data
     
-    async def add_event(self, round_id: str, event: CVEvent) -> bool:
-        """Add event to round"""
+    async def _get_open_round(self, round_id: str) -> Optional[ICVSSRound]:
+        """Get round from cache or database, None if missing or locked"""
         round_data = self.active_rounds.get(round_id)
         if not round_data:
             # Try loading from database
-            round_doc = await self.db.icvss_rounds.find_one({"round_id": round_id})
+            round_doc = await self.db.icvss_rounds.find_one({"round_id": round_id}, self.ROUND_PROJECTION)
             if not round_doc:
                 logger.error(f"Round not found: {round_id}")
-                return False
+                return None
             round_data = ICVSSRound(**round_doc)
-            self.active_rounds[round_id] = round_data
+            if round_data.status != "locked":
+                self.active_rounds[round_id] = round_data
+                await self._get_accumulator(round_id)
         
         if round_data.status == "locked":
             logger.warning(f"Cannot add event to locked round: {round_id}")
-            return False
+            return None
         
-        # Process event
+        return round_data
+    
+    def _accept_event(self, round_data: ICVSSRound, event: CVEvent) -> Optional[Tuple[str, Dict, Dict]]:
+        """
+        Run an event through the processor and append it to the in-memory round
+        
+        Returns:
+            (array field, event document, audit document) if accepted, else None
+        """
         accepted, reason = self.event_processor.process_event(event)
+        if not accepted:
+            logger.warning(f"Event rejected: {reason}")
+            return None
         
-        if accepted:
-            # Add to round
-            if event.source.value == "cv_system":
-                round_data.cv_events.append(event)
-            else:
-                round_data.judge_events.append(event.model_dump())
-            
-            # Update database with proper datetime serialization
-            event_dict = serialize_for_mongo(event.model_dump())
-            
-            await self.db.icvss_rounds.update_one(
-                {"round_id": round_id},
-                {"$push": {"cv_events" if event.source.value == "cv_system" else "judge_events": event_dict}}
-            )
-            
-            # Audit log with proper datetime serialization
-            audit_data = serialize_for_mongo(event.model_dump())
-            
-            await self.audit_logger.log_action(
-                bout_id=round_data.bout_id,
-                round_id=round_id,
-                action="event_added",
-                actor=event.source.value,
-                data=audit_data
-            )
-            
-            logger.info(f"Event added to round {round_id}: {event.event_type}")
-            return True
+        # Serialize once; the same document feeds the event bucket and the audit entry
+        event_dict = serialize_for_mongo(event.model_dump())
+        
+        accumulator = self.score_accumulators.setdefault(round_data.round_id, RoundScoreAccumulator())
+        if event.source.value == "cv_system":
+            field = "cv_events"
+            self.scoring_engine.accumulate_cv_event(accumulator, event)
         else:
-            logger.warning(f"Event rejected: {reason}")
+            field = "judge_events"
+            self.scoring_engine.accumulate_judge_event(accumulator, event_dict)
+        
+        audit_entry = self.audit_logger.build_entry(
+            bout_id=round_data.bout_id,
+            round_id=round_data.round_id,
+            action="event_added",
+            actor=event.source.value,
+            data=event_dict
+        )
+        return field, event_dict, audit_entry.model_dump()
+    
+    async def add_event(self, round_id: str, event: CVEvent) -> bool:
+        """Add event to round (written through the write-behind buffer)"""
+        round_data = await self._get_open_round(round_id)
+        if not round_data:
             return False
+        
+        result = self._accept_event(round_data, event)
+        if result is None:
+            return False
+        
+        field, event_dict, audit_doc = result
+        await self.write_buffer.enqueue(round_id, round_data.bout_id, field, event_dict, audit_doc)
+        
+        logger.debug(f"Event added to round {round_id}: {event.event_type}")
+        return True
+    
+    async def add_events(self, round_id: str, events: List[CVEvent]) -> Tuple[List[CVEvent], int]:
+        """
+        Add a batch of events to a round
+        
+        Accepted events are written with a single $push/$each and one audit
+        insert_many, regardless of batch size.
+        
+        Returns:
+            (accepted_events, rejected_count)
+        """
+        round_data = await self._get_open_round(round_id)
+        if not round_data:
+            return [], len(events)
+        
+        accepted: List[CVEvent] = []
+        for event in events:
+            result = self._accept_event(round_data, event)
+            if result is None:
+                continue
+            field, event_dict, audit_doc = result
+            self.write_buffer.stage(round_id, round_data.bout_id, field, event_dict, audit_doc)
+            accepted.append(event)
+        
+        if accepted:
+            await self.write_buffer.flush_round(round_id)
+        
+        logger.info(f"Batch added to round {round_id}: {len(accepted)} accepted, {len(events) - len(accepted)} rejected")
+        return accepted, len(events) - len(accepted)
     
     async def calculate_score(self, round_id: str) -> Optional[ScoreResponse]:
         """Calculate current score for round"""
-        round_data = self.active_rounds.get(round_id)
+        round_data = await self.get_round(round_id)
         if not round_data:
-            round_doc = await self.db.icvss_rounds.find_one({"round_id": round_id})
-            if not round_doc:
-                return None
-            round_data = ICVSSRound(**round_doc)
+            return None
         
-        # Calculate hybrid score
-        score_result = self.scoring_engine.calculate_hybrid_score(
-            cv_events=round_data.cv_events,
-            judge_events=round_data.judge_events
-        )
+        # Score from the incremental accumulator (no event re-scan)
+        accumulator = await self._get_accumulator(round_id)
+        score_result = self.scoring_engine.score_from_accumulator(accumulator)
         
         # Create response
         response = ScoreResponse(
@@ -179,12 +241,20 @@ class RoundEngine:
         if not round_data:
             return False
         
+        # Durability flush: every accepted event is persisted before locking
+        await self.write_buffer.flush_round(round_id)
+        
         # Calculate final score
         final_score = await self.calculate_score(round_id)
         
-        # Generate event hash
+        # Generate event hash over the persisted event stream, including arrays
+        # still embedded in rounds opened before event buckets
+        legacy_doc = await self.db.icvss_rounds.find_one(
+            {"round_id": round_id}, {"cv_events": 1, "judge_events": 1}
+        )
+        events = await self.bucket_store.load_events(round_id, legacy_doc=legacy_doc)
         event_hash = self.audit_logger.generate_event_hash(
-            round_data.cv_events + round_data.judge_events
+            events["cv_events"] + events["judge_events"]
         )
         
         # Update status
@@ -215,18 +285,63 @@ class RoundEngine:
             data=audit_data
         )
         
+        # Locked rounds are served from the database; free in-memory state
+        self.event_processor.release_round(round_data.bout_id, round_id)
+        self.write_buffer.release_round(round_id)
+        self.active_rounds.pop(round_id, None)
+        self.score_accumulators.pop(round_id, None)
+        
         logger.info(f"Round locked: {round_id} with hash {event_hash}")
         return True
     
-    async def get_round(self, round_id: str) -> Optional[ICVSSRound]:
-        """Get round data"""
-        if round_id in self.active_rounds:
-            return self.active_rounds[round_id]
+    async def get_round(self, round_id: str, include_events: bool = False) -> Optional[ICVSSRound]:
+        """
+        Get round data
+        
+        Args:
+            round_id: Round identifier
+            include_events: Hydrate cv_events/judge_events from event buckets
+        """
+        round_data = self.active_rounds.get(round_id)
+        if round_data and not include_events:
+            return round_data
         
-        round_doc = await self.db.icvss_rounds.find_one({"round_id": round_id})
-        if round_doc:
+        projection = None if include_events else self.ROUND_PROJECTION
+        round_doc = await self.db.icvss_rounds.find_one({"round_id": round_id}, projection)
+        if not round_doc:
+            return round_data
+        if not include_events:
             return ICVSSRound(**round_doc)
-        return None
+        
+        await self.write_buffer.flush_round(round_id)
+        events = await self.bucket_store.load_events(round_id, legacy_doc=round_doc)
+        base = round_data.model_dump() if round_data else round_doc
+        return ICVSSRound(**{**base, **events})
+    
+    async def _get_accumulator(self, round_id: str) -> RoundScoreAccumulator:
+        """
+        Get the round's score accumulator, rebuilding it once from
+        persisted events after a restart or for locked rounds
+        """
+        accumulator = self.score_accumulators.get(round_id)
+        if accumulator is not None:
+            return accumulator
+        
+        await self.write_buffer.flush_round(round_id)
+        round_doc = await self.db.icvss_rounds.find_one(
+            {"round_id": round_id}, {"cv_events": 1, "judge_events": 1}
+        )
+        events = await self.bucket_store.load_events(round_id, legacy_doc=round_doc)
+        
+        accumulator = RoundScoreAccumulator()
+        for event in events["cv_events"]:
+            self.scoring_engine.accumulate_cv_event(accumulator, event)
+        for event in events["judge_events"]:
+            self.scoring_engine.accumulate_judge_event(accumulator, event)
+        
+        if round_id in self.active_rounds:
+            self.score_accumulators[round_id] = accumulator
+        return accumulator
 
     async def get_active_rounds_count(self) -> int:
         """Get count of currently active rounds"""
@@ -245,11 +360,11 @@ class RoundEngine:
         error_count = 0
         dedup_count = 0
         
-        for round_data in self.active_rounds.values():
+        for round_id in self.active_rounds:
             # Count CV and judge events
-            cv_events = len(round_data.cv_events)
-            judge_events = len(round_data.judge_events)
-            total_events += cv_events + judge_events
+            accumulator = self.score_accumulators.get(round_id)
+            if accumulator is not None:
+                total_events += accumulator.cv_event_count + accumulator.judge_event_count
             
             # Get dedup stats from event processor
             dedup_count += self.event_processor.dedup_count
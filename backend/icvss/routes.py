@@ -103,10 +103,13 @@ async def add_event(round_id: str, event: CVEvent, engine: RoundEngine = Depends
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@icvss_router.post("/round/event/batch")
-async def add_events_batch(round_id: str, events: List[CVEvent], engine: RoundEngine = Depends(get_round_engine)):
+@icvss_router.post("/round/{round_id}/events")
+async def add_round_events(round_id: str, events: List[CVEvent], engine: RoundEngine = Depends(get_round_engine)):
     """
-    Add multiple events at once (batch processing)
+    Add multiple events to a round in one write
+    
+    Accepted events are persisted with a single $push/$each and one
+    audit insert_many, then broadcast to the CV/judge feeds.
     
     Args:
         round_id: Round identifier
@@ -116,19 +119,19 @@ async def add_events_batch(round_id: str, events: List[CVEvent], engine: RoundEn
         Summary of accepted/rejected events
     """
     try:
-        accepted_count = 0
-        rejected_count = 0
+        accepted, rejected_count = await engine.add_events(round_id, events)
         
-        for event in events:
-            accepted = await engine.add_event(round_id, event)
-            if accepted:
-                accepted_count += 1
-            else:
-                rejected_count += 1
+        if accepted:
+            round_data = await engine.get_round(round_id)
+            for event in accepted:
+                if event.source.value == "cv_system":
+                    await ws_manager.broadcast_cv_event(round_data.bout_id, round_id, event.model_dump())
+                else:
+                    await ws_manager.broadcast_judge_event(round_data.bout_id, round_id, event.model_dump())
         
         return {
             "success": True,
-            "accepted": accepted_count,
+            "accepted": len(accepted),
             "rejected": rejected_count,
             "total": len(events)
         }
@@ -138,6 +141,16 @@ async def add_events_batch(round_id: str, events: List[CVEvent], engine: RoundEn
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@icvss_router.post("/round/event/batch")
+async def add_events_batch(round_id: str, events: List[CVEvent], engine: RoundEngine = Depends(get_round_engine)):
+    """
+    Add multiple events at once (batch processing)
+    
+    Legacy query-parameter form of /round/{round_id}/events
+    """
+    return await add_round_events(round_id, events, engine)
+
+
 @icvss_router.get("/round/score/{round_id}", response_model=ScoreResponse)
 async def get_round_score(round_id: str, engine: RoundEngine = Depends(get_round_engine)):
     """
@@ -239,7 +252,7 @@ async def get_round(round_id: str, engine: RoundEngine = Depends(get_round_engin
     Returns:
         ICVSSRound object
     """
-    round_data = await engine.get_round(round_id)
+    round_data = await engine.get_round(round_id, include_events=True)
     
     if not round_data:
         raise HTTPException(status_code=404, detail="Round not found")
@@ -383,6 +396,7 @@ async def get_icvss_stats(engine: RoundEngine = Depends(get_round_engine)):
     
     return {
         "event_processor": processor_stats,
+        "write_buffer": engine.write_buffer.get_stats(),
         "websocket_connections": ws_stats,
         "active_rounds": len(engine.active_rounds),
         "timestamp": datetime.now(timezone.utc).isoformat()
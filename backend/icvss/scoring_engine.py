@@ -10,6 +10,27 @@ from .models import CVEvent, EventType, EventSource
 logger = logging.getLogger(__name__)
 
 
+def _empty_categories() -> Dict[str, float]:
+    return {"striking": 0.0, "grappling": 0.0, "control": 0.0}
+
+
+class RoundScoreAccumulator:
+    """
+    Running per-round category totals for CV and judge events
+    
+    Updated once per accepted event so a live score never re-walks the
+    round's event history.
+    """
+    
+    __slots__ = ("cv", "judge", "cv_event_count", "judge_event_count")
+    
+    def __init__(self):
+        self.cv = {"fighter1": _empty_categories(), "fighter2": _empty_categories()}
+        self.judge = {"fighter1": _empty_categories(), "fighter2": _empty_categories()}
+        self.cv_event_count = 0
+        self.judge_event_count = 0
+
+
 class HybridScoringEngine:
     """
     Hybrid scoring that combines CV-detected events with judge manual events
@@ -85,13 +106,91 @@ class HybridScoringEngine:
         """
         logger.info(f"Calculating hybrid score: {len(cv_events)} CV events, {len(judge_events)} judge events")
         
-        # Calculate CV scores
-        f1_cv_score, f1_cv_breakdown = self._score_events(cv_events, "fighter1")
-        f2_cv_score, f2_cv_breakdown = self._score_events(cv_events, "fighter2")
+        accumulator = RoundScoreAccumulator()
+        for event in cv_events:
+            self.accumulate_cv_event(accumulator, event)
+        for event in judge_events:
+            self.accumulate_judge_event(accumulator, event)
+        
+        return self.score_from_accumulator(accumulator)
+    
+    def accumulate_cv_event(self, accumulator: "RoundScoreAccumulator", event) -> None:
+        """
+        Add one CV event (CVEvent or stored dict) to a round accumulator in O(1)
+        """
+        accumulator.cv_event_count += 1
+        
+        if isinstance(event, dict):
+            fighter_id = event.get("fighter_id")
+            event_type = event.get("event_type")
+            severity = event.get("severity", 0.0)
+            confidence = event.get("confidence", 0.0)
+        else:
+            fighter_id = event.fighter_id
+            event_type = event.event_type
+            severity = event.severity
+            confidence = event.confidence
+        
+        categories = accumulator.cv.get(fighter_id)
+        if categories is None:
+            return
+        
+        event_config = self.EVENT_VALUES.get(event_type)
+        if not event_config:
+            return
+        
+        # Apply severity multiplier (CV confidence affects impact)
+        categories[event_config["category"]] += event_config["base_value"] * severity * confidence
+    
+    def accumulate_judge_event(self, accumulator: "RoundScoreAccumulator", event: Dict) -> None:
+        """
+        Add one judge manual event to a round accumulator in O(1)
+        (using existing scoring logic)
+        """
+        accumulator.judge_event_count += 1
+        
+        categories = accumulator.judge.get(event.get("fighter"))
+        if categories is None:
+            return
+        
+        event_type = event.get("event_type", "").lower()
+        
+        # Striking events
+        if any(x in event_type for x in ["jab", "cross", "hook", "kick", "knee", "elbow"]):
+            categories["striking"] += 2.0
         
-        # Calculate judge scores (using existing scoring logic)
-        f1_judge_score, f1_judge_breakdown = self._score_judge_events(judge_events, "fighter1")
-        f2_judge_score, f2_judge_breakdown = self._score_judge_events(judge_events, "fighter2")
+        # Damage events
+        if "rock" in event_type:
+            categories["striking"] += 20.0
+        elif "kd" in event_type:
+            categories["striking"] += 40.0
+        
+        # Grappling events
+        if "takedown" in event_type:
+            categories["grappling"] += 15.0
+        elif "submission" in event_type:
+            categories["grappling"] += 20.0
+        
+        # Control events (from metadata duration)
+        if "control" in event_type:
+            duration = (event.get("metadata") or {}).get("duration", 0)
+            categories["control"] += duration * 0.5
+    
+    def score_from_accumulator(self, accumulator: "RoundScoreAccumulator") -> Dict:
+        """
+        Fuse accumulated category totals into the round score
+        
+        Cost is independent of the number of events in the round.
+        """
+        f1_cv_breakdown = accumulator.cv["fighter1"]
+        f2_cv_breakdown = accumulator.cv["fighter2"]
+        f1_judge_breakdown = accumulator.judge["fighter1"]
+        f2_judge_breakdown = accumulator.judge["fighter2"]
+        
+        f1_cv_score = self._weighted_total(f1_cv_breakdown)
+        f2_cv_score = self._weighted_total(f2_cv_breakdown)
+        f1_judge_score = self._weighted_total(f1_judge_breakdown)
+        f2_judge_score = self._weighted_total(f2_judge_breakdown)
         
         # Fuse scores with weights
         f1_total = (f1_cv_score * self.cv_weight) + (f1_judge_score * self.judge_weight)
@@ -132,85 +231,17 @@ class HybridScoringEngine:
             "winner": winner,
             "cv_contribution": self.cv_weight,
             "judge_contribution": self.judge_weight,
-            "cv_event_count": len(cv_events),
-            "judge_event_count": len(judge_events)
+            "cv_event_count": accumulator.cv_event_count,
+            "judge_event_count": accumulator.judge_event_count
         }
     
-    def _score_events(self, events: List[CVEvent], fighter_id: str) -> Tuple[float, Dict]:
-        """Score CV events for a specific fighter"""
-        fighter_events = [e for e in events if e.fighter_id == fighter_id]
-        
-        categories = {
-            "striking": 0.0,
-            "grappling": 0.0,
-            "control": 0.0
-        }
-        
-        for event in fighter_events:
-            event_config = self.EVENT_VALUES.get(event.event_type)
-            if not event_config:
-                continue
-            
-            category = event_config["category"]
-            base_value = event_config["base_value"]
-            
-            # Apply severity multiplier (CV confidence affects impact)
-            value = base_value * event.severity * event.confidence
-            
-            categories[category] += value
-        
-        # Apply category weights
-        total = (
-            categories["striking"] * self.CATEGORY_WEIGHTS["striking"] +
-            categories["grappling"] * self.CATEGORY_WEIGHTS["grappling"] +
-            categories["control"] * self.CATEGORY_WEIGHTS["control"]
-        )
-        
-        return total, categories
-    
-    def _score_judge_events(self, events: List[Dict], fighter_id: str) -> Tuple[float, Dict]:
-        """Score judge manual events (using existing scoring logic)"""
-        fighter_events = [e for e in events if e.get("fighter") == fighter_id]
-        
-        categories = {
-            "striking": 0.0,
-            "grappling": 0.0,
-            "control": 0.0
-        }
-        
-        # Map existing event types to categories
-        for event in fighter_events:
-            event_type = event.get("event_type", "")
-            
-            # Striking events
-            if any(x in event_type.lower() for x in ["jab", "cross", "hook", "kick", "knee", "elbow"]):
-                categories["striking"] += 2.0
-            
-            # Damage events
-            if "rock" in event_type.lower():
-                categories["striking"] += 20.0
-            elif "kd" in event_type.lower():
-                categories["striking"] += 40.0
-            
-            # Grappling events
-            if "takedown" in event_type.lower():
-                categories["grappling"] += 15.0
-            elif "submission" in event_type.lower():
-                categories["grappling"] += 20.0
-            
-            # Control events (from metadata duration)
-            if "control" in event_type.lower():
-                duration = event.get("metadata", {}).get("duration", 0)
-                categories["control"] += duration * 0.5
-        
-        # Apply category weights
-        total = (
+    def _weighted_total(self, categories: Dict[str, float]) -> float:
+        """Apply category weights"""
+        return (
             categories["striking"] * self.CATEGORY_WEIGHTS["striking"] +
             categories["grappling"] * self.CATEGORY_WEIGHTS["grappling"] +
             categories["control"] * self.CATEGORY_WEIGHTS["control"]
         )
-        
-        return total, categories
     
     def _apply_damage_primacy(self, f1_total, f2_total, f1_cv, f2_cv, f1_judge, f2_judge) -> Tuple[float, float]:
         """
@@ -4,10 +4,11 @@ Real-time feeds for CV events, judge events, scores, and broadcast
 """
 
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 import json
 import logging
 from datetime import datetime, timezone
+from broadcast_bus import BroadcastBus, ws_bus
 from .models import WebSocketMessage
 
 logger = logging.getLogger(__name__)
@@ -16,7 +17,7 @@ logger = logging.getLogger(__name__)
 class ConnectionManager:
     """Manage WebSocket connections for ICVSS"""
     
-    def __init__(self):
+    def __init__(self, bus: Optional[BroadcastBus] = None):
         # Active connections by feed type
         self.cv_feed_connections: Dict[str, Set[WebSocket]] = {}  # bout_id -> {websockets}
         self.judge_feed_connections: Dict[str, Set[WebSocket]] = {}
@@ -25,6 +26,26 @@ class ConnectionManager:
         
         # Connection metadata
         self.connection_metadata: Dict[WebSocket, Dict] = {}  # websocket -> {auth, bout_id, etc}
+        
+        # Broadcasts are published once on the bus and fanned out per worker
+        self.bus = bus or ws_bus
+        self.feeds = {
+            "cv_event": self.cv_feed_connections,
+            "judge_event": self.judge_feed_connections,
+            "score_update": self.score_feed_connections,
+            "broadcast": self.broadcast_feed_connections
+        }
+        for feed_type, feed_dict in self.feeds.items():
+            self.bus.register(self._namespace(feed_type), self._local_fanout(feed_dict))
+    
+    @staticmethod
+    def _namespace(feed_type: str) -> str:
+        return f"icvss:{feed_type}"
+    
+    def _local_fanout(self, feed_dict: Dict[str, Set[WebSocket]]):
+        async def deliver(bout_id: str, message: dict):
+            await self._broadcast_to_feed(feed_dict, bout_id, message)
+        return deliver
     
     async def connect(self, websocket: WebSocket, feed_type: str, bout_id: str, auth_token: str = None):
         """
@@ -67,6 +88,9 @@ class ConnectionManager:
                 self.broadcast_feed_connections[bout_id] = set()
             self.broadcast_feed_connections[bout_id].add(websocket)
         
+        if feed_type in self.feeds:
+            self.bus.join(self._namespace(feed_type), bout_id)
+        
         logger.info(f"WebSocket connected: {feed_type} for bout {bout_id}")
         
         # Send welcome message
@@ -87,14 +111,12 @@ class ConnectionManager:
         bout_id = metadata["bout_id"]
         
         # Remove from appropriate feed
-        if feed_type == "cv_event" and bout_id in self.cv_feed_connections:
-            self.cv_feed_connections[bout_id].discard(websocket)
-        elif feed_type == "judge_event" and bout_id in self.judge_feed_connections:
-            self.judge_feed_connections[bout_id].discard(websocket)
-        elif feed_type == "score_update" and bout_id in self.score_feed_connections:
-            self.score_feed_connections[bout_id].discard(websocket)
-        elif feed_type == "broadcast" and bout_id in self.broadcast_feed_connections:
-            self.broadcast_feed_connections[bout_id].discard(websocket)
+        feed_dict = self.feeds.get(feed_type)
+        if feed_dict is not None and websocket in feed_dict.get(bout_id, ()):
+            feed_dict[bout_id].discard(websocket)
+            if not feed_dict[bout_id]:
+                del feed_dict[bout_id]
+            self.bus.leave(self._namespace(feed_type), bout_id)
         
         # Remove metadata
         del self.connection_metadata[websocket]
@@ -117,7 +139,7 @@ class ConnectionManager:
             data=event_data
         )
         
-        await self._broadcast_to_feed(self.cv_feed_connections, bout_id, message.model_dump())
+        await self.bus.publish(self._namespace("cv_event"), bout_id, message.model_dump(mode="json"))
     
     async def broadcast_judge_event(self, bout_id: str, round_id: str, event_data: dict):
         """Broadcast judge event to all judge feed subscribers"""
@@ -128,7 +150,7 @@ class ConnectionManager:
             data=event_data
         )
         
-        await self._broadcast_to_feed(self.judge_feed_connections, bout_id, message.model_dump())
+        await self.bus.publish(self._namespace("judge_event"), bout_id, message.model_dump(mode="json"))
     
     async def broadcast_score_update(self, bout_id: str, round_id: str, score_data: dict):
         """Broadcast score update to all score feed subscribers"""
@@ -139,7 +161,7 @@ class ConnectionManager:
             data=score_data
         )
         
-        await self._broadcast_to_feed(self.score_feed_connections, bout_id, message.model_dump())
+        await self.bus.publish(self._namespace("score_update"), bout_id, message.model_dump(mode="json"))
     
     async def broadcast_to_display(self, bout_id: str, broadcast_data: dict):
         """Broadcast to all broadcast feed subscribers (arena displays, overlays)"""
@@ -149,7 +171,7 @@ class ConnectionManager:
             data=broadcast_data
         )
         
-        await self._broadcast_to_feed(self.broadcast_feed_connections, bout_id, message.model_dump())
+        await self.bus.publish(self._namespace("broadcast"), bout_id, message.model_dump(mode="json"))
     
     async def _broadcast_to_feed(self, feed_dict: Dict[str, Set[WebSocket]], bout_id: str, message: dict):
         """Broadcast message to all connections in a feed"""
@@ -158,7 +180,7 @@ class ConnectionManager:
         
         dead_connections = set()
         
-        for connection in feed_dict[bout_id]:
+        for connection in list(feed_dict[bout_id]):
             try:
                 await connection.send_json(message)
             except WebSocketDisconnect:
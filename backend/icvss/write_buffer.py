@@ -0,0 +1,174 @@
+"""
+ICVSS Write-Behind Buffer
+Groups accepted events per round and flushes them into the round's event
+buckets plus one audit insert_many every N ms or M events.
+"""
+
+from typing import Dict, List, Any, Optional
+import asyncio
+import logging
+from pymongo.errors import BulkWriteError
+from .event_buckets import EventBucketStore, PartialAppendError
+
+logger = logging.getLogger(__name__)
+
+
+class RoundWriteBuffer:
+    """Per-round write-behind buffer for round event buckets and audit logs"""
+
+    def __init__(self, db, bucket_store: Optional[EventBucketStore] = None,
+                 flush_interval_ms: int = 100, max_batch_events: int = 64):
+        """
+        Args:
+            db: Motor database handle
+            bucket_store: Bucketed event storage (created on db if omitted)
+            flush_interval_ms: Maximum time an event waits before being flushed
+            max_batch_events: Flush a round as soon as this many events are pending
+        """
+        self.db = db
+        self.bucket_store = bucket_store or EventBucketStore(db)
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch_events = max_batch_events
+
+        # round_id -> {"bout_id": str, "cv_events": [...], "judge_events": [...], "audit": [...]}
+        self.pending: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            "flushes": 0,
+            "events_written": 0,
+            "audit_written": 0,
+            "flush_errors": 0
+        }
+
+    def stage(self, round_id: str, bout_id: str, field: str, event_doc: Dict[str, Any],
+              audit_doc: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Add an event document to the round's pending batch without flushing
+
+        Returns:
+            Number of events now pending for the round
+        """
+        batch = self.pending.get(round_id)
+        if batch is None:
+            batch = self._new_batch(bout_id)
+            self.pending[round_id] = batch
+
+        batch[field].append(event_doc)
+        if audit_doc is not None:
+            batch["audit"].append(audit_doc)
+        return len(batch["cv_events"]) + len(batch["judge_events"])
+
+    async def enqueue(self, round_id: str, bout_id: str, field: str, event_doc: Dict[str, Any],
+                      audit_doc: Optional[Dict[str, Any]] = None):
+        """
+        Queue an event document for the round's cv_events/judge_events array
+
+        Flushes the round inline once max_batch_events are pending; otherwise
+        the background flusher writes it within flush_interval_ms.
+        """
+        if self.stage(round_id, bout_id, field, event_doc, audit_doc) >= self.max_batch_events:
+            await self.flush_round(round_id)
+        else:
+            self._ensure_flusher()
+
+    async def flush_round(self, round_id: str) -> int:
+        """
+        Write all pending events for a round
+
+        Returns:
+            Number of events written
+        """
+        lock = self._locks.setdefault(round_id, asyncio.Lock())
+        async with lock:
+            batch = self.pending.pop(round_id, None)
+            if not batch:
+                return 0
+
+            written = len(batch["cv_events"]) + len(batch["judge_events"])
+
+            try:
+                for field in ("cv_events", "judge_events"):
+                    if batch[field]:
+                        try:
+                            await self.bucket_store.append_many(
+                                round_id, batch["bout_id"], field, batch[field]
+                            )
+                        except PartialAppendError as e:
+                            # Only the unwritten tail is requeued
+                            batch[field] = batch[field][e.written:]
+                            raise
+                        batch[field] = []  # Written; not requeued on a later failure
+                if batch["audit"]:
+                    try:
+                        await self.db.icvss_audit_logs.insert_many(batch["audit"], ordered=True)
+                    except BulkWriteError as e:
+                        # Drop the inserted prefix; the rest get fresh _ids on retry
+                        batch["audit"] = batch["audit"][e.details.get("nInserted", 0):]
+                        for doc in batch["audit"]:
+                            doc.pop("_id", None)
+                        raise
+            except Exception as e:
+                # Put the batch back in front of anything queued meanwhile
+                self.stats["flush_errors"] += 1
+                requeued = self.pending.setdefault(round_id, self._new_batch(batch["bout_id"]))
+                for key in ("cv_events", "judge_events", "audit"):
+                    requeued[key][:0] = batch[key]
+                logger.error(f"Error flushing {written} events for round {round_id}: {e}")
+                raise
+
+            self.stats["flushes"] += 1
+            self.stats["events_written"] += written
+            self.stats["audit_written"] += len(batch["audit"])
+            logger.debug(f"Flushed {written} events for round {round_id}")
+            return written
+
+    async def flush_all(self) -> int:
+        """Flush every round with pending writes"""
+        written = 0
+        for round_id in list(self.pending.keys()):
+            try:
+                written += await self.flush_round(round_id)
+            except Exception:
+                pass  # Already logged and requeued; retried on next tick
+        return written
+
+    def release_round(self, round_id: str):
+        """Drop per-round lock and bucket cursor state once a round is locked and flushed"""
+        if round_id not in self.pending:
+            self._locks.pop(round_id, None)
+            self.bucket_store.release_round(round_id)
+
+    @staticmethod
+    def _new_batch(bout_id: str) -> Dict[str, Any]:
+        return {"bout_id": bout_id, "cv_events": [], "judge_events": [], "audit": []}
+
+    def _ensure_flusher(self):
+        """Start the interval flusher on the running loop if it is not active"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """Flush pending rounds every flush_interval_ms until nothing is pending"""
+        while self.pending:
+            await asyncio.sleep(self.flush_interval_ms / 1000.0)
+            await self.flush_all()
+
+    async def close(self):
+        """Durability flush on shutdown"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Buffer statistics"""
+        return {
+            **self.stats,
+            "pending_rounds": len(self.pending),
+            "pending_events": sum(
+                len(b["cv_events"]) + len(b["judge_events"]) for b in self.pending.values()
+            ),
+            "flush_interval_ms": self.flush_interval_ms,
+            "max_batch_events": self.max_batch_events
+        }
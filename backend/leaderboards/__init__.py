@@ -0,0 +1,9 @@
+"""
+Leaderboards
+Materialized, incrementally maintained fan and judge rankings
+"""
+
+from .ranking import RankIndex
+from .boards import MaterializedLeaderboard, FanLeaderboard, JudgeLeaderboard
+
+__version__ = "1.0.0"
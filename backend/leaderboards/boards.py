@@ -0,0 +1,440 @@
+"""
+Materialized Leaderboards
+
+Each board keeps one materialized row per member in Mongo, updated in place
+when a round is settled or a submission arrives, and orders the rows in a
+RankIndex for O(log n) rank lookups and top-k reads.
+
+- Rows changed by other workers are picked up by an incremental sync on
+  an updated-at field (at most every sync_interval_sec).
+- A full rebuild from the source collection runs every check_interval_sec
+  purely as a consistency check: it corrects drifted rows and reports how
+  many it found. Only the worker holding the board's lease in
+  leaderboard_leases runs it, each correction is a compare-and-set on the
+  row it was computed against, and members with a submission younger than
+  settle_sec are left for the next check.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from .ranking import RankIndex
+
+logger = logging.getLogger(__name__)
+
+# Allowance for clock skew between workers when syncing on updated_at
+SYNC_SKEW = timedelta(seconds=5)
+
+# Running sums on judge_leaderboard rows
+COUNT_FIELDS = ("totalAttempts", "sensitivity108Count", "perfectMatches")
+SUM_FIELDS = COUNT_FIELDS + ("accuracySum", "maeSum")
+
+DUPLICATE_KEY = 11000
+
+# A lease outlives its check interval by this much before another worker takes over
+LEASE_GRACE = timedelta(seconds=60)
+
+
+class MaterializedLeaderboard(ABC):
+    """Base class: materialized rows + RankIndex + consistency checks"""
+    
+    member_field = "id"
+    updated_field = "updated_at"
+    
+    def __init__(self, db, sync_interval_sec: float = 5.0, check_interval_sec: float = 900.0,
+                 settle_sec: float = 30.0, worker_id: Optional[str] = None):
+        """
+        Args:
+            db: Motor database handle
+            sync_interval_sec: Minimum time between incremental syncs
+            check_interval_sec: Time between full consistency rebuilds
+            settle_sec: Submissions younger than this may not have reached
+                their row yet; their members are not corrected
+            worker_id: Identifies this worker on the consistency check lease
+        """
+        self.db = db
+        self.sync_interval_sec = sync_interval_sec
+        self.check_interval_sec = check_interval_sec
+        self.settle_sec = settle_sec
+        self.worker_id = worker_id or f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.index = RankIndex()
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self.loaded = False
+        self.synced_at: Optional[datetime] = None
+        self.synced_mono = 0.0
+        self._sync_lock = asyncio.Lock()
+        self._check_task: Optional[asyncio.Task] = None
+        
+        self.stats = {
+            "updates": 0,
+            "syncs": 0,
+            "consistency_checks": 0,
+            "checks_skipped": 0,
+            "drift_corrected": 0,
+            "corrections_conflicted": 0
+        }
+    
+    # ---- subclass hooks ----
+    
+    @abstractmethod
+    def _materialized(self):
+        """Collection holding the materialized rows"""
+    
+    def _row_filter(self) -> Dict[str, Any]:
+        return {}
+    
+    def _projection(self) -> Dict[str, int]:
+        return {"_id": 0}
+    
+    @abstractmethod
+    def _score(self, row: Dict[str, Any]) -> Tuple[float, float]:
+        """(score, tiebreak) the member is ranked by"""
+    
+    def _is_ranked(self, row: Dict[str, Any]) -> bool:
+        return True
+    
+    def _format(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(row)
+    
+    @abstractmethod
+    async def _compute_rows(self) -> Dict[str, Dict[str, Any]]:
+        """Rows recomputed from the source collection (consistency check)"""
+    
+    @abstractmethod
+    def _drifted(self, stored: Optional[Dict[str, Any]], computed: Dict[str, Any]) -> bool:
+        """Whether the stored row disagrees with the recomputed one"""
+    
+    @abstractmethod
+    def _correction(self, stored: Optional[Dict[str, Any]], computed: Dict[str, Any]) -> UpdateOne:
+        """
+        Update that repairs the stored row, matching only while the row is
+        still exactly what was compared
+        """
+    
+    def _settling(self, computed: Dict[str, Any], cutoff: str) -> bool:
+        """Whether the member has a submission newer than cutoff (ISO time)"""
+        return False
+    
+    # ---- maintenance ----
+    
+    def apply(self, row: Dict[str, Any]):
+        """Put one materialized row into the in-memory ranking"""
+        member = row[self.member_field]
+        self.rows[member] = row
+        if self._is_ranked(row):
+            score, tiebreak = self._score(row)
+            self.index.upsert(member, score, tiebreak)
+        else:
+            self.index.remove(member)
+    
+    async def sync(self, force: bool = False):
+        """Load all rows once, then only rows updated since the last sync"""
+        if not force and self.loaded and time.monotonic() - self.synced_mono < self.sync_interval_sec:
+            return
+        async with self._sync_lock:
+            if not force and self.loaded and time.monotonic() - self.synced_mono < self.sync_interval_sec:
+                return
+            started = datetime.now(timezone.utc)
+            query = dict(self._row_filter())
+            if self.loaded and self.synced_at is not None:
+                query[self.updated_field] = {"$gte": self.synced_at - SYNC_SKEW}
+            async for row in self._materialized().find(query, self._projection()):
+                self.apply(row)
+            self.loaded = True
+            self.synced_at = started
+            self.synced_mono = time.monotonic()
+            self.stats["syncs"] += 1
+    
+    async def top(self, k: int, offset: int = 0) -> List[Dict[str, Any]]:
+        """Top-k formatted rows with their rank"""
+        await self.sync()
+        return [
+            {**self._format(self.rows[member]), "rank": offset + i}
+            for i, member in enumerate(self.index.top(k, offset), 1)
+        ]
+    
+    async def get(self, member: str) -> Optional[Dict[str, Any]]:
+        """Formatted row with rank (None rank if unranked), or None if unknown"""
+        await self.sync()
+        row = self.rows.get(member)
+        if row is None:
+            return None
+        return {**self._format(row), "rank": self.index.rank(member)}
+    
+    async def total(self) -> int:
+        await self.sync()
+        return len(self.index)
+    
+    async def check_consistency(self) -> Dict[str, int]:
+        """
+        Rebuild from the source collection and correct drifted rows
+        
+        Stored rows are read before the rebuild, so a submission is in the
+        rebuild whenever its $inc is in the stored row. One inserted but not
+        yet $inc'ed looks like drift; members with such recent submissions
+        are skipped. A row changed after it was read no longer matches its
+        correction and is left for the next check.
+        
+        Returns:
+            {"checked": int, "corrected": int}
+        """
+        await self.sync(force=True)
+        stored = {member: dict(row) for member, row in self.rows.items()}
+        cutoff = (datetime.now(timezone.utc) - timedelta(seconds=self.settle_sec)).isoformat()
+        computed = await self._compute_rows()
+        corrections = [
+            self._correction(stored.get(member), row) for member, row in computed.items()
+            if self._drifted(stored.get(member), row) and not self._settling(row, cutoff)
+        ]
+        
+        corrected = 0
+        if corrections:
+            try:
+                result = await self._materialized().bulk_write(corrections, ordered=False)
+                corrected = result.matched_count + result.upserted_count
+            except BulkWriteError as e:
+                # An upsert racing a first submission for the member
+                if any(err.get("code") != DUPLICATE_KEY for err in e.details.get("writeErrors", [])):
+                    raise
+                corrected = e.details.get("nMatched", 0) + len(e.details.get("upserted", []))
+            if corrected:
+                logger.warning(f"{type(self).__name__}: corrected {corrected} drifted rows")
+            await self.sync(force=True)
+        self.stats["consistency_checks"] += 1
+        self.stats["drift_corrected"] += corrected
+        self.stats["corrections_conflicted"] += len(corrections) - corrected
+        return {"checked": len(computed), "corrected": corrected}
+    
+    async def acquire_check_lease(self) -> bool:
+        """
+        Take or renew this board's consistency check lease
+        
+        Returns:
+            True when this worker holds the lease until the next check
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            lease = await self.db.leaderboard_leases.find_one_and_update(
+                {"_id": type(self).__name__,
+                 "$or": [{"owner": self.worker_id}, {"lease_until": {"$lt": now}}]},
+                {"$set": {"owner": self.worker_id,
+                          "lease_until": now + timedelta(seconds=self.check_interval_sec) + LEASE_GRACE}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Held by a live worker: the upsert tried to insert its _id again
+            return False
+        return lease is not None and lease.get("owner") == self.worker_id
+    
+    def start(self):
+        """Start periodic consistency checks on the running loop"""
+        if self._check_task is None or self._check_task.done():
+            self._check_task = asyncio.get_running_loop().create_task(self._check_loop())
+    
+    async def _check_loop(self):
+        # Every worker tries for the lease; the first check also backfills
+        # rows that predate the board
+        while True:
+            try:
+                if await self.acquire_check_lease():
+                    await self.check_consistency()
+                else:
+                    self.stats["checks_skipped"] += 1
+            except Exception as e:
+                logger.error(f"{type(self).__name__} consistency check failed: {e}")
+            await asyncio.sleep(self.check_interval_sec)
+    
+    async def close(self):
+        if self._check_task is not None and not self._check_task.done():
+            self._check_task.cancel()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "ranked": len(self.index), "rows": len(self.rows)}
+
+
+class FanLeaderboard(MaterializedLeaderboard):
+    """
+    Fans ranked by accuracy, then rounds scored
+    
+    The fan_users documents are the materialized rows: accuracy is stored on
+    them when a round is settled (see fan_scoring.accuracy).
+    """
+    
+    member_field = "fan_id"
+    updated_field = "accuracy_updated_at"
+    
+    def _materialized(self):
+        return self.db.fan_users
+    
+    def _row_filter(self):
+        return {"rounds_scored": {"$gt": 0}}
+    
+    def _projection(self) -> Dict[str, int]:
+        return {"_id": 0, "fan_id": 1, "display_name": 1, "rounds_scored": 1,
+                "correct_predictions": 1, "accuracy": 1}
+    
+    def _score(self, row):
+        return row.get("accuracy") or 0, row.get("rounds_scored") or 0
+    
+    def _is_ranked(self, row) -> bool:
+        return (row.get("rounds_scored") or 0) > 0
+    
+    def _format(self, row):
+        return {
+            "fan_id": row["fan_id"],
+            "display_name": row.get("display_name"),
+            "rounds_scored": row.get("rounds_scored", 0),
+            "correct_predictions": row.get("correct_predictions", 0),
+            "accuracy": row.get("accuracy") or 0
+        }
+    
+    async def refresh(self, fan_ids: Iterable[str]):
+        """Re-read the rows of fans whose accuracy was just updated"""
+        fan_ids = list(fan_ids)
+        if not fan_ids:
+            return
+        async for row in self.db.fan_users.find({"fan_id": {"$in": fan_ids}}, self._projection()):
+            self.apply(row)
+        self.stats["updates"] += len(fan_ids)
+    
+    async def _compute_rows(self):
+        rows = {}
+        async for row in self.db.fan_users.find(self._row_filter(), self._projection()):
+            rounds = row.get("rounds_scored") or 0
+            correct = row.get("correct_predictions") or 0
+            rows[row["fan_id"]] = {**row, "accuracy": round(correct / rounds * 100, 1) if rounds else 0}
+        return rows
+    
+    def _drifted(self, stored, computed) -> bool:
+        return stored is None or (stored.get("accuracy") or 0) != computed["accuracy"]
+    
+    def _correction(self, stored, computed):
+        return UpdateOne(
+            {
+                "fan_id": computed["fan_id"],
+                "rounds_scored": computed.get("rounds_scored"),
+                "correct_predictions": computed.get("correct_predictions")
+            },
+            {"$set": {"accuracy": computed["accuracy"], "accuracy_updated_at": datetime.now(timezone.utc)}}
+        )
+
+
+class JudgeLeaderboard(MaterializedLeaderboard):
+    """
+    Shadow-judging judges ranked by average accuracy, then attempts
+    
+    Rows live in judge_leaderboard as running sums, so each submission is a
+    single $inc and averages are derived on read.
+    """
+    
+    member_field = "judgeId"
+    
+    def _materialized(self):
+        return self.db.judge_leaderboard
+    
+    def _score(self, row):
+        attempts = row.get("totalAttempts") or 0
+        return (row.get("accuracySum", 0) / attempts if attempts else 0), attempts
+    
+    def _is_ranked(self, row) -> bool:
+        return (row.get("totalAttempts") or 0) > 0
+    
+    def _format(self, row):
+        attempts = row.get("totalAttempts") or 0
+        return {
+            "judgeId": row["judgeId"],
+            "judgeName": row.get("judgeName", "Unknown"),
+            "totalAttempts": attempts,
+            "averageAccuracy": round(row.get("accuracySum", 0) / attempts, 2) if attempts else 0,
+            "averageMAE": round(row.get("maeSum", 0) / attempts, 2) if attempts else 0,
+            "sensitivity108Rate": round(row.get("sensitivity108Count", 0) / attempts * 100, 2) if attempts else 0,
+            "perfectMatches": row.get("perfectMatches", 0)
+        }
+    
+    async def record(self, performance: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add one judge_performance submission to its judge's row
+        
+        Returns:
+            The judge's formatted row with rank
+        """
+        row = await self.db.judge_leaderboard.find_one_and_update(
+            {"judgeId": performance["judgeId"]},
+            {
+                "$inc": {
+                    "totalAttempts": 1,
+                    "accuracySum": performance["accuracy"],
+                    "maeSum": performance["mae"],
+                    "sensitivity108Count": 1 if performance["sensitivity108"] else 0,
+                    "perfectMatches": 1 if performance["match"] else 0
+                },
+                "$set": {"judgeName": performance["judgeName"], "updated_at": datetime.now(timezone.utc)}
+            },
+            projection={"_id": 0},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        self.apply(row)
+        self.stats["updates"] += 1
+        return {**self._format(row), "rank": self.index.rank(row["judgeId"])}
+    
+    async def _compute_rows(self):
+        pipeline = [
+            {
+                "$group": {
+                    "_id": "$judgeId",
+                    "judgeName": {"$last": "$judgeName"},
+                    "totalAttempts": {"$sum": 1},
+                    "accuracySum": {"$sum": "$accuracy"},
+                    "maeSum": {"$sum": "$mae"},
+                    "sensitivity108Count": {"$sum": {"$cond": [{"$eq": ["$sensitivity108", True]}, 1, 0]}},
+                    "perfectMatches": {"$sum": {"$cond": [{"$eq": ["$match", True]}, 1, 0]}},
+                    "lastSubmittedAt": {"$max": "$timestamp"}
+                }
+            }
+        ]
+        rows = {}
+        async for group in self.db.judge_performance.aggregate(pipeline):
+            judge_id = group.pop("_id")
+            rows[judge_id] = {"judgeId": judge_id, **group}
+        return rows
+    
+    def _drifted(self, stored, computed) -> bool:
+        if stored is None:
+            return True
+        for field in COUNT_FIELDS:
+            if stored.get(field, 0) != computed[field]:
+                return True
+        # Running float sums may differ from a fresh sum in the last bits
+        return any(abs(stored.get(field, 0) - computed[field]) > 1e-6 for field in ("accuracySum", "maeSum"))
+    
+    def _settling(self, computed, cutoff) -> bool:
+        # judge_performance timestamps are stored as ISO strings
+        last = computed.get("lastSubmittedAt")
+        return isinstance(last, str) and last > cutoff
+    
+    def _correction(self, stored, computed):
+        # $inc the difference, only onto the sums the difference was taken from
+        # (a new row is only inserted while the judge still has none)
+        match = {"judgeId": computed["judgeId"]}
+        for field in SUM_FIELDS:
+            match[field] = stored[field] if stored and field in stored else {"$exists": False}
+        stored = stored or {}
+        return UpdateOne(
+            match,
+            {
+                "$inc": {field: computed[field] - stored.get(field, 0) for field in SUM_FIELDS},
+                "$set": {"judgeName": computed["judgeName"], "updated_at": datetime.now(timezone.utc)}
+            },
+            upsert=not stored
+        )
@@ -0,0 +1,58 @@
+"""
+Rank Index
+In-memory ordering of leaderboard members, the local equivalent of a Redis
+sorted set: rank lookups are a bisect, top-k reads are a slice.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+SortKey = Tuple[float, float, str]
+
+
+class RankIndex:
+    """Members sorted by (score desc, tiebreak desc, member)"""
+    
+    def __init__(self):
+        self._keys: List[SortKey] = []
+        self._members: Dict[str, SortKey] = {}
+    
+    @staticmethod
+    def _key(member: str, score: float, tiebreak: float) -> SortKey:
+        return (-score, -tiebreak, member)
+    
+    def upsert(self, member: str, score: float, tiebreak: float = 0):
+        key = self._key(member, score, tiebreak)
+        old = self._members.get(member)
+        if old == key:
+            return
+        if old is not None:
+            del self._keys[bisect_left(self._keys, old)]
+        insort(self._keys, key)
+        self._members[member] = key
+    
+    def remove(self, member: str):
+        old = self._members.pop(member, None)
+        if old is not None:
+            del self._keys[bisect_left(self._keys, old)]
+    
+    def rank(self, member: str) -> Optional[int]:
+        """1-based rank, or None if the member is not ranked"""
+        key = self._members.get(member)
+        if key is None:
+            return None
+        return bisect_left(self._keys, key) + 1
+    
+    def top(self, k: int, offset: int = 0) -> List[str]:
+        """Members ranked offset+1 .. offset+k"""
+        return [key[2] for key in self._keys[offset:offset + k]]
+    
+    def clear(self):
+        self._keys = []
+        self._members = {}
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __contains__(self, member: str) -> bool:
+        return member in self._members
@@ -9,18 +9,22 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from typing import Optional, List, Dict, Any
 import logging
 
+from stats_rollups import StatsRollups, init_stats_rollups
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/organizations", tags=["Organization Stats"])
 
 # Global instances
 db: Optional[AsyncIOMotorDatabase] = None
+rollups: Optional[StatsRollups] = None
 
 
 def init_organization_stats(database: AsyncIOMotorDatabase):
     """Initialize organization stats with database"""
-    global db
+    global db, rollups
     db = database
+    rollups = init_stats_rollups(database)
     logger.info("✅ Organization Stats initialized")
 
 
@@ -47,30 +51,15 @@ async def list_organizations():
         raise HTTPException(status_code=500, detail="Database not initialized")
     
     try:
-        # Get unique organization IDs from events
-        org_ids = await db.events.distinct("organization_id")
-        
-        organizations = []
-        
-        for org_id in org_ids:
-            if not org_id:
-                continue
-            
-            # Count events per org
-            event_count = await db.events.count_documents({"organization_id": org_id})
-            
-            # Count fights per org
-            fight_count = await db.fight_stats.count_documents({"organization_id": org_id})
-            
-            # Get fighters per org
-            fighter_ids = await db.events.distinct("fighter_id", {"organization_id": org_id})
-            
-            organizations.append({
-                "organization_id": org_id,
-                "total_events": event_count,
-                "total_fights": fight_count,
-                "total_fighters": len(fighter_ids)
-            })
+        # One read of the per-organization rollup rows
+        rows = await rollups.rows(
+            {"kind": "scope", "scope": "org", "organization_id": {"$nin": [None, ""]}, "total_events": {"$gt": 0}},
+            sort=[("organization_id", 1)]
+        )
+        organizations = [
+            {k: row[k] for k in ("organization_id", "total_events", "total_fights", "total_fighters")}
+            for row in rows
+        ]
         
         return {
             "count": len(organizations),
@@ -98,14 +87,8 @@ async def get_organization_summary(organization_id: str):
         raise HTTPException(status_code=500, detail="Database not initialized")
     
     try:
-        # Event counts
-        total_events = await db.events.count_documents({"organization_id": organization_id})
-        
-        # Fight counts
-        total_fights = await db.fight_stats.count_documents({"organization_id": organization_id})
-        
-        # Fighter counts
-        unique_fighters = await db.events.distinct("fighter_id", {"organization_id": organization_id})
+        # Event / fight / fighter counts from the rollup
+        totals = await rollups.scope(organization_id=organization_id)
         
         # Recent events
         recent_events = await db.events.find(
@@ -127,11 +110,7 @@ async def get_organization_summary(organization_id: str):
         
         return {
             "organization_id": organization_id,
-            "summary": {
-                "total_events": total_events,
-                "total_fights": total_fights,
-                "total_fighters": len(unique_fighters)
-            },
+            "summary": totals,
             "recent_events": [
                 {
                     "fighter_id": e.get("fighter_id"),
@@ -9,7 +9,12 @@ import logging
 import random
 from typing import List, Optional, Dict
 from datetime import datetime, timezone
+import numpy as np
 from .models import *
+from .triangulation import (
+    ArenaCalibrationStore, triangulate_points, estimate_velocity, triangulation_accuracy
+)
+from .fie_accumulator import FIEAccumulatorStore
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +28,14 @@ class ProfessionalCVEngine:
         # In-memory caches
         self.strike_cache: Dict[str, List[StrikeEvent]] = {}
         self.ground_game_cache: Dict[str, List] = {}
-        self.damage_heatmaps: Dict[str, DamageHeatmap] = {}
+        self.damage_heatmaps: Dict[tuple, DamageHeatmap] = {}  # (bout_id, fighter_id)
+        
+        # Event-driven FIE counters per (bout, round, fighter)
+        self.fie_store = FIEAccumulatorStore()
+        
+        # Calibrated cameras per arena for triangulation
+        self.calibrations = ArenaCalibrationStore()
+        self.camera_positions: Dict[tuple, str] = {}
     
     # ========================================================================
     # Strike Classification & Analysis
@@ -277,57 +289,162 @@ class ProfessionalCVEngine:
     # Multi-Camera Strike Correlation
     # ========================================================================
     
+    def set_camera_calibration(self, calibration: CameraCalibration):
+        """Store a calibrated projection matrix for an arena camera"""
+        self.calibrations.set_camera(
+            calibration.arena_id, calibration.camera_id, calibration.projection_matrix
+        )
+        self.camera_positions[(calibration.arena_id, calibration.camera_id)] = calibration.camera_position
+    
+    async def save_camera_calibration(self, calibration: CameraCalibration):
+        """Store calibration in memory and persist it when a database is attached"""
+        self.set_camera_calibration(calibration)
+        if self.db is not None:
+            await self.db.pro_cv_camera_calibrations.update_one(
+                {"arena_id": calibration.arena_id, "camera_id": calibration.camera_id},
+                {"$set": calibration.model_dump()},
+                upsert=True
+            )
+    
+    async def ensure_arena_loaded(self, arena_id: str) -> bool:
+        """Load an arena's calibrations from the database on first use"""
+        if self.calibrations.has_arena(arena_id) or self.db is None:
+            return self.calibrations.has_arena(arena_id)
+        async for doc in self.db.pro_cv_camera_calibrations.find({"arena_id": arena_id}, {"_id": 0}):
+            self.set_camera_calibration(CameraCalibration(**doc))
+        return self.calibrations.has_arena(arena_id)
+    
     def triangulate_strike(
         self,
         strike: StrikeEvent,
-        camera_data: List[dict]
+        camera_data: List[dict],
+        arena_id: str = "default"
     ) -> TriangulatedStrike:
         """
         Triangulate exact impact point from multiple camera angles
         
-        In production:
-        - Camera calibration matrices
-        - Epipolar geometry
-        - Bundle adjustment
-        - 3D reconstruction
+        Args:
+            strike: Strike being located
+            camera_data: One dict per view: {"id", "impact_point": [x, y],
+                "confidence", optional "trajectory": [[x, y], ...] ending at
+                impact, optional "frame_interval_ms"}
+            arena_id: Arena whose calibrated cameras are used
         """
+        return self.triangulate_strikes([strike], [camera_data], arena_id)[0]
+    
+    def triangulate_strikes(
+        self,
+        strikes: List[StrikeEvent],
+        camera_data: List[List[dict]],
+        arena_id: str = "default"
+    ) -> List[TriangulatedStrike]:
+        """
+        Triangulate a batch of strikes in one solve
         
-        camera_views = []
-        
-        for cam_data in camera_data:
-            view = CameraView(
-                camera_id=cam_data.get("id", "cam1"),
-                camera_position=cam_data.get("position", "main"),
-                impact_point_x=random.uniform(0, 1920),
-                impact_point_y=random.uniform(0, 1080),
-                detection_confidence=random.uniform(0.7, 0.99),
-                camera_angle_degrees=cam_data.get("angle", 0),
-                distance_to_fighters_meters=cam_data.get("distance", 5.0)
-            )
-            camera_views.append(view)
-        
-        # Simulated 3D triangulation
-        impact_3d = {
-            "x": random.uniform(-1.0, 1.0),
-            "y": random.uniform(0.5, 2.0),  # Height
-            "z": random.uniform(-0.5, 0.5)
-        }
-        
-        # Estimate velocity and force
-        velocity_mps = random.uniform(8, 15)  # 8-15 m/s typical
-        force_newtons = (velocity_mps ** 2) * 5  # Simplified
-        
-        return TriangulatedStrike(
-            bout_id=strike.bout_id,
-            round_num=strike.round_num,
-            timestamp_ms=strike.timestamp_ms,
-            strike_event=strike,
-            camera_views=camera_views,
-            impact_point_3d=impact_3d,
-            trajectory_angle=random.uniform(30, 60),
-            estimated_velocity_mps=velocity_mps,
-            estimated_force_newtons=force_newtons,
-            triangulation_accuracy=min([v.detection_confidence for v in camera_views])
+        Impact points and every trajectory sample of every strike are stacked
+        into a single (M, K, 2) observation array over the arena's K
+        calibrated cameras. Velocity comes from consecutive triangulated
+        trajectory points.
+        """
+        camera_ids, projections = self.calibrations.stacked(arena_id)
+        camera_index = {camera_id: i for i, camera_id in enumerate(camera_ids)}
+        k = len(camera_ids)
+        
+        # Row layout per strike: [impact, trajectory_0 .. trajectory_T-1]
+        row_counts = [
+            1 + max((len(view.get("trajectory") or []) for view in views), default=0)
+            for views in camera_data
+        ]
+        offsets = np.concatenate([[0], np.cumsum(row_counts)])
+        observations = np.full((int(offsets[-1]), k, 2), np.nan)
+        confidences = np.zeros((int(offsets[-1]), k))
+        
+        for s, views in enumerate(camera_data):
+            base = offsets[s]
+            for view in views:
+                column = camera_index.get(view.get("id"))
+                if column is None:
+                    continue  # Uncalibrated camera: reported, not solved
+                confidence = view.get("confidence", 1.0)
+                point = self._view_impact_point(view)
+                if point is not None:
+                    observations[base, column] = point
+                    confidences[base, column] = confidence
+                for t, sample in enumerate(view.get("trajectory") or []):
+                    if sample is not None:
+                        observations[base + 1 + t, column] = sample
+                        confidences[base + 1 + t, column] = confidence
+        
+        if k >= 2 and len(observations):
+            points_3d, error_px, views_used = triangulate_points(projections, observations, confidences)
+        else:
+            points_3d = np.full((len(observations), 3), np.nan)
+            error_px = np.full(len(observations), np.nan)
+            views_used = np.zeros(len(observations), dtype=int)
+        
+        used_confidence = np.where(confidences > 0, confidences, np.inf).min(axis=1) if k else np.zeros(len(observations))
+        used_confidence[~np.isfinite(used_confidence)] = 0.0
+        accuracy = triangulation_accuracy(used_confidence, error_px)
+        
+        results = []
+        for s, (strike, views) in enumerate(zip(strikes, camera_data)):
+            base = offsets[s]
+            impact = points_3d[base]
+            
+            velocity_mps = None
+            trajectory_angle = None
+            samples = row_counts[s] - 1
+            if samples >= 2:
+                interval_ms = views[0].get("frame_interval_ms", 1000.0 / 60) if views else 1000.0 / 60
+                trajectory = points_3d[base + 1:base + 1 + samples]
+                timestamps = strike.timestamp_ms - interval_ms * np.arange(samples - 1, -1, -1)
+                solved = np.isfinite(trajectory).all(axis=1)
+                if solved.sum() >= 2:
+                    velocities, speeds = estimate_velocity(trajectory[solved], timestamps[solved])
+                    velocity_mps = float(speeds[-1])
+                    vx, vy, vz = velocities[-1]
+                    trajectory_angle = float(np.degrees(np.arctan2(vy, np.hypot(vx, vz))))
+            
+            results.append(TriangulatedStrike(
+                bout_id=strike.bout_id,
+                round_num=strike.round_num,
+                timestamp_ms=strike.timestamp_ms,
+                strike_event=strike,
+                camera_views=[self._camera_view(arena_id, view) for view in views],
+                impact_point_3d=(
+                    {"x": float(impact[0]), "y": float(impact[1]), "z": float(impact[2])}
+                    if np.isfinite(impact).all() else None
+                ),
+                trajectory_angle=trajectory_angle,
+                estimated_velocity_mps=velocity_mps,
+                estimated_force_newtons=(velocity_mps ** 2) * 5 if velocity_mps is not None else None,  # Simplified
+                triangulation_accuracy=float(accuracy[base]),
+                arena_id=arena_id,
+                views_used=int(views_used[base]),
+                reprojection_error_px=float(error_px[base]) if np.isfinite(error_px[base]) else None
+            ))
+        
+        return results
+    
+    @staticmethod
+    def _view_impact_point(view: dict) -> Optional[List[float]]:
+        point = view.get("impact_point")
+        if point is not None:
+            return point
+        trajectory = view.get("trajectory") or []
+        return trajectory[-1] if trajectory else None
+    
+    def _camera_view(self, arena_id: str, view: dict) -> CameraView:
+        camera_id = view.get("id", "cam1")
+        point = self._view_impact_point(view) or [0.0, 0.0]
+        return CameraView(
+            camera_id=camera_id,
+            camera_position=view.get("position", self.camera_positions.get((arena_id, camera_id), "main")),
+            impact_point_x=point[0],
+            impact_point_y=point[1],
+            detection_confidence=view.get("confidence", 1.0),
+            camera_angle_degrees=view.get("angle", 0),
+            distance_to_fighters_meters=view.get("distance", 5.0)
         )
     
     # ========================================================================
@@ -345,7 +462,7 @@ class ProfessionalCVEngine:
         Tracks damage accumulation by zone and specific targets
         """
         
-        key = fighter_id
+        key = (strike.bout_id, fighter_id)
         if key not in self.damage_heatmaps:
             self.damage_heatmaps[key] = DamageHeatmap(
                 bout_id=strike.bout_id,
@@ -374,79 +491,90 @@ class ProfessionalCVEngine:
         
         return heatmap
     
+    def get_damage_heatmap(self, bout_id: Optional[str], fighter_id: str) -> DamageHeatmap:
+        """
+        Damage heatmap for a fighter in a bout (empty if none recorded)
+        
+        With bout_id=None the fighter's heatmaps are summed across every bout
+        still in memory (bout_id "all" when more than one contributes).
+        """
+        if bout_id is not None:
+            heatmap = self.damage_heatmaps.get((bout_id, fighter_id))
+            if heatmap is None:
+                return DamageHeatmap(bout_id=bout_id, fighter_id=fighter_id)
+            return heatmap
+        
+        heatmaps = [h for key, h in self.damage_heatmaps.items() if key[1] == fighter_id]
+        if not heatmaps:
+            return DamageHeatmap(bout_id="unknown", fighter_id=fighter_id)
+        if len(heatmaps) == 1:
+            return heatmaps[0]
+        
+        merged = DamageHeatmap(bout_id="all", fighter_id=fighter_id)
+        for heatmap in heatmaps:
+            merged.head_damage += heatmap.head_damage
+            merged.body_damage += heatmap.body_damage
+            merged.leg_damage += heatmap.leg_damage
+            merged.total_damage_score += heatmap.total_damage_score
+            for target, value in heatmap.target_damage.items():
+                merged.target_damage[target] = merged.target_damage.get(target, 0) + value
+        return merged
+    
+    def archive_bout(self, bout_id: str) -> Dict[str, int]:
+        """Evict heatmaps and FIE counters for an archived bout"""
+        heatmap_keys = [key for key in self.damage_heatmaps if key[0] == bout_id]
+        for key in heatmap_keys:
+            del self.damage_heatmaps[key]
+        rounds = self.fie_store.evict_bout(bout_id)
+        self.strike_cache.pop(bout_id, None)
+        self.ground_game_cache.pop(bout_id, None)
+        logger.info(f"Archived bout {bout_id}: {len(heatmap_keys)} heatmaps, {rounds} round accumulators evicted")
+        return {"heatmaps_evicted": len(heatmap_keys), "round_accumulators_evicted": rounds}
+    
     # ========================================================================
     # Advanced Metrics Calculation
     # ========================================================================
     
+    def record_strike(self, strike: StrikeEvent):
+        """Feed a detected strike into the FIE counters"""
+        self.fie_store.record_strike(strike)
+    
+    def record_defense(self, defense: DefenseEvent):
+        """Feed a detected defense into the FIE counters"""
+        self.fie_store.record_defense(defense)
+    
+    def record_takedown(self, takedown: TakedownEvent):
+        """Feed a detected takedown into the FIE counters"""
+        self.fie_store.record_takedown(takedown)
+    
+    def record_submission(self, submission: SubmissionAttemptPro):
+        """Feed a detected submission attempt into the FIE counters"""
+        self.fie_store.record_submission(submission)
+    
+    def record_ground_control(self, control: GroundControl, timestamp_ms: int = 0):
+        """Add ground control time for a fighter's round"""
+        self.fie_store.record_control_time(
+            control.bout_id, control.round_num, control.fighter_id,
+            control.total_control_time_ms, timestamp_ms
+        )
+    
     def calculate_fie_metrics(
         self,
         bout_id: str,
         fighter_id: str,
-        round_num: Optional[int] = None
+        round_num: Optional[int] = None,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None
     ) -> FIEMetrics:
         """
         Calculate complete Fight Impact Engine metrics
         
-        Comparable to Jabbr/DeepStrike/CompuBox standards
+        Comparable to Jabbr/DeepStrike/CompuBox standards. Read from the
+        incremental counters: a round, the whole fight (round_num=None) or a
+        time window [start_ms, end_ms).
         """
-        
-        # In production: aggregate from actual detected events
-        # Current: Generate realistic simulation data
-        
-        total_thrown = random.randint(50, 150)
-        total_landed = int(total_thrown * random.uniform(0.35, 0.55))
-        
-        metrics = FIEMetrics(
-            bout_id=bout_id,
-            round_num=round_num,
-            fighter_id=fighter_id,
-            
-            # Striking
-            total_strikes_thrown=total_thrown,
-            total_strikes_landed=total_landed,
-            strike_accuracy=(total_landed / total_thrown * 100) if total_thrown > 0 else 0,
-            
-            # Power
-            significant_strikes=int(total_landed * 0.4),
-            power_strikes_landed=int(total_landed * 0.25),
-            avg_strike_power=random.uniform(5.0, 7.5),
-            max_strike_power=random.uniform(8.0, 10.0),
-            
-            # Zones
-            head_strikes_landed=int(total_landed * 0.5),
-            body_strikes_landed=int(total_landed * 0.3),
-            leg_strikes_landed=int(total_landed * 0.2),
-            
-            # Types
-            jabs_landed=int(total_landed * 0.3),
-            power_punches_landed=int(total_landed * 0.4),
-            kicks_landed=int(total_landed * 0.25),
-            knees_landed=int(total_landed * 0.03),
-            elbows_landed=int(total_landed * 0.02),
-            
-            # Defense
-            strikes_absorbed=random.randint(30, 80),
-            strikes_defended=random.randint(20, 60),
-            defense_rate=random.uniform(35, 65),
-            
-            # Ground
-            takedowns_landed=random.randint(0, 3),
-            takedowns_attempted=random.randint(0, 5),
-            takedown_accuracy=random.uniform(40, 80),
-            submission_attempts=random.randint(0, 2),
-            ground_control_time_sec=random.uniform(0, 120),
-            
-            # Damage
-            damage_dealt=random.uniform(300, 800),
-            damage_absorbed=random.uniform(200, 700),
-            damage_differential=random.uniform(-100, 200),
-            
-            # Overall
-            dominance_score=random.uniform(40, 80),
-            aggression_rating=random.uniform(5, 9)
-        )
-        
-        return metrics
+        counters = self.fie_store.query(bout_id, fighter_id, round_num, start_ms, end_ms)
+        return counters.to_metrics(bout_id, fighter_id, round_num)
     
     def analyze_momentum(
         self,
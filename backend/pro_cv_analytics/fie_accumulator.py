@@ -0,0 +1,308 @@
+"""
+Professional CV Analytics - FIE Accumulators
+
+Fight Impact Engine metrics maintained incrementally from the detected
+strike / defense / takedown / submission stream. Every event updates a
+compact counter struct for its (bout, round, fighter) in O(1); a time-slice
+copy of the same counters makes window queries a merge of a few slices
+rather than a rescan of events.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+import logging
+from .models import (
+    StrikeEvent, DefenseEvent, TakedownEvent, SubmissionAttemptPro, FIEMetrics
+)
+
+logger = logging.getLogger(__name__)
+
+# Strike type groups
+POWER_PUNCHES = frozenset({"cross", "hook", "uppercut", "overhand"})
+KICKS = frozenset({
+    "front_kick", "roundhouse", "side_kick", "back_kick",
+    "leg_kick", "body_kick", "head_kick", "spinning_kick"
+})
+KNEES = frozenset({"knee_straight", "knee_flying", "knee_clinch"})
+ELBOWS = frozenset({"elbow_horizontal", "elbow_vertical", "elbow_spinning"})
+
+# Power thresholds (0-10 scale)
+SIGNIFICANT_POWER = 5.0
+POWER_STRIKE_POWER = 7.0
+
+# Width of the time slices used for window queries
+DEFAULT_SLICE_MS = 10_000
+
+
+def strike_damage(strike: StrikeEvent) -> float:
+    """Damage value of a landed strike (same scale as the damage heatmap)"""
+    return strike.power_rating * strike.accuracy_score * 10
+
+
+class FighterCounters:
+    """Counters for one fighter over one round (or one time slice)"""
+    
+    __slots__ = (
+        "strikes_thrown", "strikes_landed", "significant_strikes", "power_strikes_landed",
+        "power_sum", "power_max",
+        "head_landed", "body_landed", "leg_landed",
+        "jabs_landed", "power_punches_landed", "kicks_landed", "knees_landed", "elbows_landed",
+        "strikes_absorbed", "strikes_defended",
+        "takedowns_landed", "takedowns_attempted", "submission_attempts", "control_time_ms",
+        "damage_dealt", "damage_absorbed",
+        "first_ts", "last_ts"
+    )
+    
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+        self.power_sum = 0.0
+        self.power_max = 0.0
+        self.damage_dealt = 0.0
+        self.damage_absorbed = 0.0
+        self.first_ts = None
+        self.last_ts = None
+    
+    def touch(self, timestamp_ms: int):
+        if self.first_ts is None or timestamp_ms < self.first_ts:
+            self.first_ts = timestamp_ms
+        if self.last_ts is None or timestamp_ms > self.last_ts:
+            self.last_ts = timestamp_ms
+    
+    def add_strike_thrown(self, strike: StrikeEvent):
+        self.strikes_thrown += 1
+        self.touch(strike.timestamp_ms)
+        if not strike.landed:
+            return
+        
+        power = strike.power_rating
+        self.strikes_landed += 1
+        self.power_sum += power
+        if power > self.power_max:
+            self.power_max = power
+        if power >= SIGNIFICANT_POWER:
+            self.significant_strikes += 1
+        if power >= POWER_STRIKE_POWER:
+            self.power_strikes_landed += 1
+        
+        if strike.zone == "head":
+            self.head_landed += 1
+        elif strike.zone == "body":
+            self.body_landed += 1
+        else:
+            self.leg_landed += 1
+        
+        strike_type = strike.strike_type
+        if strike_type == "jab":
+            self.jabs_landed += 1
+        elif strike_type in POWER_PUNCHES:
+            self.power_punches_landed += 1
+        elif strike_type in KICKS:
+            self.kicks_landed += 1
+        elif strike_type in KNEES:
+            self.knees_landed += 1
+        elif strike_type in ELBOWS:
+            self.elbows_landed += 1
+        
+        self.damage_dealt += strike_damage(strike)
+    
+    def add_strike_received(self, strike: StrikeEvent):
+        self.touch(strike.timestamp_ms)
+        if strike.landed:
+            self.strikes_absorbed += 1
+            self.damage_absorbed += strike_damage(strike)
+    
+    def merge(self, other: "FighterCounters"):
+        """Add another counter set into this one"""
+        for name in self.__slots__:
+            if name in ("power_max", "first_ts", "last_ts"):
+                continue
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        if other.power_max > self.power_max:
+            self.power_max = other.power_max
+        if other.first_ts is not None:
+            self.touch(other.first_ts)
+            self.touch(other.last_ts)
+        return self
+    
+    def to_metrics(self, bout_id: str, fighter_id: str, round_num: Optional[int] = None) -> FIEMetrics:
+        """Derive FIE ratios from the counters"""
+        thrown = self.strikes_thrown
+        landed = self.strikes_landed
+        defense_opportunities = self.strikes_defended + self.strikes_absorbed
+        damage_total = self.damage_dealt + self.damage_absorbed
+        
+        active_minutes = 0.0
+        if self.first_ts is not None:
+            active_minutes = max((self.last_ts - self.first_ts) / 60000.0, 1.0)
+        offensive_actions = thrown + self.takedowns_attempted + self.submission_attempts
+        
+        return FIEMetrics(
+            bout_id=bout_id,
+            round_num=round_num,
+            fighter_id=fighter_id,
+            
+            # Striking
+            total_strikes_thrown=thrown,
+            total_strikes_landed=landed,
+            strike_accuracy=(landed / thrown * 100) if thrown > 0 else 0.0,
+            
+            # Power
+            significant_strikes=self.significant_strikes,
+            power_strikes_landed=self.power_strikes_landed,
+            avg_strike_power=(self.power_sum / landed) if landed > 0 else 0.0,
+            max_strike_power=self.power_max,
+            
+            # Zones
+            head_strikes_landed=self.head_landed,
+            body_strikes_landed=self.body_landed,
+            leg_strikes_landed=self.leg_landed,
+            
+            # Types
+            jabs_landed=self.jabs_landed,
+            power_punches_landed=self.power_punches_landed,
+            kicks_landed=self.kicks_landed,
+            knees_landed=self.knees_landed,
+            elbows_landed=self.elbows_landed,
+            
+            # Defense
+            strikes_absorbed=self.strikes_absorbed,
+            strikes_defended=self.strikes_defended,
+            defense_rate=(self.strikes_defended / defense_opportunities * 100) if defense_opportunities > 0 else 0.0,
+            
+            # Ground
+            takedowns_landed=self.takedowns_landed,
+            takedowns_attempted=self.takedowns_attempted,
+            takedown_accuracy=(self.takedowns_landed / self.takedowns_attempted * 100) if self.takedowns_attempted > 0 else 0.0,
+            submission_attempts=self.submission_attempts,
+            ground_control_time_sec=self.control_time_ms / 1000.0,
+            
+            # Damage
+            damage_dealt=self.damage_dealt,
+            damage_absorbed=self.damage_absorbed,
+            damage_differential=self.damage_dealt - self.damage_absorbed,
+            
+            # Overall: share of damage exchanged, offensive actions per minute
+            dominance_score=(self.damage_dealt / damage_total * 100) if damage_total > 0 else 0.0,
+            aggression_rating=min(10.0, offensive_actions / active_minutes / 3.0) if active_minutes else 0.0
+        )
+
+
+RoundKey = Tuple[str, int, str]  # (bout_id, round_num, fighter_id)
+
+
+class RoundAccumulator:
+    """Totals plus time slices for one (bout, round, fighter)"""
+    
+    __slots__ = ("totals", "slices")
+    
+    def __init__(self):
+        self.totals = FighterCounters()
+        self.slices: Dict[int, FighterCounters] = {}
+
+
+class FIEAccumulatorStore:
+    """Per-(bout, round, fighter) FIE counters fed by the event stream"""
+    
+    def __init__(self, slice_ms: int = DEFAULT_SLICE_MS):
+        self.slice_ms = slice_ms
+        self.rounds: Dict[RoundKey, RoundAccumulator] = {}
+        # bout_id -> round keys, so bout queries/eviction never scan all bouts
+        self.bout_index: Dict[str, set] = {}
+        self.events_recorded = 0
+    
+    def _counters(self, bout_id: str, round_num: int, fighter_id: str, timestamp_ms: int) -> Tuple[FighterCounters, FighterCounters]:
+        """(round totals, time slice) counters for an event"""
+        key = (bout_id, round_num, fighter_id)
+        accumulator = self.rounds.get(key)
+        if accumulator is None:
+            accumulator = RoundAccumulator()
+            self.rounds[key] = accumulator
+            self.bout_index.setdefault(bout_id, set()).add(key)
+        slice_index = timestamp_ms // self.slice_ms
+        time_slice = accumulator.slices.get(slice_index)
+        if time_slice is None:
+            time_slice = FighterCounters()
+            accumulator.slices[slice_index] = time_slice
+        return accumulator.totals, time_slice
+    
+    def record_strike(self, strike: StrikeEvent):
+        for counters in self._counters(strike.bout_id, strike.round_num, strike.attacker_id, strike.timestamp_ms):
+            counters.add_strike_thrown(strike)
+        for counters in self._counters(strike.bout_id, strike.round_num, strike.defender_id, strike.timestamp_ms):
+            counters.add_strike_received(strike)
+        self.events_recorded += 1
+    
+    def record_defense(self, defense: DefenseEvent):
+        for counters in self._counters(defense.bout_id, defense.round_num, defense.fighter_id, defense.timestamp_ms):
+            counters.touch(defense.timestamp_ms)
+            if defense.success:
+                counters.strikes_defended += 1
+        self.events_recorded += 1
+    
+    def record_takedown(self, takedown: TakedownEvent):
+        for counters in self._counters(takedown.bout_id, takedown.round_num, takedown.attacker_id, takedown.timestamp_ms):
+            counters.touch(takedown.timestamp_ms)
+            counters.takedowns_attempted += 1
+            if takedown.successful:
+                counters.takedowns_landed += 1
+        self.events_recorded += 1
+    
+    def record_submission(self, submission: SubmissionAttemptPro):
+        for counters in self._counters(submission.bout_id, submission.round_num, submission.attacker_id, submission.timestamp_ms):
+            counters.touch(submission.timestamp_ms)
+            counters.submission_attempts += 1
+        self.events_recorded += 1
+    
+    def record_control_time(self, bout_id: str, round_num: int, fighter_id: str,
+                            duration_ms: int, timestamp_ms: int):
+        for counters in self._counters(bout_id, round_num, fighter_id, timestamp_ms):
+            counters.touch(timestamp_ms)
+            counters.control_time_ms += duration_ms
+        self.events_recorded += 1
+    
+    def _round_keys(self, bout_id: str, fighter_id: str, round_num: Optional[int]) -> Iterable[RoundKey]:
+        if round_num is not None:
+            key = (bout_id, round_num, fighter_id)
+            return [key] if key in self.rounds else []
+        return sorted(k for k in self.bout_index.get(bout_id, ()) if k[2] == fighter_id)
+    
+    def query(self, bout_id: str, fighter_id: str, round_num: Optional[int] = None,
+              start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> FighterCounters:
+        """
+        Counters for a round, the whole fight, or a time window
+        
+        Window bounds are aligned to slice_ms: every slice overlapping
+        [start_ms, end_ms) is included.
+        """
+        result = FighterCounters()
+        windowed = start_ms is not None or end_ms is not None
+        first_slice = (start_ms // self.slice_ms) if start_ms is not None else None
+        last_slice = ((end_ms - 1) // self.slice_ms) if end_ms is not None else None
+        
+        for key in self._round_keys(bout_id, fighter_id, round_num):
+            accumulator = self.rounds[key]
+            if not windowed:
+                result.merge(accumulator.totals)
+                continue
+            for slice_index, counters in accumulator.slices.items():
+                if first_slice is not None and slice_index < first_slice:
+                    continue
+                if last_slice is not None and slice_index > last_slice:
+                    continue
+                result.merge(counters)
+        return result
+    
+    def evict_bout(self, bout_id: str) -> int:
+        """Drop all counters for a bout"""
+        keys = self.bout_index.pop(bout_id, set())
+        for key in keys:
+            self.rounds.pop(key, None)
+        return len(keys)
+    
+    def get_stats(self) -> Dict:
+        return {
+            "bouts": len(self.bout_index),
+            "round_accumulators": len(self.rounds),
+            "events_recorded": self.events_recorded,
+            "slice_ms": self.slice_ms
+        }
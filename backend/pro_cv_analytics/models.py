@@ -264,6 +264,20 @@ class TriangulatedStrike(BaseModel):
     estimated_force_newtons: Optional[float] = None
     
     triangulation_accuracy: float  # 0.0-1.0
+    
+    # Solve diagnostics
+    arena_id: Optional[str] = None
+    views_used: int = 0
+    reprojection_error_px: Optional[float] = None
+
+
+class CameraCalibration(BaseModel):
+    """Calibrated camera for an arena (3x4 projection matrix, pixels <- metres)"""
+    arena_id: str
+    camera_id: str
+    camera_position: Literal["main", "corner_red", "corner_blue", "overhead"] = "main"
+    projection_matrix: List[List[float]]  # 3 rows x 4 columns
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 # ============================================================================
@@ -328,6 +342,15 @@ class MomentumAnalysis(BaseModel):
     dominance_percentage: float = 50.0
 
 
+class FIEEventBatch(BaseModel):
+    """Detected events feeding the FIE counters"""
+    strikes: List[StrikeEvent] = Field(default_factory=list)
+    defenses: List[DefenseEvent] = Field(default_factory=list)
+    takedowns: List[TakedownEvent] = Field(default_factory=list)
+    submissions: List[SubmissionAttemptPro] = Field(default_factory=list)
+    ground_control: List[GroundControl] = Field(default_factory=list)
+
+
 class FIEMetrics(BaseModel):
     """Fight Impact Engine metrics (Jabbr/DeepStrike standard)"""
     bout_id: str
@@ -29,7 +29,9 @@ def get_cv_engine():
 async def get_fie_metrics(
     bout_id: str,
     fighter_id: str,
-    round_num: Optional[int] = None
+    round_num: Optional[int] = None,
+    start_ms: Optional[int] = None,
+    end_ms: Optional[int] = None
 ):
     """
     Get complete Fight Impact Engine metrics
@@ -38,9 +40,37 @@ async def get_fie_metrics(
     - CompuBox (punch stats)
     - Jabbr (power analysis)
     - DeepStrike (comprehensive analytics)
+    
+    Scope: one round (round_num), the whole fight, or a time window
+    (start_ms/end_ms, optionally within a round).
     """
     engine = get_cv_engine()
-    return engine.calculate_fie_metrics(bout_id, fighter_id, round_num)
+    return engine.calculate_fie_metrics(bout_id, fighter_id, round_num, start_ms, end_ms)
+
+@pro_cv_api.post("/pro-cv/events")
+async def ingest_events(batch: FIEEventBatch):
+    """
+    Ingest detected strike/defense/takedown/submission/ground control events
+    
+    Each event updates the per-(bout, round, fighter) FIE counters in O(1).
+    """
+    engine = get_cv_engine()
+    for strike in batch.strikes:
+        engine.record_strike(strike)
+    for defense in batch.defenses:
+        engine.record_defense(defense)
+    for takedown in batch.takedowns:
+        engine.record_takedown(takedown)
+    for submission in batch.submissions:
+        engine.record_submission(submission)
+    for control in batch.ground_control:
+        engine.record_ground_control(control)
+    
+    return {
+        "success": True,
+        "recorded": (len(batch.strikes) + len(batch.defenses) + len(batch.takedowns)
+                     + len(batch.submissions) + len(batch.ground_control))
+    }
 
 @pro_cv_api.get("/pro-cv/metrics/{bout_id}/comparison")
 async def compare_fighters(bout_id: str, fighter_1_id: str, fighter_2_id: str):
@@ -80,10 +110,28 @@ async def classify_strike(video_frame_data: dict, fighter_pose: dict):
     """
     engine = get_cv_engine()
     strike = engine.classify_strike(video_frame_data, fighter_pose, impact_detected=True)
+    if strike:
+        engine.record_strike(strike)
     return strike
 
+@pro_cv_api.post("/pro-cv/arenas/{arena_id}/cameras")
+async def register_arena_cameras(arena_id: str, cameras: List[CameraCalibration]):
+    """
+    Register calibrated camera projection matrices for an arena
+    """
+    engine = get_cv_engine()
+    for calibration in cameras:
+        calibration.arena_id = arena_id
+        try:
+            await engine.save_camera_calibration(calibration)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    camera_ids, _ = engine.calibrations.stacked(arena_id)
+    return {"arena_id": arena_id, "cameras": camera_ids}
+
 @pro_cv_api.post("/pro-cv/strikes/triangulate")
-async def triangulate_strike(strike: StrikeEvent, camera_data: List[dict]):
+async def triangulate_strike(strike: StrikeEvent, camera_data: List[dict], arena_id: str = "default"):
     """
     Multi-camera strike triangulation
     
@@ -94,7 +142,8 @@ async def triangulate_strike(strike: StrikeEvent, camera_data: List[dict]):
     - Trajectory angle
     """
     engine = get_cv_engine()
-    return engine.triangulate_strike(strike, camera_data)
+    await engine.ensure_arena_loaded(arena_id)
+    return engine.triangulate_strike(strike, camera_data, arena_id)
 
 # ============================================================================
 # Defense Detection
@@ -116,6 +165,7 @@ async def detect_defense(defender_pose: dict, incoming_strike: StrikeEvent):
     if not defense:
         raise HTTPException(status_code=404, detail="No defense detected")
     
+    engine.record_defense(defense)
     return defense
 
 # ============================================================================
@@ -139,6 +189,7 @@ async def detect_takedown(video_frames: List[dict], fighter_poses: List[dict]):
     if not takedown:
         return {"message": "No takedown detected"}
     
+    engine.record_takedown(takedown)
     return takedown
 
 @pro_cv_api.post("/pro-cv/ground/position")
@@ -178,6 +229,7 @@ async def detect_submission(ground_position: str, limb_positions: dict):
     if not submission:
         return {"message": "No submission detected"}
     
+    engine.record_submission(submission)
     return submission
 
 # ============================================================================
@@ -185,7 +237,7 @@ async def detect_submission(ground_position: str, limb_positions: dict):
 # ============================================================================
 
 @pro_cv_api.get("/pro-cv/damage/{fighter_id}/heatmap", response_model=DamageHeatmap)
-async def get_damage_heatmap(fighter_id: str):
+async def get_damage_heatmap(fighter_id: str, bout_id: Optional[str] = None):
     """
     Get cumulative damage heatmap
     
@@ -193,14 +245,19 @@ async def get_damage_heatmap(fighter_id: str):
     - Zone damage (head/body/legs)
     - Specific target damage
     - Visual heatmap data
+    
+    Scope: one bout (bout_id), or summed across the fighter's bouts.
     """
     engine = get_cv_engine()
-    
-    if fighter_id in engine.damage_heatmaps:
-        return engine.damage_heatmaps[fighter_id]
-    
-    # Return empty heatmap
-    return DamageHeatmap(bout_id="unknown", fighter_id=fighter_id)
+    return engine.get_damage_heatmap(bout_id, fighter_id)
+
+@pro_cv_api.post("/pro-cv/bouts/{bout_id}/archive")
+async def archive_bout(bout_id: str):
+    """
+    Evict in-memory heatmaps and FIE counters for an archived bout
+    """
+    engine = get_cv_engine()
+    return {"bout_id": bout_id, **engine.archive_bout(bout_id)}
 
 @pro_cv_api.post("/pro-cv/damage/update")
 async def update_damage(fighter_id: str, strike: StrikeEvent):
@@ -272,9 +329,7 @@ async def get_complete_report(bout_id: str, fighter_id: str):
     
     # Get all metrics
     fie = engine.calculate_fie_metrics(bout_id, fighter_id)
-    damage = engine.damage_heatmaps.get(fighter_id, DamageHeatmap(
-        bout_id=bout_id, fighter_id=fighter_id
-    ))
+    damage = engine.get_damage_heatmap(bout_id, fighter_id)
     
     return {
         "bout_id": bout_id,
@@ -0,0 +1,188 @@
+"""
+Professional CV Analytics - Multi-View Triangulation
+
+Batched linear (DLT) triangulation from calibrated cameras. Each camera is a
+3x4 projection matrix P mapping homogeneous world points to pixels. For N
+points seen by K cameras the 2K x 4 DLT systems are stacked and solved in one
+batched least-squares call instead of one Python loop per strike and view.
+
+World frame: metres, y up, origin at the centre of the canvas.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Views below this confidence are ignored by the solve
+MIN_VIEW_CONFIDENCE = 0.05
+
+# Reprojection error (pixels) at which triangulation accuracy reaches zero
+MAX_REPROJECTION_ERROR_PX = 25.0
+
+
+def projection_matrix(intrinsics: np.ndarray, rotation: np.ndarray, translation: np.ndarray) -> np.ndarray:
+    """P = K [R | t]"""
+    return np.asarray(intrinsics, dtype=np.float64) @ np.hstack([
+        np.asarray(rotation, dtype=np.float64),
+        np.asarray(translation, dtype=np.float64).reshape(3, 1)
+    ])
+
+
+def look_at_camera(position, target=(0.0, 1.2, 0.0), focal_px: float = 1400.0,
+                   width: int = 1920, height: int = 1080) -> np.ndarray:
+    """
+    Projection matrix for a pinhole camera at `position` aimed at `target`
+    
+    Handy for synthetic arenas and tests; real arenas register calibrated
+    matrices.
+    """
+    position = np.asarray(position, dtype=np.float64)
+    forward = np.asarray(target, dtype=np.float64) - position
+    forward /= np.linalg.norm(forward)
+    right = np.cross(forward, [0.0, 1.0, 0.0])
+    if np.linalg.norm(right) < 1e-9:  # Looking straight down/up
+        right = np.array([1.0, 0.0, 0.0])
+    right /= np.linalg.norm(right)
+    down = np.cross(forward, right)
+    
+    rotation = np.vstack([right, down, forward])
+    intrinsics = np.array([
+        [focal_px, 0.0, width / 2.0],
+        [0.0, focal_px, height / 2.0],
+        [0.0, 0.0, 1.0]
+    ])
+    return projection_matrix(intrinsics, rotation, -rotation @ position)
+
+
+def project_points(projections: np.ndarray, points_3d: np.ndarray) -> np.ndarray:
+    """
+    Project world points through every camera
+    
+    Args:
+        projections: (K, 3, 4) projection matrices
+        points_3d: (N, 3) world points
+    
+    Returns:
+        (N, K, 2) pixel coordinates
+    """
+    homogeneous = np.concatenate([points_3d, np.ones((points_3d.shape[0], 1))], axis=1)
+    projected = np.einsum("kij,nj->nki", projections, homogeneous)
+    return projected[..., :2] / projected[..., 2:3]
+
+
+def triangulate_points(projections: np.ndarray, points_2d: np.ndarray,
+                       confidences: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Triangulate N points from K views in one batched DLT least-squares solve
+    
+    Each valid view contributes the rows  x*P3 - P1  and  y*P3 - P2  scaled
+    by its confidence. With the homogeneous coordinate fixed to 1 this is an
+    (N, 2K, 3) least-squares problem, solved through the batched 3x3 normal
+    equations.
+    
+    Args:
+        projections: (K, 3, 4) projection matrices
+        points_2d: (N, K, 2) pixel observations; NaN marks a missing view
+        confidences: (N, K) per-view weights (default 1.0)
+    
+    Returns:
+        (points_3d (N, 3), reprojection_error_px (N,), views_used (N,)).
+        Points seen by fewer than two views are NaN.
+    """
+    projections = np.asarray(projections, dtype=np.float64)
+    points_2d = np.asarray(points_2d, dtype=np.float64)
+    n, k = points_2d.shape[:2]
+    
+    if confidences is None:
+        weights = np.ones((n, k))
+    else:
+        weights = np.asarray(confidences, dtype=np.float64).copy()
+    valid = np.isfinite(points_2d).all(axis=2) & (weights >= MIN_VIEW_CONFIDENCE)
+    weights[~valid] = 0.0
+    observed = np.where(valid[..., None], points_2d, 0.0)
+    
+    # (N, K, 4) rows for x and y
+    p1, p2, p3 = projections[:, 0, :], projections[:, 1, :], projections[:, 2, :]
+    rows_x = observed[..., 0:1] * p3 - p1
+    rows_y = observed[..., 1:2] * p3 - p2
+    system = np.concatenate([rows_x, rows_y], axis=1) * np.concatenate([weights, weights], axis=1)[..., None]
+    
+    a = system[..., :3]                     # (N, 2K, 3)
+    b = -system[..., 3]                     # (N, 2K)
+    normal = np.einsum("nri,nrj->nij", a, a)
+    rhs = np.einsum("nri,nr->ni", a, b)
+    
+    views_used = valid.sum(axis=1)
+    solvable = views_used >= 2
+    # Keep singular/unsolvable systems out of the batched solve
+    normal[~solvable] = np.eye(3)
+    rhs[~solvable] = 0.0
+    points_3d = np.linalg.solve(normal, rhs[..., None])[..., 0]
+    points_3d[~solvable] = np.nan
+    
+    reprojected = project_points(projections, np.nan_to_num(points_3d))
+    errors = np.linalg.norm(reprojected - observed, axis=2)
+    error_px = (errors * valid).sum(axis=1) / np.maximum(views_used, 1)
+    error_px[~solvable] = np.nan
+    
+    return points_3d, error_px, views_used
+
+
+def estimate_velocity(points_3d: np.ndarray, timestamps_ms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Velocity from consecutive triangulated points
+    
+    Args:
+        points_3d: (T, 3) positions along one strike trajectory
+        timestamps_ms: (T,) capture times
+    
+    Returns:
+        (velocities (T-1, 3) in m/s, speeds (T-1,) in m/s)
+    """
+    dt = np.diff(np.asarray(timestamps_ms, dtype=np.float64)) / 1000.0
+    dt[dt <= 0] = np.nan
+    velocities = np.diff(points_3d, axis=0) / dt[:, None]
+    return velocities, np.linalg.norm(velocities, axis=1)
+
+
+class ArenaCalibrationStore:
+    """Calibrated projection matrices per arena, stacked for batched solves"""
+    
+    def __init__(self):
+        # arena_id -> camera_id -> (3, 4) matrix
+        self.cameras: Dict[str, Dict[str, np.ndarray]] = {}
+        self._stacked: Dict[str, Tuple[List[str], np.ndarray]] = {}
+    
+    def set_camera(self, arena_id: str, camera_id: str, projection) -> np.ndarray:
+        matrix = np.asarray(projection, dtype=np.float64)
+        if matrix.shape != (3, 4):
+            raise ValueError(f"Projection matrix for {camera_id} must be 3x4, got {matrix.shape}")
+        self.cameras.setdefault(arena_id, {})[camera_id] = matrix
+        self._stacked.pop(arena_id, None)
+        return matrix
+    
+    def has_arena(self, arena_id: str) -> bool:
+        return arena_id in self.cameras
+    
+    def stacked(self, arena_id: str) -> Tuple[List[str], np.ndarray]:
+        """(camera_ids, (K, 3, 4) matrices) for an arena, cached until it changes"""
+        cached = self._stacked.get(arena_id)
+        if cached is None:
+            cameras = self.cameras.get(arena_id, {})
+            camera_ids = sorted(cameras)
+            matrices = np.stack([cameras[c] for c in camera_ids]) if camera_ids else np.zeros((0, 3, 4))
+            cached = (camera_ids, matrices)
+            self._stacked[arena_id] = cached
+        return cached
+    
+    def camera_index(self, arena_id: str) -> Dict[str, int]:
+        camera_ids, _ = self.stacked(arena_id)
+        return {camera_id: i for i, camera_id in enumerate(camera_ids)}
+
+
+def triangulation_accuracy(view_confidences: np.ndarray, error_px: np.ndarray) -> np.ndarray:
+    """0.0-1.0 score: weakest used view scaled down by reprojection error"""
+    penalty = np.clip(1.0 - np.nan_to_num(error_px, nan=MAX_REPROJECTION_ERROR_PX) / MAX_REPROJECTION_ERROR_PX, 0.0, 1.0)
+    return view_confidences * penalty
@@ -10,6 +10,8 @@ from typing import Optional, List, Dict, Any
 import logging
 from datetime import datetime, timezone
 
+from stats_rollups import StatsRollups, init_stats_rollups
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["Public Stats"])
@@ -29,12 +31,14 @@ except ImportError:
 
 # Database instance (initialized in server.py)
 db: Optional[AsyncIOMotorDatabase] = None
+rollups: Optional[StatsRollups] = None
 
 
 def init_public_stats_routes(database: AsyncIOMotorDatabase):
     """Initialize the public stats routes with database"""
-    global db
+    global db, rollups
     db = database
+    rollups = init_stats_rollups(database)
     logger.info("✅ Public Stats Routes initialized")
 
 
@@ -64,78 +68,9 @@ async def get_events(
         raise HTTPException(status_code=500, detail="Database not initialized")
     
     try:
-        # Build match stage with sport and org filter
-        match_stage = {}
-        if sport_type:
-            match_stage['sport_type'] = sport_type
-        if organization_id:
-            match_stage['organization_id'] = organization_id
-        
-        # Aggregate events from fight_stats collection
-        # Group by event to get fight counts and total strikes
-        pipeline = []
-        
-        # Add match stage if filtering by org
-        if match_stage:
-            pipeline.append({"$match": match_stage})
-        
-        pipeline.extend([
-            {
-                "$group": {
-                    "_id": "$event_name",
-                    "fight_count": {"$sum": 1},
-                    "total_strikes": {"$sum": "$total_strikes"},
-                    "first_seen": {"$min": "$created_at"}
-                }
-            },
-            {
-                "$project": {
-                    "_id": 0,
-                    "event_name": "$_id",
-                    "fight_count": 1,
-                    "total_strikes": 1,
-                    "event_date": "$first_seen"
-                }
-            },
-            {
-                "$sort": {"event_date": -1}
-            }
-        ])
-        
-        cursor = db.fight_stats.aggregate(pipeline)
-        events = await cursor.to_list(length=None)
-        
-        # If no events from fight_stats, try to get from fights collection
-        if not events:
-            # Get all unique bout_ids from events collection
-            bout_ids = await db.events.distinct("bout_id")
-            
-            events_data = []
-            for bout_id in bout_ids:
-                # Count fights per event (assuming bout_id contains event info)
-                # Get event info from first event
-                first_event = await db.events.find_one({"bout_id": bout_id})
-                
-                if first_event:
-                    # Count total strikes for this bout
-                    total_strikes = await db.events.count_documents({
-                        "bout_id": bout_id,
-                        "event_type": {"$in": [
-                            "Head Kick", "Body Kick", "Low Kick", "Front Kick/Teep",
-                            "Elbow", "Knee", "Hook", "Cross", "Jab", "Uppercut"
-                        ]}
-                    })
-                    
-                    events_data.append({
-                        "event_name": bout_id,
-                        "fight_count": 1,  # Each bout_id is one fight
-                        "total_strikes": total_strikes,
-                        "event_date": first_event.get("timestamp", datetime.now(timezone.utc))
-                    })
-            
-            # Group by event name pattern if possible
-            # For now, return individual fights
-            events = events_data
+        # Card totals from the rollup (fight_stats grouped by event, or
+        # per-bout cards from raw events when there are no fight stats)
+        events = await rollups.cards(sport_type=sport_type, organization_id=organization_id)
         
         return {
             "events": events,
@@ -9,7 +9,8 @@ Integrates with:
 
 import logging
 import asyncio
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Deque
+from collections import deque
 from datetime import datetime, timezone
 from .models import *
 import random
@@ -28,8 +29,9 @@ class RealtimeCVEngine:
         # Model registry
         self.loaded_models: Dict[str, CVModelInfo] = {}
         
-        # Detection cache
-        self.recent_detections: Dict[str, List[ActionDetection]] = {}
+        # Detection cache (bounded per bout)
+        self.max_recent_detections = 100
+        self.recent_detections: Dict[str, Deque[ActionDetection]] = {}
         
         # Initialize models
         self._init_models()
@@ -133,15 +135,13 @@ class RealtimeCVEngine:
             actions = await self._recognize_actions(pose, frame)
             detections.extend(actions)
         
-        # Cache detections
-        if frame.bout_id not in self.recent_detections:
-            self.recent_detections[frame.bout_id] = []
+        # Cache detections (deque keeps only the most recent)
+        cache = self.recent_detections.get(frame.bout_id)
+        if cache is None:
+            cache = deque(maxlen=self.max_recent_detections)
+            self.recent_detections[frame.bout_id] = cache
         
-        self.recent_detections[frame.bout_id].extend(detections)
-        
-        # Keep only recent (last 100)
-        self.recent_detections[frame.bout_id] = \
-            self.recent_detections[frame.bout_id][-100:]
+        cache.extend(detections)
         
         # Store in database
         if self.db is not None and detections:
@@ -321,7 +321,7 @@ async def get_bout_detections(
                 "count": 0
             }
         
-        detections = cv_engine.recent_detections[bout_id]
+        detections = list(cv_engine.recent_detections[bout_id])
         
         # Apply filters
         if action_type:
@@ -0,0 +1,17 @@
+"""
+Scoring Benchmark
+Throughput, latency, allocation and winner-parity baseline for every
+round-scoring engine in the backend.
+"""
+
+from .generators import SCENARIOS, SyntheticRound, generate_round, generate_suite
+from .adapters import EngineAdapter, load_adapters
+
+__all__ = [
+    'SCENARIOS',
+    'SyntheticRound',
+    'generate_round',
+    'generate_suite',
+    'EngineAdapter',
+    'load_adapters'
+]
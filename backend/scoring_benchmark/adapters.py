@@ -0,0 +1,407 @@
+"""
+Scoring Benchmark - Engine Adapters
+One adapter per round-scoring implementation. prepare() translates canonical
+events into the engine's own input format (outside the timed section),
+score() runs the engine and returns the round winner as RED, BLUE or DRAW.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Tuple
+
+# Legacy operator-panel names shared by most engines
+LEGACY_NAMES = {
+    "jab": "Jab",
+    "cross": "Cross",
+    "hook": "Hook",
+    "uppercut": "Uppercut",
+    "elbow": "Elbow",
+    "knee": "Knee",
+    "head_kick": "Head Kick",
+    "body_kick": "Body Kick",
+    "low_kick": "Leg Kick",
+    "rocked": "Rocked/Stunned",
+    "kd": "KD",
+    "takedown": "Takedown",
+    "takedown_stuffed": "Takedown Stuffed",
+    "sub_attempt": "Submission Attempt",
+    "sweep": "Sweep/Reversal",
+    "top_control": "Top Control",
+    "back_control": "Back Control",
+    "cage_control": "Cage Control",
+}
+
+FIGHTER = {"RED": "fighter1", "BLUE": "fighter2"}
+
+
+def _legacy_event(event: Dict[str, Any], names: Dict[str, str]) -> Dict[str, Any]:
+    metadata = {}
+    if event["tier"]:
+        metadata["tier"] = event["tier"]
+    if event["duration"]:
+        metadata["duration"] = event["duration"]
+    return {
+        "corner": event["corner"],
+        "event_type": names.get(event["kind"], LEGACY_NAMES[event["kind"]]),
+        "timestamp": event["t"],
+        "metadata": metadata
+    }
+
+
+def _winner_from_diff(diff: float, draw_band: float) -> str:
+    if abs(diff) <= draw_band:
+        return "DRAW"
+    return "RED" if diff > 0 else "BLUE"
+
+
+class EngineAdapter:
+    """Translate canonical events and score one round"""
+    
+    name = ""
+    
+    def prepare(self, events: List[Dict[str, Any]]) -> Any:
+        raise NotImplementedError
+    
+    def score(self, prepared: Any) -> str:
+        raise NotImplementedError
+
+
+class EngineV3Adapter(EngineAdapter):
+    """scoring_engine_v2.ScoringEngineV3 (impact locks, control buckets)"""
+    
+    name = "engine_v3"
+    
+    def __init__(self):
+        from scoring_engine_v2 import ScoringEngineV3
+        self.engine = ScoringEngineV3()
+    
+    def prepare(self, events):
+        return [_legacy_event(e, {}) for e in events]
+    
+    def score(self, prepared):
+        return self.engine.score_round(1, prepared).winner
+
+
+class UnifiedScoringAdapter(EngineAdapter):
+    """unified_scoring.compute_round_from_events (percentage categories)"""
+    
+    name = "unified_scoring"
+    
+    def __init__(self):
+        from unified_scoring import compute_round_from_events
+        self.compute = compute_round_from_events
+    
+    def prepare(self, events):
+        return [_legacy_event(e, {}) for e in events]
+    
+    def score(self, prepared):
+        return self.compute(prepared)["winner"]
+
+
+class ScoringServiceAdapter(EngineAdapter):
+    """scoring_service.core.calculate_delta with the configured draw threshold"""
+    
+    name = "scoring_service"
+    
+    NAMES = {"top_control": "Control", "back_control": "Control", "cage_control": "Control"}
+    
+    def __init__(self):
+        from scoring_service.core import calculate_delta, compile_config
+        self.config = compile_config()
+        self.calculate_delta = calculate_delta
+    
+    def prepare(self, events):
+        return [_legacy_event(e, self.NAMES) for e in events]
+    
+    def score(self, prepared):
+        red, blue, _ = self.calculate_delta(prepared, self.config)
+        # As score_round: |delta| <= draw_threshold is 10-10
+        return _winner_from_diff(red - blue, self.config.draw_threshold)
+
+
+class FjaiWeightedAdapter(EngineAdapter):
+    """fjai.WeightedScoringEngine over CombatEvent models"""
+    
+    name = "fjai_weighted"
+    
+    def __init__(self):
+        from fjai.models import CombatEvent, EventSource, EventType
+        from fjai.scoring_engine import WeightedScoringEngine
+        self.engine = WeightedScoringEngine()
+        self.CombatEvent = CombatEvent
+        self.source = EventSource.MANUAL
+        strike = EventType.STRIKE_SIG
+        power = EventType.STRIKE_HIGHIMPACT
+        self.types = {
+            "jab": (strike, 0.3), "cross": (strike, 0.5), "hook": (strike, 0.5),
+            "uppercut": (strike, 0.5), "elbow": (strike, 0.6), "knee": (strike, 0.6),
+            "head_kick": (power, 0.7), "body_kick": (strike, 0.5), "low_kick": (strike, 0.3),
+            "rocked": (EventType.ROCKED, 0.8),
+            "takedown": (EventType.TD_LAND, 0.6), "takedown_stuffed": (EventType.TD_ATTEMPT, 0.3),
+            "sub_attempt": (EventType.SUB_ATTEMPT, 0.6), "sweep": (EventType.TD_LAND, 0.3),
+        }
+        self.kd = {"Flash": EventType.KD_FLASH, "Hard": EventType.KD_HARD, "Near-Finish": EventType.KD_NF}
+        self.control = (EventType.CONTROL_START, EventType.CONTROL_END)
+    
+    def _event(self, fighter_id, event_type, severity, timestamp_ms):
+        return self.CombatEvent(
+            bout_id="bench", round_id="bench_r1", fighter_id=fighter_id, event_type=event_type,
+            severity=severity, confidence=1.0, timestamp_ms=timestamp_ms, source=self.source
+        )
+    
+    def prepare(self, events):
+        prepared = []
+        for e in events:
+            fighter_id = "fighter_a" if e["corner"] == "RED" else "fighter_b"
+            timestamp_ms = int(e["t"] * 1000)
+            if e["kind"] == "kd":
+                prepared.append(self._event(fighter_id, self.kd[e["tier"]], 1.0, timestamp_ms))
+            elif e["duration"]:
+                start, end = self.control
+                prepared.append(self._event(fighter_id, start, 1.0, timestamp_ms))
+                prepared.append(self._event(fighter_id, end, 1.0, timestamp_ms + e["duration"] * 1000))
+            else:
+                event_type, severity = self.types[e["kind"]]
+                prepared.append(self._event(fighter_id, event_type, severity, timestamp_ms))
+        return prepared
+    
+    def score(self, prepared):
+        winner = self.engine.calculate_round_score(prepared, "bench", "bench_r1", 1).winner
+        return {"fighter_a": "RED", "fighter_b": "BLUE"}.get(winner, "DRAW")
+
+
+class IcvssHybridAdapter(EngineAdapter):
+    """icvss.HybridScoringEngine, CV-event path through the round accumulator"""
+    
+    name = "icvss_hybrid"
+    
+    def __init__(self):
+        from icvss.models import EventType
+        from icvss.scoring_engine import HybridScoringEngine, RoundScoreAccumulator
+        self.engine = HybridScoringEngine()
+        self.Accumulator = RoundScoreAccumulator
+        self.types = {
+            "jab": EventType.STRIKE_JAB, "cross": EventType.STRIKE_CROSS, "hook": EventType.STRIKE_HOOK,
+            "uppercut": EventType.STRIKE_UPPERCUT, "elbow": EventType.STRIKE_ELBOW,
+            "knee": EventType.STRIKE_KNEE, "head_kick": EventType.KICK_HEAD,
+            "body_kick": EventType.KICK_BODY, "low_kick": EventType.KICK_LOW,
+            "rocked": EventType.ROCK, "takedown": EventType.TD_LANDED,
+            "takedown_stuffed": EventType.TD_STUFFED, "sweep": EventType.SWEEP,
+            "top_control": EventType.CONTROL_TOP, "back_control": EventType.CONTROL_BACK,
+            "cage_control": EventType.CONTROL_CAGE,
+        }
+        self.kd = {"Flash": EventType.KD_FLASH, "Hard": EventType.KD_HARD,
+                   "Near-Finish": EventType.KD_NEARFINISH}
+        self.sub = {"Light": EventType.SUB_ATTEMPT_LIGHT, "Deep": EventType.SUB_ATTEMPT_DEEP,
+                    "Near-Finish": EventType.SUB_ATTEMPT_NEARFINISH}
+    
+    def prepare(self, events):
+        prepared = []
+        for e in events:
+            if e["kind"] == "kd":
+                event_type = self.kd[e["tier"]]
+            elif e["kind"] == "sub_attempt":
+                event_type = self.sub[e["tier"]]
+            else:
+                event_type = self.types[e["kind"]]
+            prepared.append({"fighter_id": FIGHTER[e["corner"]], "event_type": event_type,
+                             "severity": 1.0, "confidence": 1.0})
+        return prepared
+    
+    def score(self, prepared):
+        accumulator = self.Accumulator()
+        for event in prepared:
+            self.engine.accumulate_cv_event(accumulator, event)
+        winner = self.engine.score_from_accumulator(accumulator)["winner"]
+        return {"fighter1": "RED", "fighter2": "BLUE"}.get(winner, "DRAW")
+
+
+class _ReplaySource:
+    """Just enough of a Motor database for reconstruct_round_timeline"""
+    
+    class _Cursor:
+        def __init__(self, docs):
+            self.docs = docs
+        
+        def sort(self, *args):
+            return self
+        
+        async def to_list(self, length):
+            return self.docs[:length]
+    
+    class _Collection:
+        def __init__(self, docs):
+            self.docs = docs
+        
+        def find(self, query):
+            return _ReplaySource._Cursor(self.docs)
+    
+    def __init__(self, docs):
+        self.events_v2 = self._Collection(docs)
+        self.events = self._Collection([])
+
+
+class ReplayEngineAdapter(EngineAdapter):
+    """replay_engine.reconstruct_round_timeline over in-memory events"""
+    
+    name = "replay_engine"
+    
+    NAMES = {"low_kick": "Low Kick", "takedown": "Takedown Landed", "top_control": "Ground Top Control",
+             "back_control": "Ground Back Control", "cage_control": "Cage Control Time"}
+    
+    def __init__(self):
+        from replay_engine import reconstruct_round_timeline
+        self.reconstruct = reconstruct_round_timeline
+        self.loop = asyncio.new_event_loop()
+    
+    def prepare(self, events):
+        docs = []
+        for e in events:
+            metadata = {"significant": True}
+            if e["tier"]:
+                metadata["tier"] = e["tier"]
+            if e["duration"]:
+                metadata.update(type="stop", duration=e["duration"])
+            docs.append({
+                "fighter_id": FIGHTER[e["corner"]],
+                "event_type": self.NAMES.get(e["kind"], LEGACY_NAMES[e["kind"]]),
+                "client_timestamp_ms": int(e["t"] * 1000),
+                "metadata": metadata
+            })
+        return _ReplaySource(docs)
+    
+    def score(self, prepared):
+        replay = self.loop.run_until_complete(self.reconstruct(prepared, "bench", 1))
+        card = replay["round_summary"]["winner_recommendation"]
+        if "Draw" in card:
+            return "DRAW"
+        return "RED" if card.startswith("10-") else "BLUE"
+
+
+class ServerNewScoreAdapter(EngineAdapter):
+    """server.calculate_new_score per fighter (category totals, no guardrails)"""
+    
+    name = "server_new_score"
+    
+    NAMES = {"head_kick": "Kick", "body_kick": "Kick", "low_kick": "Kick", "takedown": "Takedown Landed",
+             "top_control": "Ground Top Control", "back_control": "Ground Back Control",
+             "cage_control": "Cage Control Time"}
+    
+    def __init__(self):
+        import server
+        self.EventData = server.EventData
+        self.calculate = server.calculate_new_score
+    
+    def prepare(self, events):
+        prepared = []
+        for e in events:
+            legacy = _legacy_event(e, self.NAMES)
+            prepared.append(self.EventData(bout_id="bench", round_num=1, fighter=FIGHTER[e["corner"]],
+                                           event_type=legacy["event_type"], timestamp=e["t"],
+                                           metadata=legacy["metadata"]))
+        return prepared
+    
+    def score(self, prepared):
+        f1_total, _, _ = self.calculate(prepared, "fighter1")
+        f2_total, _, _ = self.calculate(prepared, "fighter2")
+        # Same draw band as the calculate-score-v2 endpoint
+        return _winner_from_diff(f1_total - f2_total, 3.0)
+
+
+class ServerScoringEngineAdapter(EngineAdapter):
+    """server.ScoringEngine subscores, gates and 10-point-must mapping"""
+    
+    name = "server_scoring_engine"
+    
+    STRIKES = {"jab": "HS", "cross": "HS", "hook": "HS", "uppercut": "HS", "elbow": "HS",
+               "knee": "BS", "head_kick": "HS", "body_kick": "BS", "low_kick": "LS"}
+    SUB_DEPTH = {"Light": "light", "Deep": "tight", "Near-Finish": "fight-ending"}
+    POSITIONS = {"top_control": "top", "back_control": "back", "cage_control": "cage"}
+    
+    def __init__(self):
+        import server
+        self.EventData = server.EventData
+        self.engine = server.ScoringEngine
+    
+    def _event(self, fighter, event_type, timestamp, metadata=None):
+        return self.EventData(bout_id="bench", round_num=1, fighter=fighter, event_type=event_type,
+                              timestamp=timestamp, metadata=metadata or {})
+    
+    def prepare(self, events):
+        prepared = []
+        for e in events:
+            fighter = FIGHTER[e["corner"]]
+            kind = e["kind"]
+            if kind in self.STRIKES:
+                prepared.append(self._event(fighter, self.STRIKES[kind], e["t"]))
+            elif kind == "kd":
+                prepared.append(self._event(fighter, "KD", e["t"], {"severity": e["tier"].lower()}))
+            elif kind == "rocked":
+                prepared.append(self._event(fighter, "Rocked", e["t"]))
+            elif kind == "takedown":
+                prepared.append(self._event(fighter, "Takedown", e["t"]))
+            elif kind == "sub_attempt":
+                prepared.append(self._event(fighter, "Submission Attempt", e["t"],
+                                            {"depth": self.SUB_DEPTH[e["tier"]]}))
+            elif kind == "sweep":
+                prepared.append(self._event(fighter, "Reversal", e["t"]))
+            elif kind in self.POSITIONS:
+                prepared.append(self._event(fighter, "CTRL_START", e["t"]))
+                prepared.append(self._event(fighter, "CTRL_STOP", e["t"] + e["duration"],
+                                            {"position": self.POSITIONS[kind], "duration": e["duration"]}))
+        return prepared
+    
+    def score(self, prepared):
+        engine = self.engine
+        f1_events = [e for e in prepared if e.fighter == "fighter1"]
+        f2_events = [e for e in prepared if e.fighter == "fighter2"]
+        f1_ss = sum(1.0 for e in f1_events if e.event_type in ("HS", "BS", "LS"))
+        f2_ss = sum(1.0 for e in f2_events if e.event_type in ("HS", "BS", "LS"))
+        f1_sub = engine.calculate_subscores(prepared, "fighter1", 300, f2_ss)
+        f2_sub = engine.calculate_subscores(prepared, "fighter2", 300, f1_ss)
+        f1_ctrl = sum(e.metadata.get("duration", 0) for e in f1_events if e.event_type == "CTRL_STOP")
+        f2_ctrl = sum(e.metadata.get("duration", 0) for e in f2_events if e.event_type == "CTRL_STOP")
+        total_ctrl = f1_ctrl + f2_ctrl
+        gates_a = engine.calculate_gate_checks(f1_sub, f1_ctrl / total_ctrl if total_ctrl else 0)
+        gates_b = engine.calculate_gate_checks(f2_sub, f2_ctrl / total_ctrl if total_ctrl else 0)
+        _, winner, _ = engine.map_to_ten_point_must(
+            engine.calculate_final_score(f1_sub), engine.calculate_final_score(f2_sub),
+            gates_a, gates_b, f1_sub, f2_sub
+        )
+        return {"fighter1": "RED", "fighter2": "BLUE"}.get(winner, "DRAW")
+
+
+ADAPTERS: List[Callable[[], EngineAdapter]] = [
+    ServerNewScoreAdapter,
+    ServerScoringEngineAdapter,
+    EngineV3Adapter,
+    ScoringServiceAdapter,
+    UnifiedScoringAdapter,
+    FjaiWeightedAdapter,
+    IcvssHybridAdapter,
+    ReplayEngineAdapter,
+]
+
+SERVER_ADAPTERS = {ServerNewScoreAdapter, ServerScoringEngineAdapter}
+
+
+def load_adapters(include_server: bool = True) -> Tuple[List[EngineAdapter], Dict[str, str]]:
+    """
+    Instantiate every adapter whose engine imports here
+    
+    Args:
+        include_server: Also load the server.py engines (imports the whole app)
+    
+    Returns:
+        (adapters, {name: reason} for engines that could not be loaded)
+    """
+    adapters = []
+    unavailable = {}
+    for factory in ADAPTERS:
+        if not include_server and factory in SERVER_ADAPTERS:
+            unavailable[factory.name] = "skipped"
+            continue
+        try:
+            adapters.append(factory())
+        except Exception as e:
+            unavailable[factory.name] = f"{type(e).__name__}: {e}"
+    return adapters, unavailable
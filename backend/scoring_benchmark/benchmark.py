@@ -0,0 +1,240 @@
+"""
+Scoring Benchmark - Cross-Engine Throughput and Parity
+Scores the same seeded synthetic rounds with every round-scoring engine and
+reports events/sec, per-round latency percentiles, per-round allocation peaks
+and how often the engines disagree on the round winner.
+
+    python -m scoring_benchmark.benchmark --rounds 250 --out-dir benchmarks/scoring
+    python -m scoring_benchmark.benchmark --baseline benchmarks/scoring/<commit>.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .adapters import EngineAdapter, load_adapters
+from .generators import SyntheticRound, generate_suite
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def measure_engine(adapter: EngineAdapter, rounds: List[SyntheticRound], warmup: int = 20) -> Dict:
+    """
+    Time and trace one engine over the rounds
+    
+    Input translation happens before timing; tracemalloc runs in a separate
+    pass so it doesn't skew the latency numbers.
+    
+    Returns:
+        Measurements plus the per-round winners (key "winners")
+    """
+    prepared = [adapter.prepare(r.events) for r in rounds]
+    for native in prepared[:warmup]:
+        adapter.score(native)
+    
+    winners = []
+    latencies = []
+    for native in prepared:
+        start = time.perf_counter_ns()
+        winners.append(adapter.score(native))
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+    
+    peaks = []
+    tracemalloc.start()
+    try:
+        for native in prepared:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            adapter.score(native)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    
+    events = sum(len(r.events) for r in rounds)
+    elapsed_sec = sum(latencies) / 1e6
+    latencies.sort()
+    peaks.sort()
+    return {
+        "rounds": len(rounds),
+        "events": events,
+        "events_per_sec": round(events / elapsed_sec) if elapsed_sec else None,
+        "latency_us": {
+            "p50": round(percentile(latencies, 50), 1),
+            "p95": round(percentile(latencies, 95), 1),
+            "p99": round(percentile(latencies, 99), 1),
+            "max": round(latencies[-1], 1) if latencies else 0.0
+        },
+        "alloc_peak_bytes": {
+            "p50": percentile(peaks, 50),
+            "max": peaks[-1] if peaks else 0
+        },
+        "winners": winners
+    }
+
+
+def disagreement(winners: Dict[str, List[str]], rounds: List[SyntheticRound]) -> Dict:
+    """
+    Winner disagreement between engines over the same rounds
+    
+    Returns:
+        Pairwise disagreement rates, each engine's rate against the majority
+        call (rounds without a strict majority are skipped), per scenario
+        rates, and the share of rounds where every engine agreed
+    """
+    names = sorted(winners)
+    total = len(rounds)
+    if not names or not total:
+        return {"pairwise": {}, "vs_majority": {}, "by_scenario": {}, "winner_mix": {}, "unanimous_rate": None}
+    
+    majority = []
+    for i in range(total):
+        counts = Counter(winners[name][i] for name in names).most_common(2)
+        strict = len(counts) == 1 or counts[0][1] > counts[1][1]
+        majority.append(counts[0][0] if strict else None)
+    
+    def vs_majority(indexes) -> Dict[str, Optional[float]]:
+        decided = [i for i in indexes if majority[i] is not None]
+        return {
+            name: round(sum(winners[name][i] != majority[i] for i in decided) / len(decided), 4)
+            if decided else None
+            for name in names
+        }
+    
+    scenarios = sorted({r.scenario for r in rounds})
+    return {
+        "pairwise": {
+            f"{a}|{b}": round(sum(x != y for x, y in zip(winners[a], winners[b])) / total, 4)
+            for a, b in combinations(names, 2)
+        },
+        "vs_majority": vs_majority(range(total)),
+        "by_scenario": {
+            scenario: vs_majority([i for i, r in enumerate(rounds) if r.scenario == scenario])
+            for scenario in scenarios
+        },
+        "winner_mix": {name: dict(Counter(winners[name])) for name in names},
+        "unanimous_rate": round(
+            sum(len({winners[name][i] for name in names}) == 1 for i in range(total)) / total, 4
+        )
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run_benchmark(rounds_per_scenario: int = 250, seed: int = 7, include_server: bool = True) -> Dict:
+    rounds = generate_suite(rounds_per_scenario, seed)
+    adapters, unavailable = load_adapters(include_server)
+    
+    engines = {}
+    winners = {}
+    # icvss and the server engines log per round; keep that out of the timings
+    logging.disable(logging.INFO)
+    try:
+        for adapter in adapters:
+            try:
+                result = measure_engine(adapter, rounds)
+            except Exception as e:
+                unavailable[adapter.name] = f"{type(e).__name__}: {e}"
+                continue
+            winners[adapter.name] = result.pop("winners")
+            engines[adapter.name] = result
+    finally:
+        logging.disable(logging.NOTSET)
+    
+    return {
+        "commit": git_commit(),
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "seed": seed,
+        "rounds_per_scenario": rounds_per_scenario,
+        "rounds": len(rounds),
+        "events": sum(len(r.events) for r in rounds),
+        "engines": engines,
+        "unavailable": unavailable,
+        "disagreement": disagreement(winners, rounds)
+    }
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float = 0.2) -> List[str]:
+    """
+    Regressions of current against baseline
+    
+    An engine regresses if events/sec drops, or p95 latency or peak
+    allocation grows, by more than tolerance; or if its disagreement with the
+    majority rises by more than 5 points (same seed and round count only).
+    """
+    regressions = []
+    for name, base in baseline.get("engines", {}).items():
+        now = current.get("engines", {}).get(name)
+        if now is None:
+            regressions.append(f"{name}: missing from current run")
+            continue
+        if base["events_per_sec"] and now["events_per_sec"] < base["events_per_sec"] * (1 - tolerance):
+            regressions.append(f"{name}: events/sec {base['events_per_sec']} -> {now['events_per_sec']}")
+        if now["latency_us"]["p95"] > base["latency_us"]["p95"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {base['latency_us']['p95']}us -> {now['latency_us']['p95']}us")
+        if now["alloc_peak_bytes"]["max"] > base["alloc_peak_bytes"]["max"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: peak alloc {base['alloc_peak_bytes']['max']}B -> {now['alloc_peak_bytes']['max']}B"
+            )
+    
+    same_input = all(baseline.get(k) == current.get(k) for k in ("seed", "rounds_per_scenario"))
+    if same_input:
+        base_rates = baseline.get("disagreement", {}).get("vs_majority", {})
+        for name, rate in current.get("disagreement", {}).get("vs_majority", {}).items():
+            before = base_rates.get(name)
+            if rate is not None and before is not None and rate > before + 0.05:
+                regressions.append(f"{name}: disagreement vs majority {before} -> {rate}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-engine round scoring benchmark")
+    parser.add_argument("--rounds", type=int, default=250, help="Rounds per scenario")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--no-server", action="store_true", help="Skip the server.py engines")
+    parser.add_argument("--out-dir", help="Write <commit>.json into this directory")
+    parser.add_argument("--baseline", help="Earlier result JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+    
+    result = run_benchmark(args.rounds, args.seed, include_server=not args.no_server)
+    print(json.dumps(result, indent=2))
+    
+    if args.out_dir:
+        out_dir = Path(args.out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        (out_dir / f"{result['commit'] or 'local'}.json").write_text(json.dumps(result, indent=2))
+    
+    if args.baseline:
+        regressions = compare(json.loads(Path(args.baseline).read_text()), result, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
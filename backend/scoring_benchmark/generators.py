@@ -0,0 +1,90 @@
+"""
+Scoring Benchmark - Synthetic Round Generator
+Seeded rounds in one canonical event vocabulary, translated per engine by
+the adapters. Scenarios follow cv_analytics.mock_generator.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+SCENARIOS = ["balanced", "striker", "grappler", "war"]
+
+ROUND_SECONDS = 300
+
+STRIKES = ["jab", "cross", "hook", "uppercut", "elbow", "knee", "head_kick", "body_kick", "low_kick"]
+DAMAGE = ["rocked", "kd"]
+GRAPPLING = ["takedown", "takedown_stuffed", "sub_attempt", "sweep"]
+CONTROL = ["top_control", "back_control", "cage_control"]
+
+KD_TIERS = ["Flash", "Hard", "Near-Finish"]
+SUB_TIERS = ["Light", "Deep", "Near-Finish"]
+
+# events per round, favoured corner's share of events, category weights
+PROFILES = {
+    "balanced": {"events": (30, 60), "share": (0.5, 0.6),
+                 "weights": {"strikes": 80, "damage": 2, "grappling": 10, "control": 8}},
+    "striker": {"events": (40, 80), "share": (0.6, 0.8),
+                "weights": {"strikes": 88, "damage": 8, "grappling": 2, "control": 2}},
+    "grappler": {"events": (20, 40), "share": (0.6, 0.8),
+                 "weights": {"strikes": 30, "damage": 1, "grappling": 35, "control": 34}},
+    "war": {"events": (80, 140), "share": (0.5, 0.6),
+            "weights": {"strikes": 80, "damage": 10, "grappling": 6, "control": 4}},
+}
+
+_KINDS = {"strikes": STRIKES, "damage": DAMAGE, "grappling": GRAPPLING, "control": CONTROL}
+
+
+@dataclass
+class SyntheticRound:
+    """One generated round; events are sorted by timestamp"""
+    scenario: str
+    round_number: int
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def generate_round(rng: random.Random, scenario: str, round_number: int = 1) -> SyntheticRound:
+    """
+    Generate one round of canonical events
+    
+    Each event is {"corner", "kind", "t", "tier", "duration"}: tier is set
+    for kd/sub_attempt, duration (seconds) for control kinds.
+    """
+    profile = PROFILES[scenario]
+    favoured = rng.choice(["RED", "BLUE"])
+    other = "BLUE" if favoured == "RED" else "RED"
+    share = rng.uniform(*profile["share"])
+    categories = list(profile["weights"])
+    weights = list(profile["weights"].values())
+    
+    events = []
+    for _ in range(rng.randint(*profile["events"])):
+        category = rng.choices(categories, weights)[0]
+        kind = rng.choice(_KINDS[category])
+        event = {
+            "corner": favoured if rng.random() < share else other,
+            "kind": kind,
+            "t": round(rng.uniform(0, ROUND_SECONDS - 1), 3),
+            "tier": None,
+            "duration": None
+        }
+        if kind == "kd":
+            event["tier"] = rng.choices(KD_TIERS, [70, 25, 5])[0]
+        elif kind == "sub_attempt":
+            event["tier"] = rng.choices(SUB_TIERS, [60, 30, 10])[0]
+        elif category == "control":
+            event["duration"] = rng.randint(10, 60)
+        events.append(event)
+    
+    events.sort(key=lambda e: e["t"])
+    return SyntheticRound(scenario=scenario, round_number=round_number, events=events)
+
+
+def generate_suite(rounds_per_scenario: int, seed: int = 7) -> List[SyntheticRound]:
+    """Rounds for every scenario; identical for the same seed"""
+    rng = random.Random(seed)
+    return [
+        generate_round(rng, scenario, i % 5 + 1)
+        for scenario in SCENARIOS
+        for i in range(rounds_per_scenario)
+    ]
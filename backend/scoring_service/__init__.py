@@ -4,6 +4,7 @@ from .core import (
     RoundResult, FightResult, FinishMethod,
     score_round, score_fight, calculate_delta,
     validate_round_stats, round_stats_from_dict,
+    compile_config, CompiledConfig,
     SCORING_CONFIG
 )
 from .routes import router, init_scoring_routes
@@ -13,6 +14,7 @@ __all__ = [
     'RoundResult', 'FightResult', 'FinishMethod',
     'score_round', 'score_fight', 'calculate_delta',
     'validate_round_stats', 'round_stats_from_dict',
+    'compile_config', 'CompiledConfig',
     'SCORING_CONFIG',
     'router', 'init_scoring_routes'
 ]
@@ -9,12 +9,17 @@ Key Functions:
 - score_round(): Takes round stats, returns scores + flags
 - score_fight(): Aggregates rounds into final outcome
 - calculate_delta(): Computes point differential from events
+- compile_config(): Flattens a scoring config into a cached snapshot
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Mapping, Optional, Tuple, Any, Union
 from dataclasses import dataclass, field, asdict
-from enum import Enum
+from enum import Enum, IntEnum
 from datetime import datetime, timezone
+from collections import OrderedDict
+from types import MappingProxyType
+import hashlib
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -231,75 +236,216 @@ SCORING_CONFIG = {
 }
 
 
+# ============== Compiled Configuration ==============
+
+class ScoreCategory(IntEnum):
+    """Breakdown category, used as an index into per-corner sums"""
+    STRIKES = 0
+    GRAPPLING = 1
+    CONTROL = 2
+    IMPACT = 3
+
+
+class PointKind(IntEnum):
+    """How an event's points are read"""
+    FLAT = 0        # fixed value
+    TIERED = 1      # metadata tier, first tier if missing/unknown
+    PER_SECOND = 2  # value x metadata duration
+
+
+CATEGORY_NAMES = tuple(c.name.lower() for c in ScoreCategory)
+
+GRAPPLING_EVENTS = frozenset({"Takedown", "Takedown Stuffed", "Sweep/Reversal", "Submission Attempt"})
+CONTROL_EVENTS = frozenset({"Control"})
+
+_CORNERS = MappingProxyType({"RED": 0, "BLUE": 1})
+_EMPTY = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class CompiledConfig:
+    """
+    Immutable snapshot of a scoring config
+    
+    Event types are numbered once; points, categories and point kinds are
+    flat tuples indexed by that slot, so scoring an event is a dict lookup
+    plus tuple indexing.
+    """
+    config_hash: str
+    draw_threshold: float
+    threshold_10_8: float
+    threshold_10_7: float
+    event_types: Tuple[str, ...]
+    slots: Mapping[str, int]
+    points: Tuple[float, ...]
+    categories: Tuple[int, ...]
+    kinds: Tuple[int, ...]
+    tiers: Tuple[Mapping[str, float], ...]
+
+
+# Snapshots by config hash, so per-request custom configs compile once
+_COMPILED_CACHE_SIZE = 128
+_compiled: "OrderedDict[str, CompiledConfig]" = OrderedDict()
+
+
+def config_hash(config: Dict) -> str:
+    """Stable content hash of a scoring config"""
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def _build_snapshot(config: Dict, digest: str) -> CompiledConfig:
+    event_types = []
+    points = []
+    categories = []
+    kinds = []
+    tiers = []
+    for event_type, value in config["event_points"].items():
+        event_types.append(event_type)
+        if isinstance(value, dict):
+            points.append(next(iter(value.values())))
+            categories.append(ScoreCategory.IMPACT)
+            kinds.append(PointKind.TIERED)
+            tiers.append(MappingProxyType(dict(value)))
+        else:
+            points.append(value)
+            if event_type in GRAPPLING_EVENTS:
+                categories.append(ScoreCategory.GRAPPLING)
+                kinds.append(PointKind.FLAT)
+            elif event_type in CONTROL_EVENTS:
+                categories.append(ScoreCategory.CONTROL)
+                kinds.append(PointKind.PER_SECOND)
+            else:
+                categories.append(ScoreCategory.STRIKES)
+                kinds.append(PointKind.FLAT)
+            tiers.append(_EMPTY)
+    
+    return CompiledConfig(
+        config_hash=digest,
+        draw_threshold=config["draw_threshold"],
+        threshold_10_8=config["threshold_10_8"],
+        threshold_10_7=config["threshold_10_7"],
+        event_types=tuple(event_types),
+        slots=MappingProxyType({t: i for i, t in enumerate(event_types)}),
+        points=tuple(points),
+        categories=tuple(int(c) for c in categories),
+        kinds=tuple(int(k) for k in kinds),
+        tiers=tuple(tiers)
+    )
+
+
+def compile_config(config: Union[Dict, CompiledConfig, None] = None) -> CompiledConfig:
+    """
+    Snapshot of a scoring config, compiled once per distinct content
+    
+    Args:
+        config: Scoring config dict (default SCORING_CONFIG) or an
+            already compiled snapshot
+    
+    Returns:
+        CompiledConfig shared by every caller with the same config
+    """
+    if isinstance(config, CompiledConfig):
+        return config
+    if config is None or config is SCORING_CONFIG:
+        config = SCORING_CONFIG
+        if _default_snapshot is not None:
+            return _default_snapshot
+    
+    digest = config_hash(config)
+    snapshot = _compiled.get(digest)
+    if snapshot is None:
+        snapshot = _build_snapshot(config, digest)
+        _compiled[digest] = snapshot
+        if len(_compiled) > _COMPILED_CACHE_SIZE:
+            _compiled.popitem(last=False)
+    else:
+        _compiled.move_to_end(digest)
+    return snapshot
+
+
+# SCORING_CONFIG is treated as a constant and compiled once at import
+_default_snapshot: Optional[CompiledConfig] = None
+_default_snapshot = compile_config(SCORING_CONFIG)
+
+
 # ============== Core Scoring Functions ==============
 
-def calculate_delta(events: List[Dict], config: Dict = None) -> Tuple[float, float, Dict]:
+def calculate_delta(events: List[Dict], config: Union[Dict, CompiledConfig, None] = None) -> Tuple[float, float, Dict]:
     """
     Calculate point differential from a list of events.
     
     Args:
         events: List of event dictionaries with corner, event_type, metadata
-        config: Optional custom scoring configuration
+        config: Optional custom scoring configuration (dict or compiled)
     
     Returns:
         Tuple of (red_delta, blue_delta, breakdown)
     """
-    if config is None:
-        config = SCORING_CONFIG
-    
-    event_points = config["event_points"]
-    
-    red_delta = 0.0
-    blue_delta = 0.0
-    breakdown = {
-        "red": {"strikes": 0, "grappling": 0, "control": 0, "impact": 0},
-        "blue": {"strikes": 0, "grappling": 0, "control": 0, "impact": 0},
-        "event_counts": {"red": {}, "blue": {}}
-    }
+    compiled = compile_config(config)
+    slots = compiled.slots
+    points_by_slot = compiled.points
+    categories = compiled.categories
+    kinds = compiled.kinds
+    tiers = compiled.tiers
+    n = len(points_by_slot)
+    flat = int(PointKind.FLAT)
+    tiered = int(PointKind.TIERED)
+    
+    # Per-call accumulators, indexed [corner * width + index]
+    totals = [0.0, 0.0]
+    sums = [0, 0, 0, 0, 0, 0, 0, 0]
+    counts = [0] * (2 * n)
+    unknown = None
     
     for event in events:
-        corner = event.get("corner", "").upper()
+        corner = event.get("corner", "")
+        side = _CORNERS.get(corner)
+        if side is None:
+            side = _CORNERS.get(corner.upper())
+            if side is None:
+                continue
         event_type = event.get("event_type", "")
-        metadata = event.get("metadata", {})
-        tier = metadata.get("tier", "")
+        slot = slots.get(event_type)
         
-        # Get base points for event type
-        points = 0
-        category = "strikes"
+        if slot is None:
+            # Unknown types score nothing but still show in the counts
+            if unknown is None:
+                unknown = ({}, {})
+            unknown[side][event_type] = unknown[side].get(event_type, 0) + 1
+            continue
         
-        if event_type in event_points:
-            point_value = event_points[event_type]
-            
-            # Handle tiered events (knockdowns)
-            if isinstance(point_value, dict):
-                points = point_value.get(tier, list(point_value.values())[0])
-                category = "impact"
-            else:
-                points = point_value
-                
-                # Categorize
-                if event_type in ["Takedown", "Takedown Stuffed", "Sweep/Reversal", "Submission Attempt"]:
-                    category = "grappling"
-                elif event_type == "Control":
-                    category = "control"
-                    # Control time in seconds
-                    duration = metadata.get("duration", 1)
-                    points = points * duration
+        kind = kinds[slot]
+        if kind == flat:
+            points = points_by_slot[slot]
+        elif kind == tiered:
+            points = tiers[slot].get((event.get("metadata") or _EMPTY).get("tier", ""), points_by_slot[slot])
+        else:
+            points = points_by_slot[slot] * (event.get("metadata") or _EMPTY).get("duration", 1)
         
-        # Apply points to correct corner
-        if corner == "RED":
-            red_delta += points
-            breakdown["red"][category] += points
-            breakdown["event_counts"]["red"][event_type] = breakdown["event_counts"]["red"].get(event_type, 0) + 1
-        elif corner == "BLUE":
-            blue_delta += points
-            breakdown["blue"][category] += points
-            breakdown["event_counts"]["blue"][event_type] = breakdown["event_counts"]["blue"].get(event_type, 0) + 1
+        totals[side] += points
+        sums[side * 4 + categories[slot]] += points
+        counts[side * n + slot] += 1
+    
+    event_types = compiled.event_types
+    event_counts = [
+        {event_types[i]: c for i, c in enumerate(counts[side * n:(side + 1) * n]) if c}
+        for side in (0, 1)
+    ]
+    if unknown is not None:
+        event_counts[0].update(unknown[0])
+        event_counts[1].update(unknown[1])
     
-    return red_delta, blue_delta, breakdown
+    breakdown = {
+        "red": dict(zip(CATEGORY_NAMES, sums[0:4])),
+        "blue": dict(zip(CATEGORY_NAMES, sums[4:8])),
+        "event_counts": {"red": event_counts[0], "blue": event_counts[1]}
+    }
+    return totals[0], totals[1], breakdown
 
 
-def score_round(stats: RoundStats, config: Dict = None, require_10_8_approval: bool = True) -> RoundScore:
+def score_round(stats: RoundStats, config: Union[Dict, CompiledConfig, None] = None,
+                require_10_8_approval: bool = True) -> RoundScore:
     """
     Score a single round based on provided statistics.
     
@@ -307,22 +453,21 @@ def score_round(stats: RoundStats, config: Dict = None, require_10_8_approval: b
     
     Args:
         stats: RoundStats object with all round statistics
-        config: Optional custom scoring configuration
+        config: Optional custom scoring configuration (dict or compiled)
         require_10_8_approval: If True, flags 10-8 rounds for supervisor approval
     
     Returns:
         RoundScore object with calculated scores and flags
     """
-    if config is None:
-        config = SCORING_CONFIG
+    compiled = compile_config(config)
     
     # Calculate delta from events if provided
     if stats.events:
-        red_delta, blue_delta, breakdown = calculate_delta(stats.events, config)
+        red_delta, blue_delta, breakdown = calculate_delta(stats.events, compiled)
         delta = red_delta - blue_delta
     else:
         # Calculate from stats if no events
-        delta = _calculate_delta_from_stats(stats, config)
+        delta = _calculate_delta_from_stats(stats, compiled)
         breakdown = {"calculated_from_stats": True}
     
     # Determine base scores using 10-point must system
@@ -334,19 +479,19 @@ def score_round(stats: RoundStats, config: Dict = None, require_10_8_approval: b
     is_10_8 = False
     is_10_7 = False
     
-    if abs_delta <= config["draw_threshold"]:
+    if abs_delta <= compiled.draw_threshold:
         # Draw round
         winner = "DRAW"
         result = RoundResult.DRAW
     elif delta > 0:
         # Red wins
         winner = "RED"
-        if abs_delta >= config["threshold_10_7"]:
+        if abs_delta >= compiled.threshold_10_7:
             blue_score = 7
             is_10_7 = True
             is_10_8 = True
             result = RoundResult.RED_WIN_10_7
-        elif abs_delta >= config["threshold_10_8"]:
+        elif abs_delta >= compiled.threshold_10_8:
             blue_score = 8
             is_10_8 = True
             result = RoundResult.RED_WIN_10_8
@@ -356,12 +501,12 @@ def score_round(stats: RoundStats, config: Dict = None, require_10_8_approval: b
     else:
         # Blue wins
         winner = "BLUE"
-        if abs_delta >= config["threshold_10_7"]:
+        if abs_delta >= compiled.threshold_10_7:
             red_score = 7
             is_10_7 = True
             is_10_8 = True
             result = RoundResult.BLUE_WIN_10_7
-        elif abs_delta >= config["threshold_10_8"]:
+        elif abs_delta >= compiled.threshold_10_8:
             red_score = 8
             is_10_8 = True
             result = RoundResult.BLUE_WIN_10_8
@@ -396,7 +541,7 @@ def score_round(stats: RoundStats, config: Dict = None, require_10_8_approval: b
     )
 
 
-def _calculate_delta_from_stats(stats: RoundStats, config: Dict) -> float:
+def _calculate_delta_from_stats(stats: RoundStats, config: CompiledConfig) -> float:
     """
     Calculate delta from aggregated stats when individual events aren't available.
     """
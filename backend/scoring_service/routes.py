@@ -15,7 +15,7 @@ from .core import (
     RoundStats, RoundScore, FightScore,
     score_round, score_fight, calculate_delta,
     validate_round_stats, round_stats_from_dict,
-    SCORING_CONFIG
+    compile_config, SCORING_CONFIG
 )
 
 logger = logging.getLogger(__name__)
@@ -333,6 +333,7 @@ async def get_scoring_config():
     """
     return {
         "config": SCORING_CONFIG,
+        "config_hash": compile_config().config_hash,
         "version": "2.0",
         "description": "Fight Judge AI Scoring Configuration"
     }
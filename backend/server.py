@@ -1,4 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Form, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -14,8 +15,15 @@ import math
 import time
 import json
 from event_dedup import EventDedupEngine, verify_event_chain
+from leaderboards import JudgeLeaderboard
 from replay_engine import reconstruct_round_timeline
 from fight_completion import save_completed_fight, calculate_fighter_stats, determine_winner
+from fight_finalization import init_fight_finalization
+from discrepancy_rules import DiscrepancyRuleEngine, RoundSnapshot
+from supervisor_dashboard import SupervisorDashboard
+from subsystem_registry import SubsystemRegistry, LazyMountMiddleware
+from broadcast_bus import BroadcastBus, RedisTransport, ws_bus
+from audit_export import EXPORT_FORMATS, build_export_query, stream_audit_export, gzip_stream, encode_stream
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -70,8 +78,17 @@ db = client[os.environ['DB_NAME']]
 # Initialize Event Deduplication Engine
 dedup_engine = EventDedupEngine(db)
 
+# Materialized shadow-judging leaderboard (judge_leaderboard)
+judge_board = JudgeLeaderboard(db)
+
+# Fight finalization: live fighter stats + post-fight job queue
+finalizer = init_fight_finalization(db)
+
+# Discrepancy / judge variance rules and per-round variance summaries
+discrepancy_engine = DiscrepancyRuleEngine(db)
+
 # Initialize Postgres and Redis
-from db_utils import init_db, SessionLocal
+from db_utils import SessionLocal
 from redis_utils import init_redis, calibration_pubsub
 
 # Will be initialized on startup
@@ -133,11 +150,17 @@ class UnifiedScoringConnectionManager:
     """
     Manages WebSocket connections for real-time unified scoring updates.
     All connected operator laptops receive the same data from the server.
+    Broadcasts go through the broadcast bus so operators connected to other
+    workers receive them too.
     """
-    def __init__(self):
-        # bout_id -> list of connected WebSockets
+    NAMESPACE = "scoring"
+    
+    def __init__(self, bus: Optional[BroadcastBus] = None):
+        # bout_id -> list of connected WebSockets (this worker only)
         self.active_connections: Dict[str, List[WebSocket]] = {}
         self.lock = asyncio.Lock()
+        self.bus = bus or ws_bus
+        self.bus.register(self.NAMESPACE, self._deliver_local)
     
     async def connect(self, websocket: WebSocket, bout_id: str):
         """Connect a client to a bout's real-time updates"""
@@ -146,6 +169,7 @@ class UnifiedScoringConnectionManager:
             if bout_id not in self.active_connections:
                 self.active_connections[bout_id] = []
             self.active_connections[bout_id].append(websocket)
+            self.bus.join(self.NAMESPACE, bout_id)
             logging.info(f"[WS] Client connected to bout {bout_id}. Total: {len(self.active_connections[bout_id])}")
     
     async def disconnect(self, websocket: WebSocket, bout_id: str):
@@ -154,12 +178,17 @@ class UnifiedScoringConnectionManager:
             if bout_id in self.active_connections:
                 if websocket in self.active_connections[bout_id]:
                     self.active_connections[bout_id].remove(websocket)
+                    self.bus.leave(self.NAMESPACE, bout_id)
                     logging.info(f"[WS] Client disconnected from bout {bout_id}. Remaining: {len(self.active_connections[bout_id])}")
                 if not self.active_connections[bout_id]:
                     del self.active_connections[bout_id]
     
     async def broadcast_to_bout(self, bout_id: str, message: dict):
-        """Broadcast a message to ALL clients watching a bout"""
+        """Broadcast a message to ALL clients watching a bout (on every worker)"""
+        await self.bus.publish(self.NAMESPACE, bout_id, message)
+    
+    async def _deliver_local(self, bout_id: str, message: dict):
+        """Fan a bus message out to this worker's clients"""
         async with self.lock:
             if bout_id in self.active_connections:
                 disconnected = []
@@ -174,6 +203,7 @@ class UnifiedScoringConnectionManager:
                 for conn in disconnected:
                     if conn in self.active_connections[bout_id]:
                         self.active_connections[bout_id].remove(conn)
+                        self.bus.leave(self.NAMESPACE, bout_id)
     
     def get_connection_count(self, bout_id: str) -> int:
         """Get number of connected clients for a bout"""
@@ -182,6 +212,38 @@ class UnifiedScoringConnectionManager:
 # Global WebSocket manager for unified scoring
 ws_manager = UnifiedScoringConnectionManager()
 
+
+class SupervisorConnectionManager(UnifiedScoringConnectionManager):
+    """Supervisor dashboard clients, on their own broadcast bus channel"""
+    NAMESPACE = "supervisor"
+
+supervisor_ws_manager = SupervisorConnectionManager()
+
+# Counter-backed supervisor dashboard, pushed to supervisor_ws_manager
+dashboard = SupervisorDashboard(
+    db,
+    round_summaries=discrepancy_engine.get_bout,
+    publish=supervisor_ws_manager.broadcast_to_bout
+)
+
+
+async def track_unified_event(bout_id: str, event_doc: dict, sign: int = 1):
+    """
+    Apply a logged (sign=1) or deleted (sign=-1) unified event to the live
+    stats counters and the supervisor dashboard
+    
+    Best-effort: the event is already written, so a failure here is logged
+    and never fails the request or skips its broadcast.
+    """
+    try:
+        await finalizer.live_stats.record(event_doc, sign=sign)
+    except Exception as e:
+        logging.error(f"Error recording live stats for {bout_id}: {e}")
+    try:
+        await dashboard.events_changed(bout_id, sign)
+    except Exception as e:
+        logging.error(f"Error updating supervisor dashboard for {bout_id}: {e}")
+
 # Define Models
 class StatusCheck(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -367,6 +429,7 @@ class JudgeStats(BaseModel):
     averageMAE: float
     sensitivity108Rate: float
     perfectMatches: int
+    rank: Optional[int] = None
 
 # Fighter Memory Log Models
 class FighterTendencies(BaseModel):
@@ -1785,6 +1848,7 @@ async def submit_judge_score(performance: JudgePerformanceCreate):
         doc = perf_obj.model_dump()
         doc = prepare_for_mongo(doc)
         await db.judge_performance.insert_one(doc)
+        await judge_board.record(doc)
         return perf_obj
     except Exception as e:
         logger.error(f"Error submitting judge score: {str(e)}")
@@ -1794,33 +1858,12 @@ async def submit_judge_score(performance: JudgePerformanceCreate):
 async def get_judge_stats(judgeId: str):
     """Get calibration statistics for a specific judge"""
     try:
-        performances = await db.judge_performance.find(
-            {"judgeId": judgeId},
-            {"_id": 0}
-        ).to_list(1000)
+        entry = await judge_board.get(judgeId)
         
-        if not performances:
+        if not entry or not entry["totalAttempts"]:
             raise HTTPException(status_code=404, detail="No performance data found for this judge")
         
-        # Calculate statistics
-        total_attempts = len(performances)
-        avg_accuracy = sum(p['accuracy'] for p in performances) / total_attempts
-        avg_mae = sum(p['mae'] for p in performances) / total_attempts
-        sensitivity108_count = sum(1 for p in performances if p['sensitivity108'])
-        sensitivity108_rate = sensitivity108_count / total_attempts
-        perfect_matches = sum(1 for p in performances if p['match'])
-        
-        judge_name = performances[0]['judgeName'] if performances else "Unknown"
-        
-        return JudgeStats(
-            judgeId=judgeId,
-            judgeName=judge_name,
-            totalAttempts=total_attempts,
-            averageAccuracy=round(avg_accuracy, 2),
-            averageMAE=round(avg_mae, 2),
-            sensitivity108Rate=round(sensitivity108_rate * 100, 2),
-            perfectMatches=perfect_matches
-        )
+        return JudgeStats(**entry)
     except HTTPException:
         raise
     except Exception as e:
@@ -1831,36 +1874,11 @@ async def get_judge_stats(judgeId: str):
 async def get_leaderboard():
     """Get top judges by accuracy"""
     try:
-        # Aggregate judge performances
-        pipeline = [
-            {
-                "$group": {
-                    "_id": "$judgeId",
-                    "judgeName": {"$first": "$judgeName"},
-                    "totalAttempts": {"$sum": 1},
-                    "avgAccuracy": {"$avg": "$accuracy"},
-                    "avgMAE": {"$avg": "$mae"},
-                    "perfectMatches": {
-                        "$sum": {"$cond": [{"$eq": ["$match", True]}, 1, 0]}
-                    }
-                }
-            },
-            {"$sort": {"avgAccuracy": -1}},
-            {"$limit": 10}
-        ]
-        
-        leaderboard = await db.judge_performance.aggregate(pipeline).to_list(10)
+        # Materialized ranking, updated on each submission
+        leaderboard = await judge_board.top(10)
         
-        # Format results
         formatted_leaderboard = [
-            {
-                "judgeId": entry["_id"],
-                "judgeName": entry["judgeName"],
-                "totalAttempts": entry["totalAttempts"],
-                "averageAccuracy": round(entry["avgAccuracy"], 2),
-                "averageMAE": round(entry["avgMAE"], 2),
-                "perfectMatches": entry["perfectMatches"]
-            }
+            {k: entry[k] for k in ("judgeId", "judgeName", "totalAttempts", "averageAccuracy", "averageMAE", "perfectMatches", "rank")}
             for entry in leaderboard
         ]
         
@@ -1869,6 +1887,14 @@ async def get_leaderboard():
         logger.error(f"Error fetching leaderboard: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.on_event("startup")
+async def startup_judge_leaderboard():
+    judge_board.start()
+
+@app.on_event("shutdown")
+async def shutdown_judge_leaderboard():
+    await judge_board.close()
+
 # Fighter Memory Log Endpoints
 @api_router.post("/fighters/update-stats")
 async def update_fighter_stats(update: FighterStatsUpdate):
@@ -2081,133 +2107,9 @@ def calculate_uncertainty(score_gap: float, tie_breaker: str, event_count: int,
 
 async def detect_and_flag_discrepancies(bout_id: str, round_num: int, round_score: RoundScore, events: list):
     """Automatically detect and create flags for controversial decisions"""
-    flags_created = []
-    
     try:
-        delta = round_score.score_gap
-        
-        # Flag 1: Boundary cases (close to threshold)
-        if abs(delta - 600) < 50:
-            flag = DiscrepancyFlag(
-                bout_id=bout_id,
-                round_num=round_num,
-                flag_type="boundary_10_9_vs_10_8",
-                severity="medium",
-                description=f"Score is {delta:.0f} points, very close to 10-8 threshold (600)",
-                context={
-                    "delta": delta,
-                    "threshold": 600,
-                    "difference_from_threshold": abs(delta - 600),
-                    "card": round_score.card
-                }
-            )
-            doc = flag.model_dump()
-            doc = prepare_for_mongo(doc)
-            await db.discrepancy_flags.insert_one(doc)
-            flags_created.append("boundary_10_9_vs_10_8")
-        
-        if abs(delta - 900) < 50:
-            flag = DiscrepancyFlag(
-                bout_id=bout_id,
-                round_num=round_num,
-                flag_type="boundary_10_8_vs_10_7",
-                severity="high",
-                description=f"Score is {delta:.0f} points, very close to 10-7 threshold (900)",
-                context={
-                    "delta": delta,
-                    "threshold": 900,
-                    "difference_from_threshold": abs(delta - 900),
-                    "card": round_score.card
-                }
-            )
-            doc = flag.model_dump()
-            doc = prepare_for_mongo(doc)
-            await db.discrepancy_flags.insert_one(doc)
-            flags_created.append("boundary_10_8_vs_10_7")
-        
-        # Flag 2: Tie-breaker used
-        if round_score.reasons.tie_breaker:
-            flag = DiscrepancyFlag(
-                bout_id=bout_id,
-                round_num=round_num,
-                flag_type="tie_breaker_used",
-                severity="medium",
-                description=f"Round decided by tie-breaker: {round_score.reasons.tie_breaker}",
-                context={
-                    "tie_breaker": round_score.reasons.tie_breaker,
-                    "delta": delta,
-                    "card": round_score.card
-                }
-            )
-            doc = flag.model_dump()
-            doc = prepare_for_mongo(doc)
-            await db.discrepancy_flags.insert_one(doc)
-            flags_created.append("tie_breaker_used")
-        
-        # Flag 3: Very close decision
-        if delta < 100 and not round_score.reasons.draw:
-            flag = DiscrepancyFlag(
-                bout_id=bout_id,
-                round_num=round_num,
-                flag_type="very_close_decision",
-                severity="low",
-                description=f"Extremely close round with only {delta:.0f} point difference",
-                context={
-                    "delta": delta,
-                    "card": round_score.card,
-                    "winner": round_score.winner
-                }
-            )
-            doc = flag.model_dump()
-            doc = prepare_for_mongo(doc)
-            await db.discrepancy_flags.insert_one(doc)
-            flags_created.append("very_close_decision")
-        
-        # Flag 4: 10-8 without standard gates
-        if round_score.reasons.to_108:
-            gates = round_score.reasons.gates_winner
-            if not gates.finish_threat and not gates.control_dom and not gates.multi_cat_dom:
-                flag = DiscrepancyFlag(
-                    bout_id=bout_id,
-                    round_num=round_num,
-                    flag_type="10_8_without_gate",
-                    severity="high",
-                    description="10-8 score given without any standard dominance gates triggered",
-                    context={
-                        "delta": delta,
-                        "card": round_score.card,
-                        "gates": {
-                            "finish_threat": gates.finish_threat,
-                            "control_dom": gates.control_dom,
-                            "multi_cat_dom": gates.multi_cat_dom
-                        }
-                    }
-                )
-                doc = flag.model_dump()
-                doc = prepare_for_mongo(doc)
-                await db.discrepancy_flags.insert_one(doc)
-                flags_created.append("10_8_without_gate")
-        
-        # Flag 5: Low activity round
-        event_count = len(events)
-        if event_count < 5:
-            flag = DiscrepancyFlag(
-                bout_id=bout_id,
-                round_num=round_num,
-                flag_type="low_activity",
-                severity="low",
-                description=f"Very low activity round with only {event_count} logged events",
-                context={
-                    "event_count": event_count,
-                    "card": round_score.card
-                }
-            )
-            doc = flag.model_dump()
-            doc = prepare_for_mongo(doc)
-            await db.discrepancy_flags.insert_one(doc)
-            flags_created.append("low_activity")
-        
-        return flags_created
+        snapshot = RoundSnapshot.from_round_score(bout_id, round_num, round_score, events)
+        return await discrepancy_engine.flag(snapshot)
         
     except Exception as e:
         logger.error(f"Error detecting discrepancies: {str(e)}")
@@ -2615,42 +2517,40 @@ async def export_audit_logs(
     judge_id: str,  # Required: Judge ID for owner verification
     start_date: str = None,
     end_date: str = None,
-    format: str = "json"
+    format: str = "json",
+    compress: bool = False,
+    resume_token: str = None,
+    batch_size: int = 1000
 ):
-    """Export audit logs for compliance/archival (Owner access only)"""
+    """
+    Export audit logs for compliance/archival (Owner access only)
+    
+    Streams the whole range from a sorted cursor (no record cap) as "json" or
+    "ndjson", optionally gzip-compressed. Pass the last resume_token received
+    to continue an interrupted export.
+    """
+    # Verify owner access
+    verify_owner_access(judge_id)
+    
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {list(EXPORT_FORMATS)}")
     try:
-        # Verify owner access
-        verify_owner_access(judge_id)
-        
-        query = {}
-        
-        if start_date:
-            query["timestamp"] = {"$gte": start_date}
-        if end_date:
-            if "timestamp" in query:
-                query["timestamp"]["$lte"] = end_date
-            else:
-                query["timestamp"] = {"$lte": end_date}
-        
-        logs = await db.audit_logs.find(query, {"_id": 0}).sort("timestamp", 1).to_list(10000)
-        logs = [parse_from_mongo(log) for log in logs]
-        
-        # Convert datetime to string for JSON serialization
-        for log in logs:
-            if isinstance(log.get("timestamp"), datetime):
-                log["timestamp"] = log["timestamp"].isoformat()
-        
-        return {
-            "export_format": format,
-            "export_timestamp": datetime.now(timezone.utc).isoformat(),
-            "record_count": len(logs),
-            "logs": logs,
-            "immutable": True,
-            "note": "This is a certified export of WORM audit logs"
-        }
-    except Exception as e:
-        logger.error(f"Error exporting audit logs: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        query = build_export_query(start_date, end_date, resume_token)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    chunks = stream_audit_export(
+        db.audit_logs, query, format,
+        batch_size=max(1, min(batch_size, 10000)),
+        resumed=resume_token is not None
+    )
+    extension = "ndjson" if format == "ndjson" else "json"
+    media_type = "application/x-ndjson" if format == "ndjson" else "application/json"
+    headers = {"Content-Disposition": f'attachment; filename="audit_export.{extension}{".gz" if compress else ""}"'}
+    
+    if compress:
+        return StreamingResponse(gzip_stream(chunks), media_type="application/gzip", headers=headers)
+    return StreamingResponse(encode_stream(chunks), media_type=media_type, headers=headers)
 
 @api_router.get("/audit/stats")
 async def get_audit_stats(judge_id: str):
@@ -2732,17 +2632,14 @@ async def get_judge_profile(judge_id: str):
         
         profile = parse_from_mongo(profile)
         
-        # Get latest stats from shadow judging
-        submissions = await db.judge_performance.find({"judgeId": judge_id}, {"_id": 0}).to_list(1000)
+        # Latest stats from the materialized shadow judging leaderboard
+        entry = await judge_board.get(judge_id)
         
-        if submissions:
-            total_attempts = len(submissions)
-            avg_accuracy = sum(s["accuracy"] for s in submissions) / total_attempts
-            perfect_matches = sum(1 for s in submissions if s["match"])
-            
-            profile["totalRoundsJudged"] = total_attempts
-            profile["averageAccuracy"] = round(avg_accuracy, 2)
-            profile["perfectMatches"] = perfect_matches
+        if entry and entry["totalAttempts"]:
+            profile["totalRoundsJudged"] = entry["totalAttempts"]
+            profile["averageAccuracy"] = entry["averageAccuracy"]
+            profile["perfectMatches"] = entry["perfectMatches"]
+            profile["leaderboardRank"] = entry["rank"]
         
         return profile
     except HTTPException:
@@ -2787,26 +2684,14 @@ async def get_judge_history(judge_id: str, limit: int = 50):
         
         submissions = [parse_from_mongo(sub) for sub in submissions]
         
-        # Calculate summary stats
-        if submissions:
-            total = len(submissions)
-            avg_accuracy = sum(s["accuracy"] for s in submissions) / total
-            avg_mae = sum(s["mae"] for s in submissions) / total
-            perfect_matches = sum(1 for s in submissions if s["match"])
-            
-            stats = {
-                "totalAttempts": total,
-                "averageAccuracy": round(avg_accuracy, 2),
-                "averageMAE": round(avg_mae, 2),
-                "perfectMatches": perfect_matches
-            }
-        else:
-            stats = {
-                "totalAttempts": 0,
-                "averageAccuracy": 0,
-                "averageMAE": 0,
-                "perfectMatches": 0
-            }
+        # Summary stats from the materialized leaderboard row
+        entry = await judge_board.get(judge_id)
+        stats = {
+            "totalAttempts": entry["totalAttempts"] if entry else 0,
+            "averageAccuracy": entry["averageAccuracy"] if entry else 0,
+            "averageMAE": entry["averageMAE"] if entry else 0,
+            "perfectMatches": entry["perfectMatches"] if entry else 0
+        }
         
         return {
             "judgeId": judge_id,
@@ -2935,6 +2820,10 @@ async def lock_judge_score(score: JudgeScoreLock):
         
         all_locked = all([s.get("locked", False) for s in all_scores])
         
+        # Keep the round's variance summary and the supervisor dashboard current
+        summary = await discrepancy_engine.update_variance(score.bout_id, score.round_num)
+        await dashboard.round_updated(summary)
+        
         return {
             "success": True,
             "message": "Score locked successfully",
@@ -2967,6 +2856,9 @@ async def unlock_judge_score(unlock_request: JudgeScoreUnlock):
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="Judge score not found")
         
+        summary = await discrepancy_engine.update_variance(unlock_request.bout_id, unlock_request.round_num)
+        await dashboard.round_updated(summary)
+        
         return {"success": True, "message": "Score unlocked successfully"}
     except HTTPException:
         raise
@@ -4015,7 +3907,7 @@ from datetime import timedelta
 # Import unified scoring system (V3 Impact-First engine)
 from scoring_engine_v2 import score_round_v3
 # Keep old import for backwards compatibility during migration
-from unified_scoring import compute_fight_totals, get_event_value
+from unified_scoring import get_event_value
 
 def compute_round_from_events(events):
     """Wrapper to call V3 engine with backwards-compatible signature"""
@@ -4258,6 +4150,8 @@ async def delete_bout(bout_id: str):
         await db.unified_events.delete_many({"bout_id": bout_id})
         await db.round_results.delete_many({"bout_id": bout_id})
         await db.operators.delete_many({"bout_id": bout_id})
+        await finalizer.live_stats.clear(bout_id)
+        await dashboard.clear(bout_id)
         logging.info(f"[BOUT] Deleted: {bout_id}")
         return {"success": True}
     except Exception as e:
@@ -4465,6 +4359,7 @@ async def create_event(event: UnifiedEventCreate):
         
         await db.unified_events.insert_one(event_doc)
         event_doc.pop("_id", None)
+        await track_unified_event(event.bout_id, event_doc)
         
         logging.info(f"[UNIFIED] Event created: {event.event_type} for {event.corner} (from {event.device_role})")
         
@@ -4517,6 +4412,7 @@ async def supervisor_create_event(event: SupervisorEventCreate):
         
         await db.unified_events.insert_one(event_doc)
         event_doc.pop("_id", None)
+        await track_unified_event(event.bout_id, event_doc)
         
         logging.info(f"[SUPERVISOR] Event created: {event.event_type} for {event.corner}")
         
@@ -4565,6 +4461,7 @@ async def delete_event(request: EventDeleteRequest):
         )
         
         if result:
+            await track_unified_event(request.bout_id, result, sign=-1)
             logging.info(f"[SUPERVISOR] Event deleted: {request.event_type} for {request.corner}")
             
             # Broadcast the deletion
@@ -4594,6 +4491,7 @@ async def delete_event_by_id(event_id: str, bout_id: str):
         )
         
         if result:
+            await track_unified_event(bout_id, result, sign=-1)
             logging.info(f"[SUPERVISOR] Event deleted by ID: {event_id}")
             
             # Broadcast the deletion
@@ -4986,98 +4884,11 @@ async def finalize_fight(request: FightFinalizeRequest):
     """
     Finalize a fight - compute final totals and determine winner.
     This is the authoritative final result.
+    Archival and stat aggregation run afterwards on the finalization job queue.
     """
     try:
-        bout_id = request.bout_id
-        
-        # Get all round results
-        round_results = await db.round_results.find(
-            {"bout_id": bout_id},
-            {"_id": 0}
-        ).sort("round_number", 1).to_list(100)
-        
-        # If no round_results, try to get from bout
-        if not round_results:
-            bout = await db.bouts.find_one(
-                {"$or": [{"bout_id": bout_id}, {"boutId": bout_id}]},
-                {"_id": 0}
-            )
-            if bout and bout.get("roundScores"):
-                for r in bout["roundScores"]:
-                    round_results.append({
-                        "round_number": r.get("round"),
-                        "red_points": r.get("red_score", r.get("unified_red", 0)),
-                        "blue_points": r.get("blue_score", r.get("unified_blue", 0)),
-                        "delta": r.get("delta", 0)
-                    })
-        
-        # Compute final totals
-        fight_totals = compute_fight_totals(round_results)
-        
-        # Get bout info for fighter names
-        bout = await db.bouts.find_one(
-            {"$or": [{"bout_id": bout_id}, {"boutId": bout_id}]},
-            {"_id": 0}
-        )
-        
-        fighter1_name = bout.get("fighter1", "Red Corner") if bout else "Red Corner"
-        fighter2_name = bout.get("fighter2", "Blue Corner") if bout else "Blue Corner"
-        
-        if fight_totals["winner"] == "RED":
-            winner_name = fighter1_name
-        elif fight_totals["winner"] == "BLUE":
-            winner_name = fighter2_name
-        else:
-            winner_name = "DRAW"
-        
-        # Create FightResult document
-        fight_result = {
-            "bout_id": bout_id,
-            "final_red": fight_totals["final_red"],
-            "final_blue": fight_totals["final_blue"],
-            "winner": fight_totals["winner"],
-            "winner_name": winner_name,
-            "fighter1_name": fighter1_name,
-            "fighter2_name": fighter2_name,
-            "total_rounds": fight_totals["total_rounds"],
-            "rounds": [
-                {
-                    "round": r.get("round_number"),
-                    "red": r.get("red_points"),
-                    "blue": r.get("blue_points"),
-                    "delta": r.get("delta", 0)
-                }
-                for r in round_results
-            ],
-            "finalized_at": datetime.now(timezone.utc).isoformat()
-        }
-        
-        # UPSERT - idempotent storage
-        await db.fight_results.update_one(
-            {"bout_id": bout_id},
-            {"$set": fight_result},
-            upsert=True
-        )
-        
-        # Update bout status
-        await db.bouts.update_one(
-            {"$or": [{"bout_id": bout_id}, {"boutId": bout_id}]},
-            {"$set": {
-                "status": "completed",
-                "fighter1_total": fight_totals["final_red"],
-                "fighter2_total": fight_totals["final_blue"],
-                "winner": fight_totals["winner"],
-                "winner_name": winner_name,
-                "finalized_at": fight_result["finalized_at"]
-            }}
-        )
-        
-        logging.info(f"[UNIFIED] Fight finalized: {bout_id} - {fighter1_name} {fight_totals['final_red']} vs {fight_totals['final_blue']} {fighter2_name} | Winner: {winner_name}")
-        
-        # BROADCAST to all connected WebSocket clients
-        await broadcast_fight_finalized(bout_id, fight_result)
-        
-        return fight_result
+        # BROADCAST to all connected WebSocket clients (not awaited)
+        return await finalizer.finalize(request.bout_id, broadcast=broadcast_fight_finalized)
     except Exception as e:
         logging.error(f"Error finalizing fight: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -5454,7 +5265,8 @@ async def complete_fight(bout_id: str):
     """
     try:
         # Save the completed fight
-        completed_fight = await save_completed_fight(db, bout_id)
+        completed_fight = await save_completed_fight(db, bout_id, await finalizer.live_stats.load(bout_id))
+        await finalizer.release(bout_id)
         
         # Remove _id for JSON response
         completed_fight.pop('_id', None)
@@ -5476,6 +5288,20 @@ async def complete_fight(bout_id: str):
         logging.error(f"Error completing fight {bout_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to complete fight: {str(e)}")
 
+async def archive_finalized_fight(bout_id: str, payload: dict):
+    """Finalization job: archive the fight with the stats accumulated live"""
+    await save_completed_fight(db, bout_id, await finalizer.live_stats.load(bout_id))
+
+finalizer.jobs.register("archive", archive_finalized_fight)
+
+@app.on_event("startup")
+async def startup_fight_finalization():
+    finalizer.start()
+
+@app.on_event("shutdown")
+async def shutdown_fight_finalization():
+    await finalizer.close()
+
 @api_router.get("/fight/completed/{bout_id}")
 async def get_completed_fight(bout_id: str):
     """
@@ -5709,6 +5535,7 @@ async def create_round_note(note: RoundNoteCreate):
         )
         
         result = await db.round_notes.insert_one(note_data.model_dump())
+        await dashboard.notes_changed(note.bout_id)
         logger.info(f"Round note created: {note_data.id} for bout {note.bout_id} round {note.round_num}")
         
         return note_data
@@ -5786,11 +5613,13 @@ async def update_round_note(note_id: str, note_text: str = Form(...)):
 async def delete_round_note(note_id: str):
     """Delete a round note"""
     try:
-        result = await db.round_notes.delete_one({"id": note_id})
+        deleted = await db.round_notes.find_one_and_delete({"id": note_id})
         
-        if result.deleted_count == 0:
+        if deleted is None:
             raise HTTPException(status_code=404, detail="Note not found")
         
+        await dashboard.notes_changed(deleted["bout_id"], -1)
+        
         return {"success": True, "message": "Note deleted successfully"}
     except HTTPException:
         raise
@@ -5806,53 +5635,30 @@ async def delete_round_note(note_id: str):
 async def get_supervisor_dashboard(bout_id: str):
     """Get comprehensive dashboard data for supervisor"""
     try:
-        # Get all judge scores
-        judge_scores_cursor = db.judge_scores.find({"bout_id": bout_id}, {"_id": 0})
-        judge_scores = await judge_scores_cursor.to_list(length=None)
-        
-        # Get all events
-        events_cursor = db.events.find({"boutId": bout_id}, {"_id": 0})
-        events = await events_cursor.to_list(length=None)
-        
-        # Get round notes
-        notes_cursor = db.round_notes.find({"bout_id": bout_id}, {"_id": 0})
-        notes = await notes_cursor.to_list(length=None)
+        # Per-round judge scores and variance, maintained as judges lock;
+        # event / note counts from the dashboard projection
+        summaries, projection = await asyncio.gather(
+            discrepancy_engine.get_bout(bout_id),
+            dashboard.get(bout_id)
+        )
         
-        # Calculate stats per round
-        rounds_data = {}
-        for score in judge_scores:
-            round_num = score.get("round_num")
-            if round_num not in rounds_data:
-                rounds_data[round_num] = {
-                    "scores": [],
-                    "locked_count": 0,
-                    "total_judges": 0
-                }
-            rounds_data[round_num]["scores"].append(score)
-            rounds_data[round_num]["total_judges"] += 1
-            if score.get("locked"):
-                rounds_data[round_num]["locked_count"] += 1
-        
-        # Detect anomalies
-        anomalies = []
-        for round_num, data in rounds_data.items():
-            if data["total_judges"] >= 2:
-                scores = [s.get("fighter1_score", 10) for s in data["scores"]]
-                max_variance = max(scores) - min(scores)
-                if max_variance > 2:  # More than 2 point variance
-                    anomalies.append({
-                        "round": round_num,
-                        "type": "variance",
-                        "severity": "high" if max_variance > 3 else "medium",
-                        "message": f"High score variance ({max_variance} points) in Round {round_num}"
-                    })
+        judge_scores = [score for summary in summaries for score in summary["scores"]]
+        rounds_data = {
+            summary["round_num"]: {
+                "scores": summary["scores"],
+                "locked_count": summary["locked_count"],
+                "total_judges": summary["judge_count"]
+            }
+            for summary in summaries
+        }
+        anomalies = [summary["anomaly"] for summary in summaries if summary.get("anomaly")]
         
         return {
             "bout_id": bout_id,
             "judge_scores": judge_scores,
             "rounds_data": rounds_data,
-            "total_events": len(events),
-            "total_notes": len(notes),
+            "total_events": projection["total_events"],
+            "total_notes": projection["total_notes"],
             "anomalies": anomalies,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
@@ -5860,6 +5666,57 @@ async def get_supervisor_dashboard(bout_id: str):
         logger.error(f"Error getting supervisor dashboard: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@api_router.get("/supervisor/dashboard/{bout_id}/summary")
+async def get_supervisor_dashboard_summary(bout_id: str):
+    """
+    Lightweight dashboard: event / note counts and per-round judge locks,
+    min / max scores and variance, from the counter-backed projection.
+    The same document is pushed on /api/ws/supervisor/{bout_id}.
+    """
+    try:
+        return await dashboard.get(bout_id)
+    except Exception as e:
+        logger.error(f"Error getting supervisor dashboard summary: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.websocket("/api/ws/supervisor/{bout_id}")
+async def supervisor_dashboard_websocket(websocket: WebSocket, bout_id: str):
+    """
+    Supervisor dashboard updates for a bout.
+    
+    Message types sent to clients:
+    - dashboard_sync: Full projection on connect / request_sync
+    - dashboard_update: Projection after every event, note or judge score change
+    """
+    await supervisor_ws_manager.connect(websocket, bout_id)
+    
+    try:
+        await websocket.send_json({"type": "dashboard_sync", "data": await dashboard.get(bout_id)})
+        
+        while True:
+            try:
+                data = await asyncio.wait_for(websocket.receive_json(), timeout=30.0)
+                
+                if data.get("type") == "ping":
+                    await websocket.send_json({"type": "pong", "timestamp": datetime.now(timezone.utc).isoformat()})
+                
+                elif data.get("type") == "request_sync":
+                    await websocket.send_json({"type": "dashboard_sync", "data": await dashboard.get(bout_id)})
+                    
+            except asyncio.TimeoutError:
+                # Send keepalive ping
+                try:
+                    await websocket.send_json({"type": "ping"})
+                except Exception:
+                    break
+                    
+    except WebSocketDisconnect:
+        logging.info(f"[WS] Supervisor disconnected from bout {bout_id}")
+    except Exception as e:
+        logging.error(f"[WS] Error in supervisor websocket: {e}")
+    finally:
+        await supervisor_ws_manager.disconnect(websocket, bout_id)
+
 # ============================================================================
 # SYSTEM 4: AI JUDGE VARIANCE DETECTION (Rule-Based)
 # ============================================================================
@@ -5868,79 +5725,31 @@ async def get_supervisor_dashboard(bout_id: str):
 async def detect_judge_variance(bout_id: str, round_num: int):
     """Detect variance between judge scores using rule-based algorithm"""
     try:
-        # Get all judge scores for this round
-        judge_scores_cursor = db.judge_scores.find({
-            "bout_id": bout_id,
-            "round_num": round_num
-        }, {"_id": 0})
-        judge_scores = await judge_scores_cursor.to_list(length=None)
+        summary = await discrepancy_engine.get_round(bout_id, round_num)
         
-        if len(judge_scores) < 2:
+        if summary["judge_count"] < 2:
             return {
                 "bout_id": bout_id,
                 "round_num": round_num,
                 "variance_detected": False,
                 "message": "Insufficient judges for variance detection",
-                "judge_count": len(judge_scores)
+                "judge_count": summary["judge_count"]
             }
         
-        # Extract scores
-        fighter1_scores = [s.get("fighter1_score", 10) for s in judge_scores]
-        fighter2_scores = [s.get("fighter2_score", 10) for s in judge_scores]
-        
-        # Calculate variance metrics
-        f1_variance = max(fighter1_scores) - min(fighter1_scores)
-        f2_variance = max(fighter2_scores) - min(fighter2_scores)
-        max_variance = max(f1_variance, f2_variance)
-        
-        # Detect outliers
-        outliers = []
-        for i, score in enumerate(judge_scores):
-            f1_score = score.get("fighter1_score", 10)
-            f2_score = score.get("fighter2_score", 10)
-            
-            # Check if this judge's score is outlier (>2 points from any other judge)
-            is_outlier = False
-            for j, other_score in enumerate(judge_scores):
-                if i != j:
-                    other_f1 = other_score.get("fighter1_score", 10)
-                    other_f2 = other_score.get("fighter2_score", 10)
-                    
-                    if abs(f1_score - other_f1) > 2 or abs(f2_score - other_f2) > 2:
-                        is_outlier = True
-                        break
-            
-            if is_outlier:
-                outliers.append({
-                    "judge_id": score.get("judge_id"),
-                    "judge_name": score.get("judge_name"),
-                    "card": score.get("card"),
-                    "fighter1_score": f1_score,
-                    "fighter2_score": f2_score
-                })
-        
-        # Determine severity
-        severity = "low"
-        if max_variance > 3:
-            severity = "critical"
-        elif max_variance > 2:
-            severity = "high"
-        elif max_variance > 1:
-            severity = "medium"
-        
-        variance_detected = max_variance > 2  # Threshold: 2+ points
+        max_variance = summary["max_variance"]
+        variance_detected = summary["variance_detected"]  # Threshold: 2+ points
         
         return {
             "bout_id": bout_id,
             "round_num": round_num,
             "variance_detected": variance_detected,
             "max_variance": max_variance,
-            "fighter1_variance": f1_variance,
-            "fighter2_variance": f2_variance,
-            "severity": severity,
-            "outliers": outliers,
-            "judge_count": len(judge_scores),
-            "all_scores": judge_scores,
+            "fighter1_variance": summary["fighter1_variance"],
+            "fighter2_variance": summary["fighter2_variance"],
+            "severity": summary["severity"],
+            "outliers": summary["outliers"],
+            "judge_count": summary["judge_count"],
+            "all_scores": summary["scores"],
             "message": f"{'Variance detected' if variance_detected else 'No significant variance'} ({max_variance} points max)"
         }
     except Exception as e:
@@ -6220,11 +6029,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# OPTIONAL SUBSYSTEMS
+# ============================================================================
+# Each subsystem registers a loader; see subsystem_registry for the
+# SUBSYSTEMS / SUBSYSTEMS_DISABLED / SUBSYSTEMS_LAZY settings. In lazy mode a
+# subsystem is imported and mounted on the first request under its paths.
+# Background work is started from ctx.on_startup hooks only.
+
+subsystems = SubsystemRegistry(app)
+app.add_middleware(LazyMountMiddleware, registry=subsystems)
+
+
+@api_router.get("/subsystems")
+async def get_subsystems():
+    """Load state and import / startup timings of the optional subsystems"""
+    return subsystems.get_stats()
+
+
 # ============================================================================
 # ICVSS INTEGRATION
 # ============================================================================
 
-try:
+@subsystems.subsystem("icvss", paths=["/api/icvss"])
+def load_icvss(ctx):
     from icvss.routes import icvss_router
     from icvss.round_engine import RoundEngine
     import icvss.routes as icvss_routes_module
@@ -6233,24 +6061,25 @@ try:
     icvss_round_engine = RoundEngine(db)
     icvss_routes_module.round_engine = icvss_round_engine
     
+    # Flush buffered round events before the process exits
+    ctx.on_shutdown(icvss_round_engine.write_buffer.close)
+    
     # Mount ICVSS router under API prefix
-    api_router.include_router(icvss_router, prefix="/icvss")
+    ctx.include(icvss_router, prefix="/icvss")
     
     logger.info("✓ ICVSS (Intelligent Combat Vision Scoring System) loaded")
     logger.info("  - Event processing with 80-150ms deduplication")
     logger.info("  - Hybrid CV + Judge scoring (70/30 split)")
     logger.info("  - Real-time WebSocket feeds")
     logger.info("  - SHA256 audit logging")
-    
-except Exception as e:
-    logger.warning(f"ICVSS module not loaded: {e}")
-    logger.info("  System will run in legacy mode only")
 
 
 # ============================================================================
 # FIGHT JUDGE AI - Integrated Scoring Engine (E1)
 # ============================================================================
-try:
+
+@subsystems.subsystem("fjai", paths=["/api/fjai"])
+def load_fjai(ctx):
     import fjai.routes as fjai_routes_module
     from fjai.routes import fjai_router
     from fjai.round_manager import RoundManager as FJAIRoundManager
@@ -6260,25 +6089,28 @@ try:
     fjai_routes_module.round_manager = fjai_round_manager
     
     # Mount FJAI router
-    api_router.include_router(fjai_router, prefix="/fjai")
+    ctx.include(fjai_router, prefix="/fjai")
     
     logger.info("✓ Fight Judge AI (E1) - Integrated Scoring Engine loaded")
     logger.info("  - Damage primacy rule with weighted scoring")
     logger.info("  - 10-Point-Must system")
     logger.info("  - SHA256 audit trails")
     logger.info("  - Multi-camera event fusion")
-    
-except Exception as e:
-    logger.warning(f"Fight Judge AI module not loaded: {e}")
+
 
 # ============================================================================
 # CV ANALYTICS ENGINE (E2)
 # ============================================================================
-try:
-    from cv_analytics.routes import cv_analytics_router
+
+@subsystems.subsystem("cv_analytics", paths=["/api/cv-analytics"])
+def load_cv_analytics(ctx):
+    from cv_analytics.routes import cv_analytics_router, analytics_engine
     
     # Mount CV Analytics router
-    api_router.include_router(cv_analytics_router, prefix="/cv-analytics")
+    ctx.include(cv_analytics_router, prefix="/cv-analytics")
+    
+    # Smoothing windows are per (bout, stream); drop them when the bout ends
+    finalizer.on_release(analytics_engine.release_bout)
     
     logger.info("✓ CV Analytics Engine (E2) loaded")
     logger.info("  - Raw CV → Standardized events")
@@ -6286,37 +6118,41 @@ try:
     logger.info("  - Multi-camera consensus fusion")
     logger.info("  - Momentum swing detection")
     logger.info("  - Fighter style classification")
-    
-except Exception as e:
-    logger.warning(f"CV Analytics Engine not loaded: {e}")
+
 
 # ============================================================================
 # CV ROUTER
 # ============================================================================
-try:
+
+@subsystems.subsystem("cv_router", paths=["/api/cv-router"])
+def load_cv_router(ctx):
     from cv_router.routes import cv_router_api
     from cv_router.router_engine import CVRouterEngine
     import cv_router.routes as cv_router_routes_module
     
-    # Initialize CV Router
+    # Initialize CV Router (worker health monitor starts with the app)
     cv_router_engine = CVRouterEngine()
     cv_router_routes_module.router_engine = cv_router_engine
     
+    ctx.on_startup(cv_router_engine.start)
+    ctx.on_shutdown(cv_router_engine.shutdown)
+    
     # Mount router
-    api_router.include_router(cv_router_api, prefix="/cv-router")
+    ctx.include(cv_router_api, prefix="/cv-router")
     
     logger.info("✓ CV Router loaded")
     logger.info("  - Multi-camera stream ingestion")
     logger.info("  - Worker load balancing")
+    logger.info("  - Bounded per-worker queues with drop policies")
     logger.info("  - Failover & health monitoring")
-    
-except Exception as e:
-    logger.warning(f"CV Router not loaded: {e}")
+
 
 # ============================================================================
 # EVENT HARMONIZER
 # ============================================================================
-try:
+
+@subsystems.subsystem("harmonizer", paths=["/api/harmonizer"])
+def load_event_harmonizer(ctx):
     from event_harmonizer.routes import event_harmonizer_api
     from event_harmonizer.harmonizer_engine import EventHarmonizerEngine
     import event_harmonizer.routes as harmonizer_routes_module
@@ -6326,20 +6162,20 @@ try:
     harmonizer_routes_module.harmonizer_engine = event_harmonizer
     
     # Mount router
-    api_router.include_router(event_harmonizer_api, prefix="/harmonizer")
+    ctx.include(event_harmonizer_api, prefix="/harmonizer")
     
     logger.info("✓ Event Harmonizer loaded")
     logger.info("  - Judge vs CV conflict resolution")
     logger.info("  - Weighted confidence logic")
     logger.info("  - Hybrid event merging")
-    
-except Exception as e:
-    logger.warning(f"Event Harmonizer not loaded: {e}")
+
 
 # ============================================================================
 # NORMALIZATION ENGINE
 # ============================================================================
-try:
+
+@subsystems.subsystem("normalization", paths=["/api/normalization"])
+def load_normalization_engine(ctx):
     from normalization_engine.routes import normalization_api
     from normalization_engine.normalization_engine import NormalizationEngine
     import normalization_engine.routes as norm_routes_module
@@ -6349,20 +6185,20 @@ try:
     norm_routes_module.norm_engine = normalization_engine
     
     # Mount router
-    api_router.include_router(normalization_api, prefix="/normalization")
+    ctx.include(normalization_api, prefix="/normalization")
     
     logger.info("✓ Normalization Engine loaded")
     logger.info("  - Event weight normalization (0-1 scale)")
     logger.info("  - Global caps & metric drift prevention")
     logger.info("  - Transparent weight breakdown")
-    
-except Exception as e:
-    logger.warning(f"Normalization Engine not loaded: {e}")
+
 
 # ============================================================================
 # ROUND VALIDATOR (Enhanced with Postgres storage)
 # ============================================================================
-try:
+
+@subsystems.subsystem("validator", paths=["/api/validator"])
+def load_round_validator(ctx):
     from round_validator.routes import round_validator_api
     from round_validator.validator_engine import RoundValidatorEngine
     import round_validator.routes as validator_routes_module
@@ -6373,16 +6209,16 @@ try:
     )
     validator_routes_module.validator_engine = validator_engine
     
-    api_router.include_router(round_validator_api, prefix="/validator")
+    ctx.include(round_validator_api, prefix="/validator")
     logger.info(f"✓ Round Validator loaded [{'Postgres storage' if postgres_available else 'In-memory cache'}]")
-    
-except Exception as e:
-    logger.warning(f"Round Validator not loaded: {e}")
+
 
 # ============================================================================
 # REPORT GENERATOR
 # ============================================================================
-try:
+
+@subsystems.subsystem("report", paths=["/api/report"])
+def load_report_generator(ctx):
     from report_generator.routes import report_generator_api
     from report_generator.generator_engine import ReportGeneratorEngine
     import report_generator.routes as report_routes_module
@@ -6390,33 +6226,38 @@ try:
     report_engine = ReportGeneratorEngine()
     report_routes_module.report_engine = report_engine
     
-    api_router.include_router(report_generator_api, prefix="/report")
+    ctx.include(report_generator_api, prefix="/report")
     logger.info("✓ Report Generator loaded")
-    
-except Exception as e:
-    logger.warning(f"Report Generator not loaded: {e}")
+
 
 # ============================================================================
 # HIGHLIGHT WORKER
 # ============================================================================
-try:
+
+@subsystems.subsystem("highlight_worker", paths=["/api/highlights"])
+def load_highlight_worker(ctx):
     from highlight_worker.routes import highlight_worker_api
     from highlight_worker.worker_engine import HighlightWorkerEngine
     import highlight_worker.routes as highlight_routes_module
     
-    highlight_engine = HighlightWorkerEngine()
+    highlight_engine = HighlightWorkerEngine(num_workers=int(os.environ.get("HIGHLIGHT_WORKERS", "4")))
     highlight_routes_module.highlight_engine = highlight_engine
     
-    api_router.include_router(highlight_worker_api, prefix="/highlights")
-    logger.info("✓ Highlight Worker loaded")
+    ctx.on_shutdown(highlight_engine.close)
+    
+    # Clip metadata and render windows are per bout; drop them when it ends
+    finalizer.on_release(highlight_engine.release_bout)
     
-except Exception as e:
-    logger.warning(f"Highlight Worker not loaded: {e}")
+    ctx.include(highlight_worker_api, prefix="/highlights")
+    logger.info("✓ Highlight Worker loaded")
+
 
 # ============================================================================
 # REPLAY SERVICE
 # ============================================================================
-try:
+
+@subsystems.subsystem("replay", paths=["/api/replay"])
+def load_replay_service(ctx):
     from replay_service.routes import replay_service_api
     from replay_service.replay_engine import ReplayEngine
     import replay_service.routes as replay_routes_module
@@ -6424,33 +6265,36 @@ try:
     replay_engine = ReplayEngine()
     replay_routes_module.replay_engine = replay_engine
     
-    api_router.include_router(replay_service_api, prefix="/replay")
+    ctx.include(replay_service_api, prefix="/replay")
     logger.info("✓ Replay Service loaded")
-    
-except Exception as e:
-    logger.warning(f"Replay Service not loaded: {e}")
+
 
 # ============================================================================
 # STORAGE MANAGER
 # ============================================================================
-try:
+
+@subsystems.subsystem("storage", paths=["/api/storage"])
+def load_storage_manager(ctx):
     from storage_manager.routes import storage_manager_api
     from storage_manager.manager_engine import StorageManagerEngine
     import storage_manager.routes as storage_routes_module
     
-    storage_engine = StorageManagerEngine()
+    storage_engine = StorageManagerEngine(storage_path=os.environ.get("STORAGE_PATH", "/var/fight-storage"))
     storage_routes_module.storage_engine = storage_engine
     
-    api_router.include_router(storage_manager_api, prefix="/storage")
-    logger.info("✓ Storage Manager loaded")
+    ctx.on_startup(storage_engine.start)
+    ctx.on_shutdown(storage_engine.shutdown)
     
-except Exception as e:
-    logger.warning(f"Storage Manager not loaded: {e}")
+    ctx.include(storage_manager_api, prefix="/storage")
+    logger.info("✓ Storage Manager loaded")
+
 
 # ============================================================================
 # ADVANCED AUDIT LOGGER
 # ============================================================================
-try:
+
+@subsystems.subsystem("audit", paths=["/api/audit"])
+def load_advanced_audit(ctx):
     from advanced_audit.routes import advanced_audit_api
     from advanced_audit.audit_engine import AdvancedAuditEngine
     import advanced_audit.routes as audit_routes_module
@@ -6458,16 +6302,16 @@ try:
     audit_logger = AdvancedAuditEngine()
     audit_routes_module.audit_engine = audit_logger
     
-    api_router.include_router(advanced_audit_api, prefix="/audit")
+    ctx.include(advanced_audit_api, prefix="/audit")
     logger.info("✓ Advanced Audit Logger loaded - Blockchain-style tamper-proof logging")
-    
-except Exception as e:
-    logger.warning(f"Advanced Audit not loaded: {e}")
+
 
 # ============================================================================
 # SCORING SIMULATOR
 # ============================================================================
-try:
+
+@subsystems.subsystem("simulator", paths=["/api/simulator"])
+def load_scoring_simulator(ctx):
     from scoring_simulator.routes import scoring_simulator_api
     from scoring_simulator.simulator_engine import ScoringSimulatorEngine
     import scoring_simulator.routes as simulator_routes_module
@@ -6475,16 +6319,16 @@ try:
     simulator = ScoringSimulatorEngine()
     simulator_routes_module.simulator_engine = simulator
     
-    api_router.include_router(scoring_simulator_api, prefix="/simulator")
+    ctx.include(scoring_simulator_api, prefix="/simulator")
     logger.info("✓ Scoring Simulator loaded - Event replay & validation")
-    
-except Exception as e:
-    logger.warning(f"Scoring Simulator not loaded: {e}")
+
 
 # ============================================================================
 # FAILOVER ENGINE
 # ============================================================================
-try:
+
+@subsystems.subsystem("failover", paths=["/api/failover"])
+def load_failover_engine(ctx):
     from failover_engine.routes import failover_engine_api
     from failover_engine.failover_manager import FailoverManager
     import failover_engine.routes as failover_routes_module
@@ -6492,16 +6336,20 @@ try:
     failover = FailoverManager()
     failover_routes_module.failover_manager = failover
     
-    api_router.include_router(failover_engine_api, prefix="/failover")
-    logger.info("✓ Failover Engine loaded - Cloud/Local/Manual auto-failover")
+    # Health monitoring runs with the app
+    ctx.on_startup(failover.start)
+    ctx.on_shutdown(failover.close)
     
-except Exception as e:
-    logger.warning(f"Failover Engine not loaded: {e}")
+    ctx.include(failover_engine_api, prefix="/failover")
+    logger.info("✓ Failover Engine loaded - Cloud/Local/Manual auto-failover")
+
 
 # ============================================================================
 # TIME SYNC SERVICE
 # ============================================================================
-try:
+
+@subsystems.subsystem("timesync", paths=["/api/timesync"])
+def load_time_sync(ctx):
     from time_sync.routes import time_sync_api
     from time_sync.sync_engine import TimeSyncEngine
     import time_sync.routes as time_sync_routes_module
@@ -6509,16 +6357,16 @@ try:
     time_sync = TimeSyncEngine()
     time_sync_routes_module.sync_engine = time_sync
     
-    api_router.include_router(time_sync_api, prefix="/timesync")
+    ctx.include(time_sync_api, prefix="/timesync")
     logger.info("✓ Time Sync Service loaded - NTP-like unified timestamps")
-    
-except Exception as e:
-    logger.warning(f"Time Sync not loaded: {e}")
+
 
 # ============================================================================
 # CALIBRATION API (Enhanced with Postgres + Redis)
 # ============================================================================
-try:
+
+@subsystems.subsystem("calibration", paths=["/api/calibration"])
+def load_calibration_api(ctx):
     from calibration_api.routes import calibration_api
     from calibration_api.calibration_manager import CalibrationManager
     import calibration_api.routes as calibration_routes_module
@@ -6531,7 +6379,7 @@ try:
     )
     calibration_routes_module.calibration_manager = calibration_mgr
     
-    api_router.include_router(calibration_api, prefix="/calibration")
+    ctx.include(calibration_api, prefix="/calibration")
     
     features = []
     if postgres_available:
@@ -6540,41 +6388,45 @@ try:
         features.append("Redis pub/sub")
     
     logger.info(f"✓ Calibration API loaded - AI model threshold tuning [{', '.join(features) if features else 'In-memory'}]")
-    
-except Exception as e:
-    logger.warning(f"Calibration API not loaded: {e}")
+
 
 # ============================================================================
 # PERFORMANCE PROFILER
 # ============================================================================
-try:
+
+@subsystems.subsystem("perf", paths=["/api/perf"])
+def load_performance_profiler(ctx):
     from performance_profiler.routes import performance_profiler_api
     from performance_profiler.profiler_engine import PerformanceProfiler
     import performance_profiler.routes as profiler_routes_module
-    import asyncio
     
     profiler_engine = PerformanceProfiler(window_size=1000)
     profiler_routes_module.profiler = profiler_engine
     
-    # Start background task for mock data generation (for testing)
-    async def start_profiler_mock_data():
-        asyncio.create_task(profiler_engine.generate_mock_data())
+    # Mock data generation (for testing) runs with the app
+    mock_data_tasks = []
     
-    # Schedule mock data generation
-    @app.on_event("startup")
-    async def startup_profiler():
-        asyncio.create_task(profiler_engine.generate_mock_data())
+    def start_profiler_mock_data():
+        mock_data_tasks.append(asyncio.get_running_loop().create_task(profiler_engine.generate_mock_data()))
     
-    api_router.include_router(performance_profiler_api, prefix="/perf")
-    logger.info("✓ Performance Profiler loaded - Real-time metrics & WebSocket streaming")
+    def stop_profiler_mock_data():
+        for task in mock_data_tasks:
+            task.cancel()
+        mock_data_tasks.clear()
+    
+    ctx.on_startup(start_profiler_mock_data)
+    ctx.on_shutdown(stop_profiler_mock_data)
     
-except Exception as e:
-    logger.warning(f"Performance Profiler not loaded: {e}")
+    ctx.include(performance_profiler_api, prefix="/perf")
+    logger.info("✓ Performance Profiler loaded - Real-time metrics & WebSocket streaming")
+
 
 # ============================================================================
 # HEARTBEAT MONITOR
 # ============================================================================
-try:
+
+@subsystems.subsystem("heartbeat", paths=["/api/heartbeat"])
+def load_heartbeat_monitor(ctx):
     from heartbeat_monitor.routes import heartbeat_api
     from heartbeat_monitor.monitor_engine import HeartbeatMonitor
     import heartbeat_monitor.routes as heartbeat_routes_module
@@ -6582,16 +6434,19 @@ try:
     heartbeat_mon = HeartbeatMonitor(db=db)
     heartbeat_routes_module.monitor = heartbeat_mon
     
-    api_router.include_router(heartbeat_api, prefix="")
-    logger.info("✓ Heartbeat Monitor loaded - Service health tracking for FJAIPOS modules")
+    ctx.on_startup(heartbeat_mon.migrate_legacy_rows)
+    ctx.on_shutdown(heartbeat_mon.close)
     
-except Exception as e:
-    logger.warning(f"Heartbeat Monitor not loaded: {e}")
+    ctx.include(heartbeat_api)
+    logger.info("✓ Heartbeat Monitor loaded - Service health tracking for FJAIPOS modules")
+
 
 # ============================================================================
 # FIGHTER ANALYTICS (Phase 1)
 # ============================================================================
-try:
+
+@subsystems.subsystem("fighter_analytics", paths=["/api/fighters", "/api/stats"])
+def load_fighter_analytics(ctx):
     from fighter_analytics.routes import fighter_analytics_api
     from fighter_analytics.analytics_engine import FighterAnalyticsEngine
     import fighter_analytics.routes as fighter_analytics_routes_module
@@ -6599,16 +6454,16 @@ try:
     fighter_analytics_eng = FighterAnalyticsEngine(db=db)
     fighter_analytics_routes_module.analytics_engine = fighter_analytics_eng
     
-    api_router.include_router(fighter_analytics_api, prefix="")
+    ctx.include(fighter_analytics_api)
     logger.info("✓ Fighter Analytics loaded - Historical stats, performance trends, leaderboards")
-    
-except Exception as e:
-    logger.warning(f"Fighter Analytics not loaded: {e}")
+
 
 # ============================================================================
 # CV MOMENTS - AI DETECTION (Phase 2)
 # ============================================================================
-try:
+
+@subsystems.subsystem("cv_moments", paths=["/api/highlights"])
+def load_cv_moments(ctx):
     from cv_moments.routes import cv_moments_api
     from cv_moments.detection_engine import MomentDetectionEngine
     import cv_moments.routes as cv_moments_routes_module
@@ -6616,16 +6471,16 @@ try:
     cv_moments_eng = MomentDetectionEngine(db=db)
     cv_moments_routes_module.detection_engine = cv_moments_eng
     
-    api_router.include_router(cv_moments_api, prefix="")
+    ctx.include(cv_moments_api)
     logger.info("✓ CV Moments AI loaded - Knockdown/Strike/Submission detection, Auto-highlights")
-    
-except Exception as e:
-    logger.warning(f"CV Moments AI not loaded: {e}")
+
 
 # ============================================================================
 # BLOCKCHAIN AUDIT (Phase 3)
 # ============================================================================
-try:
+
+@subsystems.subsystem("blockchain_audit", paths=["/api/blockchain"])
+def load_blockchain_audit(ctx):
     from blockchain_audit.routes import blockchain_audit_api
     from blockchain_audit.blockchain_engine import BlockchainEngine
     import blockchain_audit.routes as blockchain_routes_module
@@ -6633,16 +6488,16 @@ try:
     blockchain_eng = BlockchainEngine(db=db)
     blockchain_routes_module.blockchain_engine = blockchain_eng
     
-    api_router.include_router(blockchain_audit_api, prefix="")
+    ctx.include(blockchain_audit_api)
     logger.info("✓ Blockchain Audit loaded - Immutable records, Digital signatures, Tamper-proof trail")
-    
-except Exception as e:
-    logger.warning(f"Blockchain Audit not loaded: {e}")
+
 
 # ============================================================================
 # BROADCAST CONTROL (Phase 4)
 # ============================================================================
-try:
+
+@subsystems.subsystem("broadcast_control", paths=["/api/broadcast"])
+def load_broadcast_control(ctx):
     from broadcast_control.routes import broadcast_control_api
     from broadcast_control.broadcast_engine import BroadcastEngine
     import broadcast_routes_module
@@ -6650,16 +6505,16 @@ try:
     broadcast_eng = BroadcastEngine(db=db)
     broadcast_routes_module.broadcast_engine = broadcast_eng
     
-    api_router.include_router(broadcast_control_api, prefix="")
+    ctx.include(broadcast_control_api)
     logger.info("✓ Broadcast Control loaded - Multi-camera, Graphics overlays, Sponsor management")
-    
-except Exception as e:
-    logger.warning(f"Broadcast Control not loaded: {e}")
+
 
 # ============================================================================
 # PROFESSIONAL CV ANALYTICS (Elite System)
 # ============================================================================
-try:
+
+@subsystems.subsystem("pro_cv", paths=["/api/pro-cv"])
+def load_pro_cv_analytics(ctx):
     from pro_cv_analytics.routes import pro_cv_api
     from pro_cv_analytics.analytics_engine import ProfessionalCVEngine
     import pro_cv_analytics.routes as pro_cv_routes_module
@@ -6667,16 +6522,16 @@ try:
     pro_cv_eng = ProfessionalCVEngine(db=db)
     pro_cv_routes_module.cv_engine = pro_cv_eng
     
-    api_router.include_router(pro_cv_api, prefix="")
+    ctx.include(pro_cv_api)
     logger.info("✓ Professional CV Analytics loaded - Elite strike/ground/defense analysis (Jabbr/DeepStrike grade)")
-    
-except Exception as e:
-    logger.warning(f"Professional CV Analytics not loaded: {e}")
+
 
 # ============================================================================
 # SOCIAL MEDIA INTEGRATION (Phase 5)
 # ============================================================================
-try:
+
+@subsystems.subsystem("social_media", paths=["/api/social"])
+def load_social_media(ctx):
     from social_media.routes import social_media_api
     from social_media.social_engine import SocialMediaEngine
     import social_media.routes as social_routes_module
@@ -6684,16 +6539,16 @@ try:
     social_eng = SocialMediaEngine(db=db)
     social_routes_module.social_engine = social_eng
     
-    api_router.include_router(social_media_api, prefix="")
+    ctx.include(social_media_api)
     logger.info("✓ Social Media Integration loaded - Auto-post to Twitter/Instagram")
-    
-except Exception as e:
-    logger.warning(f"Social Media Integration not loaded: {e}")
+
 
 # ============================================================================
 # BRANDING & THEMES (Phase 7)
 # ============================================================================
-try:
+
+@subsystems.subsystem("branding", paths=["/api/branding"])
+def load_branding_themes(ctx):
     from branding_themes.routes import branding_api
     from branding_themes.theme_engine import ThemeEngine
     import branding_themes.routes as branding_routes_module
@@ -6701,16 +6556,16 @@ try:
     theme_eng = ThemeEngine(db=db)
     branding_routes_module.theme_engine = theme_eng
     
-    api_router.include_router(branding_api, prefix="")
+    ctx.include(branding_api)
     logger.info("✓ Branding & Themes loaded - Custom themes, logo management, CSS generation")
-    
-except Exception as e:
-    logger.warning(f"Branding & Themes not loaded: {e}")
+
 
 # ============================================================================
 # REAL-TIME CV SYSTEM (Professional Computer Vision)
 # ============================================================================
-try:
+
+@subsystems.subsystem("realtime_cv", paths=["/api/realtime-cv", "/api/cv-data"])
+def load_realtime_cv(ctx):
     from realtime_cv.routes import router as realtime_cv_api
     from realtime_cv.data_routes import router as cv_data_api
     import realtime_cv.routes as cv_routes_module
@@ -6723,19 +6578,19 @@ try:
     cv_data_routes_module.init_data_collector(db=db)
     
     # Include both routers
-    app.include_router(realtime_cv_api)
-    app.include_router(cv_data_api)
+    ctx.include_app(realtime_cv_api)
+    ctx.include_app(cv_data_api)
     
     logger.info("✓ Real-Time CV System loaded - MediaPipe + YOLO for live video analysis")
     logger.info("✓ CV Data Collection loaded - Training dataset management (GitHub/Kaggle)")
-    
-except Exception as e:
-    logger.warning(f"Real-Time CV System not loaded: {e}")
+
 
 # ============================================================================
 # STAT ENGINE (Production-Grade Statistics Aggregation)
 # ============================================================================
-try:
+
+@subsystems.subsystem("stat_engine", paths=["/api/stats"])
+def load_stat_engine(ctx):
     from stat_engine.routes import router as stat_engine_api
     import stat_engine.routes as stat_routes_module
     
@@ -6743,7 +6598,7 @@ try:
     stat_routes_module.init_stat_engine(db=db)
     
     # Include router
-    app.include_router(stat_engine_api)
+    ctx.include_app(stat_engine_api)
     
     logger.info("✓ Stat Engine loaded - Round/Fight/Career statistics aggregation")
     logger.info("  - Event Reader (READ-ONLY from events table)")
@@ -6751,43 +6606,84 @@ try:
     logger.info("  - Fight Stats Aggregator (per-fight totals)")
     logger.info("  - Career Stats Aggregator (lifetime metrics)")
     logger.info("  - Scheduler (manual/round-locked/post-fight/nightly triggers)")
+    logger.info("  - Post-fight aggregation queued on fight finalization")
+
+
+async def aggregate_finalized_fight(bout_id: str, payload: dict):
+    """Finalization job: post-fight and career aggregation"""
+    if not await subsystems.ensure("stat_engine"):
+        raise RuntimeError("Stat Engine not loaded")
+    import stat_engine.routes as stat_routes_module
     
-except Exception as e:
-    logger.warning(f"Stat Engine not loaded: {e}")
+    scheduler = stat_routes_module.scheduler
+    job = await scheduler.trigger_fight_aggregation(bout_id, trigger="post_fight")
+    if job.status == "failed":
+        raise RuntimeError("; ".join(job.errors))
+    for fighter_id in await stat_routes_module.event_reader.get_fight_fighters(bout_id):
+        job = await scheduler.trigger_career_aggregation(fighter_id, trigger="post_fight")
+        if job.status == "failed":
+            raise RuntimeError("; ".join(job.errors))
+
+
+# The job loads the stat engine when it runs, so it stays registered in lazy mode
+if subsystems.is_enabled("stat_engine"):
+    finalizer.jobs.register("stat_aggregation", aggregate_finalized_fight)
+
+
+# ============================================================================
+# STATS ROLLUPS (shared by organization, sport and public stats pages)
+# ============================================================================
+
+def schedule_stats_rollups(ctx):
+    """Refresh the shared rollups in the background while a consumer is loaded"""
+    import stats_rollups
+    
+    ctx.on_startup(stats_rollups.rollups.start)
+    ctx.on_shutdown(stats_rollups.rollups.close)
+
 
 # ============================================================================
 # PUBLIC STATS ROUTES (Public-facing statistics pages)
 # ============================================================================
-try:
+
+@subsystems.subsystem("public_stats", paths=["/api/cards", "/api/fights", "/api/fighters"])
+def load_public_stats(ctx):
     from public_stats_routes import router as public_stats_api
     import public_stats_routes as public_stats_module
     
     # Initialize public stats routes
     public_stats_module.init_public_stats_routes(database=db)
+    schedule_stats_rollups(ctx)
     
     # Include router
-    app.include_router(public_stats_api)
+    ctx.include_app(public_stats_api)
     
     logger.info("✓ Public Stats Routes loaded - Public-facing event/fight/fighter pages")
     logger.info("  - GET /api/events (list all events with fight counts)")
     logger.info("  - GET /api/fights/:fight_id/stats (fight detail page data)")
     logger.info("  - GET /api/fighters/:fighter_id/stats (fighter profile data)")
-    
-except Exception as e:
-    logger.warning(f"Public Stats Routes not loaded: {e}")
+
 
 # ============================================================================
 # TAPOLOGY SCRAPER (Web scraping for MMA data)
 # ============================================================================
-try:
+
+@subsystems.subsystem("tapology", paths=["/api/scraper"])
+def load_tapology_scraper(ctx):
     from tapology_scraper.routes import router as scraper_api
     import tapology_scraper.routes as scraper_module
     
     # Initialize scraper with database
     scraper_module.init_tapology_scraper(database=db)
     
+    async def shutdown_tapology_scraper():
+        if scraper_module.scraper is not None:
+            await scraper_module.scraper.close()
+    
+    ctx.on_shutdown(shutdown_tapology_scraper)
+    
     # Include router
-    app.include_router(scraper_api)
+    ctx.include_app(scraper_api)
     
     logger.info("✓ Tapology Scraper loaded - Web scraping for MMA data")
     logger.info("  - POST /api/scraper/events/recent (scrape recent events)")
@@ -6795,14 +6691,14 @@ try:
     logger.info("  - POST /api/scraper/event/{id} (scrape event details)")
     logger.info("  - GET /api/scraper/status (scraping statistics)")
     logger.info("  - GET /api/scraper/fighters/search (search scraped fighters)")
-    
-except Exception as e:
-    logger.warning(f"Tapology Scraper not loaded: {e}")
+
 
 # ============================================================================
 # STATS OVERLAY API (Low-latency broadcast overlays)
 # ============================================================================
-try:
+
+@subsystems.subsystem("stats_overlay", paths=["/api/overlay"])
+def load_stats_overlay(ctx):
     from stats_overlay.routes import router as overlay_api
     import stats_overlay.routes as overlay_module
     
@@ -6810,21 +6706,21 @@ try:
     overlay_module.init_stats_overlay(database=db)
     
     # Include router
-    app.include_router(overlay_api)
+    ctx.include_app(overlay_api)
     
     logger.info("✓ Stats Overlay API loaded - Low-latency broadcast overlays")
     logger.info("  - GET /api/overlay/live/{fight_id} (live stats with 60s window)")
     logger.info("  - GET /api/overlay/comparison/{fight_id} (red vs blue deltas)")
     logger.info("  - WS /api/overlay/ws/live/{fight_id} (WebSocket real-time)")
     logger.info("  - Performance: Sub-200ms latency, 1-second cache")
-    
-except Exception as e:
-    logger.warning(f"Stats Overlay API not loaded: {e}")
+
 
 # ============================================================================
 # VERIFICATION ENGINE (Multi-operator verification)
 # ============================================================================
-try:
+
+@subsystems.subsystem("verification", paths=["/api/verification"])
+def load_verification_engine(ctx):
     from verification_engine.routes import router as verification_api
     import verification_engine.routes as verification_module
     
@@ -6832,21 +6728,21 @@ try:
     verification_module.init_verification_engine(database=db)
     
     # Include router
-    app.include_router(verification_api)
+    ctx.include_app(verification_api)
     
     logger.info("✓ Verification Engine loaded - Multi-operator data verification")
     logger.info("  - POST /api/verification/verify/round/{fight_id}/{round} (verify round)")
     logger.info("  - POST /api/verification/verify/fight/{fight_id} (verify all rounds)")
     logger.info("  - GET /api/verification/discrepancies (get flagged issues)")
     logger.info("  - Thresholds: Sig strikes >10%, Takedowns >1")
-    
-except Exception as e:
-    logger.warning(f"Verification Engine not loaded: {e}")
+
 
 # ============================================================================
 # AI MERGE ENGINE (Colab/Kaggle AI event integration)
 # ============================================================================
-try:
+
+@subsystems.subsystem("ai_merge", paths=["/api/ai-merge"])
+def load_ai_merge_engine(ctx):
     from ai_merge_engine.routes import router as ai_merge_api
     import ai_merge_engine.routes as ai_merge_module
     
@@ -6854,21 +6750,21 @@ try:
     ai_merge_module.init_ai_merge_engine(database=db)
     
     # Include router
-    app.include_router(ai_merge_api)
+    ctx.include_app(ai_merge_api)
     
     logger.info("✓ AI Merge Engine loaded - Colab/Kaggle AI event integration")
     logger.info("  - POST /api/ai-merge/submit-batch (receive AI events from Colab)")
     logger.info("  - GET /api/ai-merge/review-items (get conflicts for review)")
     logger.info("  - POST /api/ai-merge/review-items/{id}/approve (approve resolution)")
     logger.info("  - Merge rules: tolerance-based auto-approval, conflict detection")
-    
-except Exception as e:
-    logger.warning(f"AI Merge Engine not loaded: {e}")
+
 
 # ============================================================================
 # POST-FIGHT REVIEW INTERFACE (Event editing and versioning)
 # ============================================================================
-try:
+
+@subsystems.subsystem("review", paths=["/api/review"])
+def load_review_interface(ctx):
     from review_interface.routes import router as review_api
     import review_interface.routes as review_module
     
@@ -6876,7 +6772,7 @@ try:
     review_module.init_review_interface(database=db)
     
     # Include router
-    app.include_router(review_api)
+    ctx.include_app(review_api)
     
     logger.info("✓ Post-Fight Review Interface loaded - Event editing and versioning")
     logger.info("  - GET /api/review/timeline/{fight_id} (get event timeline)")
@@ -6885,22 +6781,23 @@ try:
     logger.info("  - POST /api/review/events/merge (merge duplicate events)")
     logger.info("  - POST /api/review/fights/{id}/approve (approve and rerun stats)")
     logger.info("  - POST /api/review/videos/upload (upload fight video)")
-    
-except Exception as e:
-    logger.warning(f"Post-Fight Review Interface not loaded: {e}")
+
 
 # ============================================================================
 # ORGANIZATION STATS (Multi-org filtering)
 # ============================================================================
-try:
+
+@subsystems.subsystem("organization_stats", paths=["/api/organizations"])
+def load_organization_stats(ctx):
     from organization_stats.routes import router as org_stats_api
     import organization_stats.routes as org_stats_module
     
     # Initialize organization stats with database
     org_stats_module.init_organization_stats(database=db)
+    schedule_stats_rollups(ctx)
     
     # Include router
-    app.include_router(org_stats_api)
+    ctx.include_app(org_stats_api)
     
     logger.info("✓ Organization Stats loaded - Multi-org stat filtering")
     logger.info("  - GET /api/organizations/list (list all organizations)")
@@ -6908,22 +6805,23 @@ try:
     logger.info("  - GET /api/organizations/{id}/events (org events)")
     logger.info("  - GET /api/organizations/{id}/fighters (org fighters)")
     logger.info("  - All stats APIs support ?organization_id= query parameter")
-    
-except Exception as e:
-    logger.warning(f"Organization Stats not loaded: {e}")
+
 
 # ============================================================================
 # COMBAT SPORTS (Sport types and organizations)
 # ============================================================================
-try:
+
+@subsystems.subsystem("combat_sports", paths=["/api/sports"])
+def load_combat_sports(ctx):
     from combat_sports.routes import router as combat_sports_api
     import combat_sports.routes as combat_sports_module
     
     # Initialize combat sports with database
     combat_sports_module.init_combat_sports(database=db)
+    schedule_stats_rollups(ctx)
     
     # Include router
-    app.include_router(combat_sports_api)
+    ctx.include_app(combat_sports_api)
     
     logger.info("✓ Combat Sports loaded - Multi-sport support")
     logger.info("  - GET /api/sports/types (list sport types: MMA, Boxing, BKFC, etc.)")
@@ -6931,57 +6829,71 @@ try:
     logger.info("  - GET /api/sports/stats/summary (sport-filtered stats)")
     logger.info("  - Sports: MMA, Boxing, Dirty Boxing, BKFC, Karate Combat, Other")
     logger.info("  - All stats APIs support ?sport_type= and ?organization_id= parameters")
-    
-except Exception as e:
-    logger.warning(f"Combat Sports not loaded: {e}")
+
 
 # ============================================================================
 # DATABASE MANAGEMENT (Production Models & Indexes)
 # ============================================================================
-try:
+
+@subsystems.subsystem("database", paths=["/api/database"])
+def load_database_management(ctx):
     from database.routes import router as database_api
     import database.routes as db_routes_module
-    from database.init_db import initialize_database
     
     # Initialize database routes
     db_routes_module.init_database_routes(db=db)
     
     # Include router
-    app.include_router(database_api)
+    ctx.include_app(database_api)
     
     logger.info("✓ Database Management loaded - Production schemas and indexes")
     logger.info("  - Fighters table with biographical data")
     logger.info("  - Events table with proper relations")
     logger.info("  - Round/Fight/Career stats tables")
     logger.info("  - 30+ optimized indexes for query performance")
-    
-except Exception as e:
-    logger.warning(f"Database Management not loaded: {e}")
+
 
 # Fan Scoring Routes
-try:
+@subsystems.subsystem("fan_scoring", paths=["/api/fan"])
+def load_fan_scoring(ctx):
     from fan_scoring.routes import router as fan_scoring_api, init_fan_routes
+    import fan_scoring.routes as fan_routes_module
     init_fan_routes(database=db)
-    app.include_router(fan_scoring_api)
+    ctx.include_app(fan_scoring_api)
+    
+    async def shutdown_fan_vote_ingest():
+        await fan_routes_module.ingestor.close()
+        await fan_routes_module.fan_board.close()
+    
+    async def release_fan_votes(bout_id: str):
+        # Write the bout's last votes before dropping its cached tallies
+        await fan_routes_module.ingestor.flush()
+        fan_routes_module.ingestor.release_bout(bout_id)
+    
+    ctx.on_startup(fan_routes_module.fan_board.start)
+    ctx.on_shutdown(shutdown_fan_vote_ingest)
+    finalizer.on_release(release_fan_votes)
+    
     logger.info("✓ Fan Scoring API loaded - QR code access, leaderboards, scorecards")
-except Exception as e:
-    logger.warning(f"Fan Scoring not loaded: {e}")
+
 
 # Scoring Service Routes (Modular scoring logic)
-try:
+@subsystems.subsystem("scoring_service", paths=["/api/scoring"])
+def load_scoring_service(ctx):
     from scoring_service.routes import router as scoring_service_api, init_scoring_routes
     init_scoring_routes(database=db)
-    app.include_router(scoring_service_api)
+    ctx.include_app(scoring_service_api)
     logger.info("✓ Scoring Service API loaded - modular scoring endpoints")
-except Exception as e:
-    logger.warning(f"Scoring Service not loaded: {e}")
+
 
 # ============================================================================
 # SUPABASE - Fight/Judgment Database Integration (v1)
 # ============================================================================
-try:
+
+@subsystems.subsystem("supabase", paths=["/api/v1/supabase"])
+def load_supabase(ctx):
     from supabase_routes import supabase_router
-    api_router.include_router(supabase_router)
+    ctx.include(supabase_router)
     logger.info("✓ Supabase Integration v1 loaded - Fight/Judgment storage")
     logger.info("  - POST /api/v1/supabase/fights (create fight)")
     logger.info("  - GET /api/v1/supabase/fights (list fights)")
@@ -6994,13 +6906,20 @@ try:
     logger.info("  - PUT /api/v1/supabase/judgments/{judgment_id} (update judgment)")
     logger.info("  - GET /api/v1/supabase/stats/fights (fight statistics)")
     logger.info("  - GET /api/v1/supabase/stats/judgments (judgment statistics)")
-except Exception as e:
-    logger.warning(f"Supabase Integration not loaded: {e}")
-    import traceback
-    logger.debug(traceback.format_exc())
 
-# Include the router in the main app
-app.include_router(api_router)
+
+@app.on_event("startup")
+async def startup_subsystems():
+    await subsystems.startup()
+
+
+@app.on_event("shutdown")
+async def shutdown_subsystems():
+    await subsystems.shutdown()
+
+
+# Include the router in the main app, then load eager subsystems
+subsystems.mount(api_router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -7023,10 +6942,20 @@ async def startup_databases():
         logger.info("✓ Supabase REST client initialized on startup")
     except Exception as e:
         logger.warning(f"Failed to initialize Supabase: {e}")
+    
+    # Cross-worker websocket fan-out (required when running >1 uvicorn worker)
+    if os.environ.get("BROADCAST_BUS", "local").lower() == "redis":
+        if await init_redis() is not None:
+            redis_available = True
+            ws_bus.attach_transport(RedisTransport())
+            logger.info(f"✓ Broadcast bus on Redis (worker {ws_bus.worker_id})")
+        else:
+            logger.warning("Broadcast bus: Redis unavailable, websocket fan-out is local to this worker")
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+    await ws_bus.detach_transport()
     
     # Close Redis
     if redis_available:
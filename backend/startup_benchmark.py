@@ -0,0 +1,136 @@
+"""
+Startup Benchmark - server.py Cold Start
+Times a cold `import server` and the app startup hooks in fresh interpreters,
+in lazy mode (subsystems mounted on first request) and eager mode (every
+enabled subsystem loaded up front), and reports per-subsystem import / init
+and startup milliseconds from the subsystem registry.
+
+    python startup_benchmark.py --runs 3
+    python startup_benchmark.py --isolated
+
+Eager per-subsystem times are in load order, so packages shared with an
+earlier subsystem are charged to that one; --isolated loads each subsystem
+alone in its own interpreter for its standalone cost.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).parent
+
+
+def measure_child():
+    """Runs inside the child interpreter: prints one JSON measurement"""
+    import logging
+    logging.disable(logging.WARNING)
+    
+    started = time.perf_counter()
+    import server
+    import_ms = (time.perf_counter() - started) * 1000
+    
+    async def lifespan():
+        begin = time.perf_counter()
+        await server.subsystems.startup()
+        startup_ms = (time.perf_counter() - begin) * 1000
+        await server.subsystems.shutdown()
+        return startup_ms
+    
+    startup_ms = asyncio.run(lifespan())
+    stats = server.subsystems.get_stats()
+    print(json.dumps({
+        "import_ms": round(import_ms, 2),
+        "startup_ms": round(startup_ms, 2),
+        "routes": len(server.app.router.routes),
+        "registry": stats
+    }))
+
+
+def run_child(env: Dict[str, str]) -> Dict:
+    child_env = {**os.environ, **env}
+    child_env.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    child_env.setdefault("DB_NAME", "startup_benchmark")
+    child_env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(BACKEND_DIR), child_env.get("PYTHONPATH")]))
+    out = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--child"],
+        env=child_env, cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def summarize(runs: List[Dict]) -> Dict:
+    last = runs[-1]
+    return {
+        "import_ms": {
+            "median": round(statistics.median(r["import_ms"] for r in runs), 2),
+            "min": min(r["import_ms"] for r in runs),
+            "max": max(r["import_ms"] for r in runs)
+        },
+        "startup_ms": round(statistics.median(r["startup_ms"] for r in runs), 2),
+        "routes": last["routes"],
+        "subsystems_loaded": last["registry"]["loaded"],
+        "subsystems_failed": last["registry"]["failed"]
+    }
+
+
+def run_benchmark(runs: int = 3, isolated: bool = False, subsystems: Optional[str] = None) -> Dict:
+    allowlist = {"SUBSYSTEMS": subsystems} if subsystems else {}
+    lazy = [run_child({**allowlist, "SUBSYSTEMS_LAZY": "true"}) for _ in range(runs)]
+    eager = [run_child({**allowlist, "SUBSYSTEMS_LAZY": "false"}) for _ in range(runs)]
+    
+    per_subsystem = {
+        s["name"]: {
+            "state": s["state"],
+            "import_ms": s["import_ms"],
+            "startup_ms": s["startup_ms"],
+            "routes": s["routes"],
+            "error": s["error"]
+        }
+        for s in eager[-1]["registry"]["subsystems"]
+        if s["state"] != "disabled"
+    }
+    
+    if isolated:
+        for name, entry in per_subsystem.items():
+            alone = run_child({"SUBSYSTEMS": name, "SUBSYSTEMS_LAZY": "false"})
+            entry["isolated_import_ms"] = next(
+                s["import_ms"] for s in alone["registry"]["subsystems"] if s["name"] == name
+            )
+    
+    lazy_summary = summarize(lazy)
+    eager_summary = summarize(eager)
+    return {
+        "runs": runs,
+        "python": sys.version.split()[0],
+        "lazy": lazy_summary,
+        "eager": eager_summary,
+        "import_saved_ms": round(eager_summary["import_ms"]["median"] - lazy_summary["import_ms"]["median"], 2),
+        "subsystems": dict(sorted(per_subsystem.items(), key=lambda kv: -(kv[1]["import_ms"] or 0)))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="server.py cold start benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per mode")
+    parser.add_argument("--isolated", action="store_true", help="Also load each subsystem alone")
+    parser.add_argument("--subsystems", help="SUBSYSTEMS allowlist to benchmark (default: all)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child:
+        measure_child()
+        return
+    
+    result = run_benchmark(args.runs, args.isolated, args.subsystems)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,9 @@ Real-time stats updates for overlay clients.
 import asyncio
 import json
 import logging
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 from fastapi import WebSocket, WebSocketDisconnect
+from broadcast_bus import BroadcastBus, ws_bus
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +17,14 @@ logger = logging.getLogger(__name__)
 class OverlayWebSocketManager:
     """Manages WebSocket connections for live overlay updates"""
     
-    def __init__(self):
-        # fight_id -> set of websockets
+    NAMESPACE = "overlay"
+    
+    def __init__(self, bus: Optional[BroadcastBus] = None):
+        # fight_id -> set of websockets (this worker only)
         self.connections: Dict[str, Set[WebSocket]] = {}
         self.update_interval = 1.0  # 1 second updates
+        self.bus = bus or ws_bus
+        self.bus.register(self.NAMESPACE, self._deliver_local)
     
     async def connect(self, websocket: WebSocket, fight_id: str):
         """Register new WebSocket connection"""
@@ -29,12 +34,14 @@ class OverlayWebSocketManager:
             self.connections[fight_id] = set()
         
         self.connections[fight_id].add(websocket)
+        self.bus.join(self.NAMESPACE, fight_id)
         logger.info(f"WebSocket connected for fight {fight_id}. Total connections: {len(self.connections[fight_id])}")
     
     def disconnect(self, websocket: WebSocket, fight_id: str):
         """Unregister WebSocket connection"""
-        if fight_id in self.connections:
+        if websocket in self.connections.get(fight_id, ()):
             self.connections[fight_id].discard(websocket)
+            self.bus.leave(self.NAMESPACE, fight_id)
             
             if len(self.connections[fight_id]) == 0:
                 del self.connections[fight_id]
@@ -43,12 +50,16 @@ class OverlayWebSocketManager:
     
     async def broadcast_to_fight(self, fight_id: str, data: dict):
         """
-        Broadcast data to all connections for a specific fight
+        Broadcast data to all connections for a specific fight, on every worker
         
         Args:
             fight_id: Fight identifier
             data: Data to broadcast
         """
+        await self.bus.publish(self.NAMESPACE, fight_id, data)
+    
+    async def _deliver_local(self, fight_id: str, data: dict):
+        """Fan a bus message out to this worker's overlay clients"""
         if fight_id not in self.connections:
             return
         
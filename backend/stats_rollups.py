@@ -0,0 +1,330 @@
+"""
+Stats Rollups
+
+Precomputed browse-page counts in the stats_rollups collection, so the
+organization list, sport summaries and event cards are a single indexed read
+instead of a count / distinct per organization, sport or bout.
+
+Rows (one document each, deterministic _id):
+- kind "scope": total_events / total_fights / total_fighters for one scope:
+  "all", "org", "sport" or "org_sport"
+- kind "card": fight_stats grouped by (event_name, organization_id, sport_type)
+- kind "bout_card": events grouped by bout_id (the /cards fallback)
+
+A refresh is three aggregations ($group / $facet) written back with one
+bulk_write. Refreshes run every refresh_interval_sec in the background and
+are shared across workers through the meta document; readers refresh inline
+if the data they would serve is older than max_staleness_sec.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import ReplaceOne
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_SEC = float(os.environ.get("STATS_ROLLUP_REFRESH_SEC", "30"))
+MAX_STALENESS_SEC = float(os.environ.get("STATS_ROLLUP_MAX_STALENESS_SEC", "120"))
+
+STRIKE_EVENT_TYPES = [
+    "Head Kick", "Body Kick", "Low Kick", "Front Kick/Teep",
+    "Elbow", "Knee", "Hook", "Cross", "Jab", "Uppercut"
+]
+
+ScopeKey = Tuple[str, Optional[str], Optional[str]]
+
+
+def _distinct_fighters() -> Dict[str, Any]:
+    # Count of (scope, fighter) groups, ignoring events without a fighter
+    return {"$sum": {"$cond": [{"$ifNull": ["$_id.f", False]}, 1, 0]}}
+
+
+def events_scope_pipeline() -> List[Dict[str, Any]]:
+    """Event and distinct-fighter counts for every scope in one pass"""
+    return [
+        {"$group": {
+            "_id": {"o": "$organization_id", "s": "$sport_type", "f": "$fighter_id"},
+            "events": {"$sum": 1}
+        }},
+        {"$facet": {
+            "org_sport": [
+                {"$group": {"_id": {"o": "$_id.o", "s": "$_id.s"}, "events": {"$sum": "$events"},
+                            "fighters": _distinct_fighters()}}
+            ],
+            "org": [
+                {"$group": {"_id": {"o": "$_id.o", "f": "$_id.f"}, "events": {"$sum": "$events"}}},
+                {"$group": {"_id": {"o": "$_id.o"}, "events": {"$sum": "$events"}, "fighters": _distinct_fighters()}}
+            ],
+            "sport": [
+                {"$group": {"_id": {"s": "$_id.s", "f": "$_id.f"}, "events": {"$sum": "$events"}}},
+                {"$group": {"_id": {"s": "$_id.s"}, "events": {"$sum": "$events"}, "fighters": _distinct_fighters()}}
+            ],
+            "all": [
+                {"$group": {"_id": {"f": "$_id.f"}, "events": {"$sum": "$events"}}},
+                {"$group": {"_id": {}, "events": {"$sum": "$events"}, "fighters": _distinct_fighters()}}
+            ]
+        }}
+    ]
+
+
+def fight_stats_pipeline() -> List[Dict[str, Any]]:
+    """Fight counts per (org, sport) and card totals in one pass"""
+    return [
+        {"$facet": {
+            "scopes": [
+                {"$group": {"_id": {"o": "$organization_id", "s": "$sport_type"}, "fights": {"$sum": 1}}}
+            ],
+            "cards": [
+                {"$group": {
+                    "_id": {"e": "$event_name", "o": "$organization_id", "s": "$sport_type"},
+                    "fight_count": {"$sum": 1},
+                    "total_strikes": {"$sum": "$total_strikes"},
+                    "first_seen": {"$min": "$created_at"}
+                }}
+            ]
+        }}
+    ]
+
+
+def bout_cards_pipeline() -> List[Dict[str, Any]]:
+    """Per-bout strike totals and first timestamp from raw events"""
+    return [
+        {"$group": {
+            "_id": "$bout_id",
+            "total_strikes": {"$sum": {"$cond": [{"$in": ["$event_type", STRIKE_EVENT_TYPES]}, 1, 0]}},
+            "first_seen": {"$min": "$timestamp"}
+        }}
+    ]
+
+
+def build_scope_rows(event_facets: Dict[str, List[Dict]], fight_groups: List[Dict]) -> List[Dict[str, Any]]:
+    """Merge event and fight counts into one row per scope"""
+    rows: Dict[ScopeKey, Dict[str, Any]] = {}
+    
+    def row(scope: str, org: Optional[str], sport: Optional[str]) -> Dict[str, Any]:
+        key = (scope, org, sport)
+        if key not in rows:
+            rows[key] = {"kind": "scope", "scope": scope, "organization_id": org, "sport_type": sport,
+                         "total_events": 0, "total_fights": 0, "total_fighters": 0}
+        return rows[key]
+    
+    for scope in ("org_sport", "org", "sport", "all"):
+        for group in event_facets.get(scope, []):
+            target = row(scope, group["_id"].get("o"), group["_id"].get("s"))
+            target["total_events"] = group["events"]
+            target["total_fighters"] = group["fighters"]
+    
+    # Fight counts are additive, so the coarser scopes are sums
+    for group in fight_groups:
+        org, sport = group["_id"].get("o"), group["_id"].get("s")
+        for scope, key_org, key_sport in (("org_sport", org, sport), ("org", org, None),
+                                          ("sport", None, sport), ("all", None, None)):
+            row(scope, key_org, key_sport)["total_fights"] += group["fights"]
+    
+    return list(rows.values())
+
+
+def _row_id(row: Dict[str, Any]) -> str:
+    if row["kind"] == "scope":
+        return f"scope:{row['scope']}:{row['organization_id']}:{row['sport_type']}"
+    if row["kind"] == "card":
+        return f"card:{row['event_name']}:{row['organization_id']}:{row['sport_type']}"
+    return f"bout_card:{row['event_name']}"
+
+
+def _date_key(value: Any) -> Tuple[int, str]:
+    """Newest-first sort key tolerating datetimes, ISO strings and missing dates"""
+    if value is None:
+        return (0, "")
+    return (1, value.isoformat() if isinstance(value, datetime) else str(value))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class StatsRollups:
+    """Maintains and serves the stats_rollups collection"""
+    
+    def __init__(self, db, refresh_interval_sec: float = REFRESH_INTERVAL_SEC,
+                 max_staleness_sec: float = MAX_STALENESS_SEC):
+        """
+        Args:
+            db: Motor database handle
+            refresh_interval_sec: Background refresh period (shared by all workers)
+            max_staleness_sec: Oldest data a read will serve before refreshing inline
+        """
+        self.db = db
+        self.refresh_interval_sec = refresh_interval_sec
+        self.max_staleness_sec = max_staleness_sec
+        self.refreshed_at: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        self.stats = {
+            "refreshes": 0,
+            "refreshes_skipped": 0,
+            "inline_refreshes": 0,
+            "rows_written": 0
+        }
+    
+    def _age(self, now: datetime) -> float:
+        if self.refreshed_at is None:
+            return float("inf")
+        return (now - self.refreshed_at).total_seconds()
+    
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        Recompute all rollups unless another worker did so recently
+        
+        Returns:
+            True if this call recomputed the rollups
+        """
+        async with self._lock:
+            started = datetime.now(timezone.utc)
+            meta = await self.db.stats_rollups.find_one({"_id": "meta"})
+            if meta and meta.get("refreshed_at"):
+                self.refreshed_at = _as_utc(meta["refreshed_at"])
+            if not force and self._age(started) < self.refresh_interval_sec:
+                self.stats["refreshes_skipped"] += 1
+                return False
+            
+            event_result = await self.db.events.aggregate(events_scope_pipeline()).to_list(1)
+            fight_result = await self.db.fight_stats.aggregate(fight_stats_pipeline()).to_list(1)
+            bout_groups = await self.db.events.aggregate(bout_cards_pipeline()).to_list(None)
+            
+            event_facets = event_result[0] if event_result else {}
+            fight_facets = fight_result[0] if fight_result else {"scopes": [], "cards": []}
+            
+            rows = build_scope_rows(event_facets, fight_facets["scopes"])
+            for card in fight_facets["cards"]:
+                rows.append({
+                    "kind": "card",
+                    "event_name": card["_id"].get("e"),
+                    "organization_id": card["_id"].get("o"),
+                    "sport_type": card["_id"].get("s"),
+                    "fight_count": card["fight_count"],
+                    "total_strikes": card["total_strikes"],
+                    "event_date": card.get("first_seen")
+                })
+            for bout in bout_groups:
+                if bout["_id"] is None:
+                    continue
+                rows.append({
+                    "kind": "bout_card",
+                    "event_name": bout["_id"],
+                    "fight_count": 1,
+                    "total_strikes": bout["total_strikes"],
+                    "event_date": bout.get("first_seen")
+                })
+            
+            operations = [
+                ReplaceOne({"_id": _row_id(row)}, {**row, "_id": _row_id(row), "refreshed_at": started}, upsert=True)
+                for row in rows
+            ]
+            for i in range(0, len(operations), 1000):
+                await self.db.stats_rollups.bulk_write(operations[i:i + 1000], ordered=False)
+            
+            # Rows not rewritten by this (or a later) refresh no longer exist in the source
+            await self.db.stats_rollups.delete_many({"_id": {"$ne": "meta"}, "refreshed_at": {"$lt": started}})
+            await self.db.stats_rollups.replace_one(
+                {"_id": "meta"}, {"_id": "meta", "refreshed_at": started, "rows": len(rows)}, upsert=True
+            )
+            
+            self.refreshed_at = started
+            self.stats["refreshes"] += 1
+            self.stats["rows_written"] += len(rows)
+            return True
+    
+    async def ensure_fresh(self):
+        """Refresh inline if the served data would exceed max_staleness_sec"""
+        if self._age(datetime.now(timezone.utc)) >= self.max_staleness_sec:
+            self.stats["inline_refreshes"] += 1
+            await self.refresh()
+    
+    async def rows(self, query: Dict[str, Any], sort: Optional[List[Tuple[str, int]]] = None) -> List[Dict[str, Any]]:
+        """Rollup rows matching query"""
+        await self.ensure_fresh()
+        cursor = self.db.stats_rollups.find(query, {"_id": 0, "refreshed_at": 0, "kind": 0})
+        if sort:
+            cursor = cursor.sort(sort)
+        return await cursor.to_list(length=None)
+    
+    async def scope(self, organization_id: Optional[str] = None, sport_type: Optional[str] = None) -> Dict[str, int]:
+        """Totals for one org / sport / org+sport / everything"""
+        scope = ("org_sport" if organization_id and sport_type else
+                 "org" if organization_id else "sport" if sport_type else "all")
+        found = await self.rows({"kind": "scope", "scope": scope,
+                                 "organization_id": organization_id, "sport_type": sport_type})
+        row = found[0] if found else {}
+        return {
+            "total_events": row.get("total_events", 0),
+            "total_fights": row.get("total_fights", 0),
+            "total_fighters": row.get("total_fighters", 0)
+        }
+    
+    async def cards(self, sport_type: Optional[str] = None, organization_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Event cards for the filters, newest first, falling back to per-bout cards"""
+        query: Dict[str, Any] = {"kind": "card"}
+        if sport_type:
+            query["sport_type"] = sport_type
+        if organization_id:
+            query["organization_id"] = organization_id
+        
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for row in await self.rows(query):
+            card = merged.get(row["event_name"])
+            if card is None:
+                merged[row["event_name"]] = {k: row.get(k) for k in ("event_name", "fight_count", "total_strikes", "event_date")}
+                continue
+            card["fight_count"] += row["fight_count"]
+            card["total_strikes"] += row["total_strikes"]
+            if row.get("event_date") is not None and (card["event_date"] is None or row["event_date"] < card["event_date"]):
+                card["event_date"] = row["event_date"]
+        
+        cards = list(merged.values())
+        if not cards:
+            cards = await self.rows({"kind": "bout_card"})
+            cards = [{k: row.get(k) for k in ("event_name", "fight_count", "total_strikes", "event_date")} for row in cards]
+        return sorted(cards, key=lambda c: _date_key(c["event_date"]), reverse=True)
+    
+    def start(self):
+        """Start background refreshes on the running loop"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_loop())
+    
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Stats rollup refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval_sec)
+    
+    async def close(self):
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "refreshed_at": self.refreshed_at.isoformat() if self.refreshed_at else None,
+            "refresh_interval_sec": self.refresh_interval_sec,
+            "max_staleness_sec": self.max_staleness_sec
+        }
+
+
+# Shared by the organization, combat sports and public stats routes
+rollups: Optional[StatsRollups] = None
+
+
+def init_stats_rollups(database) -> StatsRollups:
+    """Create the shared StatsRollups on first call and return it"""
+    global rollups
+    if rollups is None or rollups.db is not database:
+        rollups = StatsRollups(database)
+    return rollups
@@ -1,23 +1,109 @@
 """
 Storage Manager - Manager Engine
+
+Filesystem-backed storage under storage_path:
+
+    recordings/<bout_id>/...   full-resolution camera recordings
+    highlights/<bout_id>/...   generated clips
+    replays/<bout_id>/...      replay packages
+    archives/<bout_id>/...     tar.gz fight bundles
+
+Usage is served from an incrementally maintained index (see usage_index).
+Writers that know the storage root call record_file / record_access; files
+that appear any other way are folded in by a periodic background reconcile.
+Index loading, reconciles, cleanup and archival run in a thread pool so the
+event loop never blocks on disk I/O.
 """
 
+import asyncio
 import logging
-from typing import List
+import os
+import shutil
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
 from .models import StorageStats, CleanupResult, ArchiveResult
+from .usage_index import UsageIndex, FileEntry
 
 logger = logging.getLogger(__name__)
 
+GB = 1024 ** 3
+
+# Categories eligible for cleanup, cheapest to regenerate first.
+# Recordings are only removed once the bout has an archive.
+CLEANUP_TIERS = ("replays", "highlights", "recordings")
+
+# Streaming chunk size for archival
+ARCHIVE_CHUNK_BYTES = 1024 * 1024
+
+RESCAN_INTERVAL_SEC = float(os.environ.get("STORAGE_RESCAN_INTERVAL_SEC", "300"))
+
 
 class StorageManagerEngine:
     """Manage storage for fight recordings"""
     
-    def __init__(self, storage_path: str = "/var/fight-storage"):
+    def __init__(self, storage_path: str = "/var/fight-storage", max_workers: int = 2,
+                 high_watermark_pct: float = 80.0, low_watermark_pct: float = 70.0,
+                 rescan_interval_sec: float = RESCAN_INTERVAL_SEC):
+        """
+        Args:
+            storage_path: Storage root
+            max_workers: Threads for index loading / cleanup / archival
+            high_watermark_pct: Disk usage that triggers LRU eviction
+            low_watermark_pct: Disk usage LRU eviction stops at
+            rescan_interval_sec: Seconds between background reconciles (0 disables)
+        """
         self.storage_path = storage_path
-        
-        # Mock storage data
-        self.total_space_gb = 1000.0
-        self.used_space_gb = 750.0
+        self.high_watermark_pct = high_watermark_pct
+        self.low_watermark_pct = low_watermark_pct
+        self.rescan_interval_sec = rescan_interval_sec
+        self.index = UsageIndex(storage_path)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="storage")
+        self._rescan_task: Optional[asyncio.Task] = None
+    
+    async def load_index(self):
+        """Load (or build) the usage index off the event loop"""
+        if not self.index.loaded:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, self.index.load)
+    
+    async def reconcile(self) -> Dict[str, int]:
+        """Fold in files written or removed without record_file"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.index.reconcile)
+    
+    async def _index_loop(self):
+        try:
+            await self.load_index()
+        except Exception as e:
+            logger.error(f"Usage index load failed: {e}")
+        while self.rescan_interval_sec > 0:
+            await asyncio.sleep(self.rescan_interval_sec)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.error(f"Usage index reconcile failed: {e}")
+    
+    def start(self):
+        """Load the index in the background, then reconcile it periodically"""
+        if self._rescan_task is None or self._rescan_task.done():
+            self._rescan_task = asyncio.get_running_loop().create_task(self._index_loop())
+    
+    def _disk_usage(self):
+        """shutil.disk_usage of the storage root (or its nearest existing parent)"""
+        path = self.storage_path
+        while not os.path.exists(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        return shutil.disk_usage(path)
+    
+    def _used_percentage(self) -> float:
+        usage = self._disk_usage()
+        return (usage.used / usage.total) * 100 if usage.total else 0.0
     
     def get_status(self) -> StorageStats:
         """
@@ -26,8 +112,9 @@ class StorageManagerEngine:
         Returns:
             StorageStats
         """
-        free_space = self.total_space_gb - self.used_space_gb
-        used_pct = (self.used_space_gb / self.total_space_gb) * 100
+        usage = self._disk_usage()
+        category_bytes = self.index.category_bytes()
+        used_pct = (usage.used / usage.total) * 100 if usage.total else 0.0
         
         # Determine alert level
         if used_pct >= 90:
@@ -38,20 +125,88 @@ class StorageManagerEngine:
             alert_level = "normal"
         
         stats = StorageStats(
-            total_space_gb=self.total_space_gb,
-            used_space_gb=self.used_space_gb,
-            free_space_gb=free_space,
+            total_space_gb=usage.total / GB,
+            used_space_gb=usage.used / GB,
+            free_space_gb=usage.free / GB,
             used_percentage=used_pct,
             alert_level=alert_level,
-            recordings_gb=500.0,
-            highlights_gb=150.0,
-            replays_gb=50.0,
-            archives_gb=50.0
+            recordings_gb=category_bytes["recordings"] / GB,
+            highlights_gb=category_bytes["highlights"] / GB,
+            replays_gb=category_bytes["replays"] / GB,
+            archives_gb=category_bytes["archives"] / GB,
+            file_count=len(self.index.entries)
         )
         
         logger.info(f"Storage status: {used_pct:.1f}% used ({alert_level})")
         return stats
     
+    def record_file(self, path: str) -> Optional[FileEntry]:
+        """
+        Register a file written under the storage root
+        
+        Args:
+            path: Absolute path or path relative to storage_path
+        """
+        return self.index.record_file(self._relative(path))
+    
+    def record_access(self, path: str):
+        """Mark a file as recently used (LRU cleanup tier)"""
+        self.index.record_access(self._relative(path))
+    
+    def _relative(self, path: str) -> str:
+        if os.path.isabs(path):
+            return os.path.relpath(path, self.storage_path)
+        return path
+    
+    def _archived_bouts(self) -> set:
+        return {e.bout_id for e in self.index.iter_category("archives") if e.bout_id}
+    
+    def _delete(self, entries: List[FileEntry], result: CleanupResult) -> int:
+        freed = 0
+        for entry in entries:
+            try:
+                os.remove(os.path.join(self.storage_path, entry.path))
+            except FileNotFoundError:
+                pass  # Already gone; drop it from the index anyway
+            except OSError as e:
+                result.errors.append(f"{entry.path}: {e}")
+                continue
+            self.index.record_delete(entry.path)
+            freed += entry.size
+            result.files_deleted += 1
+        return freed
+    
+    def _cleanup(self, days: int) -> CleanupResult:
+        """Tiered cleanup (runs in the thread pool)"""
+        result = CleanupResult(files_deleted=0, space_freed_gb=0.0)
+        cutoff = time.time() - days * 86400
+        archived = self._archived_bouts()
+        
+        def eligible(category: str) -> List[FileEntry]:
+            entries = list(self.index.iter_category(category))
+            if category == "recordings":
+                entries = [e for e in entries if e.bout_id in archived]
+            return entries
+        
+        # Tier 1: age - anything not touched for `days`
+        freed = 0
+        for category in CLEANUP_TIERS:
+            expired = [e for e in eligible(category) if max(e.mtime, e.last_access) < cutoff]
+            freed += self._delete(expired, result)
+        
+        # Tier 2: LRU - only while the disk is over the high watermark
+        if self._used_percentage() >= self.high_watermark_pct:
+            for category in CLEANUP_TIERS:
+                for entry in sorted(eligible(category), key=lambda e: e.last_access):
+                    if self._used_percentage() <= self.low_watermark_pct:
+                        break
+                    freed += self._delete([entry], result)
+                    result.lru_evicted += 1
+        
+        result.space_freed_gb = freed / GB
+        result.bytes_freed = freed
+        return result
+    
     async def cleanup_expired(self, days: int = 7) -> CleanupResult:
         """
         Delete expired clips and recordings
@@ -62,19 +217,41 @@ class StorageManagerEngine:
         Returns:
             CleanupResult
         """
-        # Mock cleanup
-        files_deleted = 42
-        space_freed = 50.0  # GB
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, self._cleanup, days)
+        
+        logger.info(f"Cleanup complete: {result.files_deleted} files, {result.space_freed_gb:.3f}GB freed")
+        return result
+    
+    def _archive(self, bout_id: str) -> ArchiveResult:
+        """Stream a bout's files into archives/<bout_id>/ (runs in the thread pool)"""
+        entries = self.index.files_for_bout(bout_id, categories=("recordings", "highlights", "replays"))
+        if not entries:
+            raise ValueError(f"No files stored for bout {bout_id}")
         
-        self.used_space_gb -= space_freed
+        archive_dir = os.path.join(self.storage_path, "archives", bout_id)
+        os.makedirs(archive_dir, exist_ok=True)
+        name = f"{bout_id}_{datetime.now().strftime('%Y%m%dT%H%M%S')}.tar.gz"
+        final_path = os.path.join(archive_dir, name)
+        partial_path = final_path + ".partial"
         
-        result = CleanupResult(
-            files_deleted=files_deleted,
-            space_freed_gb=space_freed
-        )
+        # tarfile copies each member in fixed-size blocks, so recordings are
+        # never read into memory whole
+        with open(partial_path, "wb", buffering=ARCHIVE_CHUNK_BYTES) as raw:
+            with tarfile.open(fileobj=raw, mode="w:gz", compresslevel=6) as tar:
+                for entry in entries:
+                    tar.add(os.path.join(self.storage_path, entry.path), arcname=entry.path, recursive=False)
+        os.replace(partial_path, final_path)
         
-        logger.info(f"Cleanup complete: {files_deleted} files, {space_freed}GB freed")
-        return result
+        archive_entry = self.index.record_file(os.path.relpath(final_path, self.storage_path))
+        return ArchiveResult(
+            bout_id=bout_id,
+            archive_url=f"file://{final_path}",
+            archive_size_gb=archive_entry.size / GB,
+            archive_path=final_path,
+            files_archived=len(entries),
+            source_size_gb=sum(e.size for e in entries) / GB
+        )
     
     async def archive_bout(self, bout_id: str) -> ArchiveResult:
         """
@@ -86,15 +263,27 @@ class StorageManagerEngine:
         Returns:
             ArchiveResult
         """
-        # Mock archival
-        archive_url = f"s3://fight-archives/{bout_id}/full_bundle.tar.gz"
-        archive_size = 25.0  # GB
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, self._archive, bout_id)
         
-        result = ArchiveResult(
-            bout_id=bout_id,
-            archive_url=archive_url,
-            archive_size_gb=archive_size
-        )
-        
-        logger.info(f"Bout {bout_id} archived: {archive_size}GB")
+        logger.info(f"Bout {bout_id} archived: {result.files_archived} files, {result.archive_size_gb:.3f}GB")
         return result
+    
+    def get_index_stats(self) -> Dict:
+        """Usage index bookkeeping"""
+        return {
+            "files": len(self.index.entries),
+            "bouts": len(self.index.bout_files),
+            "category_files": dict(self.index.counts),
+            "journal_ops": self.index.journal_ops,
+            "last_scan_seconds": self.index.last_scan_seconds
+        }
+    
+    def shutdown(self):
+        """Stop the background reconcile, flush the index snapshot and stop the thread pool"""
+        if self._rescan_task is not None:
+            self._rescan_task.cancel()
+            self._rescan_task = None
+        if self.index.loaded and os.path.isdir(self.storage_path):
+            self.index.compact()
+        self.executor.shutdown(wait=True)
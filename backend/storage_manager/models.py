@@ -3,7 +3,7 @@ Storage Manager - Data Models
 """
 
 from pydantic import BaseModel, Field
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -22,12 +22,15 @@ class StorageStats(BaseModel):
     highlights_gb: float = 0.0
     replays_gb: float = 0.0
     archives_gb: float = 0.0
+    file_count: int = 0
 
 
 class CleanupResult(BaseModel):
     """Cleanup operation result"""
     files_deleted: int
     space_freed_gb: float
+    bytes_freed: int = 0
+    lru_evicted: int = 0  # Files removed by the disk-pressure tier
     errors: List[str] = Field(default_factory=list)
     completed_at: datetime = Field(default_factory=datetime.now)
 
@@ -37,4 +40,7 @@ class ArchiveResult(BaseModel):
     bout_id: str
     archive_url: str
     archive_size_gb: float
+    archive_path: Optional[str] = None
+    files_archived: int = 0
+    source_size_gb: float = 0.0
     completed_at: datetime = Field(default_factory=datetime.now)
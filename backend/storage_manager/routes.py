@@ -22,6 +22,7 @@ def get_storage_engine():
 async def get_storage_status():
     """Get storage status"""
     engine = get_storage_engine()
+    await engine.load_index()
     return engine.get_status()
 
 @storage_manager_api.post("/cleanup", response_model=CleanupResult)
@@ -34,7 +35,24 @@ async def cleanup_storage(days: int = 7):
 async def archive_bout(bout_id: str):
     """Archive full fight bundle"""
     engine = get_storage_engine()
-    return await engine.archive_bout(bout_id)
+    try:
+        return await engine.archive_bout(bout_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@storage_manager_api.get("/index")
+async def get_index_stats():
+    """Usage index bookkeeping"""
+    engine = get_storage_engine()
+    await engine.load_index()
+    return engine.get_index_stats()
+
+@storage_manager_api.post("/index/reconcile")
+async def reconcile_index():
+    """Walk the storage root and fold in untracked changes"""
+    engine = get_storage_engine()
+    await engine.load_index()
+    return await engine.reconcile()
 
 @storage_manager_api.get("/health")
 async def health_check():
@@ -0,0 +1,285 @@
+"""
+Storage Manager - Usage Index
+
+Size/mtime/last-access per file under the storage root, with running byte
+totals per category. The index lives on disk as a JSON snapshot plus an
+append-only journal of changes, so status queries never walk the tree and
+a restart replays the journal instead of rescanning.
+
+Layout under the root: <category>/<bout_id>/<file>
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ("recordings", "highlights", "replays", "archives")
+
+SNAPSHOT_FILE = ".usage_index.json"
+JOURNAL_FILE = ".usage_journal.ndjson"
+
+
+class FileEntry:
+    """Indexed file"""
+    
+    __slots__ = ("path", "category", "bout_id", "size", "mtime", "last_access")
+    
+    def __init__(self, path: str, category: str, bout_id: Optional[str], size: int, mtime: float, last_access: float):
+        self.path = path
+        self.category = category
+        self.bout_id = bout_id
+        self.size = size
+        self.mtime = mtime
+        self.last_access = last_access
+    
+    def to_row(self) -> List:
+        return [self.size, self.mtime, self.last_access]
+
+
+def split_path(rel_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """(category, bout_id) for a root-relative path"""
+    parts = rel_path.replace(os.sep, "/").split("/")
+    category = parts[0] if parts[0] in CATEGORIES else None
+    bout_id = parts[1] if category and len(parts) > 2 else None
+    return category, bout_id
+
+
+class UsageIndex:
+    """Incrementally maintained per-category usage index"""
+    
+    def __init__(self, root: str, compact_every: int = 1000):
+        """
+        Args:
+            root: Storage root directory
+            compact_every: Journal entries before the snapshot is rewritten
+        """
+        self.root = root
+        self.compact_every = compact_every
+        self.entries: Dict[str, FileEntry] = {}
+        self.bout_files: Dict[str, set] = {}
+        self.totals: Dict[str, int] = {c: 0 for c in CATEGORIES}
+        self.counts: Dict[str, int] = {c: 0 for c in CATEGORIES}
+        self.journal_ops = 0
+        self.loaded = False
+        self.last_scan_seconds: Optional[float] = None
+        self._lock = threading.RLock()
+    
+    # ------------------------------------------------------------------
+    # In-memory mutation
+    # ------------------------------------------------------------------
+    
+    def _put(self, rel_path: str, size: int, mtime: float, last_access: float):
+        category, bout_id = split_path(rel_path)
+        if category is None:
+            return None
+        self._drop(rel_path)
+        entry = FileEntry(rel_path, category, bout_id, size, mtime, last_access)
+        self.entries[rel_path] = entry
+        self.totals[category] += size
+        self.counts[category] += 1
+        if bout_id:
+            self.bout_files.setdefault(bout_id, set()).add(rel_path)
+        return entry
+    
+    def _drop(self, rel_path: str) -> Optional[FileEntry]:
+        entry = self.entries.pop(rel_path, None)
+        if entry is None:
+            return None
+        self.totals[entry.category] -= entry.size
+        self.counts[entry.category] -= 1
+        if entry.bout_id:
+            paths = self.bout_files.get(entry.bout_id)
+            if paths is not None:
+                paths.discard(rel_path)
+                if not paths:
+                    del self.bout_files[entry.bout_id]
+        return entry
+    
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    
+    def load(self):
+        """Load snapshot + journal, or build the index with one scan"""
+        with self._lock:
+            if self.loaded:
+                return
+            snapshot_path = os.path.join(self.root, SNAPSHOT_FILE)
+            journal_path = os.path.join(self.root, JOURNAL_FILE)
+            
+            if os.path.exists(snapshot_path):
+                with open(snapshot_path) as f:
+                    for rel_path, (size, mtime, last_access) in json.load(f).get("files", {}).items():
+                        self._put(rel_path, size, mtime, last_access)
+                if os.path.exists(journal_path):
+                    self._replay(journal_path)
+            elif os.path.isdir(self.root):
+                self.scan()
+            self.loaded = True
+    
+    def _replay(self, journal_path: str):
+        with open(journal_path) as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    break  # Torn final write; everything before it is applied
+                if op["op"] == "put":
+                    self._put(op["path"], op["size"], op["mtime"], op["atime"])
+                else:
+                    self._drop(op["path"])
+                self.journal_ops += 1
+    
+    def scan(self):
+        """Full walk of the root; used only when no index exists yet"""
+        start = time.perf_counter()
+        with self._lock:
+            self.entries.clear()
+            self.bout_files.clear()
+            self.totals = {c: 0 for c in CATEGORIES}
+            self.counts = {c: 0 for c in CATEGORIES}
+            for category in CATEGORIES:
+                base = os.path.join(self.root, category)
+                for dirpath, _, filenames in os.walk(base):
+                    for name in filenames:
+                        full = os.path.join(dirpath, name)
+                        try:
+                            st = os.stat(full)
+                        except OSError:
+                            continue
+                        self._put(os.path.relpath(full, self.root), st.st_size, st.st_mtime, st.st_mtime)
+            self.compact()
+        self.last_scan_seconds = time.perf_counter() - start
+        logger.info(f"Usage index built: {len(self.entries)} files in {self.last_scan_seconds:.2f}s")
+    
+    def reconcile(self) -> Dict[str, int]:
+        """
+        Walk the root and fold in changes made without record_file
+        
+        Unlike scan(), LRU positions of unchanged files are kept.
+        """
+        start = time.perf_counter()
+        seen = set()
+        changes = {"added": 0, "updated": 0, "removed": 0}
+        for category in CATEGORIES:
+            for dirpath, _, filenames in os.walk(os.path.join(self.root, category)):
+                for name in filenames:
+                    full = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(full)
+                    except OSError:
+                        continue
+                    rel_path = os.path.relpath(full, self.root)
+                    seen.add(rel_path)
+                    with self._lock:
+                        self.load()
+                        entry = self.entries.get(rel_path)
+                        if entry is None:
+                            self._put(rel_path, st.st_size, st.st_mtime, st.st_mtime)
+                            changes["added"] += 1
+                        elif entry.size != st.st_size or entry.mtime != st.st_mtime:
+                            self._put(rel_path, st.st_size, st.st_mtime, max(st.st_mtime, entry.last_access))
+                            changes["updated"] += 1
+        
+        with self._lock:
+            self.load()
+            for rel_path in [p for p in self.entries if p not in seen]:
+                # Written after the walk passed its directory
+                if os.path.exists(os.path.join(self.root, rel_path)):
+                    continue
+                self._drop(rel_path)
+                changes["removed"] += 1
+            if any(changes.values()):
+                self.compact()
+        
+        self.last_scan_seconds = time.perf_counter() - start
+        if any(changes.values()):
+            logger.info(f"Usage index reconciled in {self.last_scan_seconds:.2f}s: {changes}")
+        return changes
+    
+    def _journal(self, op: Dict):
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, JOURNAL_FILE), "a") as f:
+            f.write(json.dumps(op) + "\n")
+        self.journal_ops += 1
+        if self.journal_ops >= self.compact_every:
+            self.compact()
+    
+    def compact(self):
+        """Rewrite the snapshot atomically and truncate the journal"""
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            snapshot_path = os.path.join(self.root, SNAPSHOT_FILE)
+            tmp_path = snapshot_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({
+                    "files": {path: entry.to_row() for path, entry in self.entries.items()},
+                    "written_at": time.time()
+                }, f)
+            os.replace(tmp_path, snapshot_path)
+            open(os.path.join(self.root, JOURNAL_FILE), "w").close()
+            self.journal_ops = 0
+    
+    # ------------------------------------------------------------------
+    # Public updates
+    # ------------------------------------------------------------------
+    
+    def record_file(self, rel_path: str) -> Optional[FileEntry]:
+        """Index (or re-index) a file after it was written"""
+        st = os.stat(os.path.join(self.root, rel_path))
+        with self._lock:
+            self.load()
+            previous = self.entries.get(rel_path)
+            last_access = max(st.st_mtime, previous.last_access) if previous else st.st_mtime
+            entry = self._put(rel_path, st.st_size, st.st_mtime, last_access)
+            if entry is not None:
+                self._journal({"op": "put", "path": rel_path, "size": st.st_size, "mtime": st.st_mtime, "atime": last_access})
+            return entry
+    
+    def record_access(self, rel_path: str, when: Optional[float] = None):
+        """Bump a file's LRU position (e.g. when a clip is served)"""
+        with self._lock:
+            self.load()
+            entry = self.entries.get(rel_path)
+            if entry is None:
+                return
+            entry.last_access = when if when is not None else time.time()
+            self._journal({"op": "put", "path": rel_path, "size": entry.size, "mtime": entry.mtime, "atime": entry.last_access})
+    
+    def record_delete(self, rel_path: str) -> Optional[FileEntry]:
+        with self._lock:
+            self.load()
+            entry = self._drop(rel_path)
+            if entry is not None:
+                self._journal({"op": "del", "path": rel_path})
+            return entry
+    
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    
+    def category_bytes(self) -> Dict[str, int]:
+        with self._lock:
+            self.load()
+            return dict(self.totals)
+    
+    def used_bytes(self) -> int:
+        with self._lock:
+            self.load()
+            return sum(self.totals.values())
+    
+    def files_for_bout(self, bout_id: str, categories=CATEGORIES) -> List[FileEntry]:
+        with self._lock:
+            self.load()
+            entries = [self.entries[p] for p in self.bout_files.get(bout_id, ())]
+        return sorted((e for e in entries if e.category in categories), key=lambda e: e.path)
+    
+    def iter_category(self, category: str) -> Iterator[FileEntry]:
+        with self._lock:
+            self.load()
+            return iter([e for e in self.entries.values() if e.category == category])
@@ -0,0 +1,310 @@
+"""
+Subsystem Registry
+
+The optional server subsystems (ICVSS, FJAI, CV router, stat engine, ...)
+register a loader here instead of being imported and wired while server.py
+is imported. A loader imports its package, builds its engine, mounts its
+routers and registers startup / shutdown hooks through a SubsystemContext.
+
+Configuration (environment):
+- SUBSYSTEMS: comma-separated allowlist of subsystem names ("all", the
+  default, enables every registered subsystem)
+- SUBSYSTEMS_DISABLED: comma-separated names removed from the allowlist
+- SUBSYSTEMS_LAZY: "true" (default) imports a subsystem and mounts its
+  routers on the first request under one of its path prefixes; "false"
+  loads every enabled subsystem while the app is built, as before
+
+Background work belongs in on_startup hooks: they run from the app's startup
+event, or straight after a lazy load once the app is running. Import / init
+and startup times are recorded per subsystem (GET /api/subsystems).
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Hook = Callable[[], Optional[Awaitable[Any]]]
+
+
+def _env_list(name: str, default: str = "") -> List[str]:
+    return [item.strip() for item in os.environ.get(name, default).split(",") if item.strip()]
+
+
+@dataclass
+class Subsystem:
+    """One optional subsystem and its load state"""
+    name: str
+    loader: Callable[["SubsystemContext"], Any]
+    paths: Tuple[str, ...] = ()
+    eager: bool = False
+    order: int = 0
+    
+    # registered -> loaded | failed, or disabled by configuration
+    state: str = "registered"
+    error: Optional[str] = None
+    import_ms: Optional[float] = None
+    startup_ms: Optional[float] = None
+    started: bool = False
+    api_routes: List[Any] = field(default_factory=list)
+    app_routes: List[Any] = field(default_factory=list)
+    startup_hooks: List[Hook] = field(default_factory=list)
+    shutdown_hooks: List[Hook] = field(default_factory=list)
+    
+    def matches(self, path: str) -> bool:
+        return any(path == p or path.startswith(p.rstrip("/") + "/") for p in self.paths)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "state": self.state,
+            "eager": self.eager,
+            "paths": list(self.paths),
+            "import_ms": self.import_ms,
+            "startup_ms": self.startup_ms,
+            "routes": len(self.api_routes) + len(self.app_routes),
+            "error": self.error
+        }
+
+
+class SubsystemContext:
+    """What a loader uses to wire its subsystem into the app"""
+    
+    def __init__(self, registry: "SubsystemRegistry", subsystem: Subsystem):
+        self.registry = registry
+        self.subsystem = subsystem
+    
+    def include(self, router, prefix: str = ""):
+        """Mount a router under the API prefix (/api + prefix)"""
+        self.subsystem.api_routes.extend(
+            self.registry._capture(router, self.registry.api_prefix + prefix)
+        )
+    
+    def include_app(self, router):
+        """Mount a router that carries its own /api/... prefix"""
+        self.subsystem.app_routes.extend(self.registry._capture(router, ""))
+    
+    def on_startup(self, fn: Hook):
+        self.subsystem.startup_hooks.append(fn)
+    
+    def on_shutdown(self, fn: Hook):
+        self.subsystem.shutdown_hooks.append(fn)
+
+
+async def _run_hook(fn: Hook):
+    result = fn()
+    if result is not None and hasattr(result, "__await__"):
+        await result
+
+
+class SubsystemRegistry:
+    """Registers, loads (eagerly or on first request) and starts subsystems"""
+    
+    def __init__(self, app, api_prefix: str = "/api"):
+        """
+        Args:
+            app: The FastAPI app subsystem routers are mounted on
+            api_prefix: Prefix of the core API router
+        """
+        self.app = app
+        self.api_prefix = api_prefix
+        self.subsystems: Dict[str, Subsystem] = {}
+        
+        allowed = _env_list("SUBSYSTEMS", "all")
+        self.allowed = None if "all" in allowed else set(allowed)
+        self.disabled = set(_env_list("SUBSYSTEMS_DISABLED"))
+        self.lazy = os.environ.get("SUBSYSTEMS_LAZY", "true").lower() in ("1", "true", "yes")
+        
+        # Index in app.router.routes where the core API router is mounted
+        self._core_index: Optional[int] = None
+        self.running = False
+    
+    def register(self, name: str, loader: Callable[[SubsystemContext], Any],
+                 paths: Sequence[str] = (), eager: bool = False) -> Subsystem:
+        """
+        Register a subsystem
+        
+        Args:
+            name: Name used by SUBSYSTEMS / SUBSYSTEMS_DISABLED
+            loader: loader(ctx), imports and wires the subsystem
+            paths: URL prefixes whose first request loads it
+            eager: Load while the app is built even in lazy mode
+        """
+        subsystem = Subsystem(name=name, loader=loader, paths=tuple(paths), eager=eager,
+                              order=len(self.subsystems))
+        if not self.is_enabled(name):
+            subsystem.state = "disabled"
+        self.subsystems[name] = subsystem
+        return subsystem
+    
+    def subsystem(self, name: str, paths: Sequence[str] = (), eager: bool = False):
+        """Decorator form of register()"""
+        def decorator(loader):
+            self.register(name, loader, paths=paths, eager=eager)
+            return loader
+        return decorator
+    
+    def is_enabled(self, name: str) -> bool:
+        if name in self.disabled:
+            return False
+        return self.allowed is None or name in self.allowed
+    
+    def mount(self, api_router):
+        """
+        Include the core API router and load the eager subsystems
+        
+        Routes keep the order they had when every block was wired inline:
+        app-level routers ahead of the core API, API-prefixed routers after it.
+        """
+        self._core_index = len(self.app.router.routes)
+        self.app.include_router(api_router)
+        for subsystem in self.subsystems.values():
+            if subsystem.state == "registered" and (subsystem.eager or not self.lazy):
+                self.load(subsystem.name)
+    
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    
+    def _capture(self, router, prefix: str) -> List[Any]:
+        routes = self.app.router.routes
+        before = len(routes)
+        self.app.include_router(router, prefix=prefix)
+        added = routes[before:]
+        del routes[before:]
+        return added
+    
+    def _arrange(self):
+        """Place subsystem routes around the core routes, in registration order"""
+        owned = {
+            id(route)
+            for s in self.subsystems.values()
+            for route in s.api_routes + s.app_routes
+        }
+        core = [route for route in self.app.router.routes if id(route) not in owned]
+        split = len(core) if self._core_index is None else min(self._core_index, len(core))
+        ordered = sorted(self.subsystems.values(), key=lambda s: s.order)
+        
+        self.app.router.routes[:] = (
+            core[:split]
+            + [route for s in ordered for route in s.app_routes]
+            + core[split:]
+            + [route for s in ordered for route in s.api_routes]
+        )
+        self.app.openapi_schema = None
+    
+    def load(self, name: str) -> Subsystem:
+        """Import and wire a subsystem (startup hooks are not run here)"""
+        subsystem = self.subsystems[name]
+        if subsystem.state != "registered":
+            return subsystem
+        
+        started = time.perf_counter()
+        try:
+            subsystem.loader(SubsystemContext(self, subsystem))
+            subsystem.state = "loaded"
+        except Exception as e:
+            subsystem.state = "failed"
+            subsystem.error = str(e)
+            subsystem.api_routes.clear()
+            subsystem.app_routes.clear()
+            subsystem.startup_hooks.clear()
+            subsystem.shutdown_hooks.clear()
+            logger.warning(f"{name} not loaded: {e}")
+        subsystem.import_ms = round((time.perf_counter() - started) * 1000, 2)
+        
+        if subsystem.state == "loaded":
+            self._arrange()
+            logger.info(f"  - {name} wired in {subsystem.import_ms:.1f}ms")
+        return subsystem
+    
+    async def _start(self, subsystem: Subsystem):
+        if subsystem.started or subsystem.state != "loaded":
+            return
+        subsystem.started = True
+        started = time.perf_counter()
+        for hook in subsystem.startup_hooks:
+            try:
+                await _run_hook(hook)
+            except Exception as e:
+                logger.error(f"{subsystem.name} startup hook failed: {e}")
+        subsystem.startup_ms = round((time.perf_counter() - started) * 1000, 2)
+    
+    async def ensure(self, name: str) -> bool:
+        """
+        Load a subsystem if needed, starting it when the app is running
+        
+        Returns:
+            True when the subsystem is loaded
+        """
+        subsystem = self.subsystems.get(name)
+        if subsystem is None:
+            return False
+        self.load(name)
+        if self.running:
+            await self._start(subsystem)
+        return subsystem.state == "loaded"
+    
+    async def ensure_path(self, path: str):
+        """Load every pending subsystem serving this path"""
+        if not path.startswith(self.api_prefix):
+            return
+        pending = [s for s in self.subsystems.values() if s.state == "registered" and s.matches(path)]
+        for subsystem in pending:
+            await self.ensure(subsystem.name)
+    
+    # ------------------------------------------------------------------
+    # Lifespan
+    # ------------------------------------------------------------------
+    
+    async def startup(self):
+        """Run the startup hooks of every loaded subsystem"""
+        self.running = True
+        for subsystem in sorted(self.subsystems.values(), key=lambda s: s.order):
+            await self._start(subsystem)
+    
+    async def shutdown(self):
+        """Run shutdown hooks, last loaded first"""
+        self.running = False
+        for subsystem in sorted(self.subsystems.values(), key=lambda s: s.order, reverse=True):
+            if subsystem.state != "loaded":
+                continue
+            for hook in subsystem.shutdown_hooks:
+                try:
+                    await _run_hook(hook)
+                except Exception as e:
+                    logger.error(f"{subsystem.name} shutdown hook failed: {e}")
+            subsystem.started = False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        subsystems = [s.to_dict() for s in sorted(self.subsystems.values(), key=lambda s: s.order)]
+        return {
+            "lazy": self.lazy,
+            "loaded": sum(1 for s in subsystems if s["state"] == "loaded"),
+            "failed": sum(1 for s in subsystems if s["state"] == "failed"),
+            "disabled": sum(1 for s in subsystems if s["state"] == "disabled"),
+            "pending": sum(1 for s in subsystems if s["state"] == "registered"),
+            "import_ms_total": round(sum(s["import_ms"] or 0 for s in subsystems), 2),
+            "subsystems": subsystems
+        }
+
+
+class LazyMountMiddleware:
+    """
+    ASGI middleware: loads the subsystem behind a path on its first request
+    
+    Starlette matches against app.router.routes on every request, so routes
+    mounted here are served by the same request that triggered the load.
+    """
+    
+    def __init__(self, app, registry: SubsystemRegistry):
+        self.app = app
+        self.registry = registry
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            await self.registry.ensure_path(scope.get("path", ""))
+        await self.app(scope, receive, send)
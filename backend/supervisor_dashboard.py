@@ -0,0 +1,144 @@
+"""
+Supervisor Dashboard Projection
+
+One supervisor_dashboard document per bout, kept current by the write paths
+instead of recounted on every refresh:
+- total_events / total_notes: $inc counters (total_events counts
+  unified_events, the only events whose write paths call events_changed;
+  a bout with only legacy events counts those instead, recounted on every
+  read since their write paths keep no counter)
+- rounds.<n>: locked / total judges, min / max scores and variance, copied
+  from the round_variance summary whenever a judge locks or unlocks
+
+Every change is pushed to the bout's supervisor websocket channel, so the
+dashboard doesn't poll. A bout without a projection (or with one that only
+holds increments) is seeded once from counts.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pymongo import ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+PublishFn = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+RoundSummariesFn = Callable[[str], Awaitable[List[Dict[str, Any]]]]
+
+ROUND_FIELDS = (
+    "locked_count", "judge_count", "fighter1_min", "fighter1_max",
+    "fighter2_min", "fighter2_max", "max_variance", "severity", "anomaly"
+)
+
+
+def round_entry(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """The dashboard's view of one round_variance summary"""
+    entry = {key: summary.get(key) for key in ROUND_FIELDS}
+    entry["round_num"] = summary.get("round_num")
+    return entry
+
+
+class SupervisorDashboard:
+    """Maintains, serves and pushes the supervisor_dashboard projection"""
+    
+    def __init__(self, db, round_summaries: Optional[RoundSummariesFn] = None,
+                 publish: Optional[PublishFn] = None):
+        """
+        Args:
+            db: Motor database handle
+            round_summaries: Coroutine returning a bout's round_variance
+                summaries (used when seeding)
+            publish: publish(bout_id, message) to the supervisor channel
+        """
+        self.db = db
+        self.round_summaries = round_summaries
+        self.publish = publish
+        
+        self.stats = {
+            "updates": 0,
+            "seeds": 0,
+            "pushes": 0,
+            "push_errors": 0
+        }
+    
+    async def seed(self, bout_id: str) -> Dict[str, Any]:
+        """Rebuild a bout's projection from counts"""
+        total_events = await self.db.unified_events.count_documents({"bout_id": bout_id})
+        legacy_events = False
+        if not total_events:
+            total_events = await self.db.events.count_documents({"boutId": bout_id})
+            legacy_events = total_events > 0
+        total_notes = await self.db.round_notes.count_documents({"bout_id": bout_id})
+        
+        if self.round_summaries is not None:
+            summaries = await self.round_summaries(bout_id)
+        else:
+            summaries = await self.db.round_variance.find({"bout_id": bout_id}, {"_id": 0}).to_list(100)
+        
+        doc = {
+            "bout_id": bout_id,
+            "total_events": total_events,
+            "total_notes": total_notes,
+            "rounds": {str(s["round_num"]): round_entry(s) for s in summaries},
+            "seeded": True,
+            "legacy_events": legacy_events,
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        }
+        await self.db.supervisor_dashboard.replace_one({"bout_id": bout_id}, doc, upsert=True)
+        self.stats["seeds"] += 1
+        return doc
+    
+    async def get(self, bout_id: str) -> Dict[str, Any]:
+        """The bout's projection (a point read once seeded, unless its events are legacy)"""
+        doc = await self.db.supervisor_dashboard.find_one({"bout_id": bout_id}, {"_id": 0})
+        if doc is None or not doc.get("seeded") or doc.get("legacy_events"):
+            doc = await self.seed(bout_id)
+        return doc
+    
+    async def _apply(self, bout_id: str, update: Dict[str, Any]):
+        update.setdefault("$set", {})["updated_at"] = datetime.now(timezone.utc).isoformat()
+        doc = await self.db.supervisor_dashboard.find_one_and_update(
+            {"bout_id": bout_id},
+            update,
+            upsert=True,
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+        if doc is None or not doc.get("seeded"):
+            # First write for this bout: the counters only hold this increment
+            doc = await self.seed(bout_id)
+        self.stats["updates"] += 1
+        await self._push(bout_id, doc)
+        return doc
+    
+    async def _push(self, bout_id: str, doc: Dict[str, Any]):
+        if self.publish is None:
+            return
+        try:
+            await self.publish(bout_id, {"type": "dashboard_update", "data": doc})
+            self.stats["pushes"] += 1
+        except Exception as e:
+            self.stats["push_errors"] += 1
+            logger.warning(f"Supervisor dashboard push failed for {bout_id}: {e}")
+    
+    async def events_changed(self, bout_id: str, count: int = 1):
+        """count events were logged (negative when deleted)"""
+        return await self._apply(bout_id, {"$inc": {"total_events": count}})
+    
+    async def notes_changed(self, bout_id: str, count: int = 1):
+        """count round notes were added (negative when deleted)"""
+        return await self._apply(bout_id, {"$inc": {"total_notes": count}})
+    
+    async def round_updated(self, summary: Dict[str, Any]):
+        """A round's judge variance summary changed"""
+        return await self._apply(
+            summary["bout_id"],
+            {"$set": {f"rounds.{summary['round_num']}": round_entry(summary)}}
+        )
+    
+    async def clear(self, bout_id: str):
+        await self.db.supervisor_dashboard.delete_one({"bout_id": bout_id})
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
@@ -0,0 +1,199 @@
+"""
+Tapology HTTP Client
+
+Async fetching with a per-host budget and an on-disk response cache.
+
+- HostBudget: at most max_concurrency requests in flight per host and at
+  least min_interval seconds between request starts.
+- ResponseCache: body + validators (ETag / Last-Modified) on disk, keyed by
+  URL. Entries younger than fresh_for_sec are served without a request;
+  older ones are revalidated with a conditional GET and a 304 reuses the
+  cached body.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class HostBudget:
+    """Concurrency and request-rate budget for one host"""
+    
+    def __init__(self, max_concurrency: int = 2, min_interval: float = 1.0):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.min_interval = min_interval
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            # Reserve the next start slot, then wait for it outside the lock
+            async with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self.min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+    
+    async def __aexit__(self, *exc):
+        self.semaphore.release()
+
+
+class ResponseCache:
+    """On-disk cache of response bodies and their validators"""
+    
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{key}.meta.json", self.cache_dir / f"{key}.body"
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Returns:
+            {"meta": {...}, "body": str} or None if not cached
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = body_path.read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return {"meta": meta, "body": body}
+    
+    def put(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]):
+        meta_path, body_path = self._paths(url)
+        # Body first, then meta: a meta file always points at a complete body
+        self._write_atomic(body_path, body)
+        self._write_atomic(meta_path, json.dumps({
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time()
+        }))
+    
+    def touch(self, url: str):
+        """Mark a cached entry as freshly revalidated"""
+        cached = self.get(url)
+        if cached is not None:
+            meta = cached["meta"]
+            meta["fetched_at"] = time.time()
+            self._write_atomic(self._paths(url)[0], json.dumps(meta))
+    
+    @staticmethod
+    def _write_atomic(path: Path, text: str):
+        tmp = path.with_suffix(path.suffix + ".partial")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+
+
+class CachingFetcher:
+    """httpx.AsyncClient wrapper applying HostBudget and ResponseCache"""
+    
+    def __init__(self, cache_dir: str, headers: Optional[Dict[str, str]] = None,
+                 max_concurrency_per_host: int = 2, min_interval: float = 1.0,
+                 fresh_for_sec: float = 3600, timeout: float = 15.0):
+        """
+        Args:
+            cache_dir: Directory for cached responses
+            headers: Default request headers
+            max_concurrency_per_host: Requests in flight per host
+            min_interval: Seconds between request starts per host
+            fresh_for_sec: Serve cached pages younger than this without revalidating
+            timeout: Request timeout in seconds
+        """
+        self.cache = ResponseCache(cache_dir)
+        self.headers = headers or {}
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.min_interval = min_interval
+        self.fresh_for_sec = fresh_for_sec
+        self.timeout = timeout
+        self.budgets: Dict[str, HostBudget] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        self.stats = {
+            "requests": 0,
+            "cache_fresh": 0,
+            "not_modified": 0,
+            "errors": 0
+        }
+    
+    def _budget(self, url: str) -> HostBudget:
+        host = urlsplit(url).netloc
+        budget = self.budgets.get(host)
+        if budget is None:
+            budget = HostBudget(self.max_concurrency_per_host, self.min_interval)
+            self.budgets[host] = budget
+        return budget
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(headers=self.headers, timeout=self.timeout, follow_redirects=True)
+        return self._client
+    
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        Get a page body, from cache when fresh or unchanged
+        
+        Returns:
+            Response text, or None on error
+        """
+        cached = await asyncio.to_thread(self.cache.get, url)
+        if cached is not None and time.time() - cached["meta"]["fetched_at"] < self.fresh_for_sec:
+            self.stats["cache_fresh"] += 1
+            return cached["body"]
+        
+        headers = {}
+        if cached is not None:
+            if cached["meta"].get("etag"):
+                headers["If-None-Match"] = cached["meta"]["etag"]
+            if cached["meta"].get("last_modified"):
+                headers["If-Modified-Since"] = cached["meta"]["last_modified"]
+        
+        try:
+            async with self._budget(url):
+                logger.info(f"Fetching: {url}")
+                self.stats["requests"] += 1
+                response = await self._get_client().get(url, headers=headers)
+            
+            if response.status_code == 304 and cached is not None:
+                self.stats["not_modified"] += 1
+                await asyncio.to_thread(self.cache.touch, url)
+                return cached["body"]
+            
+            response.raise_for_status()
+            body = response.text
+            await asyncio.to_thread(
+                self.cache.put, url, body,
+                response.headers.get("ETag"), response.headers.get("Last-Modified")
+            )
+            return body
+        
+        except httpx.HTTPError as e:
+            self.stats["errors"] += 1
+            logger.error(f"Request failed for {url}: {e}")
+            return None
+    
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,290 @@
+"""
+Tapology Page Parsers
+
+Pure HTML -> dict functions. They take the page text rather than a soup so
+they can run in a worker process (see TapologyScraper.parse_workers).
+"""
+
+import re
+import logging
+import uuid
+from typing import Dict, List, Optional, Any
+from datetime import datetime, timezone
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://www.tapology.com"
+
+EVENT_LINK = re.compile(r'/fightcenter/events/\d+')
+FIGHTER_LINK = re.compile(r'/fightcenter/fighters/\d+')
+BOUT_LINK = re.compile(r'/fightcenter/bouts/\d+')
+MONTH = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)')
+
+
+def _soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def parse_event_listings(html: str, limit: int, base_url: str = BASE_URL) -> List[Dict[str, Any]]:
+    """Parse event listings from a FightCenter page"""
+    soup = _soup(html)
+    
+    # Find event containers (this selector may need adjustment based on actual HTML)
+    event_sections = soup.find_all('div', class_='fightcenterEvent') or soup.find_all('section', attrs={'data-name': True})
+    
+    # Fallback: look for event links
+    if not event_sections:
+        event_links = soup.find_all('a', href=EVENT_LINK)
+        event_sections = [link.parent for link in event_links[:limit]]
+    
+    events = []
+    for section in event_sections[:limit]:
+        try:
+            event_data = _parse_event_listing(section, base_url)
+            if event_data:
+                events.append(event_data)
+        except Exception as e:
+            logger.error(f"Error parsing event section: {e}")
+    return events
+
+
+def _parse_event_listing(section, base_url: str) -> Optional[Dict[str, Any]]:
+    """Parse an event listing section"""
+    # Extract event link
+    event_link = section.find('a', href=EVENT_LINK)
+    if not event_link:
+        return None
+    
+    event_url = event_link.get('href')
+    event_id = re.search(r'/events/(\d+)', event_url)
+    event_id = event_id.group(1) if event_id else str(uuid.uuid4())
+    
+    # Extract date info
+    date_text = section.find(string=MONTH)
+    
+    # Extract promotion
+    promotion_img = section.find('img', alt=True)
+    
+    # Extract location
+    location_text = section.find(string=re.compile(r'[A-Z]{2}$'))  # Country code
+    
+    return {
+        'tapology_id': event_id,
+        'event_name': event_link.get_text(strip=True),
+        'event_date': parse_date(date_text) if date_text else None,
+        'promotion': promotion_img.get('alt', 'Unknown') if promotion_img else 'Unknown',
+        'location': location_text.strip() if location_text else 'Unknown',
+        'tapology_url': f"{base_url}{event_url}",
+        'scraped_at': datetime.now(timezone.utc).isoformat()
+    }
+
+
+def parse_event_details(html: str, event_id: str, base_url: str = BASE_URL) -> Dict[str, Any]:
+    """Parse an event page including its fight card"""
+    soup = _soup(html)
+    event_data = {
+        'tapology_id': event_id,
+        'fights': [],
+        'scraped_at': datetime.now(timezone.utc).isoformat()
+    }
+    
+    # Extract event title
+    title = soup.find('h1') or soup.find('h2', class_='eventPageTitle')
+    if title:
+        event_data['event_name'] = title.get_text(strip=True)
+    
+    # Extract fights from fight card
+    fight_rows = soup.find_all('li', class_='fightCard') or soup.find_all('div', class_='bout')
+    for fight_row in fight_rows:
+        fight_data = _parse_fight_row(fight_row, base_url)
+        if fight_data:
+            event_data['fights'].append(fight_data)
+    
+    return event_data
+
+
+def _parse_fight_row(fight_row, base_url: str) -> Optional[Dict[str, Any]]:
+    """Parse a fight row from an event page"""
+    try:
+        # Extract fighter links
+        fighter_links = fight_row.find_all('a', href=FIGHTER_LINK)
+        if len(fighter_links) < 2:
+            return None
+        
+        # Extract weight class
+        weight_text = fight_row.find(string=re.compile(r'\d{3}'))
+        
+        # Extract bout link
+        bout_link = fight_row.find('a', href=BOUT_LINK)
+        bout_id = None
+        if bout_link:
+            bout_match = re.search(r'/bouts/(\d+)', bout_link.get('href'))
+            bout_id = bout_match.group(1) if bout_match else None
+        
+        return {
+            'bout_id': bout_id,
+            'fighter1': extract_fighter_info(fighter_links[0], base_url),
+            'fighter2': extract_fighter_info(fighter_links[1], base_url),
+            'weight_class': weight_text.strip() if weight_text else None
+        }
+    
+    except Exception as e:
+        logger.error(f"Error parsing fight row: {e}")
+        return None
+
+
+def extract_fighter_info(fighter_link, base_url: str = BASE_URL) -> Dict[str, str]:
+    """Extract fighter information from a link"""
+    fighter_url = fighter_link.get('href', '')
+    
+    # Extract fighter ID
+    fighter_id_match = re.search(r'/fighters/(\d+)', fighter_url)
+    
+    return {
+        'tapology_id': fighter_id_match.group(1) if fighter_id_match else None,
+        'name': fighter_link.get_text(strip=True),
+        'tapology_url': f"{base_url}{fighter_url}" if fighter_url else None
+    }
+
+
+def parse_fighter_profile(html: str, fighter_id: str, url: str) -> Dict[str, Any]:
+    """Parse a fighter profile page"""
+    soup = _soup(html)
+    profile = {
+        'tapology_id': fighter_id,
+        'tapology_url': url,
+        'scraped_at': datetime.now(timezone.utc).isoformat()
+    }
+    
+    # Extract fighter name
+    name_elem = soup.find('h1', class_='fighterUpcomingHeader') or soup.find('h1')
+    if name_elem:
+        profile['name'] = name_elem.get_text(strip=True)
+    
+    # Extract record (W-L-D format)
+    record_elem = soup.find(string=re.compile(r'\d+-\d+-\d+'))
+    if record_elem:
+        profile['record'] = record_elem.strip()
+    
+    # Extract additional details
+    for detail in soup.find_all('span', class_='fighterInfo'):
+        text = detail.get_text(strip=True)
+        
+        if 'Nickname' in text:
+            profile['nickname'] = text.replace('Nickname:', '').strip()
+        elif 'Age' in text:
+            age_match = re.search(r'(\d+)', text)
+            if age_match:
+                profile['age'] = int(age_match.group(1))
+        elif 'Weight Class' in text or 'Division' in text:
+            profile['weight_class'] = text.split(':')[-1].strip()
+        elif 'Height' in text:
+            profile['height'] = text.split(':')[-1].strip()
+        elif 'Reach' in text:
+            profile['reach'] = text.split(':')[-1].strip()
+        elif 'Stance' in text:
+            profile['stance'] = text.split(':')[-1].strip().lower()
+    
+    return profile
+
+
+def parse_bout_details(html: str, bout_id: str, url: str, base_url: str = BASE_URL) -> Dict[str, Any]:
+    """Parse a bout page including its result"""
+    soup = _soup(html)
+    bout_data = {
+        'tapology_id': bout_id,
+        'tapology_url': url,
+        'scraped_at': datetime.now(timezone.utc).isoformat()
+    }
+    
+    # Extract fighters
+    fighter_links = soup.find_all('a', href=FIGHTER_LINK)[:2]
+    if len(fighter_links) >= 2:
+        bout_data['fighter1'] = extract_fighter_info(fighter_links[0], base_url)
+        bout_data['fighter2'] = extract_fighter_info(fighter_links[1], base_url)
+    
+    # Extract result
+    result_elem = soup.find('div', class_='boutResult') or soup.find(string=re.compile(r'(def\.|defeated)'))
+    if result_elem:
+        result_text = result_elem.get_text(strip=True) if hasattr(result_elem, 'get_text') else result_elem
+        bout_data['result'] = parse_result(result_text)
+    
+    # Extract method and round
+    method_elem = soup.find(string=re.compile(r'(KO/TKO|Submission|Decision|DQ)'))
+    if method_elem:
+        bout_data['method'] = method_elem.strip()
+    
+    round_elem = soup.find(string=re.compile(r'Round \d+'))
+    if round_elem:
+        round_match = re.search(r'Round (\d+)', round_elem)
+        if round_match:
+            bout_data['round'] = int(round_match.group(1))
+    
+    return bout_data
+
+
+def parse_search_result(html: str) -> Optional[str]:
+    """First fighter ID on a search results page"""
+    fighter_link = _soup(html).find('a', href=FIGHTER_LINK)
+    if fighter_link:
+        match = re.search(r'/fighters/(\d+)', fighter_link.get('href'))
+        if match:
+            return match.group(1)
+    return None
+
+
+def parse_result(result_text: str) -> Dict[str, str]:
+    """Parse fight result text"""
+    result = {
+        'winner': None,
+        'method': None,
+        'round': None
+    }
+    
+    # Extract winner
+    if 'def.' in result_text or 'defeated' in result_text:
+        parts = re.split(r'def\.|defeated', result_text)
+        if len(parts) >= 2:
+            result['winner'] = parts[0].strip()
+    
+    # Extract method
+    methods = ['KO', 'TKO', 'Submission', 'Decision', 'DQ', 'NC']
+    for method in methods:
+        if method.lower() in result_text.lower():
+            result['method'] = method
+            break
+    
+    # Extract round
+    round_match = re.search(r'R(\d+)', result_text)
+    if round_match:
+        result['round'] = int(round_match.group(1))
+    
+    return result
+
+
+def parse_date(date_text: str) -> Optional[str]:
+    """Parse date string to ISO format"""
+    # Handle various date formats from Tapology
+    # Example: "Nov 26, 2025" or "Friday, November 28"
+    date_text = date_text.strip()
+    
+    # Try common formats
+    for fmt in ['%b %d, %Y', '%B %d, %Y', '%b %d', '%B %d']:
+        try:
+            dt = datetime.strptime(date_text, fmt)
+            # If no year, assume current year
+            if fmt in ['%b %d', '%B %d']:
+                dt = dt.replace(year=datetime.now().year)
+            return dt.isoformat()
+        except ValueError:
+            continue
+    
+    return None
@@ -72,7 +72,8 @@ async def get_scraping_status():
         
         return {
             **scraping_status,
-            'statistics': stats
+            'statistics': stats,
+            'fetcher': scraper.get_stats() if scraper else None
         }
     
     except Exception as e:
@@ -112,6 +113,12 @@ async def scrape_recent_events(
     }
 
 
+def _transform_fighters(profiles) -> list:
+    """Transform scraped profiles, dropping ones that fail"""
+    docs = (DataTransformer.transform_fighter(profile) for profile in profiles)
+    return [doc for doc in docs if doc]
+
+
 async def _scrape_events_task(limit: int):
     """Background task for scraping events"""
     global scraping_status
@@ -121,7 +128,7 @@ async def _scrape_events_task(limit: int):
         scraping_status['current_operation'] = f"Scraping {limit} recent events"
         
         # Scrape events
-        events_data = scraper.scrape_recent_events(limit=limit)
+        events_data = await scraper.scrape_recent_events(limit=limit)
         
         # Transform and store
         results = {
@@ -131,6 +138,7 @@ async def _scrape_events_task(limit: int):
             'fighters_stored': 0
         }
         
+        fighter_ids = []
         for event_data in events_data:
             # Store event summary
             event_doc = DataTransformer.transform_event(event_data)
@@ -138,20 +146,19 @@ async def _scrape_events_task(limit: int):
                 await storage.store_event_summary(event_doc)
                 results['events_stored'] += 1
             
-            # Extract and store fighters from event
+            # Collect fighters from event
             for fight in event_data.get('fights', []):
                 for fighter_key in ['fighter1', 'fighter2']:
                     fighter_data = fight.get(fighter_key)
                     if fighter_data and fighter_data.get('tapology_id'):
-                        # Scrape full fighter profile
-                        fighter_profile = scraper.scrape_fighter_profile(fighter_data['tapology_id'])
-                        if fighter_profile:
-                            fighter_doc = DataTransformer.transform_fighter(fighter_profile)
-                            if fighter_doc:
-                                result = await storage.store_fighter(fighter_doc)
-                                if result.get('status') == 'inserted':
-                                    results['fighters_stored'] += 1
-                                results['fighters_discovered'] += 1
+                        fighter_ids.append(fighter_data['tapology_id'])
+        
+        # Scrape full fighter profiles concurrently, then store in one bulk write
+        fighter_docs = _transform_fighters(await scraper.scrape_fighter_profiles(fighter_ids))
+        if fighter_docs:
+            stored = await storage.store_fighters_batch(fighter_docs)
+            results['fighters_stored'] = stored['inserted']
+            results['fighters_discovered'] = len(fighter_docs)
         
         scraping_status['last_result'] = results
         scraping_status['last_run'] = datetime.now(timezone.utc).isoformat()
@@ -188,12 +195,12 @@ async def scrape_fighter(fighter_identifier: str):
             fighter_id = fighter_identifier
         else:
             # Search for fighter by name
-            fighter_id = scraper.search_fighter(fighter_identifier)
+            fighter_id = await scraper.search_fighter(fighter_identifier)
             if not fighter_id:
                 raise HTTPException(status_code=404, detail=f"Fighter '{fighter_identifier}' not found on Tapology")
         
         # Scrape fighter profile
-        fighter_data = scraper.scrape_fighter_profile(fighter_id)
+        fighter_data = await scraper.scrape_fighter_profile(fighter_id)
         
         if not fighter_data:
             raise HTTPException(status_code=404, detail="Failed to scrape fighter data")
@@ -240,7 +247,7 @@ async def scrape_event_details(event_id: str):
     
     try:
         # Scrape event
-        event_data = scraper.scrape_event_details(event_id)
+        event_data = await scraper.scrape_event_details(event_id)
         
         if not event_data:
             raise HTTPException(status_code=404, detail=f"Event {event_id} not found or failed to scrape")
@@ -250,22 +257,21 @@ async def scrape_event_details(event_id: str):
         if event_doc:
             await storage.store_event_summary(event_doc)
         
-        # Store fighters from fights
+        # Store fighters from fights that are not in the database yet
+        fighter_ids = [
+            fight[fighter_key]['tapology_id']
+            for fight in event_data.get('fights', [])
+            for fighter_key in ['fighter1', 'fighter2']
+            if fight.get(fighter_key) and fight[fighter_key].get('tapology_id')
+        ]
+        existing = await storage.existing_tapology_ids(fighter_ids)
+        missing = [fid for fid in fighter_ids if fid not in existing]
+        
         fighters_stored = 0
-        for fight in event_data.get('fights', []):
-            for fighter_key in ['fighter1', 'fighter2']:
-                fighter_data = fight.get(fighter_key)
-                if fighter_data and fighter_data.get('tapology_id'):
-                    # Check if fighter already exists
-                    existing = await storage.find_fighter_by_tapology_id(fighter_data['tapology_id'])
-                    if not existing:
-                        # Scrape full profile
-                        fighter_profile = scraper.scrape_fighter_profile(fighter_data['tapology_id'])
-                        if fighter_profile:
-                            fighter_doc = DataTransformer.transform_fighter(fighter_profile)
-                            if fighter_doc:
-                                await storage.store_fighter(fighter_doc)
-                                fighters_stored += 1
+        fighter_docs = _transform_fighters(await scraper.scrape_fighter_profiles(missing))
+        if fighter_docs:
+            stored = await storage.store_fighters_batch(fighter_docs)
+            fighters_stored = stored['inserted'] + stored['updated']
         
         return {
             "status": "success",
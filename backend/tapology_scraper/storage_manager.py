@@ -7,6 +7,8 @@ Handles storage of scraped data with duplicate detection and batch processing.
 import logging
 from typing import Dict, List, Optional, Any
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
@@ -28,67 +30,75 @@ class StorageManager:
         Returns:
             Result with status and fighter_id
         """
-        try:
-            # Check for existing fighter by Tapology ID
-            tapology_id = fighter_doc.get('tapology_id')
-            
-            if tapology_id:
-                existing = await self.db.fighters.find_one({'tapology_id': tapology_id})
-                
-                if existing:
-                    # Update existing fighter
-                    fighter_doc['updated_at'] = datetime.now(timezone.utc)
-                    await self.db.fighters.update_one(
-                        {'tapology_id': tapology_id},
-                        {'$set': fighter_doc}
-                    )
-                    
-                    logger.info(f"Updated existing fighter: {fighter_doc.get('name')}")
-                    return {
-                        'status': 'updated',
-                        'fighter_id': existing.get('id'),
-                        'tapology_id': tapology_id
-                    }
-            
-            # Check by name if no Tapology ID match
-            existing_by_name = await self.db.fighters.find_one({
-                'name': fighter_doc.get('name'),
-                'source': 'tapology'
-            })
-            
-            if existing_by_name:
-                # Update with Tapology ID if missing
-                if tapology_id and not existing_by_name.get('tapology_id'):
-                    fighter_doc['updated_at'] = datetime.now(timezone.utc)
-                    await self.db.fighters.update_one(
-                        {'id': existing_by_name['id']},
-                        {'$set': {'tapology_id': tapology_id, 'tapology_url': fighter_doc.get('tapology_url')}}
-                    )
-                
-                logger.info(f"Fighter already exists: {fighter_doc.get('name')}")
-                return {
-                    'status': 'exists',
-                    'fighter_id': existing_by_name.get('id'),
-                    'tapology_id': tapology_id
-                }
-            
-            # Insert new fighter
-            await self.db.fighters.insert_one(fighter_doc)
-            logger.info(f"Inserted new fighter: {fighter_doc.get('name')}")
-            
-            return {
-                'status': 'inserted',
-                'fighter_id': fighter_doc['id'],
-                'tapology_id': tapology_id
-            }
-            
-        except Exception as e:
-            logger.error(f"Error storing fighter: {e}")
-            return {'status': 'error', 'error': str(e)}
+        results = await self.store_fighters_batch([fighter_doc])
+        if results['fighters']:
+            return results['fighters'][0]
+        return {'status': 'error', 'error': results.get('error', 'not stored')}
+    
+    @staticmethod
+    def _fighter_key(fighter_doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Upsert filter: Tapology ID when known, otherwise name within Tapology fighters"""
+        tapology_id = fighter_doc.get('tapology_id')
+        if tapology_id:
+            return {'tapology_id': tapology_id}
+        return {'name': fighter_doc.get('name'), 'source': 'tapology'}
+    
+    async def _resolve_fighter_keys(self, docs: List[Dict[str, Any]]):
+        """
+        Upsert filter per fighter, matching existing rows in one query
+        
+        A fighter whose Tapology ID is not stored yet falls back to a Tapology
+        row with the same name and no Tapology ID; that row is updated in
+        place, which backfills the ID onto it.
+        
+        Returns:
+            (filters, {index: existing fighter id})
+        """
+        tapology_ids = [doc['tapology_id'] for doc in docs if doc.get('tapology_id')]
+        names = [doc.get('name') for doc in docs if doc.get('name')]
+        clauses = []
+        if tapology_ids:
+            clauses.append({'tapology_id': {'$in': tapology_ids}})
+        if names:
+            clauses.append({'name': {'$in': names}, 'source': 'tapology'})
+        
+        by_tapology_id: Dict[str, Dict[str, Any]] = {}
+        unlinked_by_name: Dict[str, Dict[str, Any]] = {}
+        if clauses:
+            cursor = self.db.fighters.find(
+                {'$or': clauses}, {'_id': 0, 'id': 1, 'tapology_id': 1, 'name': 1, 'source': 1}
+            )
+            async for row in cursor:
+                if row.get('tapology_id'):
+                    by_tapology_id[row['tapology_id']] = row
+                elif row.get('source') == 'tapology':
+                    unlinked_by_name.setdefault(row.get('name'), row)
+        
+        filters = []
+        existing: Dict[int, str] = {}
+        for i, doc in enumerate(docs):
+            tapology_id = doc.get('tapology_id')
+            row = by_tapology_id.get(tapology_id) if tapology_id else None
+            if row is None and tapology_id:
+                row = unlinked_by_name.pop(doc.get('name'), None)
+                if row is not None and row.get('id'):
+                    filters.append({'id': row['id']})
+                    existing[i] = row['id']
+                    continue
+            if row is None and not tapology_id:
+                row = unlinked_by_name.get(doc.get('name'))
+            filters.append(self._fighter_key(doc))
+            if row is not None and row.get('id'):
+                existing[i] = row['id']
+        return filters, existing
     
     async def store_fighters_batch(self, fighters: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Store multiple fighters with batch processing
+        Store multiple fighters with one bulk_write of upserts
+        
+        New fighters keep the generated id/created_at ($setOnInsert); existing
+        ones have their scraped fields refreshed. Duplicates within the batch
+        collapse to the last occurrence.
         
         Args:
             fighters: List of fighter documents
@@ -104,21 +114,79 @@ class StorageManager:
             'fighters': []
         }
         
+        # One upsert per fighter key
+        by_key: Dict[tuple, Dict[str, Any]] = {}
         for fighter in fighters:
-            result = await self.store_fighter(fighter)
-            results['fighters'].append(result)
-            
-            status = result.get('status')
-            if status == 'inserted':
+            by_key[tuple(sorted(self._fighter_key(fighter).items()))] = fighter
+        docs = list(by_key.values())
+        if not docs:
+            return results
+        
+        try:
+            filters, existing_by_index = await self._resolve_fighter_keys(docs)
+        except Exception as e:
+            logger.error(f"Error matching fighters batch: {e}")
+            results['errors'] = len(docs)
+            results['error'] = str(e)
+            return results
+        
+        now = datetime.now(timezone.utc)
+        operations = []
+        for doc, key in zip(docs, filters):
+            fields = {k: v for k, v in doc.items() if k not in ('id', 'created_at', '_id')}
+            fields['updated_at'] = now
+            operations.append(UpdateOne(
+                key,
+                {'$set': fields, '$setOnInsert': {'id': doc['id'], 'created_at': doc.get('created_at', now)}},
+                upsert=True
+            ))
+        
+        try:
+            write_result = await self.db.fighters.bulk_write(operations, ordered=False)
+            upserted = write_result.upserted_ids or {}
+            failed = set()
+        except BulkWriteError as e:
+            details = e.details or {}
+            upserted = {u['index']: u['_id'] for u in details.get('upserted', [])}
+            failed = {err['index'] for err in details.get('writeErrors', [])}
+            logger.error(f"Errors storing fighters batch: {len(failed)} failed")
+        except Exception as e:
+            logger.error(f"Error storing fighters batch: {e}")
+            results['errors'] = len(docs)
+            results['error'] = str(e)
+            return results
+        
+        # Existing fighters keep their original id; fetch any not matched up front
+        updated_docs = [
+            doc for i, doc in enumerate(docs)
+            if i not in upserted and i not in failed and i not in existing_by_index
+        ]
+        existing_ids: Dict[tuple, str] = {}
+        if updated_docs:
+            cursor = self.db.fighters.find(
+                {'$or': [self._fighter_key(doc) for doc in updated_docs]},
+                {'_id': 0, 'id': 1, 'tapology_id': 1, 'name': 1, 'source': 1}
+            )
+            async for existing in cursor:
+                if existing.get('tapology_id'):
+                    existing_ids[('tapology_id', existing['tapology_id'])] = existing.get('id')
+                existing_ids[('name', existing.get('name'))] = existing.get('id')
+        
+        for i, doc in enumerate(docs):
+            tapology_id = doc.get('tapology_id')
+            if i in failed:
+                results['errors'] += 1
+                results['fighters'].append({'status': 'error', 'tapology_id': tapology_id})
+            elif i in upserted:
                 results['inserted'] += 1
-            elif status == 'updated':
+                results['fighters'].append({'status': 'inserted', 'fighter_id': doc['id'], 'tapology_id': tapology_id})
+            else:
                 results['updated'] += 1
-            elif status == 'exists':
-                results['exists'] += 1
-            elif status == 'error':
-                results['errors'] += 1
+                key = ('tapology_id', tapology_id) if tapology_id else ('name', doc.get('name'))
+                fighter_id = existing_by_index.get(i) or existing_ids.get(key)
+                results['fighters'].append({'status': 'updated', 'fighter_id': fighter_id, 'tapology_id': tapology_id})
         
-        logger.info(f"Batch stored {len(fighters)} fighters: {results['inserted']} inserted, {results['updated']} updated, {results['exists']} existed")
+        logger.info(f"Batch stored {len(docs)} fighters: {results['inserted']} inserted, {results['updated']} updated, {results['errors']} errors")
         return results
     
     async def store_event_summary(self, event_doc: Dict[str, Any]) -> Dict[str, Any]:
@@ -241,6 +309,20 @@ class StorageManager:
             logger.error(f"Error finding fighter: {e}")
             return None
     
+    async def existing_tapology_ids(self, tapology_ids: List[str]) -> set:
+        """Which of the given Tapology IDs are already stored (one query)"""
+        if not tapology_ids:
+            return set()
+        try:
+            cursor = self.db.fighters.find(
+                {'tapology_id': {'$in': list(set(tapology_ids))}},
+                {'_id': 0, 'tapology_id': 1}
+            )
+            return {f['tapology_id'] async for f in cursor}
+        except Exception as e:
+            logger.error(f"Error finding fighters: {e}")
+            return set()
+    
     async def search_fighters(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Search for fighters by name
@@ -0,0 +1,899 @@
+"""
+Shared test fixtures
+
+fake_db is an in-memory stand-in for a Motor database. Collections are
+created on first access and evaluate the query operators, update operators
+and aggregation stages the backend uses, so tests assert on the stored
+documents instead of on per-test fakes.
+
+    async def test_something(fake_db):
+        fake_db.collection("events", [{"bout_id": "b1"}])
+        fake_db.collection("fan_scores", unique=("bout_id", "round_number", "voter_key"))
+        fake_db.fan_users.fail("bulk_write", ConnectionError("down"))
+
+Every collection records the methods called on it in .calls.
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DUPLICATE_KEY = 11000
+
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+# ============================================================================
+# Queries
+# ============================================================================
+
+def _clone(value):
+    # Documents only nest dicts and lists around immutable values
+    if isinstance(value, dict):
+        return {k: _clone(v) if isinstance(v, (dict, list)) else v for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone(v) if isinstance(v, (dict, list)) else v for v in value]
+    return value
+
+
+def get_path(doc: Any, path: str) -> Any:
+    """Value at a dotted path, MISSING if absent"""
+    if "." not in path and isinstance(doc, dict):
+        return doc.get(path, MISSING)
+    value = doc
+    for part in path.split("."):
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return MISSING
+    return value
+
+
+def set_path(doc: Dict[str, Any], path: str, value: Any):
+    *parents, key = path.split(".")
+    for parent in parents:
+        doc = doc.setdefault(parent, {})
+    doc[key] = value
+
+
+def unset_path(doc: Dict[str, Any], path: str):
+    *parents, key = path.split(".")
+    for parent in parents:
+        doc = doc.get(parent)
+        if not isinstance(doc, dict):
+            return
+    doc.pop(key, None)
+
+
+def _equals(value, expected) -> bool:
+    if value is MISSING:
+        return expected is None
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+    return value == expected
+
+
+def _compare(op):
+    def check(value, arg):
+        if value is MISSING or value is None:
+            return False
+        try:
+            return op(value, arg)
+        except TypeError:
+            return False
+    return check
+
+
+def _in(value, arg) -> bool:
+    if not isinstance(value, (list, dict)) and value is not MISSING:
+        try:
+            return value in _as_set(arg)
+        except TypeError:
+            pass
+    return any(_equals(value, a) for a in arg)
+
+
+_cache: Dict[tuple, tuple] = {}
+
+
+def _cached(kind, obj, build):
+    # Query and update arguments are reused across every document they are
+    # applied to; keep what was built from them, keyed by identity
+    key = (kind, id(obj))
+    cached = _cache.get(key)
+    if cached is None or cached[0] is not obj:
+        if len(_cache) > 256:
+            _cache.clear()
+        cached = _cache[key] = (obj, build(obj))
+    return cached[1]
+
+
+def _as_set(values) -> frozenset:
+    return _cached("set", values, frozenset)
+
+
+QUERY_OPERATORS = {
+    "$eq": _equals,
+    "$ne": lambda value, arg: not _equals(value, arg),
+    "$gt": _compare(lambda a, b: a > b),
+    "$gte": _compare(lambda a, b: a >= b),
+    "$lt": _compare(lambda a, b: a < b),
+    "$lte": _compare(lambda a, b: a <= b),
+    "$in": _in,
+    "$nin": lambda value, arg: not _in(value, arg),
+    "$exists": lambda value, arg: (value is not MISSING) == bool(arg),
+    "$not": lambda value, arg: not _match_value(value, arg),
+}
+
+
+def _is_operator_dict(cond) -> bool:
+    return isinstance(cond, dict) and bool(cond) and all(str(k).startswith("$") for k in cond)
+
+
+def _match_value(value, cond) -> bool:
+    if _is_operator_dict(cond):
+        return all(QUERY_OPERATORS[op](value, arg) for op, arg in cond.items())
+    return _equals(value, cond)
+
+
+def matches(doc: Dict[str, Any], query: Optional[Dict[str, Any]]) -> bool:
+    """Whether doc satisfies a Mongo query"""
+    for key, cond in (query or {}).items():
+        if key == "$and":
+            if not all(matches(doc, q) for q in cond):
+                return False
+        elif key == "$or":
+            if not any(matches(doc, q) for q in cond):
+                return False
+        elif key == "$nor":
+            if any(matches(doc, q) for q in cond):
+                return False
+        elif not _match_value(get_path(doc, key), cond):
+            return False
+    return True
+
+
+def project(doc: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Copy of doc with an inclusion or exclusion projection applied"""
+    doc = _clone(doc)
+    if not projection:
+        return doc
+    included = [k for k, v in projection.items() if v and k != "_id"]
+    if included:
+        result = {}
+        if projection.get("_id", 1) and "_id" in doc:
+            result["_id"] = doc["_id"]
+        for path in included:
+            value = get_path(doc, path)
+            if value is not MISSING:
+                set_path(result, path, value)
+        return result
+    for path, keep in projection.items():
+        if not keep:
+            unset_path(doc, path)
+    return doc
+
+
+def _sort_key(value):
+    # Missing and null sort first, as in Mongo
+    if value is MISSING or value is None:
+        return (0, 0)
+    return (1, value)
+
+
+def sort_docs(docs: List[Dict[str, Any]], keys) -> List[Dict[str, Any]]:
+    for field, direction in reversed(list(keys)):
+        docs = sorted(docs, key=lambda d: _sort_key(get_path(d, field)), reverse=direction < 0)
+    return docs
+
+
+def _sort_spec(key_or_list, direction=1):
+    if isinstance(key_or_list, (list, tuple)):
+        return list(key_or_list)
+    if isinstance(key_or_list, dict):
+        return list(key_or_list.items())
+    return [(key_or_list, direction)]
+
+
+# ============================================================================
+# Aggregation expressions and stages
+# ============================================================================
+
+def _truthy(value) -> bool:
+    return value is not MISSING and value is not None and value is not False and value != 0
+
+
+def _compile_all(args) -> list:
+    return [compile_expression(a) for a in (args if isinstance(args, list) else [args])]
+
+
+def _arith(fn):
+    def build(args):
+        parts = _compile_all(args)
+        def run(doc):
+            values = [_plain(part(doc)) for part in parts]
+            return None if any(v is None for v in values) else fn(*values)
+        return run
+    return build
+
+
+def _round(args):
+    value, places = (_compile_all(args) + [lambda doc: 0])[:2]
+    def run(doc):
+        number = _plain(value(doc))
+        return None if number is None else round(number, places(doc))
+    return run
+
+
+def _cond(args):
+    if isinstance(args, dict):
+        args = [args["if"], args["then"], args["else"]]
+    test, then, otherwise = _compile_all(args)
+    return lambda doc: then(doc) if _truthy(test(doc)) else otherwise(doc)
+
+
+def _if_null(args):
+    parts = _compile_all(args)
+    def run(doc):
+        for part in parts:
+            value = part(doc)
+            if value is not MISSING and value is not None:
+                return value
+        return None
+    return run
+
+
+def _pair(op):
+    def build(args):
+        left, right = _compile_all(args)
+        def run(doc):
+            a, b = _plain(left(doc)), _plain(right(doc))
+            try:
+                return op(a, b)
+            except TypeError:
+                return False
+        return run
+    return build
+
+
+def _logical(combine):
+    def build(args):
+        parts = _compile_all(args)
+        return lambda doc: combine(_truthy(part(doc)) for part in parts)
+    return build
+
+
+def _not(args):
+    part, = _compile_all(args)
+    return lambda doc: not _truthy(part(doc))
+
+
+def _size(args):
+    part, = _compile_all(args)
+    return lambda doc: len(part(doc))
+
+
+# Operator name -> builder taking the operator's arguments and returning doc -> value
+EXPRESSION_OPERATORS = {
+    "$eq": _pair(lambda a, b: a == b),
+    "$ne": _pair(lambda a, b: a != b),
+    "$gt": _pair(lambda a, b: a is not None and (b is None or a > b)),
+    "$gte": _pair(lambda a, b: a is not None and (b is None or a >= b)),
+    "$lt": _pair(lambda a, b: b is not None and (a is None or a < b)),
+    "$lte": _pair(lambda a, b: b is not None and (a is None or a <= b)),
+    "$in": _pair(lambda a, b: a in b),
+    "$and": _logical(all),
+    "$or": _logical(any),
+    "$not": _not,
+    "$cond": _cond,
+    "$ifNull": _if_null,
+    "$add": _arith(lambda *v: sum(v)),
+    "$subtract": _arith(lambda a, b: a - b),
+    "$multiply": _arith(lambda a, b: a * b),
+    "$divide": _arith(lambda a, b: a / b),
+    "$round": _round,
+    "$size": _size,
+    "$literal": lambda args: lambda doc: args,
+}
+
+
+def compile_expression(expr):
+    """Aggregation expression as a function of the document"""
+    if isinstance(expr, str) and expr[:1] == "$":
+        if expr == "$$NOW":
+            return lambda doc: datetime.now(timezone.utc)
+        if expr == "$$ROOT":
+            return lambda doc: doc
+        path = expr[1:]
+        return lambda doc: get_path(doc, path)
+    if isinstance(expr, list):
+        parts = [compile_expression(e) for e in expr]
+        return lambda doc: [part(doc) for part in parts]
+    if isinstance(expr, dict):
+        if len(expr) == 1:
+            op, args = next(iter(expr.items()))
+            if op.startswith("$"):
+                return EXPRESSION_OPERATORS[op](args)
+        parts = {k: compile_expression(v) for k, v in expr.items()}
+        return lambda doc: {k: _plain(part(doc)) for k, part in parts.items()}
+    return lambda doc: expr
+
+
+def evaluate(expr, doc):
+    """Evaluate an aggregation expression against doc"""
+    return compile_expression(expr)(doc)
+
+
+def _plain(value):
+    return None if value is MISSING else value
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _group(docs, spec):
+    group_key = compile_expression(spec["_id"])
+    accumulators = [
+        (field, compile_expression(next(iter(accumulator.values()))))
+        for field, accumulator in spec.items() if field != "_id"
+    ]
+    groups: Dict[Any, Dict[str, Any]] = {}
+    for doc in docs:
+        key = _plain(group_key(doc))
+        group = groups.setdefault(_freeze(key), {"_id": key, "__values": {}})
+        for field, value in accumulators:
+            group["__values"].setdefault(field, []).append(value(doc))
+    
+    results = []
+    for group in groups.values():
+        row = {"_id": group["_id"]}
+        for field, accumulator in spec.items():
+            if field == "_id":
+                continue
+            op = next(iter(accumulator))
+            values = group["__values"].get(field, [])
+            present = [v for v in values if v is not MISSING and v is not None]
+            if op == "$sum":
+                row[field] = sum(v for v in present if isinstance(v, (int, float)) and not isinstance(v, bool))
+            elif op == "$avg":
+                numbers = [v for v in present if isinstance(v, (int, float))]
+                row[field] = sum(numbers) / len(numbers) if numbers else None
+            elif op == "$min":
+                row[field] = min(present) if present else None
+            elif op == "$max":
+                row[field] = max(present) if present else None
+            elif op == "$first":
+                row[field] = _plain(values[0]) if values else None
+            elif op == "$last":
+                row[field] = _plain(values[-1]) if values else None
+            elif op == "$push":
+                row[field] = [_plain(v) for v in values]
+            elif op == "$addToSet":
+                row[field] = list({_freeze(v): v for v in present}.values())
+            else:
+                raise NotImplementedError(f"accumulator {op}")
+        results.append(row)
+    return results
+
+
+def run_pipeline(docs: List[Dict[str, Any]], pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Evaluate an aggregation pipeline over copies of docs"""
+    if pipeline and "$match" in pipeline[0]:
+        docs = [d for d in docs if matches(d, pipeline[0]["$match"])]
+        pipeline = pipeline[1:]
+    return _run_stages([_clone(d) for d in docs], pipeline)
+
+
+def _run_stages(docs: List[Dict[str, Any]], pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    for stage in pipeline:
+        (name, spec), = stage.items()
+        if name == "$match":
+            docs = [d for d in docs if matches(d, spec)]
+        elif name == "$group":
+            docs = _group(docs, spec)
+        elif name == "$facet":
+            docs = [{field: _run_stages(list(docs), sub) for field, sub in spec.items()}]
+        elif name == "$sort":
+            docs = sort_docs(docs, spec.items())
+        elif name == "$limit":
+            docs = docs[:spec]
+        elif name == "$skip":
+            docs = docs[spec:]
+        elif name == "$count":
+            docs = [{spec: len(docs)}] if docs else []
+        elif name in ("$set", "$addFields"):
+            fields = [(field, compile_expression(expr)) for field, expr in spec.items()]
+            for d in docs:
+                for field, value in fields:
+                    set_path(d, field, _plain(value(d)))
+        elif name == "$project":
+            docs = [
+                project(d, spec) if all(isinstance(v, (int, bool)) for v in spec.values())
+                else {k: _plain(evaluate(v if not isinstance(v, (int, bool)) else f"${k}", d)) for k, v in spec.items()}
+                for d in docs
+            ]
+        else:
+            raise NotImplementedError(f"stage {name}")
+    return docs
+
+
+# ============================================================================
+# Updates
+# ============================================================================
+
+def upsert_seed(query: Dict[str, Any]) -> Dict[str, Any]:
+    """The document an upsert starts from: the query's equality fields"""
+    doc: Dict[str, Any] = {}
+    for key, cond in query.items():
+        if key == "$and":
+            for part in cond:
+                doc.update(upsert_seed(part))
+        elif not key.startswith("$") and not _is_operator_dict(cond):
+            set_path(doc, key, _clone(cond))
+        elif _is_operator_dict(cond) and "$eq" in cond:
+            set_path(doc, key, _clone(cond["$eq"]))
+    return doc
+
+
+def apply_update(doc: Dict[str, Any], update, inserting: bool = False):
+    """Apply update operators (or a pipeline update) to doc in place"""
+    if isinstance(update, list):
+        for stage in update:
+            (name, spec), = stage.items()
+            if name in ("$set", "$addFields"):
+                fields = _cached("stage", spec, lambda spec: [
+                    (field, compile_expression(expr)) for field, expr in spec.items()
+                ])
+                # Expressions read the document as it was before the stage
+                snapshot = _clone(doc) if any("." in field for field in spec) else dict(doc)
+                for field, value in fields:
+                    set_path(doc, field, _plain(value(snapshot)))
+            elif name == "$unset":
+                for field in [spec] if isinstance(spec, str) else spec:
+                    unset_path(doc, field)
+            else:
+                raise NotImplementedError(f"pipeline update stage {name}")
+        return
+    
+    for op, fields in update.items():
+        for path, value in fields.items():
+            current = get_path(doc, path)
+            if op == "$set":
+                set_path(doc, path, _clone(value))
+            elif op == "$setOnInsert":
+                if inserting:
+                    set_path(doc, path, _clone(value))
+            elif op == "$inc":
+                set_path(doc, path, (0 if current is MISSING else current) + value)
+            elif op == "$unset":
+                unset_path(doc, path)
+            elif op in ("$push", "$addToSet"):
+                items = value["$each"] if isinstance(value, dict) and "$each" in value else [value]
+                target = [] if current is MISSING else current
+                for item in items:
+                    if op == "$push" or item not in target:
+                        target.append(_clone(item))
+                set_path(doc, path, target)
+            elif op == "$min":
+                if current is MISSING or value < current:
+                    set_path(doc, path, value)
+            elif op == "$max":
+                if current is MISSING or value > current:
+                    set_path(doc, path, value)
+            else:
+                raise NotImplementedError(f"update operator {op}")
+
+
+# ============================================================================
+# Cursor, collection, database
+# ============================================================================
+
+class FakeCursor:
+    """Motor-like cursor over already filtered and projected documents"""
+    
+    def __init__(self, docs: List[Dict[str, Any]]):
+        self.docs = docs
+    
+    def sort(self, key_or_list, direction=1):
+        self.docs = sort_docs(self.docs, _sort_spec(key_or_list, direction))
+        return self
+    
+    def skip(self, count: int):
+        self.docs = self.docs[count:]
+        return self
+    
+    def limit(self, count: int):
+        if count:
+            self.docs = self.docs[:count]
+        return self
+    
+    def batch_size(self, size: int):
+        return self
+    
+    async def to_list(self, length=None):
+        return self.docs if length is None else self.docs[:length]
+    
+    def __aiter__(self):
+        self._iter = iter(self.docs)
+        return self
+    
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _result(**fields):
+    return SimpleNamespace(**fields)
+
+
+class FakeCollection:
+    """
+    In-memory collection
+    
+    Args:
+        docs: Initial documents (each gets an _id, as on insert)
+        unique: Fields of a unique index, enforced on every write
+        partial: Partial filter of that index
+        delay: Seconds every call waits, to exercise concurrency
+    """
+    
+    def __init__(self, name: str = "", docs=None, unique=None, partial=None, delay: float = 0.0):
+        self.name = name
+        self.docs: List[Dict[str, Any]] = []
+        self.unique = tuple(unique) if unique else None
+        self.partial = partial or {}
+        self.delay = delay
+        self.calls: List[str] = []
+        self.indexes: List[Any] = []
+        self.on_find = None
+        self._failures: Dict[str, List[tuple]] = {}
+        self._index: Dict[tuple, Dict[str, Any]] = {}
+        self._ids: Dict[Any, Dict[str, Any]] = {}
+        for doc in docs or []:
+            doc = dict(doc)
+            doc.setdefault("_id", ObjectId())
+            self._store(doc)
+    
+    # ---- unique index ----
+    
+    def _key(self, doc) -> Optional[tuple]:
+        if self.unique is None or (self.partial and not matches(doc, self.partial)):
+            return None
+        return tuple(_freeze(_plain(get_path(doc, f))) for f in self.unique)
+    
+    def _conflicts(self, doc, current=None) -> bool:
+        if self._ids.get(_freeze(doc.get("_id"))) not in (None, current):
+            return True
+        key = self._key(doc)
+        return key is not None and self._index.get(key) not in (None, current)
+    
+    def _store(self, doc):
+        if self._conflicts(doc):
+            raise DuplicateKeyError(f"E11000 duplicate key in {self.name}", DUPLICATE_KEY)
+        self.docs.append(doc)
+        self._ids[_freeze(doc["_id"])] = doc
+        key = self._key(doc)
+        if key is not None:
+            self._index[key] = doc
+    
+    def _unstore(self, doc):
+        self.docs.remove(doc)
+        self._ids.pop(_freeze(doc["_id"]), None)
+        key = self._key(doc)
+        if key is not None and self._index.get(key) is doc:
+            del self._index[key]
+    
+    def _modify(self, doc, change):
+        """Apply change(copy) to doc, keeping the unique index; raises on a conflict"""
+        updated = _clone(doc)
+        change(updated)
+        if updated == doc:
+            return False
+        if self._conflicts(updated, current=doc):
+            raise DuplicateKeyError(f"E11000 duplicate key in {self.name}", DUPLICATE_KEY)
+        old_key = self._key(doc)
+        if old_key is not None and self._index.get(old_key) is doc:
+            del self._index[old_key]
+        doc.clear()
+        doc.update(updated)
+        key = self._key(doc)
+        if key is not None:
+            self._index[key] = doc
+        return True
+    
+    def _matching(self, query) -> List[Dict[str, Any]]:
+        query = query or {}
+        if self.unique and not self.partial and all(
+            f in query and not _is_operator_dict(query[f]) for f in self.unique
+        ):
+            doc = self._index.get(tuple(_freeze(query[f]) for f in self.unique))
+            return [doc] if doc is not None and matches(doc, query) else []
+        return [d for d in self.docs if matches(d, query)]
+    
+    def _first(self, query, sort=None):
+        found = self._matching(query)
+        if sort:
+            found = sort_docs(found, _sort_spec(sort))
+        return found[0] if found else None
+    
+    # ---- failure injection ----
+    
+    def fail(self, method: str, error: Optional[BaseException] = None, at=None):
+        """
+        Make the next call of method fail
+        
+        Args:
+            error: Raised before anything is written (default ConnectionError)
+            at: For insert_many / bulk_write: the operation index (or
+                indexes) that fail inside a BulkWriteError; the others are
+                written as an ordered / unordered write would
+        """
+        if at is not None:
+            at = {at} if isinstance(at, int) else set(at)
+        self._failures.setdefault(method, []).append((error, at))
+    
+    def _take_failure(self, method: str):
+        pending = self._failures.get(method)
+        return pending.pop(0) if pending else None
+    
+    async def _enter(self, method: str):
+        self.calls.append(method)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        failure = self._take_failure(method)
+        if failure is not None and failure[1] is None:
+            raise failure[0] or ConnectionError(f"{self.name}.{method} unavailable")
+        return failure[1] if failure is not None else set()
+    
+    # ---- reads ----
+    
+    def find(self, query=None, projection=None, sort=None):
+        self.calls.append("find")
+        if self.on_find:
+            hook, self.on_find = self.on_find, None
+            hook()
+        cursor = FakeCursor([project(d, projection) for d in self._matching(query)])
+        return cursor.sort(sort) if sort else cursor
+    
+    async def find_one(self, query=None, projection=None, sort=None, **kwargs):
+        await self._enter("find_one")
+        doc = self._first(query, sort)
+        return project(doc, projection) if doc is not None else None
+    
+    async def count_documents(self, query=None, **kwargs):
+        await self._enter("count_documents")
+        return len(self._matching(query))
+    
+    async def distinct(self, field, query=None):
+        await self._enter("distinct")
+        values = {}
+        for doc in self._matching(query):
+            value = get_path(doc, field)
+            for item in value if isinstance(value, list) else [value]:
+                if item is not MISSING:
+                    values[_freeze(item)] = item
+        return list(values.values())
+    
+    def aggregate(self, pipeline, **kwargs):
+        self.calls.append("aggregate")
+        return FakeCursor(run_pipeline(self.docs, pipeline))
+    
+    # ---- writes ----
+    
+    def _insert(self, doc):
+        doc.setdefault("_id", ObjectId())
+        self._store(_clone(doc))
+        return doc["_id"]
+    
+    async def insert_one(self, doc, **kwargs):
+        await self._enter("insert_one")
+        return _result(inserted_id=self._insert(doc))
+    
+    async def insert_many(self, docs, ordered=True, **kwargs):
+        fail_at = await self._enter("insert_many")
+        docs = list(docs)
+        for doc in docs:
+            doc.setdefault("_id", ObjectId())
+        inserted, errors = 0, []
+        for index, doc in enumerate(docs):
+            try:
+                if index in fail_at:
+                    raise RuntimeError("injected failure")
+                self._insert(doc)
+                inserted += 1
+            except (DuplicateKeyError, RuntimeError) as e:
+                code = DUPLICATE_KEY if isinstance(e, DuplicateKeyError) else 1
+                errors.append({"index": index, "code": code, "errmsg": str(e)})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": inserted, "nUpserted": 0, "nMatched": 0,
+                                  "nModified": 0, "nRemoved": 0, "upserted": [], "writeConcernErrors": []})
+        return _result(inserted_ids=[d["_id"] for d in docs])
+    
+    def _update(self, query, update, upsert=False, many=False, replace=False):
+        found = self._matching(query)
+        if not many:
+            found = found[:1]
+        if found:
+            if replace:
+                def change(doc):
+                    _id = doc["_id"]
+                    doc.clear()
+                    doc.update(_clone(update))
+                    doc["_id"] = _id
+            else:
+                def change(doc):
+                    apply_update(doc, update)
+            modified = sum(self._modify(doc, change) for doc in found)
+            return _result(matched_count=len(found), modified_count=modified, upserted_id=None)
+        if not upsert:
+            return _result(matched_count=0, modified_count=0, upserted_id=None)
+        
+        doc = upsert_seed(query)
+        if replace:
+            doc = {**({"_id": doc["_id"]} if "_id" in doc else {}), **_clone(update)}
+        else:
+            apply_update(doc, update, inserting=True)
+        doc.setdefault("_id", ObjectId())
+        self._store(doc)
+        return _result(matched_count=0, modified_count=0, upserted_id=doc["_id"])
+    
+    async def update_one(self, query, update, upsert=False, **kwargs):
+        await self._enter("update_one")
+        return self._update(query, update, upsert)
+    
+    async def update_many(self, query, update, upsert=False, **kwargs):
+        await self._enter("update_many")
+        return self._update(query, update, upsert, many=True)
+    
+    async def replace_one(self, query, replacement, upsert=False, **kwargs):
+        await self._enter("replace_one")
+        return self._update(query, replacement, upsert, replace=True)
+    
+    async def delete_one(self, query, **kwargs):
+        await self._enter("delete_one")
+        doc = self._first(query)
+        if doc is not None:
+            self._unstore(doc)
+        return _result(deleted_count=int(doc is not None))
+    
+    async def delete_many(self, query, **kwargs):
+        await self._enter("delete_many")
+        found = self._matching(query)
+        for doc in found:
+            self._unstore(doc)
+        return _result(deleted_count=len(found))
+    
+    async def _find_one_and(self, method, query, update, projection, sort, upsert, return_document, replace=False):
+        await self._enter(method)
+        doc = self._first(query, sort)
+        before = _clone(doc) if doc is not None else None
+        if doc is None:
+            if not upsert:
+                return None
+            result = self._update(query, update, upsert=True, replace=replace)
+            doc = next(d for d in self.docs if d["_id"] == result.upserted_id)
+        elif replace:
+            self._update({"_id": doc["_id"]}, update, replace=True)
+        else:
+            self._modify(doc, lambda d: apply_update(d, update))
+        chosen = doc if return_document else before
+        return project(chosen, projection) if chosen is not None else None
+    
+    async def find_one_and_update(self, query, update, projection=None, sort=None, upsert=False,
+                                  return_document=False, **kwargs):
+        return await self._find_one_and("find_one_and_update", query, update, projection, sort,
+                                        upsert, return_document)
+    
+    async def find_one_and_replace(self, query, replacement, projection=None, sort=None, upsert=False,
+                                   return_document=False, **kwargs):
+        return await self._find_one_and("find_one_and_replace", query, replacement, projection, sort,
+                                        upsert, return_document, replace=True)
+    
+    async def find_one_and_delete(self, query, projection=None, sort=None, **kwargs):
+        await self._enter("find_one_and_delete")
+        doc = self._first(query, sort)
+        if doc is None:
+            return None
+        self._unstore(doc)
+        return project(doc, projection)
+    
+    async def bulk_write(self, operations, ordered=True, **kwargs):
+        fail_at = await self._enter("bulk_write")
+        counts = {"nInserted": 0, "nMatched": 0, "nModified": 0, "nRemoved": 0}
+        upserted, errors = [], []
+        for index, op in enumerate(operations):
+            kind = type(op).__name__
+            try:
+                if index in fail_at:
+                    raise RuntimeError("injected failure")
+                if kind == "InsertOne":
+                    self._insert(op._doc)
+                    counts["nInserted"] += 1
+                elif kind in ("DeleteOne", "DeleteMany"):
+                    found = self._matching(op._filter)
+                    for doc in found if kind == "DeleteMany" else found[:1]:
+                        self._unstore(doc)
+                        counts["nRemoved"] += 1
+                else:
+                    result = self._update(op._filter, op._doc, upsert=bool(op._upsert),
+                                          many=kind == "UpdateMany", replace=kind == "ReplaceOne")
+                    counts["nMatched"] += result.matched_count
+                    counts["nModified"] += result.modified_count
+                    if result.upserted_id is not None:
+                        upserted.append({"index": index, "_id": result.upserted_id})
+            except (DuplicateKeyError, RuntimeError) as e:
+                code = DUPLICATE_KEY if isinstance(e, DuplicateKeyError) else 1
+                errors.append({"index": index, "code": code, "errmsg": str(e)})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError({**counts, "nUpserted": len(upserted), "upserted": upserted,
+                                  "writeErrors": errors, "writeConcernErrors": []})
+        return _result(
+            inserted_count=counts["nInserted"], matched_count=counts["nMatched"],
+            modified_count=counts["nModified"], deleted_count=counts["nRemoved"],
+            upserted_count=len(upserted), upserted_ids={u["index"]: u["_id"] for u in upserted}
+        )
+    
+    # ---- indexes ----
+    
+    async def create_index(self, keys, **kwargs):
+        self.indexes.append((keys, kwargs))
+        return kwargs.get("name")
+
+
+class FakeDB:
+    """Motor-like database; collections are created on first access"""
+    
+    def __init__(self):
+        # No client: code paths that need a replica set take their standalone branch
+        self.client = None
+        self.collections: Dict[str, FakeCollection] = {}
+    
+    def collection(self, name: str, docs=None, **options) -> FakeCollection:
+        """(Re)create a collection with initial documents / index options"""
+        self.collections[name] = FakeCollection(name, docs, **options)
+        return self.collections[name]
+    
+    def __getattr__(self, name: str) -> FakeCollection:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(name)
+        return self.collections[name]
+    
+    def __getitem__(self, name: str) -> FakeCollection:
+        return getattr(self, name)
+
+
+@pytest.fixture
+def fake_db() -> FakeDB:
+    """A fresh in-memory Motor database"""
+    return FakeDB()
@@ -0,0 +1,108 @@
+"""
+Tests for checkpointed audit chain verification
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from blockchain_audit.blockchain_engine import BlockchainEngine
+from blockchain_audit.benchmark import MemoryDatabase, append_blocks
+from advanced_audit.audit_engine import AdvancedAuditEngine
+from fjai.audit_layer import AuditLayer, compute_signature
+
+
+class TestChainVerification:
+    
+    @pytest.mark.asyncio
+    async def test_incremental_verification(self):
+        """Test: Re-verification only processes blocks added since the checkpoint"""
+        db = MemoryDatabase()
+        engine = BlockchainEngine(db)
+        tip = await append_blocks(engine, db, "bout_1", 50)
+        engine.verifier.batch_size = 8
+        
+        first = await engine.verify_bout_integrity("bout_1")
+        assert first["verified"] is True
+        assert first["blocks_checked"] == 50
+        assert first["checkpoint_block"] == 50
+        
+        await append_blocks(engine, db, "bout_1", 5, start=51, previous_hash=tip)
+        second = await engine.verify_bout_integrity("bout_1")
+        assert second["verified"] is True
+        assert second["resumed_from_block"] == 50
+        assert second["blocks_checked"] == 5
+        assert second["total_records"] == 55
+        
+        full = await engine.verify_bout_integrity("bout_1", full=True)
+        assert full["blocks_checked"] == 55
+        engine.verifier.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_tampering_detected(self):
+        """Test: Bad signatures and edits to the checkpointed block fail verification"""
+        db = MemoryDatabase()
+        engine = BlockchainEngine(db)
+        await append_blocks(engine, db, "bout_1", 20)
+        engine.verifier.batch_size = 4
+        
+        db.blockchain_records.docs[12]["signature"] = "0" * 64
+        result = await engine.verify_bout_integrity("bout_1")
+        assert result["verified"] is False
+        assert result["first_invalid_block"] == 13
+        assert result["verified_records"] == 12
+        assert result["checkpoint_block"] == 12
+        
+        # Rewriting the checkpointed block is caught on the next incremental run
+        db.blockchain_records.docs[11]["data_hash"] = "f" * 64
+        result = await engine.verify_bout_integrity("bout_1")
+        assert result["verified"] is False
+        assert result["invalid_reason"] == "checkpointed block changed"
+        engine.verifier.shutdown()
+    
+    def test_advanced_audit_incremental(self):
+        """Test: AdvancedAuditEngine resumes from its checkpoint and still catches edits"""
+        engine = AdvancedAuditEngine()
+        for i in range(10):
+            engine.log_event("bout_1", "score", {"round": i}, "judge_1")
+        
+        assert engine.verify_chain("bout_1").verified_entries == 10
+        
+        engine.log_event("bout_1", "score", {"round": 10}, "judge_1")
+        result = engine.verify_chain("bout_1")
+        assert result.valid
+        assert result.resumed_from == 10
+        assert result.entries_checked == 1
+        
+        engine.chains["bout_1"][10].payload["round"] = 99
+        result = engine.verify_chain("bout_1")
+        assert result.tampered
+        assert result.tamper_detected_at == 10
+    
+    @pytest.mark.asyncio
+    async def test_fjai_audit_verification_streams_batches(self, fake_db):
+        """Test: Signed logs verify in bounded batches and resume from the checkpoint"""
+        logs = []
+        for i in range(25):
+            log = {"log_id": f"log{i:02d}", "bout_id": "bout_1", "round_id": "r1", "action": "score",
+                   "actor": "judge_1", "timestamp": f"2026-01-01T00:00:{i:02d}+00:00", "data": {"i": i}}
+            log["signature"] = compute_signature(log)
+            logs.append(log)
+        logs[20]["data"] = {"i": -1}
+        fake_db.collection("fjai_audit_logs", logs)
+        layer = AuditLayer(fake_db, verify_workers=1, verify_batch_size=4)
+        
+        result = await layer.verify_bout("bout_1")
+        assert (result["logs_checked"], result["verified_logs"]) == (25, 20)
+        assert result["invalid_log_ids"] == ["log20"]
+        
+        # Only the logs after the valid prefix are checked again
+        await fake_db.fjai_audit_logs.update_one({"log_id": "log20"}, {"$set": {"data": {"i": 20}}})
+        result = await layer.verify_bout("bout_1")
+        assert result["all_valid"] and result["resumed_from"] == 20
+        assert (result["logs_checked"], result["total_logs"]) == (5, 25)
+        layer.executor.shutdown()
@@ -0,0 +1,81 @@
+"""
+Tests for the cross-worker broadcast bus
+
+Several BroadcastBus instances share a LocalHub to stand in for uvicorn
+workers on Redis; every socket must receive each message exactly once.
+"""
+
+import pytest
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from broadcast_bus import BroadcastBus, LocalHub, channel_name
+from stats_overlay.websocket_handler import OverlayWebSocketManager
+from fjai.websocket_manager import FJAIWebSocketManager
+
+
+class FakeSocket:
+    def __init__(self):
+        self.received = []
+    
+    async def accept(self):
+        pass
+    
+    async def send_json(self, data):
+        self.received.append(data)
+
+
+class TestBroadcastBus:
+
+    @pytest.mark.asyncio
+    async def test_fan_out_across_workers(self):
+        """Test: A broadcast on one worker reaches sockets on all workers once"""
+        hub = LocalHub()
+        managers = [OverlayWebSocketManager(BroadcastBus(hub.transport(), worker_id=f"w{i}")) for i in range(3)]
+        sockets = [FakeSocket() for _ in range(9)]
+        for i, socket in enumerate(sockets):
+            await managers[i % 3].connect(socket, "bout_1")
+        other = FakeSocket()
+        await managers[0].connect(other, "bout_2")
+        
+        await managers[1].broadcast_to_fight("bout_1", {"score": "10-9"})
+        await asyncio.sleep(0.01)
+        
+        assert all(s.received == [{"score": "10-9"}] for s in sockets)
+        assert other.received == []
+        assert sum(m.bus.remote_received for m in managers) == 2
+    
+    @pytest.mark.asyncio
+    async def test_channels_follow_local_sockets(self):
+        """Test: Workers subscribe per bout only while they have sockets"""
+        hub = LocalHub()
+        bus = BroadcastBus(hub.transport(), worker_id="w0")
+        manager = FJAIWebSocketManager(bus)
+        a, b = FakeSocket(), FakeSocket()
+        
+        await manager.connect(a, "score", "bout_1")
+        await manager.connect(b, "score", "bout_1")
+        channel = channel_name("fjai:score", "bout_1")
+        assert channel in hub.subscribers
+        
+        manager.disconnect(a, "score", "bout_1")
+        assert channel in hub.subscribers
+        manager.disconnect(b, "score", "bout_1")
+        assert channel not in hub.subscribers
+    
+    @pytest.mark.asyncio
+    async def test_single_process_mode(self):
+        """Test: Without a transport the bus delivers locally"""
+        manager = FJAIWebSocketManager(BroadcastBus())
+        socket = FakeSocket()
+        await manager.connect(socket, "cv", "bout_1")
+        
+        await manager.broadcast_cv_event("bout_1", {"event": "KD"})
+        
+        assert socket.received[-1]["type"] == "cv_event"
+        assert manager.get_stats()["messages_sent"] == 1
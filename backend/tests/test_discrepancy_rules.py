@@ -0,0 +1,119 @@
+"""
+Tests for the one-pass discrepancy rule engine and round variance summaries
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from discrepancy_rules import DiscrepancyRuleEngine, RoundSnapshot, evaluate_rules, variance_summary
+
+
+def judge(judge_id, f1, f2, locked=True):
+    return {"judge_id": judge_id, "judge_name": judge_id.upper(), "bout_id": "b1", "round_num": 1,
+            "fighter1_score": f1, "fighter2_score": f2, "card": f"{f1}-{f2}", "locked": locked}
+
+
+class TestDiscrepancyRules:
+
+    def test_round_rules_in_one_pass(self):
+        """Test: Score rules fire as before; variance rules skip without judge scores"""
+        snapshot = RoundSnapshot(
+            bout_id="b1", round_num=2, delta=620, card="10-8", winner="fighter1",
+            to_108=True, gates={"finish_threat": False, "control_dom": False, "multi_cat_dom": False},
+            event_count=3
+        )
+        flags = evaluate_rules(snapshot)
+        assert [f["flag_type"] for f in flags] == ["boundary_10_9_vs_10_8", "10_8_without_gate", "low_activity"]
+        assert flags[0]["context"]["difference_from_threshold"] == 20
+        assert all(f["status"] == "pending" and f["bout_id"] == "b1" for f in flags)
+        assert len({f["id"] for f in flags}) == 3
+        
+        close = RoundSnapshot(bout_id="b1", round_num=1, delta=40, card="10-9", winner="fighter2",
+                              tie_breaker="damage", event_count=12)
+        assert [f["flag_type"] for f in evaluate_rules(close)] == ["tie_breaker_used", "very_close_decision"]
+    
+    def test_variance_summary_matches_pairwise_outliers(self):
+        """Test: Single-pass outliers equal the pairwise >2 point check"""
+        scores = [judge("a", 10, 9), judge("b", 10, 9), judge("c", 7, 10), judge("d", 10, 8, locked=False)]
+        summary = variance_summary("b1", 1, scores)
+        
+        pairwise = [
+            s["judge_id"] for s in scores
+            if any(abs(s["fighter1_score"] - o["fighter1_score"]) > 2 or
+                   abs(s["fighter2_score"] - o["fighter2_score"]) > 2 for o in scores if o is not s)
+        ]
+        assert [o["judge_id"] for o in summary["outliers"]] == pairwise
+        assert summary["max_variance"] == 3 and summary["severity"] == "high"
+        assert summary["variance_detected"] and not summary["all_locked"]
+        assert summary["locked_count"] == 3
+        assert summary["anomaly"]["severity"] == "medium"
+        
+        single = variance_summary("b1", 1, [judge("a", 10, 9)])
+        assert single["judge_count"] == 1 and not single["variance_detected"]
+    
+    @pytest.mark.asyncio
+    async def test_engine_batches_flags_and_flags_variance_once(self, fake_db):
+        """Test: One insert_many per pass; a round is variance-flagged once"""
+        db = fake_db
+        db.collection("judge_scores", [judge("a", 10, 9), judge("b", 10, 9)])
+        db.collection("round_variance", unique=("bout_id", "round_num"))
+        engine = DiscrepancyRuleEngine(db)
+        
+        await engine.update_variance("b1", 1)
+        assert db.discrepancy_flags.docs == []
+        
+        await db.judge_scores.insert_one(judge("c", 7, 10))
+        await engine.update_variance("b1", 1)
+        await db.judge_scores.replace_one({"judge_id": "c"}, judge("c", 6, 10))
+        await engine.update_variance("b1", 1)
+        assert [f["flag_type"] for f in db.discrepancy_flags.docs] == ["judge_variance"]
+        assert db.discrepancy_flags.calls == ["insert_many"]
+        
+        calls = len(db.judge_scores.calls)
+        summary = await engine.get_round("b1", 1)
+        assert summary["max_variance"] == 4 and summary["severity"] == "critical"
+        assert summary["version"] == 3
+        assert len(db.judge_scores.calls) == calls
+    
+    @pytest.mark.asyncio
+    async def test_racing_lock_is_not_overwritten(self, fake_db):
+        """Test: A summary replaced mid-recompute is recomputed from fresh judge scores"""
+        db = fake_db
+        db.collection("judge_scores", [judge("a", 10, 9)])
+        db.collection("round_variance", unique=("bout_id", "round_num"))
+        engine = DiscrepancyRuleEngine(db)
+        await engine.update_variance("b1", 1)
+        
+        # Another lock lands and writes its summary while this one reads scores
+        def racing_lock():
+            db.judge_scores.docs.append(judge("b", 7, 10))
+            stored = db.round_variance.docs[0]
+            stored.update(version=2, judge_count=2)
+        db.judge_scores.on_find = racing_lock
+        
+        summary = await engine.update_variance("b1", 1)
+        assert summary["judge_count"] == 2 and summary["version"] == 3
+        assert db.round_variance.docs[0]["max_variance"] == 3
+        assert db.round_variance.calls.count("replace_one") == 2
+    
+    @pytest.mark.asyncio
+    async def test_repeated_flags_are_skipped(self, fake_db):
+        """Test: Flags a round already has are dropped; the rest are still inserted"""
+        db = fake_db
+        db.collection("discrepancy_flags", unique=("bout_id", "round_num", "flag_type"),
+                      partial={"source": "rules"})
+        engine = DiscrepancyRuleEngine(db)
+        
+        assert await engine.flag(RoundSnapshot(bout_id="b1", round_num=1, tie_breaker="damage")) == ["tie_breaker_used"]
+        created = await engine.flag(RoundSnapshot(bout_id="b1", round_num=1, tie_breaker="damage", event_count=2))
+        assert created == ["low_activity"]
+        assert [f["flag_type"] for f in db.discrepancy_flags.docs] == ["tie_breaker_used", "low_activity"]
+        
+        # Manually created flags are not rule flags
+        await db.discrepancy_flags.insert_one({"bout_id": "b1", "round_num": 1, "flag_type": "low_activity"})
+        assert len(db.discrepancy_flags.docs) == 3
@@ -0,0 +1,172 @@
+"""
+Load tests for fan vote ingestion (a 20k-vote round-end burst) and
+accuracy settlement
+"""
+
+import pytest
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fan_scoring.vote_ingest import FanVoteIngestor, ScoringClosed
+from fan_scoring import accuracy
+from fan_scoring.accuracy import settle_round
+
+
+def fan_db(fake_db, fan_ids=()):
+    """fan_scores with its unique vote key and write latency, an open scoring window"""
+    fake_db.collection("fan_scores", unique=("bout_id", "round_number", "voter_key"), delay=0.005)
+    fake_db.collection("fan_users", [{"fan_id": fan_id, "rounds_scored": 0} for fan_id in fan_ids],
+                       unique=("fan_id",))
+    fake_db.collection("fan_active_event", [
+        {"is_active": True, "scoring_open": True, "scoring_deadline": time.time() + 60}
+    ])
+    return fake_db
+
+
+def rounds_scored(db):
+    return {d["fan_id"]: d["rounds_scored"] for d in db.fan_users.docs if d["rounds_scored"]}
+
+
+class TestFanVoteIngest:
+    
+    @pytest.mark.asyncio
+    async def test_20k_vote_burst(self, fake_db):
+        """Test: 20k votes (5k re-votes) land within 10s in a few bulk writes"""
+        voters = 15000
+        db = fan_db(fake_db, [f"fan{i}" for i in range(0, voters, 2)])
+        ingestor = FanVoteIngestor(db, flush_interval_ms=50, max_batch=2000)
+        
+        async def vote(i):
+            voter = i % voters
+            winner = "RED" if i < voters else "BLUE"  # Re-votes switch sides
+            fan_id = f"fan{voter}" if voter % 2 == 0 else None
+            session_id = None if fan_id else f"session{voter}"
+            return await ingestor.submit("bout_1", 1, 10 if winner == "RED" else 9, 10 if winner == "BLUE" else 9,
+                                         winner, "simple", fan_id=fan_id, session_id=session_id)
+        
+        start = time.perf_counter()
+        results = []
+        for chunk in range(0, 20000, 500):
+            results += await asyncio.gather(*(vote(i) for i in range(chunk, chunk + 500)))
+        await ingestor.close()
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 10
+        assert len(db.fan_scores.docs) == voters
+        assert db.fan_scores.calls.count("bulk_write") < 100
+        assert db.fan_active_event.calls.count("find_one") <= 2 + int(elapsed / ingestor.events.refresh_sec)
+        
+        tally = (await ingestor.get_tally("bout_1"))[1]
+        assert tally["total_votes"] == voters
+        assert tally["blue_votes"] == 5000
+        assert tally["red_votes"] == 10000
+        
+        # Re-votes keep their score_id and don't count twice toward rounds_scored
+        assert [r["updated"] for r in results] == [False] * voters + [True] * 5000
+        assert all(results[i + voters]["score_id"] == results[i]["score_id"] for i in range(5000))
+        assert sum(rounds_scored(db).values()) == voters // 2
+        assert max(rounds_scored(db).values()) == 1
+    
+    @pytest.mark.asyncio
+    async def test_fan_users_failure_retries_only_increments(self, fake_db):
+        """Test: A failed rounds_scored write is retried without rewriting the votes"""
+        db = fan_db(fake_db, ["f1", "f2"])
+        # The second vote fills the batch and flushes both
+        ingestor = FanVoteIngestor(db, flush_interval_ms=10000, max_batch=2)
+        db.fan_users.fail("bulk_write")
+        await asyncio.gather(
+            ingestor.submit("bout_1", 1, 10, 9, "RED", "simple", fan_id="f1"),
+            ingestor.submit("bout_1", 1, 9, 10, "BLUE", "simple", fan_id="f2")
+        )
+        assert ingestor.pending == {}
+        assert ingestor.pending_increments == {"f1": 1, "f2": 1}
+        
+        ingestor.max_batch = 1
+        await ingestor.submit("bout_1", 2, 10, 9, "RED", "simple", fan_id="f1")
+        await ingestor.close()
+        assert db.fan_scores.calls.count("bulk_write") == 2
+        assert rounds_scored(db) == {"f1": 2, "f2": 1}
+        
+        assert list(await ingestor.get_tally("bout_1")) == [1, 2]
+        ingestor.release_bout("bout_1")
+        assert ingestor.get_stats()["tallies_cached"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_revote_on_another_worker(self, fake_db):
+        """Test: A vote first stored by another worker (or before a restart) is reported and tallied as a re-vote"""
+        db = fan_db(fake_db, ["f1"])
+        first = FanVoteIngestor(db, max_batch=1)
+        stored = await first.submit("bout_1", 1, 10, 9, "RED", "simple", fan_id="f1")
+        assert stored["updated"] is False
+        
+        second = FanVoteIngestor(db, max_batch=1)
+        result = await second.submit("bout_1", 1, 9, 10, "BLUE", "simple", fan_id="f1")
+        assert result == {"score_id": stored["score_id"], "updated": True}
+        assert db.fan_scores.docs[0]["score_id"] == stored["score_id"]
+        
+        for ingestor in (first, second):
+            tally = (await ingestor.get_tally("bout_1"))[1]
+            assert (tally["total_votes"], tally["red_votes"], tally["blue_votes"]) == (1, 0, 1)
+        await first.close()
+        await second.close()
+        assert rounds_scored(db) == {"f1": 1}
+    
+    @pytest.mark.asyncio
+    async def test_closed_window_rejected(self, fake_db):
+        """Test: Votes are rejected from the cached window state"""
+        db = fan_db(fake_db)
+        ingestor = FanVoteIngestor(db)
+        ingestor.events.set({"is_active": True, "scoring_open": False})
+        
+        with pytest.raises(ScoringClosed):
+            await ingestor.submit("bout_1", 1, 10, 9, "RED", "detailed", fan_id="f1")
+        assert db.fan_active_event.calls == []
+    
+    @pytest.mark.asyncio
+    async def test_settlement_is_constant_ops_and_resettles(self, fake_db):
+        """Test: 20k scores settle in four operations; a corrected result re-settles"""
+        scores = []
+        for i in range(20000):
+            fan_id = f"fan{i}" if i % 2 == 0 else None
+            scores.append({"bout_id": "bout_1", "round_number": 1, "fan_id": fan_id,
+                           "winner": "RED" if i % 3 else "BLUE"})
+        db = fake_db
+        db.collection("fan_scores", scores)
+        db.collection("fan_users", [
+            {"fan_id": s["fan_id"], "rounds_scored": 1, "correct_predictions": 0} for s in scores if s["fan_id"]
+        ], unique=("fan_id",))
+        # Live views of the stored rows
+        users = {d["fan_id"]: d for d in db.fan_users.docs}
+        
+        start = time.perf_counter()
+        first = await settle_round(db, "bout_1", 1, "RED")
+        assert time.perf_counter() - start < 1
+        assert first["total_scores"] == 20000
+        assert first["correct_predictions"] == sum(s["winner"] == "RED" for s in scores)
+        assert len(db.fan_scores.calls) + len(db.fan_users.calls) == 4
+        red_fans = sum(s["winner"] == "RED" for s in scores if s["fan_id"])
+        assert sum(u["correct_predictions"] for u in users.values()) == red_fans
+        assert users["fan2"]["accuracy"] == 100.0
+        assert users["fan0"]["accuracy"] == 0.0
+        
+        # Official score corrected to BLUE: RED pickers lose their point, BLUE pickers gain one
+        await settle_round(db, "bout_1", 1, "BLUE")
+        assert users["fan0"]["correct_predictions"] == 1
+        assert users["fan2"]["correct_predictions"] == 0
+        assert sum(u["correct_predictions"] for u in users.values()) == len(users) - red_fans
+        
+        # Settling the same result again changes nothing
+        before = {k: u["correct_predictions"] for k, u in users.items()}
+        await settle_round(db, "bout_1", 1, "BLUE")
+        assert {k: u["correct_predictions"] for k, u in users.items()} == before
+        
+        # Concurrent settlements of the round share one lock, discarded afterwards
+        await asyncio.gather(*(settle_round(db, "bout_1", 1, "BLUE") for _ in range(3)))
+        assert {k: u["correct_predictions"] for k, u in users.items()} == before
+        assert accuracy._round_locks == {}
@@ -0,0 +1,209 @@
+"""
+Tests for pipelined fight finalization
+"""
+
+import asyncio
+import pytest
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fight_completion import calculate_fighter_stats, save_completed_fight
+from fight_finalization import FightFinalizer, FinalizationJobQueue
+
+
+class TestFightFinalization:
+    
+    @pytest.mark.asyncio
+    async def test_finalize_writes_result_and_hands_off(self, fake_db):
+        """Test: One bout read, result + bout written, broadcast and jobs don't block the response"""
+        db = fake_db
+        db.collection("round_results", [
+            {"bout_id": "b1", "round_number": 2, "red_points": 9, "blue_points": 10, "delta": -20},
+            {"bout_id": "b1", "round_number": 1, "red_points": 10, "blue_points": 9, "delta": 30},
+            {"bout_id": "b1", "round_number": 3, "red_points": 10, "blue_points": 8, "delta": 80},
+        ])
+        db.collection("bouts", [{"bout_id": "b1", "fighter1": "Red", "fighter2": "Blue", "status": "in_progress"}])
+        finalizer = FightFinalizer(db)
+        finalizer.jobs.retry_delay_sec = 0.01
+        
+        attempts = []
+        release = asyncio.Event()
+        
+        async def archive(bout_id, payload):
+            attempts.append(bout_id)
+            if len(attempts) == 1:
+                raise RuntimeError("transient")
+            await release.wait()
+        
+        broadcasts = []
+        
+        async def broadcast(bout_id, result):
+            broadcasts.append(result)
+        
+        released = []
+        
+        def failing_release(bout_id):
+            raise RuntimeError("subsystem error")
+        
+        async def release_bout(bout_id):
+            released.append(bout_id)
+        
+        finalizer.jobs.register("archive", archive)
+        finalizer.on_release(failing_release)
+        finalizer.on_release(release_bout)
+        finalizer.start()
+        
+        result = await finalizer.finalize("b1", broadcast=broadcast)
+        assert released == ["b1"]  # A failing hook neither blocks the others nor the result
+        assert [r["round"] for r in result["rounds"]] == [1, 2, 3]
+        assert (result["final_red"], result["final_blue"]) == (29, 27)
+        assert result["winner"] == "RED" and result["winner_name"] == "Red"
+        assert db.bouts.calls.count("find_one") == 1
+        
+        bout = db.bouts.docs[0]
+        assert bout["status"] == "completed" and bout["winner_name"] == "Red"
+        assert db.fight_results.docs[0]["final_red"] == 29
+        
+        # The job is still retrying / blocked while the broadcast has gone out
+        await asyncio.sleep(0.05)
+        assert broadcasts and broadcasts[0]["bout_id"] == "b1"
+        assert db.finalization_jobs.docs[0]["status"] == "running"
+        
+        release.set()
+        await finalizer.jobs.drain()
+        job = db.finalization_jobs.docs[0]
+        assert job["status"] == "done" and job["attempts"] == 2
+        assert finalizer.jobs.get_stats()["retried"] == 1
+        await finalizer.close()
+    
+    @pytest.mark.asyncio
+    async def test_live_stats_match_full_recompute(self, fake_db):
+        """Test: Counters kept per event (with a deletion) equal calculate_fighter_stats"""
+        events = [
+            {"bout_id": "b1", "corner": "RED", "event_type": "Jab", "metadata": {"significant": True}},
+            {"bout_id": "b1", "corner": "RED", "event_type": "KD", "metadata": {"tier": "Hard"}},
+            {"bout_id": "b1", "corner": "BLUE", "event_type": "Takedown Landed", "metadata": {}},
+            {"bout_id": "b1", "corner": "BLUE", "event_type": "Ground Top Control", "metadata": {"duration": 42}},
+            {"bout_id": "b1", "corner": "RED", "event_type": "Submission Attempt", "metadata": {"tier": "Deep"}},
+        ]
+        finalizer = FightFinalizer(fake_db)
+        for event in events:
+            await finalizer.live_stats.record(event)
+        await finalizer.live_stats.record(events[-1], sign=-1)
+        
+        live = await finalizer.live_stats.load("b1")
+        logged = [
+            {"fighter": "fighter1" if e["corner"] == "RED" else "fighter2",
+             "eventType": e["event_type"], "metadata": e["metadata"]}
+            for e in events[:-1]
+        ]
+        assert live["fighter1"] == calculate_fighter_stats(logged, "fighter1")
+        assert live["fighter2"] == calculate_fighter_stats(logged, "fighter2")
+        assert await finalizer.live_stats.load("other") is None
+    
+    @pytest.mark.asyncio
+    async def test_live_stats_recount_events_logged_before_counters(self, fake_db):
+        """Test: A bout whose early events have no counters is recounted from unified_events"""
+        events = [
+            {"bout_id": "b1", "corner": "RED", "event_type": "Jab", "metadata": {}},
+            {"bout_id": "b1", "corner": "BLUE", "event_type": "Takedown Landed", "metadata": {}},
+            {"bout_id": "b1", "corner": "RED", "event_type": "KD", "metadata": {"tier": "Flash"}},
+            {"bout_id": "b2", "corner": "BLUE", "event_type": "Jab", "metadata": {}},
+        ]
+        fake_db.collection("unified_events", [dict(e) for e in events])
+        finalizer = FightFinalizer(fake_db)
+        # Only the last b1 event was logged after the counters existed
+        await finalizer.live_stats.record(events[2])
+        
+        logged = [
+            {"fighter": "fighter1" if e["corner"] == "RED" else "fighter2",
+             "eventType": e["event_type"], "metadata": e["metadata"]}
+            for e in events
+        ]
+        live = await finalizer.live_stats.load("b1")
+        assert live["fighter1"] == calculate_fighter_stats(logged[:3], "fighter1")
+        assert live["fighter2"] == calculate_fighter_stats(logged[:3], "fighter2")
+        # No counters at all
+        assert (await finalizer.live_stats.load("b2"))["fighter2"] == calculate_fighter_stats(logged[3:], "fighter2")
+    
+    @pytest.mark.asyncio
+    async def test_jobs_claimed_by_one_worker(self, fake_db):
+        """Test: Workers recovering at once run each unfinished job once and leave leased jobs alone"""
+        past = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+        future = (datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat()
+        fake_db.collection("finalization_jobs", [
+            {"job_id": "queued", "kind": "archive", "bout_id": "b1", "status": "queued", "attempts": 0,
+             "created_at": "1"},
+            {"job_id": "expired", "kind": "archive", "bout_id": "b2", "status": "running", "attempts": 1,
+             "owner": "gone", "lease_until": past, "created_at": "2"},
+            {"job_id": "leased", "kind": "archive", "bout_id": "b3", "status": "running", "attempts": 1,
+             "owner": "alive", "lease_until": future, "created_at": "3"},
+            {"job_id": "done", "kind": "archive", "bout_id": "b4", "status": "done", "attempts": 1,
+             "created_at": "4"},
+        ], delay=0.001)
+        
+        runs = []
+        
+        async def archive(bout_id, payload):
+            runs.append(bout_id)
+            await asyncio.sleep(0.01)
+        
+        queues = [FinalizationJobQueue(fake_db, workers=2, worker_id=f"w{i}") for i in range(2)]
+        for queue in queues:
+            queue.register("archive", archive)
+            queue.start()
+        await asyncio.sleep(0.02)
+        for queue in queues:
+            await queue.drain()
+        
+        assert sorted(runs) == ["b1", "b2"]
+        jobs = {d["job_id"]: d for d in fake_db.finalization_jobs.docs}
+        assert (jobs["queued"]["status"], jobs["queued"]["attempts"]) == ("done", 1)
+        assert (jobs["expired"]["status"], jobs["expired"]["attempts"]) == ("done", 2)
+        assert jobs["leased"]["owner"] == "alive" and jobs["leased"]["status"] == "running"
+        assert sum(q.get_stats()["claims_lost"] for q in queues) == 2
+        for queue in queues:
+            await queue.close()
+    
+    @pytest.mark.asyncio
+    async def test_archive_of_unified_bout(self, fake_db):
+        """Test: A bout logged through /events archives kicks, takedowns and control from unified_events"""
+        events = [
+            {"bout_id": "b1", "corner": "RED", "event_type": "Head Kick", "metadata": {"significant": True},
+             "created_at": "2026-01-01T00:00:01"},
+            {"bout_id": "b1", "corner": "RED", "event_type": "Low Kick", "metadata": {},
+             "created_at": "2026-01-01T00:00:02"},
+            {"bout_id": "b1", "corner": "BLUE", "event_type": "Takedown", "metadata": {},
+             "created_at": "2026-01-01T00:00:03"},
+            {"bout_id": "b1", "corner": "BLUE", "event_type": "Cage Control", "metadata": {"duration": 30},
+             "created_at": "2026-01-01T00:00:04"},
+            {"bout_id": "b1", "corner": "RED", "event_type": "Takedown Defended", "metadata": {},
+             "created_at": "2026-01-01T00:00:05"},
+        ]
+        db = fake_db
+        db.collection("bouts", [{"_id": "b1", "bout_id": "b1", "fighter1": "Red", "fighter2": "Blue"}])
+        db.collection("unified_events", [dict(e) for e in reversed(events)])
+        finalizer = FightFinalizer(db)
+        for event in events:
+            await finalizer.live_stats.record(event)
+        
+        archived = await save_completed_fight(db, "b1", await finalizer.live_stats.load("b1"))
+        
+        red, blue = archived["fighter1"]["stats"], archived["fighter2"]["stats"]
+        assert (red["striking"]["kicks"], red["striking"]["ss_kicks"], red["striking"]["total_strikes"]) == (2, 1, 2)
+        assert red["grappling"]["takedowns_stuffed"] == 1
+        assert blue["grappling"]["takedowns_landed"] == 1
+        assert blue["control"]["cage_control_seconds"] == 30
+        assert blue["summary"]["offensive_actions"] == 1
+        
+        # The event log comes from unified_events; the legacy log is not read
+        assert [e["event_type"] for e in archived["events"]] == [e["event_type"] for e in events]
+        assert archived["metadata"]["total_events"] == 5
+        assert db.events.calls == []
+        assert db.completed_fights.docs[0]["bout_id"] == "b1"
+
@@ -12,6 +12,7 @@ from fjai.event_pipeline import EventPipeline
 from fjai.scoring_engine import WeightedScoringEngine, ScoringWeights
 from cv_analytics.models import RawCVInput, ActionType, ImpactLevel
 from cv_analytics.analytics_engine import CVAnalyticsEngine
+from cv_analytics.temporal_smoothing import TemporalSmoother
 from cv_analytics.mock_generator import MockCVDataGenerator
 
 
@@ -286,6 +287,57 @@ class TestCVAnalyticsPipeline:
         
         print(f"✓ Momentum detection: {len(momentum_events)} momentum swing(s) detected")
     
+    def test_temporal_smoothing_isolated_per_stream(self):
+        """Test: Interleaved cameras/fighters keep separate smoothing windows"""
+        smoother = TemporalSmoother(window_size=5)
+        
+        def frame(i, camera_id, fighter_id, action):
+            return RawCVInput(
+                frame_id=i,
+                timestamp_ms=1000 + i * 33,
+                camera_id=camera_id,
+                fighter_id=fighter_id,
+                action_type=action,
+                action_logits={action.value: 0.9},
+                fighter_bbox=[0.3, 0.4, 0.2, 0.4],
+                keypoints=[(0.5, 0.5, 0.9) for _ in range(17)],
+                camera_angle=90.0,
+                camera_distance=5.0
+            )
+        
+        smoothed = []
+        for i in range(5):
+            smoothed.append(smoother.smooth(frame(i, "cam_1", "fighter_a", ActionType.PUNCH), "bout_1"))
+            smoothed.append(smoother.smooth(frame(i, "cam_2", "fighter_b", ActionType.KICK), "bout_1"))
+            smoothed.append(smoother.smooth(frame(i, "cam_1", "fighter_a", ActionType.KNEE), "bout_2"))
+        
+        # A shared window would never reach 60% consistency here
+        assert all(s is not None for s in smoothed[-3:])
+        assert smoothed[-3].action_logits == {"punch": pytest.approx(0.9)}
+        assert len(smoother.windows) == 3
+        
+        assert smoother.release_bout("bout_1") == 2
+        assert len(smoother.windows) == 1
+        
+        print("✓ Temporal smoothing isolated per (bout, camera, fighter)")
+    
+    def test_smoothing_window_running_counts(self):
+        """Test: O(1) running counts match a full recount of the window"""
+        import random
+        rng = random.Random(5)
+        smoother = TemporalSmoother(window_size=7)
+        window = smoother._get_window(("b", "c", "f"))
+        
+        for _ in range(500):
+            action_id = rng.randrange(4)
+            confidence = rng.random()
+            window.push(action_id, confidence)
+            filled = window.actions[:window.size]
+            assert window.max_count == max(list(filled).count(a) for a in set(filled))
+            assert window.confidence_sum == pytest.approx(float(window.confidences[:window.size].sum()))
+        
+        print("✓ Smoothing window running counts consistent")
+    
     def test_fighter_style_classification(self):
         """Test: Fighter style correctly classified"""
         engine = CVAnalyticsEngine()
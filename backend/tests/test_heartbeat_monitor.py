@@ -299,6 +299,56 @@ def test_multiple_heartbeats_same_service():
     print("✅ Multiple heartbeats from same service handled correctly")
 
 
+def test_heartbeats_batched_and_history_from_memory(fake_db):
+    """Test: Heartbeats are written with one insert_many and history comes from the ring buffer"""
+    import asyncio
+    from datetime import datetime
+    from heartbeat_monitor.monitor_engine import HeartbeatMonitor
+    from heartbeat_monitor.models import HeartbeatData
+    
+    async def run():
+        db = fake_db
+        mon = HeartbeatMonitor(db=db, flush_interval_ms=10000, history_size=5)
+        for i in range(8):
+            await mon.record_heartbeat(HeartbeatData(service_name="CV Router", metrics={"seq": i}))
+        assert db.heartbeats.docs == []
+        
+        history = await mon.get_service_history("CV Router", limit=3)
+        assert [r.metrics["seq"] for r in history] == [7, 6, 5]
+        
+        await mon.close()
+        assert db.heartbeats.calls == ["insert_many"]
+        assert len(db.heartbeats.docs) == 8
+        assert isinstance(db.heartbeats.docs[0]["received_at"], datetime)
+    
+    asyncio.run(run())
+
+
+def test_partial_flush_requeues_only_failed_heartbeats(fake_db):
+    """Test: Inserted heartbeats are not retried; failed ones are requeued without their _id"""
+    import asyncio
+    from heartbeat_monitor.monitor_engine import HeartbeatMonitor
+    from heartbeat_monitor.models import HeartbeatData
+    
+    async def run():
+        db = fake_db
+        mon = HeartbeatMonitor(db=db, flush_interval_ms=10000)
+        for i in range(4):
+            await mon.record_heartbeat(HeartbeatData(service_name="CV Router", metrics={"seq": i}))
+        
+        db.heartbeats.fail("insert_many", at=[1, 3])
+        assert await mon.flush() == 2
+        assert [d["metrics"]["seq"] for d in mon.pending] == [1, 3]
+        assert all("_id" not in d for d in mon.pending)
+        
+        await mon.close()
+        stored = [d["metrics"]["seq"] for d in db.heartbeats.docs]
+        assert sorted(stored) == [0, 1, 2, 3]
+        assert mon.get_stats()["heartbeats_written"] == 4
+    
+    asyncio.run(run())
+
+
 if __name__ == "__main__":
     print("\n" + "="*80)
     print("COMPREHENSIVE TEST SUITE: HEARTBEAT MONITOR")
@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from icvss.models import CVEvent, EventType, EventSource, Position
 from icvss.event_processor import EventProcessor
-from icvss.scoring_engine import HybridScoringEngine
+from icvss.scoring_engine import HybridScoringEngine, RoundScoreAccumulator
 from datetime import datetime, timezone
 
 
@@ -85,6 +85,56 @@ class TestEventProcessor:
         assert "duplicate" in reason2.lower()
         assert accepted3 == True  # Outside window, accepted
 
+    def test_round_partitions_and_release(self):
+        """Test events are retained per round and freed when the round is released"""
+        processor = EventProcessor()
+
+        for round_id in ("round-1", "round-2"):
+            for i in range(3):
+                processor.process_event(CVEvent(
+                    bout_id="test-bout-1",
+                    round_id=round_id,
+                    fighter_id="fighter1",
+                    event_type=EventType.STRIKE_JAB,
+                    severity=0.8,
+                    confidence=0.9,
+                    timestamp_ms=1000 + i * 500
+                ))
+
+        records = processor.get_events_for_round("test-bout-1", "round-1")
+        assert len(records) == 3
+        assert records[0].event_type == "strike_jab"
+
+        freed = processor.release_round("test-bout-1", "round-1")
+        assert freed == 3
+        assert processor.get_events_for_round("test-bout-1", "round-1") == []
+
+        memory = processor.get_stats()["memory"]
+        assert memory["retained_rounds"] == 1
+        assert memory["retained_records"] == 3
+        assert memory["evicted_rounds"] == 1
+
+    def test_round_partitions_are_bounded(self):
+        """Test least recently used rounds are evicted past max_rounds"""
+        processor = EventProcessor(max_events_per_round=2, max_rounds=2)
+
+        for round_num in range(4):
+            for i in range(3):
+                processor.process_event(CVEvent(
+                    bout_id="test-bout-1",
+                    round_id=f"round-{round_num}",
+                    fighter_id="fighter1",
+                    event_type=EventType.STRIKE_CROSS,
+                    severity=0.8,
+                    confidence=0.9,
+                    timestamp_ms=1000 + i * 500
+                ))
+
+        memory = processor.get_stats()["memory"]
+        assert memory["retained_rounds"] == 2
+        assert memory["retained_records"] == 4
+        assert processor.get_stats()["total_processed"] == 12
+
 
 class TestHybridScoring:
     """Test hybrid CV + judge scoring"""
@@ -271,6 +321,52 @@ class TestHybridScoring:
         # Should be very close or draw
         assert abs(result['fighter1_total'] - result['fighter2_total']) < 5.0
 
+    def test_incremental_accumulator_matches_full_rescore(self):
+        """Test per-event accumulation gives the same score as scoring the full event list"""
+        engine = HybridScoringEngine()
+        accumulator = RoundScoreAccumulator()
+
+        cv_events = []
+        for i, event_type in enumerate([EventType.STRIKE_JAB, EventType.KD_HARD, EventType.TD_LANDED,
+                                        EventType.KICK_BODY, EventType.CONTROL_TOP]):
+            event = CVEvent(
+                bout_id="test-bout",
+                round_id="test-round",
+                fighter_id="fighter1" if i % 2 == 0 else "fighter2",
+                event_type=event_type,
+                severity=0.8,
+                confidence=0.9,
+                timestamp_ms=1000 * i
+            )
+            cv_events.append(event)
+            engine.accumulate_cv_event(accumulator, event)
+
+        # Stored (serialized) events accumulate identically
+        stored = CVEvent(
+            bout_id="test-bout",
+            round_id="test-round",
+            fighter_id="fighter2",
+            event_type=EventType.STRIKE_HOOK,
+            severity=0.6,
+            confidence=0.8,
+            timestamp_ms=9000
+        )
+        cv_events.append(stored)
+        engine.accumulate_cv_event(accumulator, stored.model_dump(mode="json"))
+
+        judge_events = [{"fighter": "fighter2", "event_type": "Takedown"}]
+        for event in judge_events:
+            engine.accumulate_judge_event(accumulator, event)
+
+        incremental = engine.score_from_accumulator(accumulator)
+        full = engine.calculate_hybrid_score(cv_events, judge_events)
+
+        assert incremental["score_card"] == full["score_card"]
+        assert incremental["fighter1_total"] == pytest.approx(full["fighter1_total"])
+        assert incremental["fighter2_total"] == pytest.approx(full["fighter2_total"])
+        assert incremental["cv_event_count"] == 6
+        assert incremental["judge_event_count"] == 1
+
 
 def run_tests():
     """Run all tests"""
@@ -0,0 +1,124 @@
+"""
+ICVSS Write Buffer / Event Bucket Tests
+Testing: flush into event buckets, requeue of the unwritten tail on partial
+failures, durability flush on close, rounds with legacy embedded arrays
+"""
+
+import pytest
+import sys
+import os
+
+from pymongo.errors import BulkWriteError
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from icvss.audit_logger import AuditLogger
+from icvss.event_buckets import EventBucketStore
+from icvss.models import CVEvent, EventType
+from icvss.round_engine import RoundEngine
+from icvss.write_buffer import RoundWriteBuffer
+
+
+def events(start, count):
+    return [{"event_id": f"e{i}", "timestamp_ms": i} for i in range(start, start + count)]
+
+
+class TestRoundWriteBuffer:
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_buckets_and_audit(self, fake_db):
+        """Test: One flush fills buckets in order and inserts the audit batch"""
+        db = fake_db
+        buffer = RoundWriteBuffer(db, bucket_store=EventBucketStore(db, bucket_size=3))
+        
+        for event in events(0, 5):
+            buffer.stage("r1", "b1", "cv_events", event, audit_doc={"event_id": event["event_id"]})
+        buffer.stage("r1", "b1", "judge_events", {"event_id": "j0", "timestamp_ms": 9})
+        
+        assert await buffer.flush_round("r1") == 6
+        loaded = await buffer.bucket_store.load_events("r1")
+        assert [e["event_id"] for e in loaded["cv_events"]] == ["e0", "e1", "e2", "e3", "e4"]
+        assert [e["event_id"] for e in loaded["judge_events"]] == ["j0"]
+        assert [b["count"] for b in db.icvss_event_buckets.docs] == [3, 2, 1]
+        assert len(db.icvss_audit_logs.docs) == 5
+        assert buffer.pending == {}
+    
+    @pytest.mark.asyncio
+    async def test_partial_bucket_failure_requeues_only_the_tail(self, fake_db):
+        """Test: Buckets that landed are not written again; the round hash input is unchanged"""
+        db = fake_db
+        store = EventBucketStore(db, bucket_size=2)
+        buffer = RoundWriteBuffer(db, bucket_store=store)
+        for event in events(0, 5):
+            buffer.stage("r1", "b1", "cv_events", event)
+        
+        db.icvss_event_buckets.fail("bulk_write", at=1)  # First bucket lands, second fails
+        with pytest.raises(Exception):
+            await buffer.flush_round("r1")
+        assert [e["event_id"] for e in buffer.pending["r1"]["cv_events"]] == ["e2", "e3", "e4"]
+        assert buffer.stats["flush_errors"] == 1
+        
+        # Queued meanwhile: stays behind the requeued tail
+        buffer.stage("r1", "b1", "cv_events", events(5, 1)[0])
+        await buffer.flush_round("r1")
+        
+        loaded = await store.load_events("r1")
+        assert [e["event_id"] for e in loaded["cv_events"]] == [f"e{i}" for i in range(6)]
+        assert [b["count"] for b in db.icvss_event_buckets.docs] == [2, 2, 2]
+    
+    @pytest.mark.asyncio
+    async def test_partial_audit_failure_and_close(self, fake_db):
+        """Test: Inserted audit rows are dropped from the retry; close flushes what is left"""
+        db = fake_db
+        buffer = RoundWriteBuffer(db)
+        for event in events(0, 3):
+            buffer.stage("r1", "b1", "cv_events", event, audit_doc={"event_id": event["event_id"]})
+        
+        db.icvss_audit_logs.fail("insert_many", at=2)
+        with pytest.raises(BulkWriteError):
+            await buffer.flush_round("r1")
+        
+        # Events landed; only the un-inserted audit row is requeued, without its _id
+        assert buffer.pending["r1"]["cv_events"] == []
+        assert buffer.pending["r1"]["audit"] == [{"event_id": "e2"}]
+        
+        await buffer.close()
+        assert [d["event_id"] for d in db.icvss_audit_logs.docs] == ["e0", "e1", "e2"]
+        loaded = await buffer.bucket_store.load_events("r1")
+        assert len(loaded["cv_events"]) == 3
+        assert buffer.get_stats()["pending_rounds"] == 0
+
+
+class TestEventBucketStore:
+    
+    @pytest.mark.asyncio
+    async def test_legacy_round_locks_and_verifies(self, fake_db):
+        """Test: Events embedded before bucketing are hashed at lock and verify afterwards"""
+        legacy_event = CVEvent(
+            bout_id="b1", round_id="r1", fighter_id="fighter1", event_type=EventType.STRIKE_JAB,
+            severity=0.8, confidence=0.9, timestamp_ms=1000
+        )
+        db = fake_db
+        db.collection("icvss_rounds", [{
+            "round_id": "r1", "bout_id": "b1", "round_num": 1, "status": "open",
+            "cv_events": [legacy_event.model_dump(mode="json")], "judge_events": []
+        }])
+        engine = RoundEngine(db)
+        
+        assert await engine.add_event("r1", CVEvent(
+            bout_id="b1", round_id="r1", fighter_id="fighter2", event_type=EventType.STRIKE_CROSS,
+            severity=0.7, confidence=0.9, timestamp_ms=5000
+        ))
+        
+        loaded = await engine.bucket_store.load_events("r1", legacy_doc=db.icvss_rounds.docs[0])
+        assert [e["timestamp_ms"] for e in loaded["cv_events"]] == [1000]
+        
+        assert await engine.lock_round("r1")
+        loaded = await engine.bucket_store.load_events("r1", legacy_doc=db.icvss_rounds.docs[0])
+        assert [e["timestamp_ms"] for e in loaded["cv_events"]] == [1000, 5000]
+        
+        assert db.icvss_rounds.docs[0]["event_hash"] == AuditLogger(db).generate_event_hash(
+            loaded["cv_events"] + loaded["judge_events"]
+        )
+        assert await AuditLogger(db).verify_integrity("r1")
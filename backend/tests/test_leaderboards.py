@@ -0,0 +1,127 @@
+"""
+Tests for materialized leaderboards
+"""
+
+import asyncio
+import pytest
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from leaderboards import RankIndex, JudgeLeaderboard
+
+
+def performance(judge, accuracy, match=False, timestamp="2026-01-01T00:00:00+00:00"):
+    return {"judgeId": judge, "judgeName": judge.upper(), "accuracy": accuracy, "mae": 1.0,
+            "sensitivity108": False, "match": match, "timestamp": timestamp}
+
+
+def judge_db(db, delay=0.0):
+    db.collection("judge_leaderboard", unique=("judgeId",), delay=delay)
+    db.collection("judge_performance", delay=delay)
+    return db
+
+
+class TestLeaderboards:
+    
+    def test_rank_index_matches_full_sort(self):
+        """Test: Ranks and top-k agree with sorting everything after random updates"""
+        rng = random.Random(7)
+        index = RankIndex()
+        scores = {}
+        for _ in range(5000):
+            member = f"m{rng.randrange(800)}"
+            scores[member] = (rng.randrange(100), rng.randrange(20))
+            index.upsert(member, *scores[member])
+        index.remove("m1")
+        scores.pop("m1", None)
+        
+        expected = sorted(scores, key=lambda m: (-scores[m][0], -scores[m][1], m))
+        assert index.top(len(expected)) == expected
+        assert index.top(5, offset=10) == expected[10:15]
+        assert all(index.rank(m) == i for i, m in enumerate(expected, 1))
+        assert index.rank("m1") is None
+    
+    @pytest.mark.asyncio
+    async def test_judge_board_incremental_and_consistency_check(self, fake_db):
+        """Test: Submissions update ranks in place; the rebuild only corrects drift"""
+        db = judge_db(fake_db)
+        board = JudgeLeaderboard(db, sync_interval_sec=3600)
+        
+        for judge, accuracy in [("a", 80), ("b", 90), ("a", 100), ("c", 70)]:
+            doc = performance(judge, accuracy, match=accuracy == 100)
+            await db.judge_performance.insert_one(doc)
+            await board.record(doc)
+        
+        top = await board.top(3)
+        assert [(e["judgeId"], e["rank"]) for e in top] == [("a", 1), ("b", 2), ("c", 3)]
+        assert top[0]["averageAccuracy"] == 90.0
+        assert top[0]["perfectMatches"] == 1
+        assert (await board.get("c"))["rank"] == 3
+        
+        # Reads after the initial load don't touch Mongo
+        finds = db.judge_leaderboard.calls.count("find")
+        for _ in range(50):
+            await board.top(10)
+        assert db.judge_leaderboard.calls.count("find") == finds
+        
+        assert await board.check_consistency() == {"checked": 3, "corrected": 0}
+        
+        # A submission written without the board (e.g. before it existed) is repaired
+        await db.judge_performance.insert_one(performance("c", 100))
+        assert (await board.check_consistency())["corrected"] == 1
+        assert (await board.get("c"))["averageAccuracy"] == 85.0
+        assert (await board.get("c"))["rank"] == 3
+        
+        # A submission inserted but not yet recorded is left alone until it settles
+        recent = performance("b", 50, timestamp=datetime.now(timezone.utc).isoformat())
+        await db.judge_performance.insert_one(recent)
+        assert (await board.check_consistency())["corrected"] == 0
+        await board.record(recent)
+        assert (await board.check_consistency())["corrected"] == 0
+        assert (await board.get("b"))["totalAttempts"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_correct_once(self, fake_db):
+        """Test: Two workers checking at once apply each correction once"""
+        db = judge_db(fake_db, delay=0.001)
+        first = JudgeLeaderboard(db, sync_interval_sec=3600)
+        second = JudgeLeaderboard(db, sync_interval_sec=3600)
+        
+        for judge, accuracy in [("a", 80), ("b", 90)]:
+            doc = performance(judge, accuracy)
+            await db.judge_performance.insert_one(doc)
+            await first.record(doc)
+        # Drift on an existing row and a judge with no row yet
+        await db.judge_performance.insert_many([performance("a", 100), performance("c", 70)])
+        
+        results = await asyncio.gather(first.check_consistency(), second.check_consistency())
+        assert sum(r["corrected"] for r in results) == 2
+        
+        rows = {d["judgeId"]: d for d in db.judge_leaderboard.docs}
+        assert (rows["a"]["totalAttempts"], rows["a"]["accuracySum"]) == (2, 180)
+        assert (rows["c"]["totalAttempts"], rows["c"]["accuracySum"]) == (1, 70)
+        assert rows["b"]["totalAttempts"] == 1
+        assert await first.check_consistency() == {"checked": 3, "corrected": 0}
+    
+    @pytest.mark.asyncio
+    async def test_check_lease_has_one_holder(self, fake_db):
+        """Test: One worker holds the check lease until it lapses"""
+        first = JudgeLeaderboard(fake_db, worker_id="w1")
+        second = JudgeLeaderboard(fake_db, worker_id="w2")
+        
+        assert await first.acquire_check_lease()
+        assert not await second.acquire_check_lease()
+        assert await first.acquire_check_lease()
+        
+        await fake_db.leaderboard_leases.update_one(
+            {"_id": "JudgeLeaderboard"},
+            {"$set": {"lease_until": datetime.now(timezone.utc) - timedelta(seconds=1)}}
+        )
+        assert await second.acquire_check_lease()
+        assert not await first.acquire_check_lease()
@@ -9,9 +9,12 @@ import sys
 sys.path.append('/app/backend')
 
 # CV Router imports
-from cv_router.worker_manager import WorkerManager
+from cv_router.worker_manager import WorkerManager, load_score
 from cv_router.stream_ingestor import StreamIngestor
-from cv_router.models import Frame, StreamType
+from cv_router.models import Frame, StreamType, DropPolicy
+from cv_router.router_engine import CVRouterEngine
+from cv_router.frame_transport import FramePacket, WorkerChannel
+from cv_router.stub_worker import start_stub_worker
 
 # Event Harmonizer imports
 from event_harmonizer.conflict_resolver import ConflictResolver
@@ -73,6 +76,30 @@ class TestCVRouter:
         
         print("✓ Failover working: unhealthy workers avoided")
     
+    @pytest.mark.asyncio
+    async def test_worker_selection_matches_full_scan(self):
+        """Test: Heap selection agrees with a full load_score scan"""
+        import random
+        rng = random.Random(3)
+        manager = WorkerManager(history_size=50)
+        workers = [await manager.register_worker(f"mock://w{i}") for i in range(12)]
+        
+        for step in range(500):
+            worker = rng.choice(workers)
+            await manager.update_worker_metrics(worker.worker_id, rng.uniform(1, 100), rng.randrange(10))
+            if step % 50 == 0:
+                manager.set_worker_status(rng.choice(workers), "degraded")
+            
+            selected = manager.select_worker(f"frame_{step}")
+            healthy = [w for w in workers if w.status == "healthy"] or [w for w in workers if w.status == "degraded"]
+            assert load_score(selected) == min(load_score(w) for w in healthy)
+        
+        # Routing history is a fixed-size ring
+        assert len(manager.routing_history) == 50
+        assert manager.routing_history.recent(1)[0].frame_id == "frame_499"
+        
+        print("✓ Heap selection matches full scan")
+    
     @pytest.mark.asyncio
     async def test_stream_ingestion(self):
         """Test: Mock stream ingestion"""
@@ -104,6 +131,56 @@ class TestCVRouter:
         await ingestor.remove_stream("cam_1")
         
         print(f"✓ Stream ingestion working: received {len(frames_received)} frames")
+    
+    @pytest.mark.asyncio
+    async def test_worker_channel_drop_policies(self):
+        """Test: Bounded worker queues drop oldest / skip non-keyframes"""
+        def packet(seq, keyframe=True):
+            return FramePacket(f"f{seq}", "cam_1", seq, seq, b"x", 640, 480, is_keyframe=keyframe)
+        
+        channel = WorkerChannel("w1", maxsize=2, drop_policy=DropPolicy.DROP_OLDEST)
+        channel.offer(packet(1))
+        channel.offer(packet(2))
+        accepted, evicted, reason = channel.offer(packet(3))
+        
+        assert accepted and evicted.frame_id == "f1" and reason == "evicted_oldest"
+        assert [channel.queue.get_nowait().frame_id for _ in range(2)] == ["f2", "f3"]
+        
+        channel = WorkerChannel("w2", maxsize=2, drop_policy=DropPolicy.SKIP_NON_KEYFRAMES)
+        accepted, _, reason = channel.offer(packet(1, keyframe=False), under_pressure=True)
+        assert not accepted and reason == "non_keyframe_skipped"
+        assert channel.offer(packet(2, keyframe=True), under_pressure=True)[0]
+        
+        print("✓ Drop policies working")
+    
+    @pytest.mark.asyncio
+    async def test_route_frames_to_stub_worker(self):
+        """Test: Frames reach a local HTTP worker as raw bytes"""
+        stub = start_stub_worker()
+        engine = CVRouterEngine(worker_queue_size=64)
+        try:
+            await engine.worker_manager.register_worker(stub.endpoint)
+            
+            for seq in range(20):
+                await engine._on_frame_received(
+                    FramePacket(f"f{seq}", "cam_1", seq, seq, b"\xff\xd8frame", 640, 480)
+                )
+            
+            for _ in range(100):
+                if stub.frames_received >= 20:
+                    break
+                await asyncio.sleep(0.02)
+            
+            metrics = engine.get_metrics()
+            assert stub.frames_received == 20
+            assert stub.bytes_received == 20 * len(b"\xff\xd8frame")
+            assert metrics.camera_stats["cam_1"]["frames_delivered"] == 20
+            assert sum(s["frames_sent"] for s in metrics.worker_stats.values()) == 20
+        finally:
+            await engine.shutdown()
+            stub.shutdown()
+        
+        print(f"✓ Routed {stub.frames_received} frames to stub worker")
 
 
 class TestEventHarmonizer:
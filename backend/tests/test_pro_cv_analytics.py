@@ -0,0 +1,213 @@
+"""
+Tests for Professional CV Analytics
+
+Triangulation: synthetic cameras project known 3D points that must be
+recovered. FIE metrics: counters fed by a known event stream.
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from pro_cv_analytics.triangulation import look_at_camera, project_points, triangulate_points
+from pro_cv_analytics.analytics_engine import ProfessionalCVEngine
+from pro_cv_analytics.models import (
+    StrikeEvent, CameraCalibration, DefenseEvent, TakedownEvent, GroundControl
+)
+
+
+CAMERA_POSITIONS = {
+    "cam_main": (0.0, 3.0, -7.0),
+    "cam_red": (6.0, 3.5, 4.0),
+    "cam_blue": (-6.0, 3.5, 4.0),
+    "cam_overhead": (0.5, 9.0, 0.5),
+}
+
+
+def synthetic_arena():
+    camera_ids = sorted(CAMERA_POSITIONS)
+    projections = np.stack([look_at_camera(CAMERA_POSITIONS[c]) for c in camera_ids])
+    return camera_ids, projections
+
+
+class TestTriangulation:
+    """Batched DLT triangulation"""
+    
+    def test_recovers_ground_truth_batch(self):
+        """Test: N strikes x K views recovered in one solve"""
+        rng = np.random.default_rng(0)
+        _, projections = synthetic_arena()
+        truth = rng.uniform([-2.0, 0.3, -2.0], [2.0, 2.0, 2.0], size=(2000, 3))
+        
+        observed = project_points(projections, truth) + rng.normal(0, 0.5, size=(2000, 4, 2))
+        points, error_px, views_used = triangulate_points(projections, observed)
+        
+        assert (views_used == 4).all()
+        assert np.abs(points - truth).max() < 0.02  # 2cm with 0.5px noise
+        assert np.nanmean(error_px) < 1.0
+        print("✓ Batched triangulation recovers ground truth")
+    
+    def test_missing_views(self):
+        """Test: Missing views are skipped; one view is not solvable"""
+        _, projections = synthetic_arena()
+        truth = np.array([[0.5, 1.5, 0.2], [-1.0, 1.0, 1.0]])
+        observed = project_points(projections, truth)
+        observed[0, [1, 2]] = np.nan       # Two views left
+        observed[1, [0, 1, 2]] = np.nan    # One view left
+        
+        points, _, views_used = triangulate_points(projections, observed)
+        
+        assert views_used.tolist() == [2, 1]
+        assert np.allclose(points[0], truth[0], atol=1e-6)
+        assert np.isnan(points[1]).all()
+        print("✓ Missing views handled")
+
+
+class TestEngineTriangulation:
+    """ProfessionalCVEngine.triangulate_strikes"""
+    
+    def test_impact_point_and_velocity(self):
+        """Test: Impact point and velocity from a calibrated arena"""
+        engine = ProfessionalCVEngine()
+        camera_ids, projections = synthetic_arena()
+        for camera_id, matrix in zip(camera_ids, projections):
+            engine.set_camera_calibration(CameraCalibration(
+                arena_id="arena_1", camera_id=camera_id, projection_matrix=matrix.tolist()
+            ))
+        
+        # Fist travels at 10 m/s along +x, sampled at 60fps, ending at impact
+        frame_ms = 1000.0 / 60
+        impact = np.array([0.4, 1.6, 0.1])
+        velocity = np.array([10.0, 0.0, 0.0])
+        path = impact - velocity * (frame_ms / 1000.0) * np.arange(4, -1, -1)[:, None]
+        pixels = project_points(projections, path)  # (T, K, 2)
+        
+        camera_data = [
+            {"id": camera_id, "confidence": 0.9, "trajectory": pixels[:, k].tolist(),
+             "frame_interval_ms": frame_ms}
+            for k, camera_id in enumerate(camera_ids)
+        ]
+        camera_data.append({"id": "uncalibrated", "impact_point": [10, 10]})
+        strike = StrikeEvent(
+            bout_id="bout_1", round_num=1, timestamp_ms=60000,
+            attacker_id="fighter_1", defender_id="fighter_2",
+            strike_type="cross", hand_foot="right", zone="head",
+            target_area="jaw", landed=True, power_rating=7.0, accuracy_score=0.9
+        )
+        
+        result = engine.triangulate_strikes([strike], [camera_data], "arena_1")[0]
+        
+        assert result.views_used == 4
+        assert result.impact_point_3d["x"] == pytest.approx(0.4, abs=1e-6)
+        assert result.impact_point_3d["y"] == pytest.approx(1.6, abs=1e-6)
+        assert result.estimated_velocity_mps == pytest.approx(10.0, rel=1e-6)
+        assert result.trajectory_angle == pytest.approx(0.0, abs=1e-6)
+        assert result.triangulation_accuracy == pytest.approx(0.9, abs=1e-3)
+        assert len(result.camera_views) == 5
+        print(f"✓ Strike triangulated at {result.impact_point_3d}, {result.estimated_velocity_mps:.1f} m/s")
+
+
+def make_strike(attacker, defender, round_num, timestamp_ms, strike_type="cross",
+                landed=True, power=6.0, zone="head"):
+    return StrikeEvent(
+        bout_id="bout_1", round_num=round_num, timestamp_ms=timestamp_ms,
+        attacker_id=attacker, defender_id=defender, strike_type=strike_type,
+        zone=zone, target_area="jaw", landed=landed, power_rating=power, accuracy_score=0.5
+    )
+
+
+class TestFIEMetrics:
+    """Event-driven FIE counters"""
+    
+    def setup_method(self):
+        self.engine = ProfessionalCVEngine()
+        events = [
+            make_strike("fighter_1", "fighter_2", 1, 1_000, "jab", power=3.0),
+            make_strike("fighter_1", "fighter_2", 1, 15_000, "cross", power=8.0),
+            make_strike("fighter_1", "fighter_2", 1, 25_000, "leg_kick", landed=False),
+            make_strike("fighter_2", "fighter_1", 1, 26_000, "hook", power=5.0, zone="body"),
+            make_strike("fighter_1", "fighter_2", 2, 5_000, "knee_straight", power=7.5, zone="body"),
+        ]
+        for strike in events:
+            self.engine.record_strike(strike)
+        self.engine.record_defense(DefenseEvent(
+            bout_id="bout_1", round_num=1, timestamp_ms=27_000, fighter_id="fighter_2",
+            defense_type="block", success=True, effectiveness_score=0.8
+        ))
+        self.engine.record_takedown(TakedownEvent(
+            bout_id="bout_1", round_num=2, timestamp_ms=30_000, attacker_id="fighter_1",
+            defender_id="fighter_2", takedown_type="double_leg", successful=True
+        ))
+        self.engine.update_damage_heatmap("fighter_2", events[1])
+    
+    def test_round_and_fight_metrics(self):
+        """Test: Round and whole-fight metrics come from recorded events"""
+        round_1 = self.engine.calculate_fie_metrics("bout_1", "fighter_1", round_num=1)
+        assert round_1.total_strikes_thrown == 3
+        assert round_1.total_strikes_landed == 2
+        assert round_1.jabs_landed == 1 and round_1.power_punches_landed == 1
+        assert round_1.significant_strikes == 1 and round_1.power_strikes_landed == 1
+        assert round_1.avg_strike_power == pytest.approx(5.5)
+        assert round_1.strikes_absorbed == 1
+        assert round_1.damage_dealt == pytest.approx((3.0 + 8.0) * 0.5 * 10)
+        
+        fight = self.engine.calculate_fie_metrics("bout_1", "fighter_1")
+        assert fight.total_strikes_landed == 3
+        assert fight.knees_landed == 1
+        assert fight.takedowns_landed == 1 and fight.takedown_accuracy == 100.0
+        assert fight.max_strike_power == 8.0
+        
+        defender = self.engine.calculate_fie_metrics("bout_1", "fighter_2", round_num=1)
+        assert defender.strikes_defended == 1
+        assert defender.defense_rate == pytest.approx(100 / 3)
+        print("✓ FIE round/fight metrics from event stream")
+    
+    def test_time_window_metrics(self):
+        """Test: Window queries merge time slices"""
+        window = self.engine.calculate_fie_metrics("bout_1", "fighter_1", round_num=1, start_ms=10_000, end_ms=30_000)
+        assert window.total_strikes_thrown == 2
+        assert window.total_strikes_landed == 1
+        print("✓ FIE time window metrics")
+    
+    def test_ground_control_counts_toward_fight(self):
+        """Test: Ground control time feeds the round counters"""
+        self.engine.record_ground_control(GroundControl(
+            bout_id="bout_1", round_num=2, fighter_id="fighter_1", total_control_time_ms=45_000
+        ), timestamp_ms=31_000)
+        
+        assert self.engine.calculate_fie_metrics("bout_1", "fighter_1", round_num=2).ground_control_time_sec == 45.0
+        assert self.engine.calculate_fie_metrics("bout_1", "fighter_1", round_num=1).ground_control_time_sec == 0.0
+        print("✓ Ground control recorded")
+    
+    def test_heatmap_without_bout_sums_fighter_bouts(self):
+        """Test: Omitting bout_id aggregates the fighter's heatmaps across bouts"""
+        single = self.engine.get_damage_heatmap(None, "fighter_2")
+        assert single.bout_id == "bout_1"
+        
+        other = make_strike("fighter_3", "fighter_2", 1, 2_000, power=4.0).model_copy(update={"bout_id": "bout_2"})
+        self.engine.update_damage_heatmap("fighter_2", other)
+        
+        merged = self.engine.get_damage_heatmap(None, "fighter_2")
+        assert merged.bout_id == "all"
+        assert merged.total_damage_score == pytest.approx((8.0 + 4.0) * 0.5 * 10)
+        assert merged.target_damage["jaw"] == pytest.approx(60.0)
+        assert self.engine.get_damage_heatmap("bout_2", "fighter_2").total_damage_score == pytest.approx(20.0)
+        assert self.engine.get_damage_heatmap(None, "nobody").total_damage_score == 0
+        print("✓ Cross-bout heatmap")
+    
+    def test_archive_evicts_bout_state(self):
+        """Test: Archiving a bout evicts heatmaps and counters"""
+        assert self.engine.get_damage_heatmap("bout_1", "fighter_2").total_damage_score > 0
+        
+        evicted = self.engine.archive_bout("bout_1")
+        
+        assert evicted["heatmaps_evicted"] == 1
+        assert self.engine.damage_heatmaps == {}
+        assert self.engine.fie_store.rounds == {}
+        assert self.engine.calculate_fie_metrics("bout_1", "fighter_1").total_strikes_thrown == 0
+        print("✓ Archived bout evicted")
@@ -5,7 +5,12 @@ Round Validator, Report Generator, Highlight Worker, Replay Service, Storage Man
 
 import pytest
 import asyncio
+import os
 import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
 sys.path.append('/app/backend')
 
 from fjai.models import CombatEvent, EventType, EventSource
@@ -14,6 +19,7 @@ from round_validator.models import ValidationSeverity
 from report_generator.generator_engine import ReportGeneratorEngine
 from report_generator.models import FightReport, ReportFormat, RoundScore
 from highlight_worker.worker_engine import HighlightWorkerEngine
+from highlight_worker.models import ClipStatus
 from replay_service.replay_engine import ReplayEngine
 from storage_manager.manager_engine import StorageManagerEngine
 from datetime import datetime
@@ -195,6 +201,61 @@ class TestHighlightWorker:
         assert clip.end_time_ms == 10000 + 10000
         assert clip.duration_sec == 15.0
         print(f"✓ Clip timing: {clip.start_time_ms} to {clip.end_time_ms}")
+    
+    @pytest.mark.asyncio
+    async def test_overlapping_events_merge_into_one_clip(self):
+        """Test: Overlapping windows in a round coalesce into one clip"""
+        worker = HighlightWorkerEngine(render_time_s=0.01)
+        
+        def event(event_type, timestamp_ms, severity, round_id="r1"):
+            return CombatEvent(
+                bout_id="merge", round_id=round_id, fighter_id="fighter_a",
+                event_type=event_type, severity=severity, confidence=0.95,
+                timestamp_ms=timestamp_ms, source=EventSource.CV_SYSTEM
+            )
+        
+        await worker.watch_event(event(EventType.ROCKED, 10000, 0.6))
+        await worker.watch_event(event(EventType.KD_HARD, 14000, 0.9))
+        await worker.watch_event(event(EventType.MOMENTUM_SWING, 60000, 0.5))
+        await worker.watch_event(event(EventType.ROCKED, 10000, 0.6, round_id="r2"))
+        
+        clips = worker.get_clips("merge")
+        assert len(clips) == 3
+        merged = clips[0]
+        assert (merged.start_time_ms, merged.end_time_ms) == (5000, 24000)
+        assert merged.duration_sec == 19.0
+        assert merged.event_type == EventType.KD_HARD
+        assert len(merged.event_ids) == 2
+        
+        await asyncio.sleep(0.1)
+        metrics = worker.get_metrics()
+        assert metrics["events_merged"] == 1
+        assert metrics["clips_completed"] == 3
+        assert all(c.status == ClipStatus.COMPLETED for c in clips)
+        await worker.close()
+    
+    @pytest.mark.asyncio
+    async def test_queue_prioritises_severity(self):
+        """Test: Most severe pending clip is generated first"""
+        worker = HighlightWorkerEngine(num_workers=1, render_time_s=0)
+        order = []
+        original = worker._generate_clip
+        
+        async def record(clip):
+            order.append(clip.severity)
+            await original(clip)
+        
+        worker._generate_clip = record
+        for i, severity in enumerate([0.3, 0.5, 0.95, 0.7]):
+            await worker.watch_event(CombatEvent(
+                bout_id="prio", round_id="r1", fighter_id="fighter_a",
+                event_type=EventType.ROCKED, severity=severity, confidence=0.9,
+                timestamp_ms=i * 60000, source=EventSource.CV_SYSTEM
+            ))
+        
+        await asyncio.sleep(0.05)
+        assert order == [0.95, 0.7, 0.5, 0.3]
+        await worker.close()
 
 
 class TestReplayService:
@@ -227,40 +288,114 @@ class TestReplayService:
 class TestStorageManager:
     """Test Storage Manager"""
     
-    def test_storage_status(self):
+    @staticmethod
+    def _write(root, rel_path, size, age_days=0):
+        path = os.path.join(str(root), rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+        if age_days:
+            old = time.time() - age_days * 86400
+            os.utime(path, (old, old))
+        return path
+    
+    def test_storage_status(self, tmp_path):
         """Test: Get storage status"""
-        manager = StorageManagerEngine()
+        self._write(tmp_path, "recordings/B1/cam_1.mp4", 4096)
+        self._write(tmp_path, "highlights/B1/clip.mp4", 1024)
+        manager = StorageManagerEngine(storage_path=str(tmp_path))
         
         status = manager.get_status()
         
         assert status.total_space_gb > 0
         assert status.used_percentage >= 0
         assert status.alert_level in ["normal", "warning", "critical"]
+        assert status.file_count == 2
+        assert manager.index.category_bytes()["recordings"] == 4096
         print(f"✓ Storage status: {status.used_percentage:.1f}% used ({status.alert_level})")
     
+    def test_usage_index_is_incremental(self, tmp_path):
+        """Test: Index updates without rescans and survives restart"""
+        manager = StorageManagerEngine(storage_path=str(tmp_path))
+        manager.get_status()
+        
+        manager.record_file(self._write(tmp_path, "replays/B1/replay.mp4", 2048))
+        manager.record_file(self._write(tmp_path, "replays/B1/replay.mp4", 512))
+        assert manager.index.category_bytes()["replays"] == 512
+        manager.index.record_delete("replays/B1/replay.mp4")
+        manager.record_file(self._write(tmp_path, "highlights/B1/clip.mp4", 300))
+        
+        # Restart replays snapshot + journal, no walk of the tree
+        reloaded = StorageManagerEngine(storage_path=str(tmp_path))
+        assert reloaded.index.category_bytes()["replays"] == 0
+        assert reloaded.index.category_bytes()["highlights"] == 300
+        assert reloaded.index.last_scan_seconds is None
+        manager.shutdown()
+        reloaded.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_background_load_and_reconcile(self, tmp_path):
+        """Test: Index loads off the loop; reconcile folds in untracked writes and deletes"""
+        self._write(tmp_path, "recordings/B1/cam_1.mp4", 4096)
+        manager = StorageManagerEngine(storage_path=str(tmp_path), rescan_interval_sec=0)
+        manager.start()
+        await manager._rescan_task
+        assert manager.index.loaded and manager.index.category_bytes()["recordings"] == 4096
+        
+        manager.index.record_access("recordings/B1/cam_1.mp4", when=time.time() + 100)
+        self._write(tmp_path, "highlights/B1/clip.mp4", 1024)  # Written without record_file
+        self._write(tmp_path, "replays/B1/replay.mp4", 10)
+        manager.record_file("replays/B1/replay.mp4")
+        os.remove(tmp_path / "replays/B1/replay.mp4")
+        
+        changes = await manager.reconcile()
+        
+        assert changes == {"added": 1, "updated": 0, "removed": 1}
+        assert manager.index.category_bytes() == {"recordings": 4096, "highlights": 1024, "replays": 0, "archives": 0}
+        assert manager.index.entries["recordings/B1/cam_1.mp4"].last_access > time.time()
+        manager.shutdown()
+    
     @pytest.mark.asyncio
-    async def test_cleanup_operation(self):
+    async def test_cleanup_operation(self, tmp_path):
         """Test: Cleanup expired files"""
-        manager = StorageManagerEngine()
+        self._write(tmp_path, "highlights/B1/old_clip.mp4", 1000, age_days=30)
+        self._write(tmp_path, "highlights/B1/new_clip.mp4", 1000)
+        self._write(tmp_path, "recordings/B1/cam_1.mp4", 5000, age_days=30)  # Not archived
+        self._write(tmp_path, "recordings/B2/cam_1.mp4", 5000, age_days=30)
+        self._write(tmp_path, "archives/B2/B2.tar.gz", 100)
+        manager = StorageManagerEngine(storage_path=str(tmp_path), high_watermark_pct=101.0)
         
-        initial_used = manager.used_space_gb
         result = await manager.cleanup_expired(days=7)
         
-        assert result.files_deleted > 0
-        assert result.space_freed_gb > 0
-        assert manager.used_space_gb < initial_used
-        print(f"✓ Cleanup: {result.files_deleted} files, {result.space_freed_gb}GB freed")
+        assert result.files_deleted == 2
+        assert result.bytes_freed == 6000
+        assert not os.path.exists(tmp_path / "highlights/B1/old_clip.mp4")
+        assert os.path.exists(tmp_path / "recordings/B1/cam_1.mp4")
+        assert not os.path.exists(tmp_path / "recordings/B2/cam_1.mp4")
+        assert manager.index.category_bytes()["recordings"] == 5000
+        print(f"✓ Cleanup: {result.files_deleted} files, {result.bytes_freed} bytes freed")
     
     @pytest.mark.asyncio
-    async def test_archive_operation(self):
+    async def test_archive_operation(self, tmp_path):
         """Test: Archive bout"""
-        manager = StorageManagerEngine()
+        self._write(tmp_path, "recordings/TEST_BOUT_001/cam_1.mp4", 200_000)
+        self._write(tmp_path, "highlights/TEST_BOUT_001/clip.mp4", 10_000)
+        self._write(tmp_path, "recordings/OTHER/cam_1.mp4", 100)
+        manager = StorageManagerEngine(storage_path=str(tmp_path))
         
         result = await manager.archive_bout("TEST_BOUT_001")
         
         assert result.bout_id == "TEST_BOUT_001"
-        assert "s3://" in result.archive_url
+        assert result.files_archived == 2
         assert result.archive_size_gb > 0
+        with tarfile.open(result.archive_path, "r:gz") as tar:
+            assert sorted(tar.getnames()) == [
+                "highlights/TEST_BOUT_001/clip.mp4", "recordings/TEST_BOUT_001/cam_1.mp4"
+            ]
+        assert manager.index.files_for_bout("TEST_BOUT_001", categories=("archives",))
+        
+        with pytest.raises(ValueError):
+            await manager.archive_bout("MISSING")
         print(f"✓ Archive: {result.archive_size_gb}GB at {result.archive_url}")
 
 
@@ -293,9 +428,12 @@ if __name__ == "__main__":
     test_replay.test_replay_timing()
     
     print("\nTesting Storage Manager...")
-    test_storage.test_storage_status()
-    asyncio.run(test_storage.test_cleanup_operation())
-    asyncio.run(test_storage.test_archive_operation())
+    with tempfile.TemporaryDirectory() as root:
+        test_storage.test_storage_status(Path(root))
+    with tempfile.TemporaryDirectory() as root:
+        asyncio.run(test_storage.test_cleanup_operation(Path(root)))
+    with tempfile.TemporaryDirectory() as root:
+        asyncio.run(test_storage.test_archive_operation(Path(root)))
     
     print("\n" + "="*80)
     print("✅ ALL PRODUCTION SERVICE TESTS PASSED")
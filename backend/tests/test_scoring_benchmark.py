@@ -0,0 +1,52 @@
+"""
+Tests for the cross-engine scoring benchmark
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from scoring_benchmark import SCENARIOS, generate_suite
+from scoring_benchmark.benchmark import compare, run_benchmark
+
+
+class TestScoringBenchmark:
+
+    def test_suite_is_seeded(self):
+        """Test: Same seed gives the same rounds, covering every scenario"""
+        first = generate_suite(10, seed=3)
+        second = generate_suite(10, seed=3)
+        assert [r.events for r in first] == [r.events for r in second]
+        assert {r.scenario for r in first} == set(SCENARIOS)
+        assert [r.events for r in generate_suite(10, seed=4)] != [r.events for r in first]
+    
+    def test_engines_measured_and_compared(self):
+        """Test: Every standalone engine is measured; regressions are flagged"""
+        result = run_benchmark(rounds_per_scenario=5, seed=3, include_server=False)
+        assert set(result["engines"]) == {
+            "engine_v3", "scoring_service", "unified_scoring",
+            "fjai_weighted", "icvss_hybrid", "replay_engine"
+        }
+        for stats in result["engines"].values():
+            assert stats["rounds"] == 20
+            assert stats["events_per_sec"] > 0
+            assert stats["latency_us"]["p50"] <= stats["latency_us"]["p99"]
+            assert stats["alloc_peak_bytes"]["max"] > 0
+        
+        rates = result["disagreement"]["vs_majority"]
+        assert all(0 <= rate <= 1 for rate in rates.values() if rate is not None)
+        assert len(result["disagreement"]["pairwise"]) == 15
+        
+        # Winners are deterministic, so a rerun agrees with itself
+        rerun = run_benchmark(rounds_per_scenario=5, seed=3, include_server=False)
+        assert rerun["disagreement"]["vs_majority"] == rates
+        
+        slower = {**result, "engines": {
+            name: {**stats, "events_per_sec": stats["events_per_sec"] // 2}
+            for name, stats in result["engines"].items()
+        }}
+        assert compare(result, result, tolerance=10) == []
+        assert any("events/sec" in line for line in compare(result, slower))
@@ -18,8 +18,9 @@ from scoring_service.core import (
     RoundResult, FightResult, FinishMethod,
     score_round, score_fight, calculate_delta,
     validate_round_stats, round_stats_from_dict,
-    SCORING_CONFIG
+    compile_config, SCORING_CONFIG
 )
+import copy
 
 
 # ============== Test calculate_delta ==============
@@ -87,6 +88,64 @@ class TestCalculateDelta:
         assert blue == 60  # 10 + 50
 
 
+# ============== Test compile_config ==============
+
+class TestCompiledConfig:
+    """Tests for compiled, cached config snapshots"""
+    
+    def test_snapshots_cached_by_content(self):
+        """Equal configs share one snapshot; a changed config gets its own"""
+        default = compile_config()
+        assert compile_config(SCORING_CONFIG) is default
+        assert compile_config(copy.deepcopy(SCORING_CONFIG)) is default
+        assert compile_config(default) is default
+        
+        custom = copy.deepcopy(SCORING_CONFIG)
+        custom["event_points"]["Jab"] = 12
+        custom["draw_threshold"] = 1
+        snapshot = compile_config(custom)
+        assert snapshot.config_hash != default.config_hash
+        assert compile_config(copy.deepcopy(custom)) is snapshot
+        
+        events = [{"corner": "RED", "event_type": "Jab", "metadata": {}},
+                  {"corner": "BLUE", "event_type": "Control", "metadata": {"duration": 4}}]
+        assert calculate_delta(events, custom)[:2] == (12, 4)
+        assert calculate_delta(events, snapshot)[:2] == (12, 4)
+        assert calculate_delta(events)[:2] == (10, 4)
+        
+        # score_round reads its thresholds from the same snapshot
+        stats = RoundStats(round_number=1, events=[events[1]])
+        assert score_round(stats).winner == "DRAW"
+        assert score_round(stats, custom).winner == "BLUE"
+    
+    def test_snapshot_is_immutable(self):
+        """Snapshots can't be changed after compilation"""
+        snapshot = compile_config()
+        with pytest.raises(Exception):
+            snapshot.draw_threshold = 0
+        with pytest.raises(TypeError):
+            snapshot.slots["Jab"] = 0
+        with pytest.raises(TypeError):
+            snapshot.tiers[snapshot.slots["KD"]]["Flash"] = 0
+    
+    def test_breakdown_matches_event_counts(self):
+        """Breakdown keeps categories, per-type counts and unknown types"""
+        events = [
+            {"corner": "red", "event_type": "KD", "metadata": {"tier": "Unknown Tier"}},
+            {"corner": "RED", "event_type": "Takedown"},
+            {"corner": "BLUE", "event_type": "Spinning Wheel Kick", "metadata": {}},
+            {"corner": "GREEN", "event_type": "Jab", "metadata": {}},
+        ]
+        red, blue, breakdown = calculate_delta(events)
+        assert red == 56  # first KD tier (Flash) + takedown
+        assert blue == 0
+        assert breakdown["red"] == {"strikes": 0, "grappling": 6, "control": 0, "impact": 50}
+        assert breakdown["event_counts"] == {
+            "red": {"KD": 1, "Takedown": 1},
+            "blue": {"Spinning Wheel Kick": 1}
+        }
+
+
 # ============== Test score_round ==============
 
 class TestScoreRound:
@@ -0,0 +1,80 @@
+"""
+Tests for stats rollups (organization / sport / card browse pages)
+"""
+
+import pytest
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from stats_rollups import StatsRollups
+
+
+def build_db(db):
+    events = []
+    for org, sport, fighters in (("ufc", "mma", 30), ("pfl", "mma", 10), ("wbc", "boxing", 5)):
+        for i in range(fighters):
+            for _ in range(3):
+                events.append({"organization_id": org, "sport_type": sport, "fighter_id": f"{sport}-f{i}"})
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    fights = [
+        {"organization_id": org, "sport_type": sport, "event_name": name, "total_strikes": 10,
+         "created_at": base + timedelta(days=day)}
+        for org, sport, name, day, count in (("ufc", "mma", "UFC 1", 1, 4), ("pfl", "mma", "PFL 1", 5, 2),
+                                             ("wbc", "boxing", "WBC 1", 3, 3))
+        for _ in range(count)
+    ]
+    db.collection("events", events)
+    db.collection("fight_stats", fights)
+    return db
+
+
+class TestStatsRollups:
+
+    @pytest.mark.asyncio
+    async def test_scopes_and_cards_from_one_refresh(self, fake_db):
+        """Test: Every browse scope is served from one refresh of three aggregations"""
+        db = build_db(fake_db)
+        rollups = StatsRollups(db, refresh_interval_sec=30, max_staleness_sec=120)
+        
+        assert await rollups.scope() == {"total_events": 135, "total_fights": 9, "total_fighters": 35}
+        assert await rollups.scope(organization_id="pfl") == {"total_events": 30, "total_fights": 2, "total_fighters": 10}
+        # ufc and pfl fighters overlap by id within mma
+        assert await rollups.scope(sport_type="mma") == {"total_events": 120, "total_fights": 6, "total_fighters": 30}
+        assert (await rollups.scope(organization_id="wbc", sport_type="boxing"))["total_fights"] == 3
+        
+        cards = await rollups.cards()
+        assert [c["event_name"] for c in cards] == ["PFL 1", "WBC 1", "UFC 1"]
+        assert cards[2]["fight_count"] == 4 and cards[2]["total_strikes"] == 40
+        assert [c["event_name"] for c in await rollups.cards(sport_type="boxing")] == ["WBC 1"]
+        
+        assert db.events.calls.count("aggregate") + db.fight_stats.calls.count("aggregate") == 3
+        # Each read after the refresh is a single rollup query
+        assert db.stats_rollups.calls.count("find") == 6
+    
+    @pytest.mark.asyncio
+    async def test_refresh_is_shared_and_bounded(self, fake_db):
+        """Test: Fresh rollups are reused; stale ones are rebuilt and old rows dropped"""
+        db = build_db(fake_db)
+        first = StatsRollups(db, refresh_interval_sec=30, max_staleness_sec=120)
+        assert await first.refresh() is True
+        
+        # Another worker sees the recent meta document and skips recomputing
+        second = StatsRollups(db, refresh_interval_sec=30, max_staleness_sec=120)
+        await second.scope()
+        assert second.stats["refreshes"] == 0
+        assert db.events.calls.count("aggregate") == 2
+        
+        # Past the staleness bound a read refreshes inline and removed data disappears
+        await db.fight_stats.delete_many({"event_name": "PFL 1"})
+        second.refreshed_at -= timedelta(seconds=300)
+        meta = await db.stats_rollups.find_one({"_id": "meta"})
+        await db.stats_rollups.update_one({"_id": "meta"},
+                                          {"$set": {"refreshed_at": meta["refreshed_at"] - timedelta(seconds=300)}})
+        assert [c["event_name"] for c in await second.cards()] == ["WBC 1", "UFC 1"]
+        assert second.stats["refreshes"] == 1
+        assert (await second.scope(organization_id="pfl"))["total_fights"] == 0
@@ -0,0 +1,115 @@
+"""
+Tests for the subsystem registry (allowlist, lazy mounting, lifespan hooks)
+"""
+
+import sys
+from pathlib import Path
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from subsystem_registry import LazyMountMiddleware, SubsystemRegistry
+
+
+def build_app(registry_calls):
+    app = FastAPI()
+    api_router = APIRouter(prefix="/api")
+    
+    @api_router.get("/items/{item_id}")
+    async def core_item(item_id: str):
+        return {"from": "core"}
+    
+    subsystems = SubsystemRegistry(app)
+    app.add_middleware(LazyMountMiddleware, registry=subsystems)
+    
+    def load_widgets(ctx):
+        router = APIRouter()
+        
+        @router.get("/widgets")
+        async def widgets():
+            return {"from": "widgets"}
+        
+        registry_calls.append("load:widgets")
+        ctx.on_startup(lambda: registry_calls.append("start:widgets"))
+        ctx.on_shutdown(lambda: registry_calls.append("stop:widgets"))
+        ctx.include(router)
+    
+    def load_items(ctx):
+        # Carries its own /api prefix and shadows the core route, as before
+        router = APIRouter(prefix="/api/items")
+        
+        @router.get("/{item_id}")
+        async def item(item_id: str):
+            return {"from": "items"}
+        
+        registry_calls.append("load:items")
+        ctx.include_app(router)
+    
+    def load_broken(ctx):
+        raise ImportError("No module named 'missing_dependency'")
+    
+    subsystems.register("widgets", load_widgets, paths=["/api/widgets"])
+    subsystems.register("items", load_items, paths=["/api/items"])
+    subsystems.register("broken", load_broken, paths=["/api/broken"])
+    subsystems.register("hidden", load_widgets, paths=["/api/hidden"])
+    
+    @app.on_event("startup")
+    async def startup():
+        await subsystems.startup()
+    
+    @app.on_event("shutdown")
+    async def shutdown():
+        await subsystems.shutdown()
+    
+    subsystems.mount(api_router)
+    return app, subsystems
+
+
+class TestSubsystemRegistry:
+
+    def test_lazy_mount_on_first_request(self, monkeypatch):
+        """Test: Nothing loads at import; the first request mounts and starts it"""
+        monkeypatch.setenv("SUBSYSTEMS_DISABLED", "hidden")
+        calls = []
+        app, subsystems = build_app(calls)
+        assert calls == []
+        assert subsystems.subsystems["hidden"].state == "disabled"
+        
+        with TestClient(app) as client:
+            assert client.get("/api/widgets").json() == {"from": "widgets"}
+            assert calls == ["load:widgets", "start:widgets"]
+            
+            # App-level subsystem routes still take precedence over core routes
+            assert client.get("/api/items/7").json() == {"from": "items"}
+            
+            assert client.get("/api/broken").status_code == 404
+            assert client.get("/api/hidden").status_code == 404
+            
+            stats = subsystems.get_stats()
+            assert (stats["loaded"], stats["failed"], stats["disabled"]) == (2, 1, 1)
+            assert "missing_dependency" in subsystems.subsystems["broken"].error
+        
+        assert calls[-1] == "stop:widgets"
+    
+    def test_eager_mode_and_allowlist(self, monkeypatch):
+        """Test: SUBSYSTEMS_LAZY=false loads the allowlisted subsystems up front"""
+        monkeypatch.setenv("SUBSYSTEMS_LAZY", "false")
+        monkeypatch.setenv("SUBSYSTEMS", "widgets,items")
+        calls = []
+        app, subsystems = build_app(calls)
+        assert calls == ["load:widgets", "load:items"]
+        assert subsystems.subsystems["widgets"].import_ms is not None
+        
+        # Same route order as wiring every subsystem inline
+        paths = [route.path for route in app.router.routes if route.path.startswith("/api")]
+        assert paths == ["/api/items/{item_id}", "/api/items/{item_id}", "/api/widgets"]
+        assert app.router.routes[-3].endpoint.__name__ == "item"
+        
+        with TestClient(app) as client:
+            assert client.get("/api/items/1").json() == {"from": "items"}
+            assert client.get("/api/broken").status_code == 404
+        assert subsystems.subsystems["broken"].state == "disabled"
@@ -0,0 +1,90 @@
+"""
+Tests for the counter-backed supervisor dashboard projection
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from discrepancy_rules import variance_summary
+from supervisor_dashboard import SupervisorDashboard
+
+
+class TestSupervisorDashboard:
+    
+    @pytest.mark.asyncio
+    async def test_seeded_once_then_counters_and_pushes(self, fake_db):
+        """Test: Counts seed once; later writes are $inc / $set and pushed; legacy events aren't counted"""
+        db = fake_db
+        db.collection("events", [{"boutId": "b1"}, {"boutId": "b1"}, {"boutId": "b2"}])
+        db.collection("unified_events", [{"bout_id": "b1"}])
+        db.collection("round_notes", [{"bout_id": "b1", "id": "n1"}])
+        pushed = []
+        
+        async def publish(bout_id, message):
+            pushed.append((bout_id, message))
+        
+        dashboard = SupervisorDashboard(db, publish=publish)
+        
+        projection = await dashboard.get("b1")
+        assert (projection["total_events"], projection["total_notes"]) == (1, 1)
+        assert projection["rounds"] == {}
+        
+        # The event is inserted before the hook runs
+        await db.unified_events.insert_one({"bout_id": "b1"})
+        await dashboard.events_changed("b1")
+        await dashboard.notes_changed("b1", -1)
+        
+        scores = [
+            {"judge_id": "j1", "round_num": 1, "fighter1_score": 10, "fighter2_score": 9, "locked": True},
+            {"judge_id": "j2", "round_num": 1, "fighter1_score": 10, "fighter2_score": 8, "locked": False}
+        ]
+        await dashboard.round_updated(variance_summary("b1", 1, scores))
+        
+        projection = await dashboard.get("b1")
+        assert (projection["total_events"], projection["total_notes"]) == (2, 0)
+        round_one = projection["rounds"]["1"]
+        assert (round_one["locked_count"], round_one["judge_count"]) == (1, 2)
+        assert (round_one["fighter2_min"], round_one["fighter2_max"]) == (8, 9)
+        
+        # Seeding counted once; everything after was a point update
+        assert db.unified_events.calls.count("count_documents") == 1
+        assert db.events.calls == []
+        assert [m["type"] for _, m in pushed] == ["dashboard_update"] * 3
+        assert pushed[-1][1]["data"]["rounds"]["1"]["max_variance"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_first_write_seeds(self, fake_db):
+        """Test: A write to a bout without a projection seeds it from counts"""
+        fake_db.collection("unified_events", [{"bout_id": "b1"}, {"bout_id": "b1"}])
+        dashboard = SupervisorDashboard(fake_db)
+        
+        projection = await dashboard.events_changed("b1")
+        assert projection["total_events"] == 2 and projection["seeded"]
+        assert dashboard.get_stats()["seeds"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_legacy_only_bout_counts_legacy_events(self, fake_db):
+        """Test: A bout logged only through the legacy events log reports and follows those counts"""
+        fake_db.collection("events", [{"boutId": "legacy"}, {"boutId": "legacy"}, {"boutId": "b2"}])
+        dashboard = SupervisorDashboard(fake_db)
+        
+        projection = await dashboard.get("legacy")
+        assert projection["total_events"] == 2 and projection["legacy_events"]
+        
+        # Legacy writes keep no counter, so reads recount
+        await fake_db.events.insert_one({"boutId": "legacy"})
+        assert (await dashboard.get("legacy"))["total_events"] == 3
+        
+        # Once the bout has unified events those are counted, and reads are point reads again
+        await fake_db.unified_events.insert_one({"bout_id": "legacy"})
+        await dashboard.events_changed("legacy")
+        projection = await dashboard.get("legacy")
+        assert projection["total_events"] == 1 and not projection["legacy_events"]
+        seeds = dashboard.get_stats()["seeds"]
+        await dashboard.get("legacy")
+        assert dashboard.get_stats()["seeds"] == seeds
@@ -0,0 +1,154 @@
+"""
+Tests for the async Tapology scraper against a local fixture HTTP server
+"""
+
+import pytest
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from tapology_scraper.scraper_engine import TapologyScraper
+from tapology_scraper.storage_manager import StorageManager
+from tapology_scraper.data_transformer import DataTransformer
+
+
+EVENT_PAGE = """<html><body><h1>FJ Fight Night 1</h1><ul>
+<li class="fightCard"><a href="/fightcenter/fighters/1">Alpha</a> vs <a href="/fightcenter/fighters/2">Bravo</a> 155</li>
+<li class="fightCard"><a href="/fightcenter/fighters/3">Charlie</a> vs <a href="/fightcenter/fighters/4">Delta</a> 170</li>
+</ul></body></html>"""
+
+FIGHTER_PAGE = """<html><body><h1>Fighter {id}</h1><p>1{id}-2-0</p>
+<span class="fighterInfo">Stance: Orthodox</span></body></html>"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    stats = None
+    
+    def do_GET(self):
+        stats = self.stats
+        with stats["lock"]:
+            stats["requests"] += 1
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        try:
+            time.sleep(0.02)
+            if self.path.startswith("/fightcenter/events/"):
+                body = EVENT_PAGE
+            elif self.path.startswith("/fightcenter/fighters/"):
+                body = FIGHTER_PAGE.format(id=self.path.rsplit("/", 1)[-1])
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            etag = f'"{hash(body) & 0xffffffff:x}"'
+            if self.headers.get("If-None-Match") == etag:
+                with stats["lock"]:
+                    stats["not_modified"] += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with stats["lock"]:
+                stats["in_flight"] -= 1
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    stats = {"lock": threading.Lock(), "requests": 0, "in_flight": 0, "max_in_flight": 0, "not_modified": 0}
+    handler = type("Handler", (FixtureHandler,), {"stats": stats})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", stats
+    server.shutdown()
+    server.server_close()
+
+
+def by_tapology_id(db, tapology_id):
+    return next(d for d in db.fighters.docs if d.get("tapology_id") == tapology_id)
+
+
+class TestTapologyScraper:
+
+    @pytest.mark.asyncio
+    async def test_budget_and_conditional_cache(self, fixture_server, tmp_path):
+        """Test: Concurrent fetches respect the host budget and revalidate with ETags"""
+        base_url, stats = fixture_server
+        scraper = TapologyScraper(base_url=base_url, cache_dir=str(tmp_path), max_concurrency_per_host=2,
+                                  request_delay=0, fresh_for_sec=0, parse_workers=1)
+        try:
+            event = await scraper.scrape_event_details("1")
+            assert event["event_name"] == "FJ Fight Night 1"
+            fighter_ids = [f[k]["tapology_id"] for f in event["fights"] for k in ("fighter1", "fighter2")]
+            assert fighter_ids == ["1", "2", "3", "4"]
+            
+            profiles = await scraper.scrape_fighter_profiles(fighter_ids + ["1"])
+            assert sorted(p["record"] for p in profiles) == ["11-2-0", "12-2-0", "13-2-0", "14-2-0"]
+            assert stats["requests"] == 5
+            assert stats["max_in_flight"] <= 2
+            
+            # Everything is cached: a second pass is all 304s, same parsed data
+            again = await scraper.scrape_fighter_profiles(fighter_ids)
+            assert stats["not_modified"] == 4
+            assert scraper.get_stats()["not_modified"] == 4
+            assert sorted(p["name"] for p in again) == sorted(p["name"] for p in profiles)
+            
+            # Fresh entries are served without any request
+            scraper.fetcher.fresh_for_sec = 3600
+            await scraper.scrape_fighter_profiles(fighter_ids)
+            assert stats["requests"] == 9
+        finally:
+            await scraper.close()
+    
+    @pytest.mark.asyncio
+    async def test_fighters_stored_with_one_bulk_write(self, fake_db):
+        """Test: A fighters batch is one bulk_write of upserts"""
+        db = fake_db
+        storage = StorageManager(db)
+        docs = [DataTransformer.transform_fighter({"tapology_id": str(i), "name": f"F{i}", "record": "1-0-0"})
+                for i in (1, 2, 2, 3)]
+        
+        first = await storage.store_fighters_batch(docs)
+        assert db.fighters.calls.count("bulk_write") == 1
+        assert first["inserted"] == 3
+        
+        original_id = by_tapology_id(db, "1")["id"]
+        updated = DataTransformer.transform_fighter({"tapology_id": "1", "name": "F1", "record": "2-0-0"})
+        second = await storage.store_fighter(updated)
+        assert second["status"] == "updated"
+        assert second["fighter_id"] == original_id
+        assert by_tapology_id(db, "1")["wins"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_fighter_without_tapology_id_matched_by_name(self, fake_db):
+        """Test: A stored row with no Tapology ID is matched by name and gets the ID backfilled"""
+        db = fake_db
+        db.collection("fighters", [{"id": "legacy-1", "name": "F1", "source": "tapology", "wins": 0}])
+        storage = StorageManager(db)
+        
+        result = await storage.store_fighters_batch([
+            DataTransformer.transform_fighter({"tapology_id": "1", "name": "F1", "record": "3-0-0"}),
+            DataTransformer.transform_fighter({"tapology_id": "2", "name": "F2", "record": "1-0-0"}),
+        ])
+        
+        assert (result["inserted"], result["updated"]) == (1, 1)
+        assert result["fighters"][0] == {"status": "updated", "fighter_id": "legacy-1", "tapology_id": "1"}
+        assert len(db.fighters.docs) == 2
+        legacy = by_tapology_id(db, "1")
+        assert legacy["id"] == "legacy-1" and legacy["wins"] == 3